@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark sustained request throughput of the health check server.
+
+Runs the server on an ephemeral port and hammers ``/metrics?format=prometheus``
+from several client threads over persistent (keep-alive) connections.
+
+Usage:
+    PYTHONPATH=src python benchmarks/health_server.py --clients 8 --duration 5
+"""
+
+import argparse
+import http.client
+import threading
+import time
+
+from golfcal2.metrics import Metrics
+from golfcal2.server import HealthCheckServer
+
+
+def _populate_metrics() -> None:
+    """Fill the metrics registry with a realistic number of series."""
+    metrics = Metrics()
+    for i in range(20):
+        metrics.increment(f"bench_counter_{i}", i)
+        metrics.set_gauge(f"bench_gauge_{i}", i * 1.5)
+        for j in range(50):
+            metrics.record_time(f"bench_timer_{i}", 0.001 * (j + 1))
+
+
+def _client(host: str, port: int, path: str, deadline: float, counts: list[int], index: int) -> None:
+    """Issue requests on a single keep-alive connection until the deadline."""
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    done = 0
+    try:
+        while time.perf_counter() < deadline:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f"Unexpected status {response.status}")
+            done += 1
+    finally:
+        conn.close()
+        counts[index] = done
+
+
+def run(clients: int, duration: float, workers: int, path: str) -> float:
+    """Run the benchmark and return requests per second."""
+    _populate_metrics()
+    server = HealthCheckServer('127.0.0.1', 0, max_workers=workers)
+    server.start()
+    assert server.server is not None
+    host, port = server.server.server_address[:2]
+
+    counts = [0] * clients
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=_client, args=(host, port, path, deadline, counts, i))
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    server.stop()
+    return sum(counts) / elapsed
+
+
+def main() -> int:
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=4, help='Concurrent client connections')
+    parser.add_argument('--workers', type=int, default=4, help='Server worker threads')
+    parser.add_argument('--duration', type=float, default=5.0, help='Benchmark duration in seconds')
+    parser.add_argument('--path', default='/metrics?format=prometheus', help='Request path')
+    args = parser.parse_args()
+
+    rps = run(args.clients, args.duration, args.workers, args.path)
+    print(f"{args.path}: {rps:.0f} requests/second "
+          f"({args.clients} clients, {args.workers} workers, {args.duration:.0f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
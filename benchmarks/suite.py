@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""Deterministic benchmarks of the reservation processing pipeline.
+
+Replays recorded WiseGolf, WiseGolf0, NexGolf, TeeTime, MET and Open-Meteo
+responses from ``benchmarks/fixtures`` (no network access, no credentials) and
+times each stage of a calendar sync:
+    
+    parse     ReservationFactory / Reservation.from_teetime for every reservation
+    players   WiseGolf player matching against the recorded tee sheet
+    weather   MET and Open-Meteo response parsing plus forecast formatting
+    events    ReservationEventBuilder.build with replayed weather
+    ics       Calendar assembly and to_ical() serialisation
+
+Each stage runs at 1, 50 and 500 users. Fixture dates are shifted so the
+recorded day becomes today, which keeps every reservation in the future and
+the forecasts aligned with the tee times on whatever day the suite runs.
+
+Results are compared with a JSON baseline; a stage whose time per user grew by
+more than the threshold counts as a regression and the exit status is 1.
+
+Usage:
+    PYTHONPATH=src python benchmarks/suite.py
+    PYTHONPATH=src python benchmarks/suite.py --users 1,50 --repeat 3
+    PYTHONPATH=src python benchmarks/suite.py --update-baseline
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import re
+import sys
+import time
+from collections.abc import Callable
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from golfcal2.config.types import AppConfig
+from golfcal2.models.golf_club import NexGolfClub, TeeTimeClub, WiseGolf0Club, WiseGolfClub
+from golfcal2.models.membership import Membership
+from golfcal2.models.reservation import Reservation
+from golfcal2.models.user import User
+from golfcal2.services.calendar.builders.calendar_builder import CalendarBuilder
+from golfcal2.services.calendar.builders.event_builder import ReservationEventBuilder
+from golfcal2.services.met_weather_strategy import MetWeatherStrategy
+from golfcal2.services.open_meteo_strategy import OpenMeteoStrategy
+from golfcal2.services.reservation_factory import ReservationContext, ReservationFactory, WiseGolfStrategy
+from golfcal2.services.weather_formatter import WeatherFormatter
+from golfcal2.services.weather_service import WeatherContext
+from golfcal2.services.weather_types import WeatherResponse
+from golfcal2.utils.timezone_utils import TimezoneManager
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures'
+DEFAULT_BASELINE = Path(__file__).parent / 'baseline.json'
+BASELINE_VERSION = 1
+
+STAGES = ('parse', 'players', 'weather', 'events', 'ics')
+DEFAULT_USERS = (1, 50, 500)
+DEFAULT_THRESHOLD = 0.25
+
+# Day the fixtures were recorded on; all fixture dates are shifted relative to it
+RECORDED_DATE = date(2024, 7, 16)
+TIMEZONE = 'Europe/Helsinki'
+
+# Minimum duration of one timed sample; short stages are looped until they reach it
+MIN_SAMPLE_SECONDS = 0.05
+
+_DATE_PATTERN = re.compile(r'(?<!\d)(\d{4})-(\d{2})-(\d{2})(?!\d)')
+
+
+def load_fixture(name: str, today: date | None = None) -> Any:
+    """Load a recorded response with its dates moved relative to today.
+    
+    Args:
+        name: Fixture file name in FIXTURE_DIR
+        today: Date the recording day is mapped to, defaults to the current date
+    
+    Returns:
+        Decoded JSON document
+    """
+    shift = (today or date.today()) - RECORDED_DATE
+    
+    def _shift(match: re.Match[str]) -> str:
+        recorded = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        return (recorded + shift).isoformat()
+    
+    text = (FIXTURE_DIR / name).read_text(encoding='utf-8')
+    return json.loads(_DATE_PATTERN.sub(_shift, text))
+
+
+class ReplayWiseGolfClub(WiseGolfClub):
+    """WiseGolf club answering player requests from a recorded tee sheet."""
+    
+    def __init__(self, players_response: dict[str, Any], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.players_response = players_response
+    
+    def fetch_players(self, reservation: dict[str, Any], membership: Membership) -> dict[str, Any]:
+        return self.players_response
+
+
+class ReplayWiseGolf0Club(WiseGolf0Club):
+    """WiseGolf0 club answering player requests from a recorded tee sheet."""
+    
+    def __init__(self, players_response: dict[str, Any], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.players_response = players_response
+    
+    def fetch_players(self, reservation: dict[str, Any], membership: Membership) -> dict[str, Any]:
+        return self.players_response
+
+
+class ReplayWeatherService:
+    """Weather service returning parsed recorded forecasts by region."""
+    
+    def __init__(self, met: WeatherResponse, openmeteo: WeatherResponse) -> None:
+        self.met = met
+        self.openmeteo = openmeteo
+    
+    def get_weather(self, lat: float, lon: float, start_time: datetime, end_time: datetime) -> WeatherResponse:
+        # Same split as WeatherService._select_service_for_location for the fixture clubs
+        return self.met if lat >= 53 else self.openmeteo
+
+
+class Workload:
+    """Recorded responses and the objects built from them for N users."""
+    
+    CLUBS = {
+        'wisegolf': {'name': 'Helsinki Golf', 'coordinates': {'lat': 60.2, 'lon': 24.9}},
+        'wisegolf0': {'name': 'Golf Simulators', 'coordinates': {'lat': 60.17, 'lon': 24.94}},
+        'nexgolf': {'name': 'Kultaranta Golf', 'coordinates': {'lat': 60.43, 'lon': 22.14}},
+        'teetime': {'name': 'Real Club de Golf', 'coordinates': {'lat': 36.5, 'lon': -4.75}},
+    }
+    
+    def __init__(self, users: int, today: date | None = None) -> None:
+        """Load fixtures and build per-user contexts.
+        
+        Args:
+            users: Number of simulated users
+            today: Date the recording day is mapped to
+        """
+        self.tz_manager = TimezoneManager(TIMEZONE)
+        self.local_tz = ZoneInfo(TIMEZONE)
+        self.met_response = load_fixture('met_locationforecast.json', today)
+        self.openmeteo_response = load_fixture('openmeteo_forecast.json', today)
+        
+        # Extract reservations the same way the API clients do
+        self.raw: dict[str, list[dict[str, Any]]] = {
+            'wisegolf': load_fixture('wisegolf_reservations.json', today)['rows'],
+            'wisegolf0': load_fixture('wisegolf0_reservations.json', today)['rows'],
+            'nexgolf': load_fixture('nexgolf_reservations.json', today)['data'],
+            'teetime': [
+                {**tee_time, 'players': [r['player'] for r in tee_time.get('reservations', [])]}
+                for tee_time in load_fixture('teetime_reservations.json', today)['data']
+            ],
+        }
+        wisegolf_players = load_fixture('wisegolf_players.json', today)
+        wisegolf0_players = load_fixture('wisegolf0_players.json', today)
+        
+        self.clubs = {
+            'wisegolf': ReplayWiseGolfClub(
+                wisegolf_players, name='Helsinki Golf', url='https://example.invalid',
+                timezone=TIMEZONE, club_abbreviation='HGK'
+            ),
+            'wisegolf0': ReplayWiseGolf0Club(
+                wisegolf0_players, name='Golf Simulators', url='https://example.invalid',
+                timezone=TIMEZONE, club_abbreviation='SIM'
+            ),
+            'nexgolf': NexGolfClub(
+                name='Kultaranta Golf', url='https://example.invalid',
+                timezone=TIMEZONE, club_abbreviation='KGC'
+            ),
+            'teetime': TeeTimeClub(
+                name='Real Club de Golf', url='https://example.invalid',
+                timezone=TIMEZONE, club_abbreviation='RCG'
+            ),
+        }
+        
+        self.contexts: list[dict[str, ReservationContext]] = []
+        for index in range(users):
+            memberships = {
+                club_type: Membership(
+                    club=club.name,
+                    club_abbreviation=club.club_abbreviation or club_type,
+                    duration={'hours': 4}
+                )
+                for club_type, club in self.clubs.items()
+            }
+            user = User(name=f"User {index:04d}", memberships=list(memberships.values()), handicap=18.4)
+            self.contexts.append({
+                club_type: ReservationContext(club, user, memberships[club_type], self.tz_manager)
+                for club_type, club in self.clubs.items()
+            })
+        
+        config = AppConfig(users={}, clubs={}, global_config={'timezone': TIMEZONE}, api_keys={})
+        self.weather_context = WeatherContext(
+            60.2, 24.9, datetime.now(self.local_tz), datetime.now(self.local_tz),
+            self.local_tz, ZoneInfo('UTC'), {}
+        )
+        self.calendar_builder = CalendarBuilder(self.local_tz)
+        self.event_builder = ReservationEventBuilder(
+            ReplayWeatherService(self.parse_met(), self.parse_openmeteo()),  # type: ignore[arg-type]
+            config
+        )
+        
+        # Inputs of the later stages, built once so each stage is timed on its own
+        self.reservations = self.parse()
+        self.events = self.build_events()
+    
+    def parse_met(self) -> WeatherResponse:
+        """Parse the recorded MET response."""
+        response = MetWeatherStrategy(self.weather_context)._parse_response(self.met_response)
+        assert response is not None
+        return response
+    
+    def parse_openmeteo(self) -> WeatherResponse:
+        """Parse the recorded Open-Meteo response."""
+        response = OpenMeteoStrategy(self.weather_context)._parse_response(self.openmeteo_response)
+        assert response is not None
+        return response
+    
+    def parse(self) -> list[list[Reservation]]:
+        """Create reservations for every user, including player matching."""
+        result = []
+        for contexts in self.contexts:
+            reservations = []
+            for club_type, rows in self.raw.items():
+                context = contexts[club_type]
+                for row in rows:
+                    if club_type == 'teetime':
+                        reservations.append(Reservation.from_teetime(
+                            row, context.club, context.user, context.membership, context.tz_manager
+                        ))
+                    else:
+                        reservations.append(ReservationFactory.create_reservation(club_type, row, context))
+            result.append(reservations)
+        return result
+    
+    def match_players(self) -> int:
+        """Match WiseGolf reservations against the recorded tee sheets."""
+        strategy = WiseGolfStrategy()
+        matched = 0
+        for contexts in self.contexts:
+            for club_type in ('wisegolf', 'wisegolf0'):
+                for row in self.raw[club_type]:
+                    matched += len(strategy.extract_players(row, contexts[club_type]))
+        return matched
+    
+    def weather(self) -> int:
+        """Parse both forecasts per user and format them for every reservation."""
+        length = 0
+        for reservations in self.reservations:
+            met = self.parse_met()
+            openmeteo = self.parse_openmeteo()
+            for reservation in reservations:
+                forecast = openmeteo if isinstance(reservation.club, TeeTimeClub) else met
+                length += len(WeatherFormatter.format_forecast(
+                    forecast, reservation.start_time, reservation.end_time
+                ))
+        return length
+    
+    def build_events(self) -> list[list[Any]]:
+        """Build calendar events for every user's reservations."""
+        result = []
+        for reservations in self.reservations:
+            events = []
+            for reservation in reservations:
+                club_type = next(t for t, c in self.clubs.items() if c is reservation.club)
+                events.append(self.event_builder.build(reservation, self.CLUBS[club_type]))
+            result.append(events)
+        return result
+    
+    def serialise(self) -> int:
+        """Assemble and serialise one calendar per user."""
+        size = 0
+        for contexts, events in zip(self.contexts, self.events):
+            calendar = self.calendar_builder.build_base_calendar(contexts['wisegolf'].user)
+            for event in events:
+                if event is not None:
+                    calendar.add_component(event)
+            size += len(calendar.to_ical())
+        return size
+    
+    def stage(self, name: str) -> Callable[[], Any]:
+        """Get the callable timing a stage."""
+        return {
+            'parse': self.parse,
+            'players': self.match_players,
+            'weather': self.weather,
+            'events': self.build_events,
+            'ics': self.serialise,
+        }[name]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Time a callable, returning the best seconds per call over several samples.
+    
+    Args:
+        func: Callable to time
+        repeat: Number of samples
+    
+    Returns:
+        Minimum seconds per call
+    """
+    # Warm up caches and find a loop count giving samples of a measurable length
+    start = time.perf_counter()
+    func()
+    single = max(time.perf_counter() - start, 1e-9)
+    number = max(1, int(MIN_SAMPLE_SECONDS / single))
+    
+    # Like timeit, keep garbage collection pauses out of the samples
+    best = float('inf')
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            best = min(best, (time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best
+
+
+def run(users: tuple[int, ...] = DEFAULT_USERS, repeat: int = 5,
+        stages: tuple[str, ...] = STAGES) -> dict[str, dict[str, dict[str, float]]]:
+    """Run all stages at each user count.
+    
+    Args:
+        users: User counts to run
+        repeat: Timed samples per stage
+        stages: Stages to run
+    
+    Returns:
+        Results keyed by stage and user count with ``seconds`` and ``per_user_ms``
+    """
+    results: dict[str, dict[str, dict[str, float]]] = {name: {} for name in stages}
+    for count in users:
+        workload = Workload(count)
+        for name in stages:
+            seconds = measure(workload.stage(name), repeat)
+            results[name][str(count)] = {
+                'seconds': round(seconds, 6),
+                'per_user_ms': round(seconds * 1000 / count, 4)
+            }
+    return results
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Find stages slower than the baseline by more than the threshold.
+    
+    Args:
+        results: Results from run()
+        baseline: Baseline document
+        threshold: Allowed relative slowdown, e.g. 0.25 for 25%
+    
+    Returns:
+        Human-readable regression descriptions
+    """
+    regressions = []
+    for name, by_users in results.items():
+        for count, result in by_users.items():
+            reference = baseline.get('results', {}).get(name, {}).get(count)
+            if not reference or not reference.get('per_user_ms'):
+                continue
+            ratio = result['per_user_ms'] / reference['per_user_ms']
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{name} @ {count} users: {result['per_user_ms']:.3f} ms/user "
+                    f"vs baseline {reference['per_user_ms']:.3f} ms/user (+{(ratio - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def _format_table(results: dict[str, Any], baseline: dict[str, Any] | None) -> str:
+    """Format results as a table, with the change against the baseline if given."""
+    lines = [f"{'stage':<10} {'users':>6} {'total ms':>11} {'ms/user':>10} {'vs base':>9}"]
+    for name, by_users in results.items():
+        for count, result in by_users.items():
+            change = ''
+            reference = (baseline or {}).get('results', {}).get(name, {}).get(count)
+            if reference and reference.get('per_user_ms'):
+                change = f"{(result['per_user_ms'] / reference['per_user_ms'] - 1) * 100:+.0f}%"
+            lines.append(
+                f"{name:<10} {count:>6} {result['seconds'] * 1000:>11.2f} "
+                f"{result['per_user_ms']:>10.3f} {change:>9}"
+            )
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--users', default=','.join(map(str, DEFAULT_USERS)),
+                        help='Comma-separated user counts (default: %(default)s)')
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help='Comma-separated stages to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed samples per stage')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Baseline JSON file')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help=f'Allowed relative slowdown (default: from baseline, else {DEFAULT_THRESHOLD})')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results as the new baseline')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON instead of a table')
+    args = parser.parse_args(argv)
+    
+    stages = tuple(s.strip() for s in args.stages.split(',') if s.strip())
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(sorted(unknown))}")
+    users = tuple(int(u) for u in args.users.split(',') if u.strip())
+    
+    # Keep per-reservation error and debug logging out of the timings' output
+    logging.disable(logging.CRITICAL)
+    
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    threshold = args.threshold
+    if threshold is None:
+        threshold = (baseline or {}).get('threshold', DEFAULT_THRESHOLD)
+    
+    results = run(users, args.repeat, stages)
+    
+    if args.json:
+        print(json.dumps({'results': results}, indent=2))
+    else:
+        print(_format_table(results, None if args.update_baseline else baseline))
+    
+    if args.update_baseline:
+        document = {
+            'version': BASELINE_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'threshold': threshold,
+            'results': results
+        }
+        args.baseline.write_text(json.dumps(document, indent=2) + '\n', encoding='utf-8')
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+    
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one", file=sys.stderr)
+        return 0
+    
+    regressions = compare(results, baseline, threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
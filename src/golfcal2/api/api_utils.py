@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import json
 import logging
-import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, TypeGuard
 
 import requests
 
+from golfcal2 import http_cassette
+from golfcal2.utils.retry_policy import DeadlineExceeded, retry_policy
+
 logger = logging.getLogger(__name__)
 
 class APIErrorCode(Enum):
@@ -60,15 +62,16 @@ def _single_request(
 ) -> APIResponse:
     """Make a single API request without retries."""
     try:
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=data,
-            params=params,
-            timeout=timeout,
-            verify=verify_ssl
-        )
+        with retry_policy.slot(url):
+            response = http_cassette.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=data,
+                params=params,
+                timeout=timeout,
+                verify=verify_ssl
+            )
 
         # Handle HTTP errors
         if response.status_code == 404:
@@ -133,13 +136,13 @@ def make_api_request(
     headers: dict[str, str] | None = None,
     data: dict[str, Any] | None = None,
     params: dict[str, str] | None = None,
-    timeout: tuple[int, int] = (7, 20),
-    retry_count: int = 3,
-    retry_delay: int = 5,
+    timeout: tuple[float, float] | None = None,
+    retry_count: int | None = None,
+    retry_delay: float | None = None,
     verify_ssl: bool = True
 ) -> APIResponse:
     """
-    Make an API request with retries.
+    Make an API request with retries under the shared retry policy.
 
     Args:
         method: HTTP method to use (GET, POST, etc.)
@@ -147,9 +150,10 @@ def make_api_request(
         headers: Optional HTTP headers
         data: Optional request body data
         params: Optional URL parameters
-        timeout: Tuple of (connect timeout, read timeout)
-        retry_count: Number of retries on failure
-        retry_delay: Delay between retries in seconds
+        timeout: Tuple of (connect timeout, read timeout), the policy's
+            timeout if None; cut to the time left in the cycle
+        retry_count: Number of attempts, the policy's if None
+        retry_delay: Minimum delay between attempts in seconds, the policy's if None
         verify_ssl: Whether to verify SSL certificates
 
     Returns:
@@ -157,38 +161,37 @@ def make_api_request(
 
     Raises:
         APIAuthenticationError: When authentication fails
-        APITimeoutError: When request times out
+        APITimeoutError: When request times out or the cycle deadline has passed
         APIConnectionError: When network connection fails
         APIError: For other API-related errors
     """
-    if logger.isEnabledFor(logging.ERROR):
-        logger.error(f"Making {method} request to {url}")
+    logger.debug(f"Making {method} request to {url}")
 
-    last_error = None
-    for attempt in range(retry_count):
-        try:
-            return _single_request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                params=params,
-                timeout=timeout,
-                verify_ssl=verify_ssl
-            )
-        except (APITimeoutError, APIConnectionError) as e:
-            last_error = e
-            if attempt < retry_count - 1:
-                logger.warning(f"Request failed (attempt {attempt + 1}/{retry_count}): {e!s}")
-                time.sleep(retry_delay * (2 ** attempt))
-            else:
-                raise
-        except (APIError, APIAuthenticationError):
-            raise
+    def send(request_timeout: Any) -> APIResponse:
+        return _single_request(
+            method=method,
+            url=url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=request_timeout,
+            verify_ssl=verify_ssl
+        )
 
-    # This should never be reached as the last retry will raise an exception
-    assert last_error is not None
-    raise last_error
+    try:
+        return retry_policy.call(
+            url,
+            send,
+            retry_on=(APITimeoutError, APIConnectionError),
+            timeout=timeout,
+            max_attempts=retry_count,
+            base_delay=retry_delay
+        )
+    except DeadlineExceeded as e:
+        raise APITimeoutError(
+            message=str(e),
+            code=APIErrorCode.TIMEOUT
+        )
 
 def is_dict_response(data: Any) -> TypeGuard[dict[str, Any]]:
     """Type guard to verify if data is a dictionary response."""
@@ -3,33 +3,46 @@ Base API client for golf calendar application.
 """
 
 import json
+import re
 import time
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
 
+from golfcal2 import http_cassette
 from golfcal2.exceptions import (
     APIError,
     APIResponseError,
     APITimeoutError,
     APIValidationError,
 )
-from golfcal2.utils.logging_utils import LoggerMixin
+from golfcal2.metrics import Metrics
+from golfcal2.services.session_store import PersistentSessionMixin
+from golfcal2.tracing import span
+from golfcal2.utils.logging_utils import LoggerMixin, payload
+from golfcal2.utils.retry_policy import retry_policy
 
+# Path segments that identify individual resources (numeric ids, uuids, long hex tokens)
+_ID_SEGMENT_RE = re.compile(r'^(\d+|[0-9a-fA-F-]{16,})$')
 
-class BaseAPI(LoggerMixin):
-    """Base class for API clients."""
-    
-    # Default timeouts (connection timeout, read timeout)
-    DEFAULT_TIMEOUT = (7, 20)
+
+def _endpoint_label(path: str) -> str:
+    """Normalize a URL path into a low-cardinality metric label.
     
-    # Default retry settings
-    DEFAULT_RETRY_TOTAL = 3
-    DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
-    DEFAULT_RETRY_STATUS_FORCELIST = [408, 429, 500, 502, 503, 504]
+    Args:
+        path: URL path
+        
+    Returns:
+        Path with resource id segments replaced by ``:id``
+    """
+    segments = [':id' if _ID_SEGMENT_RE.match(segment) else segment for segment in path.split('/')]
+    return '/'.join(segments) or '/'
+
+
+class BaseAPI(LoggerMixin, PersistentSessionMixin):
+    """Base class for API clients."""
     
     def __init__(
         self,
@@ -62,7 +75,7 @@ class BaseAPI(LoggerMixin):
             else:
                 self.auth_details = getattr(membership, 'auth_details', {})
 
-        # Create session with retry strategy
+        # Create session; retries are left to the shared retry policy
         self.session = self._create_session()
         
         # Get authentication strategy and create headers
@@ -70,6 +83,7 @@ class BaseAPI(LoggerMixin):
         cookie_name = self.club_details.get('cookie_name', '')
         
         # Create headers using auth details
+        self.headers: dict[str, str] = {}
         if auth_service:
             self.headers = auth_service.create_headers(auth_type, cookie_name, self.auth_details)
             self.session.headers.update(self.headers)
@@ -92,36 +106,40 @@ class BaseAPI(LoggerMixin):
                 if self.full_url:
                     self.base_url = self.full_url
         
+        # Reuse the session of an earlier run
+        self._restore_session()
+        
         init_end_time = time.time()
         self.logger.debug(f"BaseAPI: Total initialization took {init_end_time - init_start_time:.2f} seconds")
         self.logger.debug(f"BaseAPI: Final base_url: {self.base_url}")
-        self.logger.debug(f"BaseAPI: Final headers: {dict(self.session.headers)}")
-        self.logger.debug(f"BaseAPI: Final cookies: {dict(self.session.cookies)}")
+        self.logger.debug("BaseAPI: Final headers: %s", payload(self.session.headers))
+        self.logger.debug("BaseAPI: Final cookies: %s", payload(list(self.session.cookies.keys())))
     
     def _create_session(self) -> requests.Session:
         """
-        Create a requests session with retry strategy.
+        Create a requests session.
+        
+        The adapters do not retry: requests are retried by the shared retry
+        policy, which also enforces the cycle deadline and per-host budgets.
         
         Returns:
-            Session with configured retry strategy
+            Session without adapter-level retries
         """
         session = requests.Session()
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.DEFAULT_RETRY_TOTAL,
-            backoff_factor=self.DEFAULT_RETRY_BACKOFF_FACTOR,
-            status_forcelist=self.DEFAULT_RETRY_STATUS_FORCELIST,
-            allowed_methods=["GET", "POST"]  # Allow retries for GET and POST
-        )
-        
-        # Mount retry strategy to both HTTP and HTTPS
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=0)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
+        # Record or replay traffic if requested
+        http_cassette.mount(session)
+        
         return session
     
+    def _setup_auth(self) -> None:
+        """Reapply the headers created from the configured credentials."""
+        self.session.headers.update(self.headers)
+    
     def _validate_response(self, response: requests.Response) -> None:
         """
         Validate response and raise appropriate errors.
@@ -202,7 +220,8 @@ class BaseAPI(LoggerMixin):
             endpoint: API endpoint
             params: Query parameters
             data: Request body data
-            timeout: Request timeout (connection timeout, read timeout)
+            timeout: Request timeout (connection timeout, read timeout), the
+                retry policy's timeout if None; cut to the time left in the cycle
             validate_response: Whether to validate the response
             
         Returns:
@@ -217,18 +236,34 @@ class BaseAPI(LoggerMixin):
         start_time = time.time()
         url = urljoin(self.base_url, endpoint)
         
-        # Use default timeout if not specified
-        if timeout is None:
-            timeout = self.DEFAULT_TIMEOUT
-        
+        parsed_url = urlparse(url)
+        host = parsed_url.hostname or ''
+        endpoint_label = _endpoint_label(parsed_url.path)
+        status = 'error'
+        request_start = time.perf_counter()
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                timeout=timeout
-            )
+            with span('http', host=host, endpoint=endpoint_label, method=method.upper()) as request_span:
+                try:
+                    response = retry_policy.request(
+                        self.session, method, url, params=params, json=data, timeout=timeout
+                    )
+                    if self._should_reauthenticate(response):
+                        self.logger.info("BaseAPI: Stored session rejected, authenticating again")
+                        self._reauthenticate()
+                        response = retry_policy.request(
+                            self.session, method, url, params=params, json=data, timeout=timeout
+                        )
+                    status = str(response.status_code)
+                except requests.exceptions.Timeout:
+                    status = 'timeout'
+                    raise
+                finally:
+                    request_span.set_attribute('status', status)
+                    Metrics().record_time(
+                        'http_request',
+                        time.perf_counter() - request_start,
+                        {'host': host, 'endpoint': endpoint_label, 'method': method.upper(), 'status': status}
+                    )
             
             # Validate response if requested
             if validate_response:
@@ -236,6 +271,8 @@ class BaseAPI(LoggerMixin):
             
             # Parse and return response data
             result = self._parse_response(response)
+            if response.ok:
+                self._save_session()
             
             return result
             
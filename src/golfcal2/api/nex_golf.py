@@ -8,15 +8,18 @@ from urllib.parse import urljoin
 
 import requests
 
+from golfcal2 import http_cassette
 from golfcal2.models.mixins import APIError, APIResponseError, RequestHandlerMixin
 from golfcal2.services.auth_service import AuthService
-from golfcal2.utils.logging_utils import LoggerMixin
+from golfcal2.services.session_store import PersistentSessionMixin
+from golfcal2.utils.logging_utils import LoggerMixin, payload
+from golfcal2.utils.retry_policy import retry_policy
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
     from golfcal2.models.golf_club import GolfClub
 
-class NexGolfAPI(LoggerMixin, RequestHandlerMixin):
+class NexGolfAPI(LoggerMixin, RequestHandlerMixin, PersistentSessionMixin):
     """NexGolf API client implementation."""
     
     def __init__(self, base_url: str, auth_service: AuthService, club_details: dict[str, Any], membership: dict[str, Any] | Any, club: Optional['GolfClub'] = None):
@@ -38,7 +41,14 @@ class NexGolfAPI(LoggerMixin, RequestHandlerMixin):
             self.auth_details['cookie_name'] = 'JSESSIONID'
             
         self.club_details = club_details
-        self.session = requests.Session()
+        self.session = http_cassette.mount(requests.Session())
+        self._setup_session()
+        # Reuse the session of an earlier run instead of authenticating again
+        if not self._restore_session():
+            self._setup_auth_headers()
+    
+    def _setup_auth(self) -> None:
+        """Set up a fresh session from the configured credentials."""
         self._setup_session()
         self._setup_auth_headers()
     
@@ -68,12 +78,8 @@ class NexGolfAPI(LoggerMixin, RequestHandlerMixin):
         domain = self.base_url.split('//')[1].split('/')[0]  # Extract domain without path
         self.session.cookies.set('NGLOCALE', 'fi', domain=domain)
         
-        # Log headers for debugging (excluding sensitive values)
-        debug_headers = dict(self.session.headers)
-        for sensitive_key in ['X-Auth-Token', 'Cookie']:
-            if sensitive_key in debug_headers:
-                debug_headers[sensitive_key] = '***'
-        self.debug("Session headers", headers=debug_headers)
+        # Log headers for debugging (sensitive values are masked)
+        self.logger.debug("Session headers: %s", payload(self.session.headers))
     
     def _setup_auth_headers(self) -> None:
         """Setup authentication headers."""
@@ -104,13 +110,8 @@ class NexGolfAPI(LoggerMixin, RequestHandlerMixin):
                 self.session.headers.update(auth_headers)
                 
                 # Log actual headers being used (with sensitive data masked)
-                debug_headers = dict(self.session.headers)
-                debug_cookies = {name: '***' for name in self.session.cookies.keys()}
-                for sensitive_key in ['X-Auth-Token', 'Cookie']:
-                    if sensitive_key in debug_headers:
-                        debug_headers[sensitive_key] = '***'
-                self.logger.debug(f"Set up auth headers: {debug_headers}")
-                self.logger.debug(f"Set up cookies: {debug_cookies}")
+                self.logger.debug("Set up auth headers: %s", payload(self.session.headers))
+                self.logger.debug("Set up cookies: %s", payload(list(self.session.cookies.keys())))
             else:
                 self.logger.warning("No auth headers returned from auth service")
                 
@@ -126,18 +127,18 @@ class NexGolfAPI(LoggerMixin, RequestHandlerMixin):
         """Make an API request with proper error handling."""
         try:
             # Log actual request headers and cookies before making the request
-            debug_headers = dict(self.session.headers)
-            debug_cookies = {name: '***' for name in self.session.cookies.keys()}
-            for sensitive_key in ['X-Auth-Token', 'Cookie']:
-                if sensitive_key in debug_headers:
-                    debug_headers[sensitive_key] = '***'
-            self.logger.debug(f"Making request with headers: {debug_headers}")
-            self.logger.debug(f"Making request with cookies: {debug_cookies}")
+            self.logger.debug("Making request with headers: %s", payload(self.session.headers))
+            self.logger.debug("Making request with cookies: %s", payload(list(self.session.cookies.keys())))
             
             url = urljoin(self.base_url, endpoint)
-            response = self.session.request(method, url, **kwargs)
+            response = retry_policy.request(self.session, method, url, **kwargs)
+            if self._should_reauthenticate(response):
+                self.logger.info("Stored session rejected, authenticating again")
+                self._reauthenticate()
+                response = retry_policy.request(self.session, method, url, **kwargs)
             response.raise_for_status()
             result = response.json()
+            self._save_session()
             
             # Convert list responses to dict format
             if isinstance(result, list):
@@ -172,7 +173,7 @@ class NexGolfAPI(LoggerMixin, RequestHandlerMixin):
             }
             
             # Log headers for debugging
-            self.logger.debug(f"Session headers | Context: headers={dict(self.session.headers)}")
+            self.logger.debug("Session headers | Context: headers=%s", payload(self.session.headers))
             
             # Make request to get reservations using the correct endpoint
             response = self._make_request("GET", endpoint, params=params)
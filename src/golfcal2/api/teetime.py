@@ -8,6 +8,7 @@ from urllib.parse import urljoin
 
 import requests
 
+from golfcal2 import http_cassette
 from golfcal2.models.mixins import (
     APIAuthError,
     APIError,
@@ -16,7 +17,9 @@ from golfcal2.models.mixins import (
     RequestHandlerMixin,
 )
 from golfcal2.services.auth_service import AuthService
+from golfcal2.services.session_store import PersistentSessionMixin
 from golfcal2.utils.logging_utils import LoggerMixin
+from golfcal2.utils.retry_policy import retry_policy
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
@@ -26,7 +29,7 @@ class TeeTimeAPIError(Exception):
     """TeeTime API error."""
     pass
 
-class TeeTimeAPI(LoggerMixin, RequestHandlerMixin):
+class TeeTimeAPI(LoggerMixin, RequestHandlerMixin, PersistentSessionMixin):
     """TeeTime API client implementation."""
     
     def __init__(self, base_url: str, auth_service: AuthService, club_details: dict[str, Any], membership: dict[str, Any] | Any, club: Optional['GolfClub'] = None):
@@ -43,7 +46,13 @@ class TeeTimeAPI(LoggerMixin, RequestHandlerMixin):
             self.auth_details = getattr(membership, 'auth_details', {})
             
         self.club_details = club_details
-        self.session = requests.Session()
+        self.session = http_cassette.mount(requests.Session())
+        self._setup_session()
+        # The token is sent as a query parameter; reuse the cookies of earlier runs
+        self._restore_session()
+    
+    def _setup_auth(self) -> None:
+        """Set up a fresh session; the token is added to each request."""
         self._setup_session()
         
     def _setup_session(self) -> None:
@@ -71,9 +80,14 @@ class TeeTimeAPI(LoggerMixin, RequestHandlerMixin):
         """Make an API request with proper error handling."""
         try:
             url = urljoin(self.base_url, endpoint)
-            response = self.session.request(method, url, **kwargs)
+            response = retry_policy.request(self.session, method, url, **kwargs)
+            if self._should_reauthenticate(response):
+                self.logger.info("Stored session rejected, authenticating again")
+                self._reauthenticate()
+                response = retry_policy.request(self.session, method, url, **kwargs)
             response.raise_for_status()
             result = response.json()
+            self._save_session()
             
             # Convert list responses to dict format
             if isinstance(result, list):
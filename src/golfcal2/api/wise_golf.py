@@ -11,6 +11,8 @@ import requests
 from golfcal2.api.base_api import BaseAPI
 from golfcal2.models.mixins import APIError, APIResponseError
 from golfcal2.services.auth_service import AuthService
+from golfcal2.utils.logging_utils import payload
+from golfcal2.utils.retry_policy import retry_policy
 
 if TYPE_CHECKING:
     from golfcal2.models.golf_club import GolfClub
@@ -37,6 +39,12 @@ class BaseWiseGolfAPI(BaseAPI):
         self.auth_service = auth_service  # Set auth_service before super().__init__
         self.club = club
         super().__init__(base_url, auth_service, club_details, membership)
+        if not self._session_restored:
+            self._setup_auth_headers()
+    
+    def _setup_auth(self) -> None:
+        """Reapply the headers created from the configured credentials."""
+        super()._setup_auth()
         self._setup_auth_headers()
         
     def _setup_auth_headers(self) -> None:
@@ -122,7 +130,7 @@ class WiseGolfAPI(BaseWiseGolfAPI):
     def __init__(self, base_url: str, auth_service: AuthService, club_details: dict[str, Any], membership: dict[str, Any] | Any, club: Optional['GolfClub'] = None):
         """Initialize WiseGolf API client."""
         super().__init__(base_url, auth_service, club_details, membership, club)
-        self.logger.debug(f"WiseGolfAPI initialized with headers: {dict(self.session.headers)}")
+        self.logger.debug("WiseGolfAPI initialized with headers: %s", payload(self.session.headers))
     
     def get_reservations(self) -> list[dict[str, Any]]:
         """Get user's reservations."""
@@ -134,7 +142,7 @@ class WiseGolfAPI(BaseWiseGolfAPI):
             
             # Get raw response from request
             raw_response = self._make_request("GET", "", params=params)
-            self.logger.debug(f"WiseGolfAPI response data: {raw_response}")
+            self.logger.debug("WiseGolfAPI response data: %s", payload(raw_response))
             
             # Validate the response data structure
             if not isinstance(raw_response, dict):
@@ -197,7 +205,7 @@ class WiseGolf0API(BaseWiseGolfAPI):
             self.logger.warning("No restUrl found in club_details")
             
         self.logger.debug("WiseGolf0API final headers:")
-        self.logger.debug(f"Final headers: {dict(self.session.headers)}")
+        self.logger.debug("Final headers: %s", payload(self.session.headers))
     
     def _setup_auth_headers(self) -> None:
         """Setup authentication headers specific to WiseGolf0."""
@@ -227,7 +235,7 @@ class WiseGolf0API(BaseWiseGolfAPI):
             
             # Update session headers
             self.session.headers.update(headers)
-            self.logger.debug(f"Set up auth headers: {dict(self.session.headers)}")
+            self.logger.debug("Set up auth headers: %s", payload(self.session.headers))
                 
         except Exception as e:
             self.logger.error(f"Failed to set up auth headers: {e}")
@@ -282,14 +290,10 @@ class WiseGolf0API(BaseWiseGolfAPI):
             full_url = urljoin(self.rest_url, endpoint)
             
             self.logger.debug(f"Fetching players from {full_url} with params: {params}")
-            self.logger.debug(f"Using headers: {dict(self.session.headers)}")
+            self.logger.debug("Using headers: %s", payload(self.session.headers))
             
             # Make the request using the existing session
-            response = self.session.get(
-                full_url,
-                params=params,
-                timeout=self.DEFAULT_TIMEOUT
-            )
+            response = retry_policy.request(self.session, 'GET', full_url, params=params)
             
             # Validate response status code
             if response.status_code != 200:
@@ -299,7 +303,7 @@ class WiseGolf0API(BaseWiseGolfAPI):
             # Parse JSON response
             try:
                 data = response.json()
-                self.logger.debug(f"Got player data response: {data}")
+                self.logger.debug("Got player data response: %s", payload(data))
             except ValueError as e:
                 self.logger.error(f"Invalid JSON in player response: {response.text}")
                 raise WiseGolfResponseError(f"Invalid JSON response: {e!s}")
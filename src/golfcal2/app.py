@@ -5,14 +5,12 @@ from flask import Flask
 from flask_cors import CORS
 
 from .config import Config
+from .config.logging import setup_logging
 from .config.settings import ConfigurationManager
+from .context import get_context, init_context
 from .services.calendar_service import CalendarService
 from .services.weather_service import WeatherService
-from .utils.logging_utils import setup_logging
 
-# Global service cache
-_weather_service_cache: WeatherService | None = None
-_calendar_service_cache: CalendarService | None = None
 
 def create_app(config_file: str | None = None, dev_mode: bool = False, verbose: bool = False) -> Flask:
     """Create and configure the Flask application."""
@@ -27,26 +25,21 @@ def create_app(config_file: str | None = None, dev_mode: bool = False, verbose:
     # Set up logging with proper flags
     setup_logging(config, dev_mode=dev_mode, verbose=verbose)
     
-    # Initialize services with cached configuration
+    # Services are shared by all requests and rebuilt when the configuration changes
+    init_context(config, dev_mode=dev_mode)
+    
+    @app.before_request
+    def reload_changed_config() -> None:
+        get_context().reload_if_changed()
+    
     def get_weather_service() -> WeatherService:
-        global _weather_service_cache
-        if not _weather_service_cache:
-            _weather_service_cache = WeatherService(
-                config=config.global_config.__dict__ if hasattr(config.global_config, '__dict__') else dict(config.global_config)
-            )
-        return _weather_service_cache
+        return get_context().weather_service
     
     def get_calendar_service() -> CalendarService:
-        global _calendar_service_cache
-        if not _calendar_service_cache:
-            _calendar_service_cache = CalendarService(
-                config=config,
-                weather_service=get_weather_service()
-            )
-        return _calendar_service_cache
+        return get_context().calendar_service
     
     # Add service getters to app context
     app.get_weather_service = get_weather_service
     app.get_calendar_service = get_calendar_service
     
-    return app 
\ No newline at end of file
+    return app 
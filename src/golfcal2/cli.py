@@ -6,6 +6,8 @@ import argparse
 import json
 import os
 import sys
+import time
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Protocol, cast
@@ -14,18 +16,32 @@ from zoneinfo import ZoneInfo
 from icalendar import Calendar
 from tabulate import tabulate
 
+from golfcal2 import http_cassette
 from golfcal2.config.error_aggregator import init_error_aggregator
 from golfcal2.config.logging import setup_logging
 from golfcal2.config.logging_config import ErrorAggregationConfig
 from golfcal2.config.settings import ConfigurationManager
 from golfcal2.config.types import AppConfig, UserConfig
+from golfcal2.context import get_context, init_context
+from golfcal2.loadtest_server import LoadTestConfig, LoadTestServer
 from golfcal2.models.reservation import Reservation
 from golfcal2.models.user import User
 from golfcal2.services.calendar_service import CalendarService
+from golfcal2.services.conflict_service import (
+    IMPORTED,
+    RESERVATION,
+    ScheduledItem,
+    detect_conflicts,
+    external_event_items,
+    reservation_items,
+)
+from golfcal2.services.csv_import_index import CSVImportIndex
 from golfcal2.services.csv_import_service import CSVImportService
 from golfcal2.services.reservation_service import ReservationService
+from golfcal2.services.reservation_snapshots import reservation_snapshots
 from golfcal2.services.weather_database import WeatherResponseCache
 from golfcal2.services.weather_service import WeatherService
+from golfcal2.utils.circuit_breaker import circuit_breakers
 from golfcal2.utils.cli_utils import (
     ArgumentValidator,
     CLIBuilder,
@@ -34,8 +50,11 @@ from golfcal2.utils.cli_utils import (
     CommandCategory,
     CommandRegistry,
     create_command_group,
+    run_command_handler,
 )
+from golfcal2.utils.host_limiter import host_limiter
 from golfcal2.utils.logging_utils import get_logger
+from golfcal2.utils.retry_policy import retry_policy
 
 
 class GolfClubProtocol(Protocol):
@@ -119,7 +138,7 @@ class ListCommands:
                 return 1
             
             # Initialize services
-            reservation_service = ReservationService(username, ctx.config)
+            reservation_service = get_context().reservation_service(username)
             
             # Get courses
             if ctx.args.all:
@@ -173,7 +192,7 @@ class ListCommands:
         """Manage weather cache."""
         try:
             # Initialize services
-            reservation_service = ReservationService(ctx.args.user or ctx.config.get('default_user'), ctx.config)
+            reservation_service = get_context().reservation_service(ctx.args.user or ctx.config.get('default_user'))
             
             # Handle weather cache listing
             entries = reservation_service.list_weather_cache()
@@ -205,6 +224,88 @@ class ListCommands:
             ctx.logger.error(f"Failed to manage weather cache: {e!s}")
             return 1
 
+    @staticmethod
+    @CommandRegistry.register(
+        name='conflicts',
+        help_text='Report overlapping reservations, external events and imported events',
+        category=CommandCategory.LIST,
+        options=[
+            CLIOptionFactory.create_format_option(),
+            {
+                'name': '--days',
+                'type': int,
+                'default': 365,
+                'help': 'Number of days ahead to check (default: 365)'
+            },
+            {
+                'name': '--csv',
+                'action': 'append',
+                'default': [],
+                'help': 'CSV export whose events are checked as well; can be given more than once'
+            },
+            {
+                'name': '--cross-user',
+                'action': 'store_true',
+                'help': 'Also report players booked into overlapping flights of different users'
+            }
+        ],
+        parent_command='list'
+    )
+    def list_conflicts(ctx: CLIContext) -> int:
+        """Report conflicting bookings of one or all users."""
+        try:
+            users: list[str] = [ctx.args.user] if ctx.args.user else list(ctx.config.users.keys())
+            if not users:
+                ctx.logger.error("No users configured")
+                return 1
+            
+            context = get_context()
+            window_start = datetime.now(ZoneInfo(ctx.config.timezone))
+            window_end = window_start + timedelta(days=ctx.args.days)
+            external_events = context.external_event_service.load_events(ctx.args.dev)
+            
+            items: list[ScheduledItem] = []
+            for username in users:
+                reservations = context.reservation_service(username).list_reservations(days=0)
+                items.extend(reservation_items(reservations, RESERVATION, window_start, window_end))
+                items.extend(external_event_items(external_events, username, window_start, window_end))
+            
+            if ctx.args.csv:
+                username = ctx.args.user or ctx.config.get('default_user') or users[0]
+                user = User.from_config(username, dict(ctx.config.users.get(username) or {'memberships': []}))
+                csv_service = CSVImportService(timezone=ctx.config.timezone)
+                for file_path in ctx.args.csv:
+                    imported = csv_service.import_from_csv(file_path=file_path, user=user)
+                    items.extend(reservation_items(imported, IMPORTED, window_start, window_end))
+            
+            conflicts = detect_conflicts(items, cross_user=ctx.args.cross_user)
+            
+            if ctx.args.format == 'json':
+                print(json.dumps([conflict.to_dict() for conflict in conflicts], indent=2))
+                return 0
+            
+            if not conflicts:
+                print(f"No conflicts in the next {ctx.args.days} days ({len(items)} bookings checked)")
+                return 0
+            
+            rows = [
+                [
+                    ', '.join(conflict.people),
+                    conflict.first.start.strftime('%Y-%m-%d %H:%M'),
+                    f"{conflict.first.title} ({conflict.first.source})",
+                    f"{conflict.second.title} ({conflict.second.source})",
+                    int(conflict.overlap.total_seconds() // 60)
+                ]
+                for conflict in conflicts
+            ]
+            print(f"\n{len(conflicts)} conflicts in the next {ctx.args.days} days ({len(items)} bookings checked)")
+            print(tabulate(rows, headers=['People', 'Start', 'Booking', 'Overlaps with', 'Minutes']))
+            return 0
+            
+        except Exception as e:
+            ctx.logger.error(f"Failed to check conflicts: {e!s}")
+            return 1
+
 @create_command_group('get', 'Get commands')
 class GetCommands:
     """Get command implementations."""
@@ -342,8 +443,8 @@ class ProcessCommands:
                         continue
                     
                     user: User = User.from_config(username, dict(user_config))
-                    reservation_service: ReservationService = ReservationService(username, ctx.config)
-                    calendar_service: CalendarService = CalendarService(ctx.config, dev_mode=ctx.args.dev)
+                    reservation_service: ReservationService = get_context().reservation_service(username)
+                    calendar_service: CalendarService = get_context().calendar_service
                     calendar_service.list_only = ctx.args.list_only  # Set list_only flag
                     
                     # Get reservations
@@ -574,8 +675,8 @@ class CheckCommands:
                             success = False
                     
                     # Initialize services for basic checks
-                    reservation_service: ReservationService = ReservationService(username, ctx.config)
-                    calendar_service: CalendarService = CalendarService(ctx.config)
+                    reservation_service: ReservationService = get_context().reservation_service(username)
+                    calendar_service: CalendarService = get_context().calendar_service
                     
                     if not reservation_service.check_config():
                         ctx.logger.error(f"Reservation service configuration check failed for user {username}")
@@ -700,6 +801,11 @@ class ImportCommands:
                 'name': '--temp-user',
                 'type': str,
                 'help': 'Create a temporary user with this name (if not in users.json)'
+            },
+            {
+                'name': '--full',
+                'action': 'store_true',
+                'help': 'Forget earlier imports of the user and import every row again'
             }
         ],
         parent_command='import'
@@ -754,10 +860,16 @@ class ImportCommands:
 
             # Initialize services
             csv_service: CSVImportService = CSVImportService(timezone=ctx.args.timezone or ctx.config.timezone)
-            calendar_service: CalendarService = CalendarService(ctx.config)
+            calendar_service: CalendarService = get_context().calendar_service
 
-            # Import reservations from CSV
-            reservations: list[Reservation] = csv_service.import_from_csv(
+            # Update the import index, parsing only new and changed rows
+            data_dir = Path(ctx.config.get('data_dir', 'data'))
+            data_dir.mkdir(parents=True, exist_ok=True)
+            index = CSVImportIndex(data_dir / 'csv_import_index.db')
+            if ctx.args.full:
+                index.clear(username)
+            delta = csv_service.sync_index(
+                index,
                 file_path=ctx.args.file,
                 user=user,
                 recurring_until=recurring_until,
@@ -765,16 +877,34 @@ class ImportCommands:
                 timezone=ctx.args.timezone,
                 delimiter=ctx.args.delimiter
             )
+            print(f"\nChanges since last import: {delta}")
 
-            if not reservations:
-                ctx.logger.warning("No events found in CSV file")
+            if not delta:
+                if delta.unchanged:
+                    print("Calendar is up to date")
+                else:
+                    ctx.logger.warning("No events found in CSV file")
                 return 0
 
-            # Create calendar with imported events
-            calendar_service.process_user_reservations(user, reservations)
+            # Stream the indexed reservations straight into the calendar file
+            imported = 0
+
+            def counted() -> Iterator[Reservation]:
+                nonlocal imported
+                for reservation in csv_service.indexed_reservations(
+                    index,
+                    user,
+                    recurring_until=recurring_until,
+                    recurrence_end=recurrence_end,
+                    timezone=ctx.args.timezone
+                ):
+                    imported += 1
+                    yield reservation
+
+            calendar_service.write_user_reservations(user, counted())
 
             # Print summary
-            print(f"\nImported {len(reservations)} events")
+            print(f"\nImported {imported} events")
             if recurring_until:
                 end_date = recurrence_end if recurrence_end else recurring_until
                 print(f"Created weekly recurring events until {end_date.date()}")
@@ -787,6 +917,143 @@ class ImportCommands:
             ctx.logger.error(f"Failed to import CSV: {e!s}")
             return 1
 
+@create_command_group('loadtest-server', 'Load testing commands', CommandCategory.DEVELOP)
+class LoadTestCommands:
+    """Load testing command implementations."""
+    
+    @staticmethod
+    @CommandRegistry.register(
+        name='loadtest-server',
+        help_text='Run a local stand-in for the CRM and weather APIs with synthetic data',
+        category=CommandCategory.DEVELOP,
+        options=[
+            {
+                'name': '--host',
+                'type': str,
+                'default': '127.0.0.1',
+                'help': 'Host to bind to (default: 127.0.0.1)'
+            },
+            {
+                'name': '--port',
+                'type': int,
+                'default': 8090,
+                'help': 'Port to listen on (default: 8090)'
+            },
+            {
+                'name': '--users',
+                'type': int,
+                'default': 100,
+                'validator': lambda x: x > 0,
+                'help': 'Number of simulated users (default: 100)'
+            },
+            {
+                'name': '--reservations',
+                'type': int,
+                'default': 3,
+                'validator': lambda x: x >= 0,
+                'help': 'Reservations per user and CRM (default: 3)'
+            },
+            {
+                'name': '--latency-ms',
+                'type': float,
+                'default': 0.0,
+                'validator': lambda x: x >= 0,
+                'help': 'Delay added to every API response in milliseconds (default: 0)'
+            },
+            {
+                'name': '--jitter-ms',
+                'type': float,
+                'default': 0.0,
+                'validator': lambda x: x >= 0,
+                'help': 'Random variation of the delay in milliseconds (default: 0)'
+            },
+            {
+                'name': '--rate-429',
+                'type': float,
+                'default': 0.0,
+                'validator': lambda x: 0 <= x <= 1,
+                'help': 'Fraction of API requests answered with 429 Too Many Requests (default: 0)'
+            },
+            {
+                'name': '--rate-5xx',
+                'type': float,
+                'default': 0.0,
+                'validator': lambda x: 0 <= x <= 1,
+                'help': 'Fraction of API requests answered with a 500, 502 or 503 error (default: 0)'
+            },
+            {
+                'name': '--seed',
+                'type': int,
+                'default': 0,
+                'help': 'Seed for the synthetic data and injected faults (default: 0)'
+            },
+            {
+                'name': '--workers',
+                'type': int,
+                'default': 32,
+                'validator': lambda x: x > 0,
+                'help': 'Number of concurrently handled connections (default: 32)'
+            },
+            {
+                'name': '--print-clubs',
+                'action': 'store_true',
+                'help': 'Print clubs.json entries pointing at the server and exit'
+            }
+        ]
+    )
+    def loadtest_server(ctx: CLIContext) -> int:
+        """Run the load test server until interrupted."""
+        if ctx.args.rate_429 + ctx.args.rate_5xx > 1:
+            ctx.logger.error("--rate-429 and --rate-5xx must not add up to more than 1")
+            return 1
+        
+        config = LoadTestConfig(
+            users=ctx.args.users,
+            reservations_per_user=ctx.args.reservations,
+            latency_ms=ctx.args.latency_ms,
+            jitter_ms=ctx.args.jitter_ms,
+            rate_429=ctx.args.rate_429,
+            rate_5xx=ctx.args.rate_5xx,
+            seed=ctx.args.seed,
+            timezone=ctx.config.timezone
+        )
+        server = LoadTestServer(ctx.args.host, ctx.args.port, config, max_workers=ctx.args.workers)
+        
+        if ctx.args.print_clubs:
+            print(json.dumps(server.clubs_config(), indent=2, ensure_ascii=False))
+            return 0
+        
+        try:
+            server.start()
+        except OSError as e:
+            ctx.logger.error(f"Failed to start load test server: {e}")
+            return 1
+        
+        print(f"Load test server listening on {server.base_url}")
+        print("Weather services follow these environment variables:")
+        for name, value in server.weather_environment().items():
+            print(f"  {name}={value}")
+        print(f"Request counts: {server.base_url}/_loadtest/stats (Ctrl-C to stop)")
+        
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        
+        stats = server.stats()
+        server.stop()
+        
+        rows = [
+            [endpoint, status, count]
+            for endpoint, statuses in stats['endpoints'].items()
+            for status, count in statuses.items()
+        ]
+        print(f"\n{stats['total']} requests in {stats['elapsed_seconds']:.1f} s")
+        if rows:
+            print(tabulate(rows, headers=['Endpoint', 'Status', 'Requests'], tablefmt='simple'))
+        return 0
+
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser using the new CLI builder."""
     builder = CLIBuilder(
@@ -828,6 +1095,26 @@ def main() -> int:
         )
         init_error_aggregator(error_config)
         
+        # Share services between the commands of this run
+        init_context(config, dev_mode=args.dev)
+        
+        # Cap concurrent requests per API host
+        host_limiter.configure(int(config.global_config.get('http', {}).get('max_requests_per_host', 2)))
+        
+        # Bound the run by the cycle deadline and per-host retry budgets
+        retry_policy.configure(config.global_config.get('http', {}))
+        retry_policy.start_cycle()
+        
+        # Fail fast on CRM hosts known to be down, keeping their saved reservations
+        circuit_breakers.configure(config.global_config.get('http', {}), config.global_config.get('data_dir', 'data'))
+        reservation_snapshots.configure(config.global_config.get('data_dir', 'data'))
+        
+        # Record or replay API traffic if requested
+        if args.record_http:
+            http_cassette.configure('record', args.record_http)
+        elif args.replay_http:
+            http_cassette.configure('replay', args.replay_http, replay_latency=args.replay_latency)
+        
         # Create execution context
         ctx = CLIContext(
             args=args,
@@ -855,8 +1142,8 @@ def main() -> int:
                 logger.error(error)
             return 1
         
-        # Execute command handler with context
-        return command.handler(ctx)
+        # Execute command handler with context, under the profiler if requested
+        return run_command_handler(ctx, command.handler, command_name)
             
     except Exception:
         logger = get_logger(__name__)
@@ -1,15 +1,73 @@
-"""Error aggregation and reporting utilities."""
+"""Error aggregation and reporting utilities.
+
+Errors are grouped by a fingerprint of their type and code location, so
+counting a repeated error costs a dictionary lookup. Only the first few
+occurrences of a group keep their exception, and tracebacks are formatted
+when the group is reported rather than when the error happens. Groups are
+reported when they reach the count or age threshold, or by a timer started
+when the first error of a reporting period arrives.
+"""
 
 import logging
 import threading
-import time
 import traceback
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import TracebackType
 
 from golfcal2.config.logging_config import ErrorAggregationConfig
 
+# A formatted stack trace, a traceback object or the exception itself
+StackTrace = str | TracebackType | BaseException
+
+
+def error_fingerprint(message: str, stack_trace: StackTrace | None = None) -> str:
+    """Get the grouping key of an error.
+    
+    Exceptions are keyed by type, the frame that handled them and the frame
+    that raised them, so the same failure groups together whatever its
+    message. Errors without a traceback are keyed by message.
+    
+    Args:
+        message: Error message
+        stack_trace: Exception, traceback or formatted stack trace
+    
+    Returns:
+        Fingerprint of the error
+    """
+    if isinstance(stack_trace, BaseException):
+        error_type = type(stack_trace).__name__
+        tb = stack_trace.__traceback__
+    elif isinstance(stack_trace, TracebackType):
+        error_type = 'traceback'
+        tb = stack_trace
+    else:
+        return message
+    if tb is None:
+        return f"{error_type}: {message}"
+    
+    handled_at = f"{tb.tb_frame.f_code.co_filename}:{tb.tb_lineno}"
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    raised_at = f"{tb.tb_frame.f_code.co_filename}:{tb.tb_lineno}"
+    return f"{error_type}@{handled_at}<{raised_at}"
+
+
+def format_stack_trace(stack_trace: StackTrace) -> str:
+    """Format a stored stack trace.
+    
+    Args:
+        stack_trace: Exception, traceback or formatted stack trace
+    
+    Returns:
+        Formatted stack trace
+    """
+    if isinstance(stack_trace, BaseException):
+        return ''.join(traceback.format_exception(type(stack_trace), stack_trace, stack_trace.__traceback__))
+    if isinstance(stack_trace, TracebackType):
+        return ''.join(traceback.format_tb(stack_trace))
+    return str(stack_trace)
+
 
 @dataclass
 class ErrorGroup:
@@ -19,15 +77,21 @@ class ErrorGroup:
     first_seen: datetime = field(default_factory=datetime.now)
     last_seen: datetime = field(default_factory=datetime.now)
     services: set[str] = field(default_factory=set)
-    stack_traces: set[str] = field(default_factory=set)
+    stack_traces: list[StackTrace] = field(default_factory=list)
     
-    def update(self, service: str, stack_trace: str | None = None) -> None:
-        """Update error group with new occurrence."""
+    def update(self, service: str, stack_trace: StackTrace | None = None, max_stack_traces: int = 3) -> None:
+        """Update error group with new occurrence.
+        
+        Args:
+            service: Service where error occurred
+            stack_trace: Exception, traceback or formatted stack trace
+            max_stack_traces: Number of occurrences whose stack trace is kept
+        """
         self.count += 1
         self.last_seen = datetime.now()
         self.services.add(service)
-        if stack_trace:
-            self.stack_traces.add(stack_trace)
+        if stack_trace is not None and len(self.stack_traces) < max_stack_traces:
+            self.stack_traces.append(stack_trace)
 
 class ErrorAggregator:
     """Aggregates and reports errors across services."""
@@ -38,101 +102,105 @@ class ErrorAggregator:
         Args:
             config: Error aggregation configuration
         """
-        self._errors: defaultdict[str, ErrorGroup] = defaultdict(ErrorGroup)
+        self._errors: dict[str, ErrorGroup] = {}
         self._lock = threading.Lock()
         self._config = config
-        self._last_report = datetime.now()
+        self._timer: threading.Timer | None = None
+        self._stopped = False
         
         # Initialize logger
         self.logger = logging.getLogger('error_aggregator')
-        
-        # Start reporting thread if enabled
-        self._stop_flag = threading.Event()
-        if config.enabled:
-            self._report_thread = threading.Thread(target=self._periodic_report)
-            self._report_thread.daemon = True
-            self._report_thread.start()
     
     def add_error(
         self,
         message: str,
         service: str,
-        stack_trace: str | None = None
+        stack_trace: StackTrace | None = None
     ) -> None:
         """Add error occurrence to aggregator.
         
+        Pass the exception rather than a formatted traceback: it is only
+        formatted if it is among the first occurrences of its group.
+        
         Args:
             message: Error message
             service: Service where error occurred
-            stack_trace: Optional stack trace
+            stack_trace: Exception, traceback or formatted stack trace
         """
         if not self._config.enabled:
             return
             
+        key = error_fingerprint(message, stack_trace)
         with self._lock:
-            if message not in self._errors:
-                self._errors[message] = ErrorGroup(message=message)
-            self._errors[message].update(service, stack_trace)
+            error_group = self._errors.get(key)
+            if error_group is None:
+                error_group = self._errors[key] = ErrorGroup(message=message)
+            error_group.update(service, stack_trace, self._config.max_stack_traces)
             
             # Check if immediate report needed
-            error_group = self._errors[message]
             if (
                 error_group.count >= self._config.error_threshold or
-                (datetime.now() - error_group.first_seen).seconds >= self._config.time_threshold
+                (error_group.last_seen - error_group.first_seen).total_seconds() >= self._config.time_threshold
             ):
-                self._report_error_group(message, error_group)
-                del self._errors[message]
+                del self._errors[key]
+            else:
+                error_group = None
+                self._schedule_flush()
+        
+        if error_group is not None:
+            self._report_error_group(error_group)
     
-    def _report_error_group(self, message: str, error_group: ErrorGroup) -> None:
-        """Report a single error group."""
+    def _schedule_flush(self) -> None:
+        """Start the report timer unless running; the caller holds the lock."""
+        if self._timer is None and not self._stopped:
+            self._timer = threading.Timer(self._config.report_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def flush(self) -> None:
+        """Report all accumulated errors."""
+        with self._lock:
+            groups = list(self._errors.values())
+            self._errors.clear()
+            self._timer = None
+        for group in groups:
+            self._report_error_group(group)
+    
+    def _report_error_group(self, error_group: ErrorGroup) -> None:
+        """Report a single error group, formatting its stack traces."""
         self.logger.error(
-            message,
-            extra={"error_count": error_group.count}
+            error_group.message,
+            extra={
+                "error_count": error_group.count,
+                "services": sorted(error_group.services)
+            }
         )
-        if error_group.stack_traces:
-            for trace in error_group.stack_traces:
-                if trace:  # Only log non-empty traces
-                    try:
-                        # Format the traceback if it's a traceback object
-                        if hasattr(trace, 'tb_frame'):
-                            trace_str = ''.join(traceback.format_tb(trace))
-                        else:
-                            trace_str = str(trace)
-                        if trace_str.strip():  # Only log non-empty formatted traces
-                            self.logger.error(
-                                "Stack trace:",
-                                extra={"stack_trace": trace_str}
-                            )
-                    except Exception as e:
-                        self.logger.error(f"Failed to format traceback: {e!s}")
-    
-    def _periodic_report(self) -> None:
-        """Periodically report all accumulated errors."""
-        while not self._stop_flag.is_set():
-            time.sleep(1)  # Check every second
-            
-            now = datetime.now()
-            if (now - self._last_report).seconds >= self._config.report_interval:
-                with self._lock:
-                    for message, group in self._errors.items():
-                        self._report_error_group(message, group)
-                    self._errors.clear()
-                    self._last_report = now
+        reported = set()
+        for trace in error_group.stack_traces:
+            try:
+                trace_str = format_stack_trace(trace)
+            except Exception as e:
+                self.logger.error(f"Failed to format traceback: {e!s}")
+                continue
+            if trace_str.strip() and trace_str not in reported:
+                reported.add(trace_str)
+                self.logger.error(
+                    "Stack trace:",
+                    extra={"stack_trace": trace_str}
+                )
     
     def shutdown(self) -> None:
         """Shutdown aggregator and report remaining errors."""
         if not self._config.enabled:
             return
             
-        self._stop_flag.set()
-        if hasattr(self, '_report_thread'):
-            self._report_thread.join()
+        with self._lock:
+            self._stopped = True
+            if self._timer is not None:
+                self._timer.cancel()
         
         # Report any remaining errors
-        with self._lock:
-            for message, group in self._errors.items():
-                self._report_error_group(message, group)
-            self._errors.clear()
+        self.flush()
 
 # Global error aggregator instance
 _error_aggregator: ErrorAggregator | None = None
@@ -162,14 +230,14 @@ def get_error_aggregator() -> ErrorAggregator:
 def aggregate_error(
     message: str,
     service: str,
-    stack_trace: str | None = None
+    stack_trace: StackTrace | None = None
 ) -> None:
     """Add error to global aggregator.
     
     Args:
         message: Error message
         service: Service where error occurred
-        stack_trace: Optional stack trace
+        stack_trace: Exception, traceback or formatted stack trace
     """
     aggregator = get_error_aggregator()
     aggregator.add_error(message, service, stack_trace) 
\ No newline at end of file
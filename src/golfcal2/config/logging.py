@@ -1,18 +1,35 @@
 """Logging configuration utilities."""
 
+import atexit
+import copy
 import json
 import logging
 import logging.config
 import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from golfcal2.config.logging_config import LoggingConfig
+from golfcal2.config.logging_config import LoggingConfig, load_logging_config
 from golfcal2.config.logging_filters import SensitiveDataFilter
 from golfcal2.config.types import AppConfig
+from golfcal2.metrics import Metrics
+from golfcal2.utils import logging_utils
+
+__all__ = [
+    'DroppingQueueHandler',
+    'load_logging_config',
+    'setup_logging',
+]
+
+# Records waiting for the background writer before new ones are dropped
+DEFAULT_QUEUE_SIZE = 10000
+
+# Background writer of the current logging setup
+_queue_listener: logging.handlers.QueueListener | None = None
 
 
 class JsonFormatter(logging.Formatter):
@@ -238,6 +255,55 @@ def get_service_logger(service_name: str, config: LoggingConfig, global_level: i
     
     return logger
 
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks the logging thread.
+    
+    Records are handed to a QueueListener thread with only their message
+    rendered, so formatting, JSON serialization and journald/file I/O happen
+    off the calling thread. When the bounded queue is full the record is
+    dropped and counted instead of stalling the caller.
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        """Initialize handler.
+        
+        Args:
+            log_queue: Bounded queue read by the listener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass a shallow copy on with its message rendered.
+        
+        Arguments such as ``payload(self.session.headers)`` refer to live
+        objects, so they are rendered now to log their state at the call
+        rather than whatever the caller changed them to before the listener
+        gets to the record. Records reaching the handler have passed the
+        level check, so arguments of disabled levels are still never rendered.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            Metrics().increment('log_records_dropped', labels={'level': record.levelname})
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the background writer."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 def init_error_aggregator(config: dict[str, Any] | None = None) -> None:
     """Initialize error aggregator with given configuration.
     
@@ -247,29 +313,55 @@ def init_error_aggregator(config: dict[str, Any] | None = None) -> None:
     # Currently a placeholder - can be implemented later if error aggregation is needed
     pass
 
-def setup_logging(config: AppConfig | None = None, dev_mode: bool = False, verbose: bool = False, log_file: str | None = None) -> None:
-    """Set up logging configuration."""
+def setup_logging(
+    config: AppConfig | None = None,
+    dev_mode: bool = False,
+    verbose: bool = False,
+    log_file: str | None = None
+) -> None:
+    """Set up logging configuration.
+    
+    Unless ``logging.async`` is false in config.yaml, the handlers run on a
+    background thread fed by a bounded queue (``logging.queue_size``), and
+    ``logging.payload_limit`` caps the size of logged API payloads.
+    
+    Args:
+        config: Application configuration
+        dev_mode: Whether to run in development mode
+        verbose: Whether to log at DEBUG level
+        log_file: Optional file to write all records to
+    """
+    global _queue_listener
+    settings: dict[str, Any] = {}
+    if config is not None:
+        global_config = getattr(config, 'global_config', config)
+        if isinstance(global_config, dict):
+            settings = global_config.get('logging', {}) or {}
+    
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
     
-    # Clear any existing handlers
+    # Clear any existing handlers, flushing records queued by an earlier setup
+    _stop_queue_listener()
     root_logger.handlers.clear()
+    handlers: list[logging.Handler] = []
     
     # Create console handler with colored output
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
     console_handler.setFormatter(ColoredFormatter())
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # Try to set up journald logging, but don't fail if not available
+    journald_available = True
     try:
         from golfcal2.config.logging_handlers import JournaldHandler
         journald_handler = JournaldHandler()
         journald_handler.setLevel(logging.INFO)
-        root_logger.addHandler(journald_handler)
+        handlers.append(journald_handler)
     except ImportError:
-        root_logger.warning("systemd module not available, journald logging disabled")
+        journald_available = False
     
     # Add file handler if log file is specified
     if log_file:
@@ -278,7 +370,21 @@ def setup_logging(config: AppConfig | None = None, dev_mode: bool = False, verbo
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         ))
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    logging_utils.PAYLOAD_LIMIT = int(settings.get('payload_limit', logging_utils.PAYLOAD_LIMIT))
+    
+    if settings.get('async', True):
+        log_queue: queue.Queue = queue.Queue(maxsize=int(settings.get('queue_size', DEFAULT_QUEUE_SIZE)))
+        root_logger.addHandler(DroppingQueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+    
+    if not journald_available:
+        root_logger.warning("systemd module not available, journald logging disabled")
     
     # Set up error aggregator
     init_error_aggregator() 
\ No newline at end of file
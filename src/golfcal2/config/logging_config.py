@@ -82,6 +82,7 @@ class ErrorAggregationConfig:
     error_threshold: int
     time_threshold: int
     categorize_by: list[str]
+    max_stack_traces: int = 3
 
 @dataclass
 class JournaldConfig:
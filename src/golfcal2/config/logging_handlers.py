@@ -90,13 +90,9 @@ class AggregatingErrorHandler(logging.Handler):
             # Extract service name from logger hierarchy
             service = record.name.split('.')[2] if len(record.name.split('.')) > 2 else 'unknown'
             
-            # Get stack trace if available
-            stack_trace: str | None = None
-            if record.exc_info:
-                stack_trace = ''.join(traceback.format_exception(*record.exc_info))
-            
-            # Aggregate the error
-            aggregate_error(record.getMessage(), service, stack_trace)
+            # Aggregate the error with its exception, formatted only when reported
+            exception = record.exc_info[1] if record.exc_info else None
+            aggregate_error(record.getMessage(), service, exception)
             
         except Exception:
             self.handleError(record) 
\ No newline at end of file
@@ -73,9 +73,9 @@ class ConfigurationManager:
         return self._config
     
     def reload_config(self) -> AppConfig:
-        """Force reload configuration."""
+        """Force reload configuration from the directory it was loaded from."""
         self._config = None
-        return self.load_config()
+        return self.load_config(str(self._config_path) if self._config_path else None)
 
 def _get_config_path(config_dir: str | None = None) -> Path:
     """Get configuration directory path."""
@@ -0,0 +1,251 @@
+"""Long-lived application context shared by the CLI, the service and the web app.
+
+The context owns the services that are expensive to construct: HTTP sessions,
+authentication strategies, static club data and weather cache connections
+survive across processing cycles instead of being rebuilt for every user.
+Services are created on first use and dropped when the configuration changes
+on disk, so the next use picks up the new settings.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from golfcal2.config.settings import AppConfig, ConfigurationManager
+from golfcal2.metrics import Metrics
+from golfcal2.services.auth_service import AuthService
+from golfcal2.services.calendar_service import CalendarService
+from golfcal2.services.external_event_service import ExternalEventService
+from golfcal2.services.notification_service import NotificationService
+from golfcal2.services.reservation_service import ReservationService
+from golfcal2.services.weather_service import WeatherService
+from golfcal2.services.wise_golf_discovery_service import WiseGolfDiscoveryService
+from golfcal2.utils.logging_utils import get_logger
+
+T = TypeVar('T')
+
+# Files whose changes trigger a reload
+CONFIG_FILES = ('config.yaml', 'users.json', 'clubs.json')
+
+
+class AppContext:
+    """Registry of long-lived, lazily created services."""
+    
+    def __init__(
+        self,
+        config: AppConfig,
+        dev_mode: bool = False,
+        config_manager: ConfigurationManager | None = None,
+        check_interval: float = 5.0
+    ):
+        """Initialize context.
+        
+        Args:
+            config: Application configuration
+            dev_mode: Whether services run in development mode
+            config_manager: Manager used to reload the configuration
+            check_interval: Minimum seconds between checks for changed config files
+        """
+        self.dev_mode = dev_mode
+        self.check_interval = check_interval
+        self._config = config
+        self._config_manager = config_manager or ConfigurationManager()
+        self._services: dict[str, Any] = {}
+        self._reservation_services: dict[str, ReservationService] = {}
+        self._lock = threading.RLock()
+        self._config_mtimes = self._read_config_mtimes()
+        self._last_check = time.monotonic()
+        self.logger = get_logger(__name__)
+    
+    @property
+    def config(self) -> AppConfig:
+        """Current configuration."""
+        return self._config
+    
+    def _get(self, name: str, factory: Callable[[], T]) -> T:
+        """Get a service, creating it on first use."""
+        with self._lock:
+            service = self._services.get(name)
+            if service is None:
+                service = factory()
+                self._services[name] = service
+            return service
+    
+    @property
+    def weather_service(self) -> WeatherService:
+        """Shared weather service."""
+        return self._get('weather', lambda: WeatherService(config=self._config))
+    
+    @property
+    def external_event_service(self) -> ExternalEventService:
+        """Shared external event service."""
+        return self._get('external_events', lambda: ExternalEventService(
+            weather_service=self.weather_service,
+            config=self._config
+        ))
+    
+    @property
+    def calendar_service(self) -> CalendarService:
+        """Shared calendar service."""
+        return self._get('calendar', lambda: CalendarService(
+            config=self._config,
+            weather_service=self.weather_service,
+            dev_mode=self.dev_mode,
+            external_event_service=self.external_event_service
+        ))
+    
+    @property
+    def auth_service(self) -> AuthService:
+        """Shared authentication service."""
+        return self._get('auth', lambda: AuthService(self._config))
+    
+    @property
+    def notification_service(self) -> NotificationService:
+        """Shared notification service."""
+        return self._get('notification', lambda: NotificationService(self._config))
+    
+    @property
+    def wise_golf_discovery(self) -> WiseGolfDiscoveryService:
+        """Shared WiseGolf discovery service with its static club data."""
+        return self._get('wise_golf_discovery', lambda: WiseGolfDiscoveryService(self._config))
+    
+    def reservation_service(self, username: str) -> ReservationService:
+        """Get the reservation service of a user.
+        
+        Args:
+            username: User name
+        
+        Returns:
+            Reservation service using the shared services
+        """
+        with self._lock:
+            service = self._reservation_services.get(username)
+            if service is None:
+                service = ReservationService(
+                    username,
+                    self._config,
+                    auth_service=self.auth_service,
+                    notification_service=self.notification_service,
+                    wise_golf_discovery=self.wise_golf_discovery,
+                    weather_service=self.weather_service
+                )
+                self._reservation_services[username] = service
+            return service
+    
+    def _read_config_mtimes(self) -> dict[str, float]:
+        """Get modification times of the configuration files."""
+        config_dir = Path(self._config.config_dir or '.')
+        mtimes = {}
+        for name in CONFIG_FILES:
+            try:
+                mtimes[name] = os.stat(config_dir / name).st_mtime
+            except OSError:
+                continue
+        return mtimes
+    
+    def reload(self, config: AppConfig | None = None) -> AppConfig:
+        """Replace the configuration and drop all services.
+        
+        Services in use by other threads keep working; later calls get
+        services built from the new configuration. The old notification
+        service hands its queue over to the new one, so notifications sent
+        through it are still delivered.
+        
+        Args:
+            config: New configuration, reloaded from disk if not given
+        
+        Returns:
+            The new configuration
+        """
+        new_config = config or self._config_manager.reload_config()
+        with self._lock:
+            notification_service = self._services.pop('notification', None)
+            self._close_services()
+            self._config = new_config
+            self._config_mtimes = self._read_config_mtimes()
+            if notification_service is not None:
+                notification_service.hand_over(self.notification_service)
+        Metrics().increment('context_reloads')
+        self.logger.info("Reloaded configuration and services")
+        return new_config
+    
+    def reload_if_changed(self) -> bool:
+        """Reload if a configuration file changed since the last load.
+        
+        Checks at most once per check interval, so this is cheap to call on
+        every request or processing cycle.
+        
+        Returns:
+            True if the configuration was reloaded
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_check < self.check_interval:
+                return False
+            self._last_check = now
+            if self._read_config_mtimes() == self._config_mtimes:
+                return False
+        try:
+            self.reload()
+        except Exception as e:
+            # Keep running on the old configuration until the files are fixed
+            self.logger.error(f"Failed to reload configuration: {e}")
+            with self._lock:
+                self._config_mtimes = self._read_config_mtimes()
+            return False
+        return True
+    
+    def _close_services(self) -> None:
+        """Close and forget all services; the caller holds the lock."""
+        for service in [*self._services.values(), *self._reservation_services.values()]:
+            close = getattr(service, 'close', None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    self.logger.warning(f"Failed to close {type(service).__name__}: {e}")
+        self._services.clear()
+        self._reservation_services.clear()
+    
+    def close(self) -> None:
+        """Close all services."""
+        with self._lock:
+            self._close_services()
+
+
+# Global application context
+_context: AppContext | None = None
+_context_lock = threading.Lock()
+
+def init_context(config: AppConfig, dev_mode: bool = False) -> AppContext:
+    """Initialize the global application context.
+    
+    Args:
+        config: Application configuration
+        dev_mode: Whether services run in development mode
+    
+    Returns:
+        The new context
+    """
+    global _context
+    with _context_lock:
+        if _context is not None:
+            _context.close()
+        _context = AppContext(config, dev_mode=dev_mode)
+        return _context
+
+def get_context() -> AppContext:
+    """Get the global application context.
+    
+    Returns:
+        Global application context
+    
+    Raises:
+        RuntimeError: If the context is not initialized
+    """
+    if _context is None:
+        raise RuntimeError("Application context not initialized. Call init_context first.")
+    return _context
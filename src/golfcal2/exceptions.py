@@ -118,8 +118,8 @@ def handle_errors(
     try:
         yield
     except error_type as e:
-        # Pass the actual traceback object
-        aggregate_error(str(e), service, e.__traceback__)
+        # Pass the exception; its traceback is formatted only when reported
+        aggregate_error(str(e), service, e)
         
         if fallback:
             return fallback()
@@ -130,8 +130,8 @@ def handle_errors(
             f"Unexpected error in {service}.{operation}: {e}",
             exc_info=True
         )
-        # Pass the actual traceback object
-        aggregate_error(str(e), service, e.__traceback__)
+        # Pass the exception; its traceback is formatted only when reported
+        aggregate_error(str(e), service, e)
         
         if fallback:
             return fallback()
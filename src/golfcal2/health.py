@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from golfcal2.config.settings import ConfigurationManager
+from golfcal2.utils.circuit_breaker import CLOSED, circuit_breakers
 from golfcal2.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -97,6 +98,15 @@ def get_health_status() -> dict[str, Any]:
     # Check logging
     checks.append(("logging", check_logging()))
     
+    # CRM hosts with an open circuit are skipped; the service itself stays healthy
+    breakers = circuit_breakers.snapshot()
+    status["circuit_breakers"] = breakers
+    open_hosts = [host for host, entry in breakers.items() if entry['state'] != CLOSED]
+    checks.append(("circuit_breakers", (
+        True,
+        f"Circuits not closed: {', '.join(open_hosts)}" if open_hosts else "All circuits closed"
+    )))
+    
     # Process check results
     all_healthy = True
     for name, (success, message) in checks:
@@ -0,0 +1,390 @@
+"""Record and replay of HTTP traffic.
+
+In record mode every request made through the shared HTTP plumbing (CRM API
+sessions, ``api_utils.make_api_request`` and the weather strategies) is written
+to a cassette: a gzip-compressed JSON-lines file with one request/response
+pair per line, including the time the response took. Credentials are removed
+before writing: authentication headers and cookies are dropped, and query
+parameters and JSON fields with secret-looking names are redacted.
+
+In replay mode the same requests are answered from the cassette without
+network access, optionally delayed by the recorded response times. A captured
+processing cycle can so be profiled or benchmarked repeatedly offline.
+
+The mode is set with ``configure()`` (``--record-http``/``--replay-http`` on
+the command line) or the ``GOLFCAL_HTTP_RECORD``, ``GOLFCAL_HTTP_REPLAY`` and
+``GOLFCAL_HTTP_REPLAY_LATENCY`` environment variables.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from golfcal2.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+HTTP_MODES = ('record', 'replay')
+
+REDACTED = 'REDACTED'
+
+# Query parameters and JSON fields whose values are never written to a cassette
+_SECRET_NAME_RE = re.compile(r'token|auth|pass(word)?|secret|session|cookie|api_?key|^key$|hash', re.IGNORECASE)
+
+# Headers dropped from recorded requests and responses
+_SECRET_HEADERS = frozenset({'authorization', 'proxy-authorization', 'cookie', 'set-cookie', 'x-api-key'})
+
+# Response headers describing the transfer rather than the content; the body is stored decoded
+_TRANSFER_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection'})
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """Raised in replay mode for a request that is not in the cassette."""
+
+
+def _redact(data: Any) -> Any:
+    """Redact secret-looking fields in decoded JSON data."""
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if _SECRET_NAME_RE.search(str(key)) and isinstance(value, (str, int, float)) else _redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_redact(item) for item in data]
+    return data
+
+
+def _sanitise_url(url: str) -> str:
+    """Redact secret query parameters and sort the query for stable matching."""
+    parts = urlsplit(url)
+    query = sorted(
+        (name, REDACTED if _SECRET_NAME_RE.search(name) else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+def _sanitise_headers(headers: Any) -> dict[str, str]:
+    """Drop authentication headers."""
+    return {
+        name: value for name, value in dict(headers).items()
+        if name.lower() not in _SECRET_HEADERS and not _SECRET_NAME_RE.search(name)
+    }
+
+
+def _encode_body(content: bytes | str | None) -> tuple[str, str]:
+    """Encode a body for JSON storage, redacting secrets in JSON bodies.
+    
+    Returns:
+        Tuple of (encoding, body) where encoding is 'json', 'text' or 'base64'
+    """
+    if content is None:
+        return 'text', ''
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    try:
+        text = content.decode('utf-8')
+    except UnicodeDecodeError:
+        return 'base64', base64.b64encode(content).decode('ascii')
+    try:
+        return 'json', json.dumps(_redact(json.loads(text)), ensure_ascii=False)
+    except ValueError:
+        return 'text', text
+
+
+def _decode_body(encoding: str, body: str) -> bytes:
+    """Decode a stored body."""
+    if encoding == 'base64':
+        return base64.b64decode(body)
+    return body.encode('utf-8')
+
+
+def _match_key(method: str, url: str, body: str) -> str:
+    """Build the lookup key of a request."""
+    digest = hashlib.sha1(body.encode('utf-8')).hexdigest()[:12] if body else ''
+    return f"{method.upper()} {url} {digest}"
+
+
+def _path_key(method: str, url: str) -> str:
+    """Build the fallback lookup key ignoring query and body."""
+    parts = urlsplit(url)
+    return f"{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class Cassette:
+    """Gzip JSON-lines store of request/response pairs."""
+    
+    def __init__(self, path: str | Path, mode: str, replay_latency: float = 0.0):
+        """Initialize cassette.
+        
+        Args:
+            path: Cassette file, conventionally ``*.jsonl.gz``
+            mode: 'record' to write a new cassette, 'replay' to serve one
+            replay_latency: In replay mode, factor applied to the recorded
+                response times (0 serves immediately, 1 reproduces them)
+        
+        Raises:
+            ValueError: If the mode is unknown
+            FileNotFoundError: If the cassette to replay does not exist
+        """
+        if mode not in HTTP_MODES:
+            raise ValueError(f"Unknown HTTP mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+        self._interactions: dict[str, deque[dict[str, Any]]] = {}
+        self._by_path: dict[str, dict[str, Any]] = {}
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        
+        if mode == 'record':
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Start a new capture
+            self.path.write_bytes(b'')
+        else:
+            self._load()
+    
+    def _load(self) -> None:
+        """Index the recorded interactions by request."""
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                interaction = json.loads(line)
+                request = interaction['request']
+                key = _match_key(request['method'], request['url'], request['body'])
+                self._interactions.setdefault(key, deque()).append(interaction)
+                self._by_path.setdefault(_path_key(request['method'], request['url']), interaction)
+        logger.info(f"Loaded {sum(len(q) for q in self._interactions.values())} interactions from {self.path}")
+    
+    def record(self, request: requests.PreparedRequest, response: requests.Response, elapsed: float) -> None:
+        """Append a request/response pair to the cassette.
+        
+        Args:
+            request: Sent request
+            response: Received response
+            elapsed: Seconds from sending the request to receiving the response
+        """
+        _, request_body = _encode_body(request.body)
+        body_encoding, response_body = _encode_body(response.content)
+        interaction = {
+            'recorded_at': datetime.now(UTC).isoformat(),
+            'elapsed_ms': round(elapsed * 1000, 3),
+            'request': {
+                'method': request.method or 'GET',
+                'url': _sanitise_url(request.url or ''),
+                'headers': _sanitise_headers(request.headers),
+                'body': request_body
+            },
+            'response': {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': {
+                    name: value for name, value in _sanitise_headers(response.headers).items()
+                    if name.lower() not in _TRANSFER_HEADERS
+                },
+                'encoding': response.encoding,
+                'body_encoding': body_encoding,
+                'body': response_body
+            }
+        }
+        line = json.dumps(interaction, ensure_ascii=False) + '\n'
+        with self._lock:
+            # Each append is a complete gzip member, so an interrupted capture stays readable
+            with gzip.open(self.path, 'at', encoding='utf-8') as f:
+                f.write(line)
+            self.recorded += 1
+    
+    def replay(self, request: requests.PreparedRequest) -> requests.Response:
+        """Build the recorded response for a request.
+        
+        Repeated requests get the recorded responses in order; once they are
+        used up the last one is repeated. Requests whose query or body differs
+        from every recording (e.g. a date range) fall back to the first
+        recording of the same method and path.
+        
+        Args:
+            request: Request to answer
+        
+        Returns:
+            Recorded response
+        
+        Raises:
+            CassetteMissError: If nothing was recorded for the method and path
+        """
+        url = _sanitise_url(request.url or '')
+        _, body = _encode_body(request.body)
+        key = _match_key(request.method or 'GET', url, body)
+        with self._lock:
+            queue = self._interactions.get(key)
+            if queue:
+                interaction = queue.popleft() if len(queue) > 1 else queue[0]
+            else:
+                interaction = self._by_path.get(_path_key(request.method or 'GET', url))
+            if interaction is None:
+                self.misses += 1
+                raise CassetteMissError(f"No recorded response for {request.method} {url}")
+            if not queue:
+                logger.debug(f"Replaying {request.method} {url} from a recording with different parameters")
+            self.replayed += 1
+        
+        if self.replay_latency:
+            time.sleep(interaction['elapsed_ms'] / 1000 * self.replay_latency)
+        
+        recorded = interaction['response']
+        response = requests.Response()
+        response.status_code = recorded['status']
+        response.reason = recorded['reason']
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response._content = _decode_body(recorded['body_encoding'], recorded['body'])
+        response.encoding = recorded['encoding']
+        response.url = request.url or ''
+        response.request = request
+        response.elapsed = timedelta(milliseconds=interaction['elapsed_ms'])
+        return response
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter writing every response to a cassette."""
+    
+    def __init__(self, cassette: Cassette, **kwargs: Any):
+        """Initialize adapter.
+        
+        Args:
+            cassette: Cassette to record to
+            **kwargs: Arguments passed to HTTPAdapter, e.g. max_retries
+        """
+        super().__init__(**kwargs)
+        self.cassette = cassette
+    
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        """Send a request and record the final response after retries."""
+        start = time.perf_counter()
+        response = super().send(request, *args, **kwargs)
+        self.cassette.record(request, response, time.perf_counter() - start)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter answering requests from a cassette."""
+    
+    def __init__(self, cassette: Cassette):
+        """Initialize adapter.
+        
+        Args:
+            cassette: Cassette to replay from
+        """
+        super().__init__()
+        self.cassette = cassette
+    
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        """Answer a request from the cassette."""
+        response = self.cassette.replay(request)
+        response.connection = self
+        return response
+    
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+_cassette: Cassette | None = None
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure(mode: str | None, path: str | Path | None = None, replay_latency: float = 0.0) -> Cassette | None:
+    """Set the HTTP mode for all subsequently created sessions and requests.
+    
+    Args:
+        mode: 'record', 'replay' or None for live traffic
+        path: Cassette file, required with a mode
+        replay_latency: Factor applied to recorded response times in replay mode
+    
+    Returns:
+        Active cassette, or None for live traffic
+    
+    Raises:
+        ValueError: If the mode is unknown or no path is given
+    """
+    global _cassette, _configured
+    with _configure_lock:
+        if mode is None:
+            _cassette = None
+        else:
+            if not path:
+                raise ValueError(f"A cassette path is required to {mode} HTTP traffic")
+            _cassette = Cassette(path, mode, replay_latency)
+            logger.info(f"HTTP {mode} mode using cassette {_cassette.path}")
+        _configured = True
+        return _cassette
+
+
+def get_cassette() -> Cassette | None:
+    """Get the active cassette, configuring it from the environment on first use."""
+    if not _configured:
+        record_path = os.getenv('GOLFCAL_HTTP_RECORD')
+        replay_path = os.getenv('GOLFCAL_HTTP_REPLAY')
+        if record_path:
+            configure('record', record_path)
+        elif replay_path:
+            configure('replay', replay_path, float(os.getenv('GOLFCAL_HTTP_REPLAY_LATENCY', '0')))
+        else:
+            configure(None)
+    return _cassette
+
+
+def mount(session: requests.Session, max_retries: Any = 0) -> requests.Session:
+    """Mount the record or replay adapter on a session if a mode is active.
+    
+    Args:
+        session: Session to configure
+        max_retries: Retry configuration for the recording adapter; replayed
+            responses are final
+    
+    Returns:
+        The session
+    """
+    cassette = get_cassette()
+    if cassette is None:
+        return session
+    adapter: BaseAdapter
+    if cassette.mode == 'record':
+        adapter = RecordingAdapter(cassette, max_retries=max_retries)
+    else:
+        adapter = ReplayAdapter(cassette)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Drop-in replacement for ``requests.request`` honouring the HTTP mode.
+    
+    Args:
+        method: HTTP method
+        url: Request URL
+        **kwargs: Arguments passed to requests
+    
+    Returns:
+        Response object
+    """
+    if get_cassette() is None:
+        return requests.request(method, url, **kwargs)
+    with requests.Session() as session:
+        return mount(session).request(method, url, **kwargs)
@@ -0,0 +1,637 @@
+"""Stand-in CRM and weather server for load testing.
+
+Serves synthetic responses for the endpoints the API clients call:
+    
+    WiseGolf ajax       GET /?controller=ajax&reservations=getusergolfreservations
+    WiseGolf0 ajax      GET /pd/simulaattorit/18/simulaattorit/?reservations=getusergolfreservations
+    WiseGolf REST       GET .../reservations/ (tee sheet with reservationsGolfPlayers)
+    NexGolf             GET /pgc/member/api/flight/own
+    TeeTime             GET /backend/player/flight
+    MET                 GET .../locationforecast/2.0/complete
+    Open-Meteo          GET /v1/forecast
+
+Data is generated deterministically from a seed: the same user credential,
+day and coordinates always produce the same reservations and forecasts, so
+runs are comparable. Every request can be delayed and failed with 429 or 5xx
+responses at configurable rates, and is counted per endpoint and status.
+
+``GET /_loadtest/stats`` returns the counts, ``POST /_loadtest/reset`` clears them.
+"""
+
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+from zoneinfo import ZoneInfo
+
+from golfcal2.server import PooledHTTPServer
+from golfcal2.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+_FIRST_NAMES = ('Matti', 'Pekka', 'Anna', 'Liisa', 'Juha', 'Sari', 'Timo', 'Kaisa', 'Mikko', 'Heidi')
+_LAST_NAMES = ('Virtanen', 'Korhonen', 'Nieminen', 'Mäkinen', 'Laine', 'Heikkinen', 'Koskinen', 'Lehtonen')
+_CLUB_ABBREVIATIONS = ('HGK', 'ERG', 'KGC', 'VGC', 'TGK', 'NGK')
+_MET_SYMBOLS = ('clearsky_day', 'fair_day', 'partlycloudy_day', 'cloudy', 'lightrain', 'rain', 'rainshowers_day')
+_OPENMETEO_CODES = (0, 1, 2, 3, 61, 63, 80, 95)
+
+# Tee sheet: 10 minute slots from 07:00 on two starting tees
+_FIRST_TEE_TIME = 7 * 60
+_SLOT_MINUTES = 10
+_RESOURCES = (1, 2)
+
+# Status codes returned for injected server errors
+_SERVER_ERRORS = (500, 502, 503)
+
+
+@dataclass
+class LoadTestConfig:
+    """Scale and fault settings of the load test server."""
+    users: int = 100
+    reservations_per_user: int = 3
+    days_ahead: int = 14
+    slots_per_day: int = 66
+    max_players_per_slot: int = 4
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    seed: int = 0
+    timezone: str = 'Europe/Helsinki'
+
+
+class SyntheticData:
+    """Deterministic generator of CRM and weather responses."""
+    
+    def __init__(self, config: LoadTestConfig):
+        """Initialize generator.
+        
+        Args:
+            config: Load test configuration
+        """
+        self.config = config
+        self.tz = ZoneInfo(config.timezone)
+        self._tee_sheets: dict[tuple[str, str], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def _random(self, *key: Any) -> random.Random:
+        """Get a generator seeded from the configured seed and a key."""
+        return random.Random(':'.join(str(part) for part in (self.config.seed, *key)))
+    
+    def user_index(self, credential: str) -> int:
+        """Map a credential (token, cookie) onto one of the simulated users."""
+        return zlib.crc32(credential.encode('utf-8')) % max(self.config.users, 1)
+    
+    @staticmethod
+    def _person(rnd: random.Random) -> tuple[str, str, str, float]:
+        """Generate first name, last name, club abbreviation and handicap."""
+        return (
+            rnd.choice(_FIRST_NAMES),
+            rnd.choice(_LAST_NAMES),
+            rnd.choice(_CLUB_ABBREVIATIONS),
+            round(rnd.uniform(0, 36), 1)
+        )
+    
+    def _slot_start(self, day: date, slot: int) -> datetime:
+        """Get the local start time of a tee sheet slot."""
+        minutes = _FIRST_TEE_TIME + slot * _SLOT_MINUTES
+        return datetime(day.year, day.month, day.day, minutes // 60, minutes % 60)
+    
+    @staticmethod
+    def _time_id(day: date, slot: int, resource: int) -> int:
+        """Get a stable reservationTimeId for a slot and starting tee."""
+        return int(day.strftime('%Y%m%d')) * 1000 + slot * 10 + resource
+    
+    def _user_slots(self, user: int, kind: str) -> list[tuple[date, int, int]]:
+        """Pick the (day, slot, resource) of a user's reservations."""
+        rnd = self._random(kind, user)
+        today = datetime.now(self.tz).date()
+        return sorted(
+            (
+                today + timedelta(days=rnd.randint(1, max(self.config.days_ahead, 1))),
+                rnd.randrange(max(self.config.slots_per_day, 1)),
+                rnd.choice(_RESOURCES)
+            )
+            for _ in range(self.config.reservations_per_user)
+        )
+    
+    def wisegolf_reservations(self, credential: str, product_id: int = 55) -> dict[str, Any]:
+        """Generate a WiseGolf getusergolfreservations response."""
+        user = self.user_index(credential)
+        rows = []
+        for day, slot, resource in self._user_slots(user, f'wisegolf{product_id}'):
+            start = self._slot_start(day, slot)
+            time_id = self._time_id(day, slot, resource)
+            rows.append({
+                'dateTimeStart': start.strftime('%Y-%m-%d %H:%M:%S'),
+                'dateTimeEnd': (start + timedelta(hours=4)).strftime('%Y-%m-%d %H:%M:%S'),
+                'firstName': 'Load',
+                'familyName': f'User {user}',
+                'clubAbbreviation': 'LT',
+                'handicapActive': 18.0,
+                'productName': 'Green fee',
+                'variantName': '18 holes',
+                'status': 1,
+                'inFuture': 1,
+                'orderId': time_id * 10,
+                'reservationId': time_id * 10 + 1,
+                'reservationTimeId': time_id,
+                'productId': product_id,
+                'resources': [{'resourceId': resource, 'name': f'Tee {resource}'}]
+            })
+        return {'success': True, 'rows': rows}
+    
+    def tee_sheet(self, day: date, product_id: str = '55') -> dict[str, Any]:
+        """Generate a WiseGolf REST reservations response for one day."""
+        key = (day.isoformat(), product_id)
+        with self._lock:
+            cached = self._tee_sheets.get(key)
+        if cached is not None:
+            return cached
+        
+        rnd = self._random('sheet', *key)
+        rows = []
+        players = []
+        for slot in range(self.config.slots_per_day):
+            start = self._slot_start(day, slot)
+            for resource in _RESOURCES:
+                time_id = self._time_id(day, slot, resource)
+                rows.append({
+                    'reservationTimeId': time_id,
+                    'start': start.strftime('%Y-%m-%d %H:%M:%S'),
+                    'end': (start + timedelta(minutes=_SLOT_MINUTES)).strftime('%Y-%m-%d %H:%M:%S'),
+                    'resources': [{'resourceId': resource, 'quantity': 1}],
+                    'productId': product_id
+                })
+                for position in range(rnd.randint(1, max(self.config.max_players_per_slot, 1))):
+                    first_name, last_name, club, handicap = self._person(rnd)
+                    players.append({
+                        'reservationTimeId': time_id,
+                        'orderId': time_id * 10 + position,
+                        'firstName': first_name,
+                        'familyName': last_name,
+                        'clubAbbreviation': club,
+                        'handicapActive': handicap,
+                        'status': 'active',
+                        'holes': 18
+                    })
+        
+        sheet = {'success': True, 'rows': rows, 'reservationsGolfPlayers': players}
+        with self._lock:
+            # Only the days around the current date are requested; keep the cache small
+            if len(self._tee_sheets) >= 4 * max(self.config.days_ahead, 1):
+                self._tee_sheets.clear()
+            self._tee_sheets[key] = sheet
+        return sheet
+    
+    def nexgolf_flights(self, credential: str) -> list[dict[str, Any]]:
+        """Generate a NexGolf flight/own response."""
+        user = self.user_index(credential)
+        flights = []
+        for day, slot, _resource in self._user_slots(user, 'nexgolf'):
+            rnd = self._random('nexgolf', user, day, slot)
+            reservations = []
+            for _ in range(rnd.randint(1, max(self.config.max_players_per_slot, 1))):
+                first_name, last_name, club, handicap = self._person(rnd)
+                reservations.append({
+                    'player': {
+                        'firstName': first_name,
+                        'lastName': last_name,
+                        'handicap': handicap,
+                        'club': {'abbreviation': club, 'name': f'{club} Golf'}
+                    },
+                    'holes': 18
+                })
+            flights.append({
+                'startTime': self._slot_start(day, slot).strftime('%H:%M %Y-%m-%d'),
+                'comment': '',
+                'status': 'ACTIVE',
+                'course': {'name': 'Load Test Course', 'id': 1},
+                'reservations': reservations
+            })
+        return flights
+    
+    def teetime_flights(self, credential: str) -> dict[str, Any]:
+        """Generate a TeeTime /backend/player/flight response."""
+        user = self.user_index(credential)
+        flights = []
+        for day, slot, resource in self._user_slots(user, 'teetime'):
+            rnd = self._random('teetime', user, day, slot)
+            flights.append({
+                'id': self._time_id(day, slot, resource),
+                'startTime': self._slot_start(day, slot).strftime('%H:%M %Y-%m-%d'),
+                'status': 'CONFIRMED',
+                'course': {
+                    'name': 'Load Test Course',
+                    'id': 1,
+                    'club': {'name': 'Load Test Club', 'abbrevitation': 'LTC', 'number': 1}
+                },
+                'reservations': [
+                    {
+                        'id': rnd.randrange(10 ** 6),
+                        'player': {
+                            'handicap': round(rnd.uniform(0, 36), 1),
+                            'gender': rnd.choice(('MALE', 'FEMALE')),
+                            'holes': 18,
+                            'idHash': f'{rnd.getrandbits(64):016x}'
+                        }
+                    }
+                    for _ in range(rnd.randint(1, max(self.config.max_players_per_slot, 1)))
+                ]
+            })
+        return {'data': flights}
+    
+    def met_forecast(self, lat: float, lon: float) -> dict[str, Any]:
+        """Generate a MET locationforecast/2.0/complete response."""
+        now = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        rnd = self._random('met', round(lat, 2), round(lon, 2), now.isoformat())
+        # Hourly steps for 60 hours, then 6-hourly up to 9 days like the real API
+        steps = [now + timedelta(hours=h) for h in range(60)]
+        steps += [now + timedelta(hours=60 + 6 * i) for i in range(26)]
+        timeseries = []
+        for index, step in enumerate(steps):
+            details = {
+                'precipitation_amount': round(max(0.0, rnd.uniform(-1.5, 2.5)), 1),
+                'probability_of_precipitation': round(rnd.uniform(0, 80), 1),
+                'probability_of_thunder': round(rnd.uniform(0, 10), 1)
+            }
+            data: dict[str, Any] = {
+                'instant': {'details': {
+                    'air_temperature': round(rnd.uniform(5, 25), 1),
+                    'wind_speed': round(rnd.uniform(0, 9), 1),
+                    'wind_from_direction': round(rnd.uniform(0, 360), 1),
+                    'relative_humidity': round(rnd.uniform(40, 95), 1),
+                    'cloud_area_fraction': round(rnd.uniform(0, 100), 1)
+                }},
+                'next_6_hours': {
+                    'summary': {'symbol_code': rnd.choice(_MET_SYMBOLS)},
+                    'details': {'precipitation_amount': details['precipitation_amount'] * 4}
+                }
+            }
+            if index < 60:
+                data['next_1_hours'] = {'summary': {'symbol_code': rnd.choice(_MET_SYMBOLS)}, 'details': details}
+            timeseries.append({'time': step.strftime('%Y-%m-%dT%H:%M:%SZ'), 'data': data})
+        return {
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [lon, lat, 0]},
+            'properties': {'meta': {'updated_at': now.strftime('%Y-%m-%dT%H:%M:%SZ')}, 'timeseries': timeseries}
+        }
+    
+    def openmeteo_forecast(self, lat: float, lon: float) -> dict[str, Any]:
+        """Generate an Open-Meteo /v1/forecast hourly response for 7 days."""
+        start = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        rnd = self._random('openmeteo', round(lat, 2), round(lon, 2), start.date())
+        hours = [start + timedelta(hours=h) for h in range(168)]
+        return {
+            'latitude': lat,
+            'longitude': lon,
+            'utc_offset_seconds': 0,
+            'timezone': 'GMT',
+            'hourly': {
+                'time': [h.strftime('%Y-%m-%dT%H:%M') for h in hours],
+                'temperature_2m': [round(rnd.uniform(10, 30), 1) for _ in hours],
+                'precipitation': [round(max(0.0, rnd.uniform(-3, 1.5)), 1) for _ in hours],
+                'precipitation_probability': [rnd.randint(0, 60) for _ in hours],
+                'weathercode': [rnd.choice(_OPENMETEO_CODES) for _ in hours],
+                'windspeed_10m': [round(rnd.uniform(0, 8), 1) for _ in hours],
+                'winddirection_10m': [rnd.randint(0, 359) for _ in hours]
+            }
+        }
+
+
+class RequestStats:
+    """Thread-safe request counts per endpoint and status."""
+    
+    def __init__(self) -> None:
+        self._counts: Counter[tuple[str, int]] = Counter()
+        self._started = time.time()
+        self._lock = threading.Lock()
+    
+    def record(self, endpoint: str, status: int) -> None:
+        """Count a request."""
+        with self._lock:
+            self._counts[(endpoint, status)] += 1
+    
+    def reset(self) -> None:
+        """Clear all counts."""
+        with self._lock:
+            self._counts.clear()
+            self._started = time.time()
+    
+    def snapshot(self) -> dict[str, Any]:
+        """Get counts as ``{endpoint: {status: count}}`` with totals."""
+        with self._lock:
+            counts = dict(self._counts)
+            started = self._started
+        endpoints: dict[str, dict[str, int]] = {}
+        for (endpoint, status), count in sorted(counts.items()):
+            endpoints.setdefault(endpoint, {})[str(status)] = count
+        return {
+            'total': sum(counts.values()),
+            'elapsed_seconds': round(time.time() - started, 3),
+            'endpoints': endpoints
+        }
+
+
+class LoadTestHandler(BaseHTTPRequestHandler):
+    """Request handler routing API paths to synthetic responses."""
+    
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    
+    server: 'LoadTestHTTPServer'
+    
+    def setup(self) -> None:
+        """Apply the server's request timeout to the connection socket."""
+        self.timeout = self.server.request_timeout
+        super().setup()
+    
+    def _send_json(self, status: int, data: Any, headers: dict[str, str] | None = None) -> None:
+        """Send a JSON response."""
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _credential(self, query: dict[str, list[str]]) -> str:
+        """Identify the simulated user from the request's token or cookies."""
+        if 'token' in query:
+            return query['token'][0]
+        return self.headers.get('Authorization') or self.headers.get('Cookie') or 'anonymous'
+    
+    def _route(self, path: str, query: dict[str, list[str]]) -> tuple[str, Any] | None:
+        """Find the endpoint name and response body for a request."""
+        data = self.server.data
+        credential = self._credential(query)
+        
+        if query.get('reservations') == ['getusergolfreservations']:
+            if path.startswith('/pd/'):
+                return 'wisegolf0_reservations', data.wisegolf_reservations(credential, product_id=12)
+            return 'wisegolf_reservations', data.wisegolf_reservations(credential)
+        
+        if path.rstrip('/').endswith('/reservations'):
+            day_param = (query.get('date') or query.get('dateFrom') or [''])[0]
+            try:
+                day = date.fromisoformat(day_param[:10])
+            except ValueError:
+                day = datetime.now(data.tz).date() + timedelta(days=1)
+            product = (query.get('productid') or query.get('productId') or ['55'])[0]
+            return 'wisegolf_players', data.tee_sheet(day, product)
+        
+        if path == '/pgc/member/api/flight/own':
+            return 'nexgolf_flights', data.nexgolf_flights(credential)
+        
+        if path == '/backend/player/flight':
+            return 'teetime_flights', data.teetime_flights(credential)
+        
+        if '/locationforecast/' in path:
+            lat = float((query.get('lat') or ['60.0'])[0])
+            lon = float((query.get('lon') or ['25.0'])[0])
+            return 'met_forecast', data.met_forecast(lat, lon)
+        
+        if path == '/v1/forecast':
+            lat = float((query.get('latitude') or ['60.0'])[0])
+            lon = float((query.get('longitude') or ['25.0'])[0])
+            return 'openmeteo_forecast', data.openmeteo_forecast(lat, lon)
+        
+        return None
+    
+    def _inject_fault(self) -> int | None:
+        """Sleep for the configured latency and pick an injected error status."""
+        config = self.server.config
+        rnd = self.server.fault_random
+        with self.server.fault_lock:
+            jitter = rnd.uniform(-config.jitter_ms, config.jitter_ms) if config.jitter_ms else 0.0
+            draw = rnd.random()
+            server_error = rnd.choice(_SERVER_ERRORS)
+        
+        delay = max(0.0, config.latency_ms + jitter) / 1000
+        if delay:
+            time.sleep(delay)
+        
+        if draw < config.rate_429:
+            return 429
+        if draw < config.rate_429 + config.rate_5xx:
+            return server_error
+        return None
+    
+    def _handle(self) -> None:
+        """Serve a request."""
+        parsed_url = urlparse(self.path)
+        query = parse_qs(parsed_url.query)
+        stats = self.server.stats
+        
+        if parsed_url.path == '/_loadtest/stats':
+            self._send_json(200, {'config': asdict(self.server.config), **stats.snapshot()})
+            return
+        if parsed_url.path == '/_loadtest/reset' and self.command == 'POST':
+            stats.reset()
+            self._send_json(200, {'reset': True})
+            return
+        
+        # Drain request bodies so the connection can be reused
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        
+        try:
+            route = self._route(parsed_url.path, query)
+        except ValueError as e:
+            stats.record('invalid', 400)
+            self._send_json(400, {'error': str(e)})
+            return
+        
+        if route is None:
+            stats.record('unknown', 404)
+            self._send_json(404, {'error': f'Path not found: {parsed_url.path}'})
+            return
+        
+        endpoint, body = route
+        status = self._inject_fault()
+        if status == 429:
+            stats.record(endpoint, 429)
+            self._send_json(429, {'error': 'Too Many Requests'}, {'Retry-After': '1'})
+            return
+        if status is not None:
+            stats.record(endpoint, status)
+            self._send_json(status, {'error': 'Injected server error'})
+            return
+        
+        stats.record(endpoint, 200)
+        self._send_json(200, body)
+    
+    def do_GET(self) -> None:
+        """Handle GET requests."""
+        self._handle()
+    
+    def do_POST(self) -> None:
+        """Handle POST requests."""
+        self._handle()
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        """Log requests at debug level only; they are counted in the stats instead."""
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class LoadTestHTTPServer(PooledHTTPServer):
+    """Pooled HTTP server carrying the load test state."""
+    
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        config: LoadTestConfig,
+        max_workers: int = 32,
+        request_timeout: float | None = 30.0
+    ):
+        """Initialize server.
+        
+        Args:
+            server_address: Address to bind to
+            config: Load test configuration
+            max_workers: Number of concurrently handled connections
+            request_timeout: Socket timeout in seconds for reading a request
+        """
+        super().__init__(server_address, LoadTestHandler, max_workers=max_workers, request_timeout=request_timeout)
+        self.config = config
+        self.data = SyntheticData(config)
+        self.stats = RequestStats()
+        self.fault_random = random.Random(config.seed)
+        self.fault_lock = threading.Lock()
+
+
+class LoadTestServer:
+    """Stand-in CRM and weather server run in a background thread."""
+    
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 8090,
+        config: LoadTestConfig | None = None,
+        max_workers: int = 32
+    ):
+        """Initialize server.
+        
+        Args:
+            host: Host to bind to
+            port: Port to listen on, 0 for an ephemeral port
+            config: Load test configuration
+            max_workers: Number of worker threads; requests beyond it queue,
+                so use at least the client concurrency when injecting latency
+        """
+        self.host = host
+        self.port = port
+        self.config = config or LoadTestConfig()
+        self.max_workers = max_workers
+        self.server: LoadTestHTTPServer | None = None
+        self.thread: threading.Thread | None = None
+    
+    @property
+    def base_url(self) -> str:
+        """Get the base URL of the running server."""
+        if self.server is None:
+            return f"http://{self.host}:{self.port}"
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> None:
+        """Start the server in a background thread."""
+        if self.server:
+            logger.warning("Load test server already running")
+            return
+        self.server = LoadTestHTTPServer((self.host, self.port), self.config, max_workers=self.max_workers)
+        self.thread = threading.Thread(target=self.server.serve_forever, name='loadtest-http-accept', daemon=True)
+        self.thread.start()
+        logger.info(f"Load test server started on {self.base_url}")
+    
+    def stop(self) -> None:
+        """Stop the server."""
+        if self.server:
+            try:
+                self.server.shutdown()
+                self.server.server_close()
+                if self.thread:
+                    self.thread.join()
+            finally:
+                self.server = None
+                self.thread = None
+    
+    def stats(self) -> dict[str, Any]:
+        """Get the request counts."""
+        if self.server is None:
+            return RequestStats().snapshot()
+        return self.server.stats.snapshot()
+    
+    def clubs_config(self) -> dict[str, dict[str, Any]]:
+        """Get clubs.json entries pointing every supported CRM at this server."""
+        base = self.base_url
+        return {
+            'LoadTestWiseGolf': {
+                'type': 'wisegolf',
+                'name': 'Load Test WiseGolf',
+                'url': base,
+                'ajaxUrl': base,
+                'restUrl': base,
+                'cookie_name': 'token',
+                'auth_type': 'token_appauth',
+                'crm': 'wisegolf',
+                'address': 'Load Test Street 1, Helsinki',
+                'timezone': 'Europe/Helsinki',
+                'clubAbbreviation': 'LTW',
+                'coordinates': {'lat': 60.2, 'lon': 24.9}
+            },
+            'LoadTestWiseGolf0': {
+                'type': 'wisegolf0',
+                'name': 'Load Test WiseGolf0',
+                'restUrl': base,
+                'shopURL': base,
+                'cookie_name': 'wisenetwork_session',
+                'auth_type': 'cookie',
+                'crm': 'wisegolf0',
+                'address': 'Load Test Street 2, Vantaa',
+                'timezone': 'Europe/Helsinki',
+                'clubAbbreviation': 'LT0',
+                'coordinates': {'lat': 60.28, 'lon': 24.85}
+            },
+            'LoadTestNexGolf': {
+                'type': 'nexgolf',
+                'name': 'Load Test NexGolf',
+                'url': base,
+                'cookie_name': 'JSESSIONID',
+                'auth_type': 'cookie',
+                'crm': 'nexgolf',
+                'address': 'Load Test Street 3, Kirkkonummi',
+                'timezone': 'Europe/Helsinki',
+                'clubAbbreviation': 'LTN',
+                'coordinates': {'lat': 60.12, 'lon': 24.45}
+            },
+            'LoadTestTeeTime': {
+                'type': 'teetime',
+                'name': 'Load Test TeeTime',
+                'url': base,
+                'cookie_name': 'token',
+                'auth_type': 'query',
+                'crm': 'teetime',
+                'address': 'Load Test Street 4, Málaga',
+                'timezone': 'Europe/Madrid',
+                'clubAbbreviation': 'LTT',
+                'coordinates': {'lat': 36.5, 'lon': -4.75}
+            }
+        }
+    
+    def weather_environment(self) -> dict[str, str]:
+        """Get environment variables pointing the weather strategies at this server."""
+        return {
+            'GOLFCAL_MET_URL': f"{self.base_url}/weatherapi/locationforecast/2.0/complete",
+            'GOLFCAL_OPENMETEO_URL': f"{self.base_url}/v1/forecast"
+        }
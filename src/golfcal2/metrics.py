@@ -1,6 +1,6 @@
 """Metrics collection and reporting for golfcal2."""
 
-import statistics
+import bisect
 import threading
 import time
 from collections import defaultdict
@@ -8,47 +8,123 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+# Histogram bucket upper bounds in seconds: 1ms to ~92s, each bucket sqrt(2) wider
+# than the previous one. Fixed bounds keep memory constant and make buckets from
+# different timers (and scrapes) directly comparable in Prometheus.
+HISTOGRAM_BUCKETS: tuple[float, ...] = tuple(round(0.001 * 2 ** (i / 2), 6) for i in range(34))
+
+# Percentiles reported by TimerStats.get_stats()
+PERCENTILES: tuple[float, ...] = (0.5, 0.9, 0.95, 0.99)
+
+# Maximum number of distinct label sets per labelled metric. Further label sets
+# are folded into a single set whose values are all OVERFLOW_LABEL_VALUE so an
+# unexpected label value (e.g. an unnormalized URL) cannot grow memory unbounded.
+MAX_LABEL_SETS = 100
+OVERFLOW_LABEL_VALUE = 'other'
+
+LabelKey = tuple[tuple[str, str], ...]
+
 
 @dataclass
 class TimerStats:
-    """Statistics for timed operations."""
+    """Statistics for timed operations.
+    
+    Durations are counted into fixed logarithmic buckets, so memory use is
+    constant and recording is a binary search plus a few additions. Percentiles
+    are estimated by interpolating within the bucket containing the rank.
+    """
     count: int = 0
     total_time: float = 0.0
     min_time: float = float('inf')
     max_time: float = 0.0
-    times: list[float] = field(default_factory=list)
+    # One count per bucket in HISTOGRAM_BUCKETS plus a final overflow (+Inf) bucket
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS) + 1))
 
     def add(self, duration: float) -> None:
         """Add a new duration measurement."""
         self.count += 1
         self.total_time += duration
-        self.min_time = min(self.min_time, duration)
-        self.max_time = max(self.max_time, duration)
-        self.times.append(duration)
+        if duration < self.min_time:
+            self.min_time = duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.bucket_counts[bisect.bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+
+    def copy(self) -> 'TimerStats':
+        """Return a snapshot that can be summarized without holding locks."""
+        return TimerStats(
+            count=self.count,
+            total_time=self.total_time,
+            min_time=self.min_time,
+            max_time=self.max_time,
+            bucket_counts=list(self.bucket_counts)
+        )
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile from the bucket counts.
         
-        # Keep only last 1000 measurements to avoid memory growth
-        if len(self.times) > 1000:
-            self.times = self.times[-1000:]
+        Args:
+            q: Quantile between 0 and 1
+            
+        Returns:
+            Estimated duration in seconds, 0.0 if nothing was recorded
+        """
+        if not self.count:
+            return 0.0
+        
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            if not bucket_count or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+            
+            lower = HISTOGRAM_BUCKETS[index - 1] if index > 0 else 0.0
+            upper = HISTOGRAM_BUCKETS[index] if index < len(HISTOGRAM_BUCKETS) else self.max_time
+            # Observed extremes are tighter than the bucket edges
+            lower = max(lower, self.min_time)
+            upper = min(upper, self.max_time)
+            fraction = (rank - cumulative) / bucket_count
+            return lower + (upper - lower) * fraction
+        
+        return self.max_time
 
-    def get_stats(self) -> dict[str, float]:
+    def get_buckets(self) -> dict[str, int]:
+        """Get cumulative bucket counts keyed by Prometheus ``le`` label.
+        
+        The final ``+Inf`` bucket always equals the total count.
+        """
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(HISTOGRAM_BUCKETS, self.bucket_counts):
+            cumulative += bucket_count
+            buckets[format(bound, 'g')] = cumulative
+        buckets["+Inf"] = self.count
+        return buckets
+
+    def get_stats(self) -> dict[str, Any]:
         """Get statistical summary."""
-        if not self.times:
+        if not self.count:
             return {
                 "count": 0,
                 "total": 0.0,
                 "avg": 0.0,
                 "min": 0.0,
                 "max": 0.0,
-                "median": 0.0
+                "median": 0.0,
+                **{f"p{int(q * 100)}": 0.0 for q in PERCENTILES},
+                "buckets": self.get_buckets()
             }
-            
+        
         return {
             "count": self.count,
             "total": self.total_time,
             "avg": self.total_time / self.count,
             "min": self.min_time,
             "max": self.max_time,
-            "median": statistics.median(self.times)
+            "median": self.percentile(0.5),
+            **{f"p{int(q * 100)}": self.percentile(q) for q in PERCENTILES},
+            "buckets": self.get_buckets()
         }
 
 class Metrics:
@@ -70,82 +146,150 @@ class Metrics:
             self._timers: dict[str, TimerStats] = defaultdict(TimerStats)
             self._counters: dict[str, int] = defaultdict(int)
             self._gauges: dict[str, float] = {}
+            self._labelled_counters: dict[str, dict[LabelKey, int]] = defaultdict(dict)
+            self._labelled_gauges: dict[str, dict[LabelKey, float]] = defaultdict(dict)
+            self._labelled_timers: dict[str, dict[LabelKey, TimerStats]] = defaultdict(dict)
             self._start_time = datetime.now()
             self._lock = threading.Lock()
             self._initialized = True
     
-    def increment(self, name: str, value: int = 1) -> None:
+    @staticmethod
+    def _label_key(family: dict[LabelKey, Any], labels: dict[str, Any]) -> LabelKey:
+        """Get the key for a label set, folding new sets into overflow past the limit.
+        
+        Args:
+            family: Existing series of the labelled metric
+            labels: Label names and values
+            
+        Returns:
+            Sorted tuple of (name, value) pairs
+        """
+        key = tuple(sorted((name, str(value)) for name, value in labels.items()))
+        if key in family or len(family) < MAX_LABEL_SETS:
+            return key
+        return tuple((name, OVERFLOW_LABEL_VALUE) for name, _ in key)
+    
+    def increment(self, name: str, value: int = 1, labels: dict[str, Any] | None = None) -> None:
         """Increment a counter.
         
         Args:
             name: Counter name
             value: Value to increment by
+            labels: Optional labels identifying the series
         """
         with self._lock:
-            self._counters[name] += value
+            if labels:
+                family = self._labelled_counters[name]
+                key = self._label_key(family, labels)
+                family[key] = family.get(key, 0) + value
+            else:
+                self._counters[name] += value
     
-    def set_gauge(self, name: str, value: float) -> None:
+    def set_gauge(self, name: str, value: float, labels: dict[str, Any] | None = None) -> None:
         """Set a gauge value.
         
         Args:
             name: Gauge name
             value: Current value
+            labels: Optional labels identifying the series
         """
         with self._lock:
-            self._gauges[name] = value
+            if labels:
+                family = self._labelled_gauges[name]
+                family[self._label_key(family, labels)] = value
+            else:
+                self._gauges[name] = value
     
-    def record_time(self, name: str, duration: float) -> None:
+    def record_time(self, name: str, duration: float, labels: dict[str, Any] | None = None) -> None:
         """Record a timing measurement.
         
         Args:
             name: Timer name
             duration: Duration in seconds
+            labels: Optional labels identifying the series
         """
         with self._lock:
-            self._timers[name].add(duration)
+            if labels:
+                family = self._labelled_timers[name]
+                key = self._label_key(family, labels)
+                stats = family.get(key)
+                if stats is None:
+                    stats = family[key] = TimerStats()
+                stats.add(duration)
+            else:
+                self._timers[name].add(duration)
     
     def get_metrics(self) -> dict[str, Any]:
         """Get all metrics.
         
+        Labelled metrics are returned under ``labelled`` as lists of samples,
+        each with a ``labels`` dict and either a ``value`` or timer ``stats``.
+        
         Returns:
             Dictionary of all metrics
         """
         with self._lock:
             uptime = datetime.now() - self._start_time
-            
-            return {
-                "uptime_seconds": uptime.total_seconds(),
-                "counters": dict(self._counters),
-                "gauges": dict(self._gauges),
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            timers = {name: stats.copy() for name, stats in self._timers.items()}
+            labelled_counters = {name: dict(family) for name, family in self._labelled_counters.items()}
+            labelled_gauges = {name: dict(family) for name, family in self._labelled_gauges.items()}
+            labelled_timers = {
+                name: {key: stats.copy() for key, stats in family.items()}
+                for name, family in self._labelled_timers.items()
+            }
+        
+        # Summarize outside the lock so scrapes don't block recording
+        return {
+            "uptime_seconds": uptime.total_seconds(),
+            "counters": counters,
+            "gauges": gauges,
+            "timers": {
+                name: stats.get_stats()
+                for name, stats in timers.items()
+            },
+            "labelled": {
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in family.items()]
+                    for name, family in labelled_counters.items()
+                },
+                "gauges": {
+                    name: [{"labels": dict(key), "value": value} for key, value in family.items()]
+                    for name, family in labelled_gauges.items()
+                },
                 "timers": {
-                    name: stats.get_stats()
-                    for name, stats in self._timers.items()
+                    name: [{"labels": dict(key), "stats": stats.get_stats()} for key, stats in family.items()]
+                    for name, family in labelled_timers.items()
                 }
             }
+        }
 
 class Timer:
     """Context manager for timing operations."""
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, labels: dict[str, Any] | None = None):
         """Initialize timer.
         
         Args:
             name: Name of the operation being timed
+            labels: Optional labels identifying the series
         """
         self.name = name
+        self.labels = labels
         self.start_time: float | None = None
         self.metrics = Metrics()
     
     def __enter__(self) -> 'Timer':
         """Start timing."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Stop timing and record duration."""
         if self.start_time is not None:
-            duration = time.time() - self.start_time
-            self.metrics.record_time(self.name, duration)
+            duration = time.perf_counter() - self.start_time
+            self.metrics.record_time(self.name, duration, self.labels)
             
 def track_time(name: str):
     """Decorator for timing function calls.
@@ -45,10 +45,24 @@ class PrometheusFormatter:
             Formatted metric line
         """
         if labels:
-            label_str = ','.join(f'{k}="{v}"' for k, v in sorted(labels.items()))
+            label_str = ','.join(
+                f'{k}="{PrometheusFormatter.escape_label_value(v)}"' for k, v in sorted(labels.items())
+            )
             return f"{name}{{{label_str}}} {value}"
         return f"{name} {value}"
     
+    @staticmethod
+    def escape_label_value(value: Any) -> str:
+        """Escape a label value for the Prometheus text format.
+        
+        Args:
+            value: Label value
+            
+        Returns:
+            Escaped value
+        """
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    
     @staticmethod
     def sanitize_name(name: str) -> str:
         """Sanitize metric name to follow Prometheus naming conventions.
@@ -103,12 +117,19 @@ class PrometheusFormatter:
         return lines
     
     @classmethod
-    def format_histogram(cls, name: str, stats: dict[str, float], help_text: str = "") -> list[str]:
-        """Format histogram metrics from timer stats.
+    def format_family(
+        cls,
+        name: str,
+        type_name: str,
+        samples: list[dict[str, Any]],
+        help_text: str = ""
+    ) -> list[str]:
+        """Format a labelled counter or gauge with one line per label set.
         
         Args:
-            name: Base metric name
-            stats: Timer statistics
+            name: Metric name
+            type_name: Metric type ("counter" or "gauge")
+            samples: Samples with ``labels`` and ``value`` keys
             help_text: Optional help text
             
         Returns:
@@ -116,32 +137,96 @@ class PrometheusFormatter:
         """
         name = cls.sanitize_name(name)
         lines = []
-        
-        # Add help and type
         if help_text:
-            lines.append(cls.format_help(f"{name}_seconds", help_text))
-        lines.append(cls.format_type(f"{name}_seconds", "histogram"))
+            lines.append(cls.format_help(name, help_text))
+        lines.append(cls.format_type(name, type_name))
+        for sample in samples:
+            lines.append(cls.format_metric(name, float(sample["value"]), sample["labels"]))
+        return lines
+    
+    @classmethod
+    def _format_histogram_samples(
+        cls,
+        name: str,
+        stats: dict[str, Any],
+        labels: dict[str, str] | None = None
+    ) -> list[str]:
+        """Format bucket, sum and count lines of one histogram series.
         
-        # Add count
-        lines.append(cls.format_metric(
-            f"{name}_seconds_count",
-            float(stats["count"])
-        ))
+        Args:
+            name: Sanitized metric name including the unit suffix
+            stats: Timer statistics
+            labels: Optional labels of the series
+            
+        Returns:
+            List of formatted lines
+        """
+        labels = labels or {}
+        lines = []
+        
+        # Add cumulative buckets, falling back to just +Inf for stats without them
+        buckets = stats.get("buckets") or {"+Inf": stats["count"]}
+        for le, count in buckets.items():
+            lines.append(cls.format_metric(
+                f"{name}_bucket",
+                float(count),
+                {**labels, "le": le}
+            ))
         
         # Add sum
         lines.append(cls.format_metric(
-            f"{name}_seconds_sum",
-            float(stats["total"])
+            f"{name}_sum",
+            float(stats["total"]),
+            labels
         ))
         
-        # Add bucket for max (infinity bucket)
+        # Add count
         lines.append(cls.format_metric(
-            f"{name}_seconds_bucket",
+            f"{name}_count",
             float(stats["count"]),
-            {"le": "+Inf"}
+            labels
         ))
         
         return lines
+    
+    @classmethod
+    def format_histogram(cls, name: str, stats: dict[str, Any], help_text: str = "") -> list[str]:
+        """Format histogram metrics from timer stats.
+        
+        Args:
+            name: Base metric name
+            stats: Timer statistics
+            help_text: Optional help text
+            
+        Returns:
+            List of formatted lines
+        """
+        return cls.format_histogram_family(name, [{"labels": {}, "stats": stats}], help_text)
+    
+    @classmethod
+    def format_histogram_family(cls, name: str, samples: list[dict[str, Any]], help_text: str = "") -> list[str]:
+        """Format a labelled histogram with one series per label set.
+        
+        Args:
+            name: Base metric name
+            samples: Samples with ``labels`` and ``stats`` keys
+            help_text: Optional help text
+            
+        Returns:
+            List of formatted lines
+        """
+        name = f"{cls.sanitize_name(name)}_seconds"
+        lines = []
+        
+        # Add help and type
+        if help_text:
+            lines.append(cls.format_help(name, help_text))
+        lines.append(cls.format_type(name, "histogram"))
+        
+        for sample in samples:
+            lines.extend(cls._format_histogram_samples(name, sample["stats"], sample["labels"]))
+        
+        return lines
 
 def format_prometheus_metrics(metrics: dict[str, Any]) -> str:
     """Convert metrics dictionary to Prometheus format.
@@ -186,4 +271,29 @@ def format_prometheus_metrics(metrics: dict[str, Any]) -> str:
             f"Histogram of {name.replace('_', ' ')} durations"
         ))
     
+    # Add labelled metric families
+    labelled = metrics.get("labelled", {})
+    for name, samples in labelled.get("counters", {}).items():
+        lines.extend(formatter.format_family(
+            f"golfcal_{name}_total",
+            "counter",
+            samples,
+            f"Total number of {name.replace('_', ' ')}"
+        ))
+    
+    for name, samples in labelled.get("gauges", {}).items():
+        lines.extend(formatter.format_family(
+            f"golfcal_{name}",
+            "gauge",
+            samples,
+            f"Current value of {name.replace('_', ' ')}"
+        ))
+    
+    for name, samples in labelled.get("timers", {}).items():
+        lines.extend(formatter.format_histogram_family(
+            f"golfcal_{name}",
+            samples,
+            f"Histogram of {name.replace('_', ' ')} durations"
+        ))
+    
     return '\n'.join(lines) + '\n' 
\ No newline at end of file
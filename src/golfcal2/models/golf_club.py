@@ -16,7 +16,7 @@ from golfcal2.api.wise_golf import WiseGolf0API, WiseGolfAPI
 from golfcal2.models.mixins import PlayerFetchMixin
 from golfcal2.models.user import Membership
 from golfcal2.services.auth_service import AuthService
-from golfcal2.utils.logging_utils import LoggerMixin
+from golfcal2.utils.logging_utils import LoggerMixin, payload
 from golfcal2.utils.timezone_utils import TimezoneManager
 
 # Type definitions
@@ -183,7 +183,7 @@ class GolfClub(ABC, LoggerMixin):
             headers: Dictionary of headers to use for authentication
         """
         self._auth_headers = headers
-        self.logger.debug(f"Set auth headers: {headers}")
+        self.logger.debug("Set auth headers: %s", payload(headers))
 
     def _init_api_client(self) -> None:
         """Initialize API client based on club type."""
@@ -323,7 +323,7 @@ class BaseWiseGolfClub(GolfClub, PlayerFetchMixin):
         
         self.logger.debug("Fetching players")
         response = api.get_players(reservation)
-        self.logger.debug(f"Got response: {response}")
+        self.logger.debug("Got response: %s", payload(response))
         
         # Return the response directly without converting to list
         return response
@@ -367,7 +367,7 @@ class WiseGolfClub(BaseWiseGolfClub):
             
         self.logger.debug(f"WiseGolfClub.fetch_players - Calling fetch_players_from_rest with rest_url: {rest_url}")
         response = self.fetch_players_from_rest(reservation, membership, WiseGolfAPI, rest_url)
-        self.logger.debug(f"WiseGolfClub.fetch_players - Got response: {response}")
+        self.logger.debug("WiseGolfClub.fetch_players - Got response: %s", payload(response))
         
         # Extract players from response if it's a dictionary with reservationsGolfPlayers
         if isinstance(response, dict) and 'reservationsGolfPlayers' in response:
@@ -393,7 +393,7 @@ class WiseGolf0Club(BaseWiseGolfClub):
     
     def fetch_players(self, reservation: dict[str, Any], membership: Membership) -> list[dict[str, Any]]:
         """Fetch players for a reservation."""
-        self.logger.debug(f"WiseGolf0Club.fetch_players - Starting with reservation: {reservation}")
+        self.logger.debug("WiseGolf0Club.fetch_players - Starting with reservation: %s", payload(reservation))
         
         club_details = self._ensure_club_details()
             
@@ -404,7 +404,7 @@ class WiseGolf0Club(BaseWiseGolfClub):
             
         self.logger.debug(f"WiseGolf0Club.fetch_players - Calling fetch_players_from_rest with rest_url: {rest_url}")
         response = self.fetch_players_from_rest(reservation, membership, WiseGolf0API, rest_url)
-        self.logger.debug(f"WiseGolf0Club.fetch_players - Got response: {response}")
+        self.logger.debug("WiseGolf0Club.fetch_players - Got response: %s", payload(response))
         
         # Extract players from response if it's a dictionary with reservationsGolfPlayers
         if isinstance(response, dict) and 'reservationsGolfPlayers' in response:
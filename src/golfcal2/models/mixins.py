@@ -14,7 +14,8 @@ import icalendar  # type: ignore
 import requests
 
 from golfcal2.models.user import Membership
-from golfcal2.utils.logging_utils import LoggerMixin
+from golfcal2.utils.logging_utils import LoggerMixin, payload
+from golfcal2.utils.retry_policy import retry_policy
 
 # Type aliases for icalendar types
 ICalEvent = TypeVar('ICalEvent', bound=icalendar.Event)
@@ -158,8 +159,8 @@ class PlayerFetchMixin(LoggerMixin):
                 return []
             
             self.logger.debug(f"extract_players_from_response - Response type: {type(response)}")
-            self.logger.debug(f"extract_players_from_response - Response: {response}")
-            self.logger.debug(f"extract_players_from_response - Reservation: {reservation}")
+            self.logger.debug("extract_players_from_response - Response: %s", payload(response))
+            self.logger.debug("extract_players_from_response - Reservation: %s", payload(reservation))
             
             resp_data = ResponseData(response)
             
@@ -243,7 +244,7 @@ class PlayerFetchMixin(LoggerMixin):
             List of player data dictionaries
         """
         self.logger.debug("_extract_players_wisegolf0 - Starting extraction")
-        self.logger.debug(f"_extract_players_wisegolf0 - Reservation: {reservation}")
+        self.logger.debug("_extract_players_wisegolf0 - Reservation: %s", payload(reservation))
         
         # Get the list of players from the response
         if not isinstance(response, dict) or 'reservationsGolfPlayers' not in response:
@@ -361,7 +362,7 @@ class PlayerFetchMixin(LoggerMixin):
             List of player dictionaries
         """
         try:
-            self.logger.debug(f"PlayerFetchMixin.fetch_players_from_rest - Starting with reservation: {reservation}")
+            self.logger.debug("PlayerFetchMixin.fetch_players_from_rest - Starting with reservation: %s", payload(reservation))
             
             # Create API instance with REST URL
             self.logger.debug(f"PlayerFetchMixin.fetch_players_from_rest - Creating {api_class.__name__} instance with URL: {rest_url}")
@@ -370,7 +371,7 @@ class PlayerFetchMixin(LoggerMixin):
             # Pass the full reservation data to get_players
             self.logger.debug("PlayerFetchMixin.fetch_players_from_rest - Calling get_players with reservation data")
             response = api.get_players(reservation)
-            self.logger.debug(f"PlayerFetchMixin.fetch_players_from_rest - Got response: {response}")
+            self.logger.debug("PlayerFetchMixin.fetch_players_from_rest - Got response: %s", payload(response))
             
             # Extract players from response
             self.logger.debug("PlayerFetchMixin.fetch_players_from_rest - Calling extract_players_from_response")
@@ -488,7 +489,7 @@ class RequestHandlerMixin:
         """Make HTTP request with error handling."""
         url = urljoin(self.base_url, endpoint)
         try:
-            response = self.session.request(method, url, **kwargs)
+            response = retry_policy.request(self.session, method, url, **kwargs)
             response.raise_for_status()
             return cast(dict[str, Any], response.json())
         except requests.exceptions.Timeout as e:
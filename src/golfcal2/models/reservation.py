@@ -11,7 +11,8 @@ from golfcal2.models.golf_club import ExternalGolfClub, GolfClub
 from golfcal2.models.user import Membership, User
 from golfcal2.services.weather_formatter import WeatherFormatter
 from golfcal2.services.weather_types import WeatherData, WeatherResponse
-from golfcal2.utils.logging_utils import LoggerMixin
+from golfcal2.tracing import span
+from golfcal2.utils.logging_utils import LoggerMixin, payload
 from golfcal2.utils.timezone_utils import TimezoneManager
 
 
@@ -279,9 +280,10 @@ class Reservation(LoggerMixin):
         # For future events, try to fetch additional players
         if hasattr(self.club, 'fetch_players'):
             try:
-                self.logger.debug(f"Calling club.fetch_players with raw_data: {self.raw_data}")
-                player_data_list = self.club.fetch_players(self.raw_data, self.membership)
-                self.logger.debug(f"Got response from club.fetch_players: {player_data_list}")
+                self.logger.debug("Calling club.fetch_players with raw_data: %s", payload(self.raw_data))
+                with span('players', club=self.club.name):
+                    player_data_list = self.club.fetch_players(self.raw_data, self.membership)
+                self.logger.debug("Got response from club.fetch_players: %s", payload(player_data_list))
                 
                 # Check if we got a dictionary with reservationsGolfPlayers and rows
                 if isinstance(player_data_list, dict):
@@ -614,7 +616,7 @@ class Reservation(LoggerMixin):
             _tz_manager=tz_manager
         )
         
-        temp_instance.logger.debug(f"Processing NexGolf data: {data}")
+        temp_instance.logger.debug("Processing NexGolf data: %s", payload(data))
         
         # Parse start time using club's method
         start_time = club.parse_start_time(data)
@@ -629,7 +631,7 @@ class Reservation(LoggerMixin):
         
         # Process players from NexGolf format
         if "players" in data:
-            temp_instance.logger.debug(f"Processing NexGolf players: {data.get('players')}")
+            temp_instance.logger.debug("Processing NexGolf players: %s", payload(data.get('players')))
             try:
                 for player_data in data["players"]:
                     temp_instance.logger.debug(f"Processing player data: {player_data}")
@@ -639,7 +641,7 @@ class Reservation(LoggerMixin):
                         temp_instance.logger.debug(f"Added player: {player.name} ({player.club}, {player.handicap})")
             except Exception as e:
                 temp_instance.logger.error(f"Failed to process NexGolf player data: {e}", exc_info=True)
-                temp_instance.logger.debug(f"Raw data that caused error: {data}")
+                temp_instance.logger.debug("Raw data that caused error: %s", payload(data))
         
         # If no players found, add the user as default player
         if not players:
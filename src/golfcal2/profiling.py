@@ -0,0 +1,341 @@
+"""Profiling helpers for the running service and CLI commands.
+
+``SamplingProfiler`` periodically captures the stacks of all threads with
+``sys._current_frames()``. Unlike cProfile it needs no interpreter hooks, so it
+can observe threads that are already running and its overhead is bounded by
+the sampling interval. ``MemoryProfiler`` reports tracemalloc allocation
+growth between successive snapshots; tracing stops again when no snapshot has
+been asked for within its idle timeout.
+"""
+
+import cProfile
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+
+# Only one profile may run at a time; concurrent requests are rejected
+_profile_lock = threading.Lock()
+
+# Frames kept per allocation when profiling a whole command with tracemalloc
+_ALLOC_FRAMES = 25
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Format a frame as ``module:function``."""
+    module = frame.f_globals.get('__name__', '?')
+    return f"{module}:{frame.f_code.co_name}"
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling the stacks of all threads."""
+    
+    def __init__(self, interval: float = 0.01, max_depth: int = 64):
+        """Initialize profiler.
+        
+        Args:
+            interval: Seconds between samples
+            max_depth: Maximum number of frames kept per stack
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+    
+    def _sample(self, ignore_thread_ids: set[int]) -> None:
+        """Capture one stack per thread."""
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in ignore_thread_ids:
+                continue
+            labels = []
+            current: FrameType | None = frame
+            while current is not None and len(labels) < self.max_depth:
+                labels.append(_frame_label(current))
+                current = current.f_back
+            labels.append(thread_names.get(thread_id, str(thread_id)))
+            self.stacks[';'.join(reversed(labels))] += 1
+        self.samples += 1
+    
+    def start(self, ignore_thread_ids: set[int] | None = None) -> None:
+        """Start sampling in a background thread.
+        
+        Args:
+            ignore_thread_ids: Threads to leave out of the samples besides the sampler itself
+        
+        Raises:
+            ProfilerBusyError: If another profile is already running
+        """
+        if not _profile_lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._sample_loop,
+            args=(set(ignore_thread_ids or ()),),
+            name='golfcal2-profiler',
+            daemon=True
+        )
+        self._thread.start()
+    
+    def _sample_loop(self, ignore_thread_ids: set[int]) -> None:
+        """Take samples until stopped."""
+        ignore_thread_ids.add(threading.get_ident())
+        while not self._stop_event.wait(self.interval):
+            self._sample(ignore_thread_ids)
+    
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        try:
+            self._stop_event.set()
+            self._thread.join()
+        finally:
+            _profile_lock.release()
+    
+    def run(self, seconds: float) -> None:
+        """Sample all other threads for the given duration.
+        
+        Blocks the calling thread, which is excluded from the samples.
+        
+        Args:
+            seconds: Profiling duration
+        
+        Raises:
+            ProfilerBusyError: If another profile is already running
+        """
+        self.start(ignore_thread_ids={threading.get_ident()})
+        try:
+            time.sleep(seconds)
+        finally:
+            self.stop()
+    
+    def collapsed(self) -> str:
+        """Get samples as collapsed stacks (one ``frame;frame;... count`` per line).
+        
+        The output can be fed to flamegraph.pl, speedscope or inferno.
+        """
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+    
+    def top(self, limit: int = 30) -> str:
+        """Get a pstats-like table of the functions seen most often.
+        
+        Args:
+            limit: Number of functions to list
+        
+        Returns:
+            Table of own (top of stack) and cumulative sample counts
+        """
+        own: Counter[str] = Counter()
+        cumulative: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(';')[1:]  # Drop thread name
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for label in set(frames):
+                cumulative[label] += count
+        
+        total = max(sum(self.stacks.values()), 1)
+        lines = [
+            f"{self.samples} samples, {sum(self.stacks.values())} thread stacks",
+            "",
+            f"{'own':>8} {'own%':>6} {'cum':>8} {'cum%':>6}  function"
+        ]
+        for label, cum_count in cumulative.most_common(limit):
+            own_count = own.get(label, 0)
+            lines.append(
+                f"{own_count:>8} {100 * own_count / total:>5.1f}% "
+                f"{cum_count:>8} {100 * cum_count / total:>5.1f}%  {label}"
+            )
+        return '\n'.join(lines) + '\n'
+
+
+class MemoryProfiler:
+    """Report allocation growth between tracemalloc snapshots.
+    
+    tracemalloc slows down every allocation, so tracing started by ``diff``
+    is stopped once ``idle_timeout`` seconds pass without another diff, or
+    by ``stop``.
+    """
+    
+    _filters = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    )
+    
+    def __init__(self, frames: int = 1, idle_timeout: float = 300.0):
+        """Initialize profiler.
+        
+        Args:
+            frames: Number of frames tracemalloc stores per allocation
+            idle_timeout: Seconds after the last diff before tracing stops
+        """
+        self.frames = frames
+        self.idle_timeout = idle_timeout
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._started = False
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+    
+    def diff(self, limit: int = 20) -> dict[str, Any]:
+        """Take a snapshot and compare it with the previous one.
+        
+        The first call starts tracemalloc and records the baseline. Tracing
+        started here stops ``idle_timeout`` seconds after the last call;
+        tracing started by someone else is left running.
+        
+        Args:
+            limit: Number of allocation sites to report
+        
+        Returns:
+            Dictionary with traced memory totals, the top allocation sites by
+            growth and the seconds until tracing stops (None if not ours)
+        """
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._started = True
+                self._snapshot = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._started:
+                self._timer = threading.Timer(self.idle_timeout, self.stop)
+                self._timer.daemon = True
+                self._timer.start()
+            
+            snapshot = tracemalloc.take_snapshot().filter_traces(self._filters)
+            previous, self._snapshot = self._snapshot, snapshot
+            current, peak = tracemalloc.get_traced_memory()
+            
+            result: dict[str, Any] = {
+                'traced_kb': round(current / 1024, 1),
+                'peak_kb': round(peak / 1024, 1),
+                'baseline': previous is None,
+                'stops_in_seconds': self.idle_timeout if self._started else None,
+                'top': []
+            }
+            if previous is None:
+                return result
+            
+            for stat in snapshot.compare_to(previous, 'lineno')[:limit]:
+                frame = stat.traceback[0]
+                result['top'].append({
+                    'location': f"{frame.filename}:{frame.lineno}",
+                    'size_kb': round(stat.size / 1024, 1),
+                    'size_diff_kb': round(stat.size_diff / 1024, 1),
+                    'count': stat.count,
+                    'count_diff': stat.count_diff
+                })
+            return result
+    
+    def stop(self) -> bool:
+        """Stop tracing started by ``diff`` and forget the baseline.
+        
+        Returns:
+            True if tracing was stopped
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._snapshot = None
+            if not self._started:
+                return False
+            self._started = False
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            return True
+
+
+PROFILE_MODES = ('cpu', 'wall', 'alloc')
+
+
+def profile_call(
+    mode: str,
+    func: Callable[..., T],
+    *args: Any,
+    output_dir: str | Path,
+    name: str = 'profile',
+    **kwargs: Any
+) -> tuple[T, list[Path]]:
+    """Call a function under a profiler and write the profile artifacts.
+    
+    Modes:
+        cpu: cProfile timed with process CPU time, written as ``.pstats``
+        wall: cProfile timed with wall-clock time, written as ``.pstats``
+        alloc: tracemalloc allocation sites, written as ``.alloc.txt``
+    
+    Every mode also writes a ``.collapsed`` file for flamegraph tools. For cpu
+    and wall it holds wall-clock stack samples of all threads; for alloc it
+    holds allocated bytes per allocation stack.
+    
+    Args:
+        mode: Profiling mode, one of PROFILE_MODES
+        func: Function to call
+        *args: Positional arguments for func
+        output_dir: Directory for the artifacts
+        name: Artifact file name prefix
+        **kwargs: Keyword arguments for func
+    
+    Returns:
+        Tuple of the function result and the written artifact paths
+    
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode: {mode}")
+    
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    base = directory / f"{name}-{mode}-{time.strftime('%Y%m%d-%H%M%S')}"
+    collapsed_path = base.with_name(base.name + '.collapsed')
+    
+    if mode == 'alloc':
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(_ALLOC_FRAMES)
+        try:
+            result = func(*args, **kwargs)
+            snapshot = tracemalloc.take_snapshot().filter_traces(MemoryProfiler._filters)
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        
+        report_path = base.with_name(base.name + '.alloc.txt')
+        with open(report_path, 'w', encoding='utf-8') as f:
+            for stat in snapshot.statistics('lineno')[:100]:
+                f.write(f"{stat}\n")
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for stat in snapshot.statistics('traceback'):
+                stack = ';'.join(
+                    f"{os.path.basename(frame.filename)}:{frame.lineno}" for frame in stat.traceback
+                )
+                f.write(f"{stack} {stat.size}\n")
+        return result, [report_path, collapsed_path]
+    
+    profiler = cProfile.Profile(time.process_time if mode == 'cpu' else time.perf_counter)
+    sampler = SamplingProfiler()
+    sampler.start()
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+    finally:
+        sampler.stop()
+    
+    pstats_path = base.with_name(base.name + '.pstats')
+    profiler.dump_stats(pstats_path)
+    collapsed_path.write_text(sampler.collapsed(), encoding='utf-8')
+    return result, [pstats_path, collapsed_path]
@@ -0,0 +1,247 @@
+"""In-memory schedule of the service's wake-ups.
+
+The service keeps a min-heap of triggers:
+
+    sync            periodic calendar sync of one user
+    reminder        re-sync of one user 30 and 15 minutes before a reservation
+    cache_refresh   removal of expired weather responses
+
+Reminders are updated from the reservations each sync returns, so finding the
+next wake-up is a heap lookup without any network or disk I/O. Rescheduling or
+cancelling a trigger leaves its old heap entry in place; stale entries are
+skipped when they reach the top of the heap.
+
+With ``spread`` each user syncs at a fixed offset within the interval derived
+from a hash of the user name, so syncs are spread evenly instead of all
+hitting the APIs at the top of the hour. ``jitter`` adds a random variation
+to each sync time on top of that.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+SYNC = 'sync'
+REMINDER = 'reminder'
+CACHE_REFRESH = 'cache_refresh'
+
+# Reminder offsets before an event's start
+REMINDER_OFFSETS = (timedelta(minutes=30), timedelta(minutes=15))
+
+
+@dataclass(order=True, frozen=True)
+class Trigger:
+    """A scheduled wake-up, ordered by time."""
+    when: datetime
+    seq: int
+    kind: str = field(compare=False)
+    key: str = field(compare=False)
+    user: str | None = field(compare=False, default=None)
+
+
+class Scheduler:
+    """Min-heap of triggers with replace-by-key semantics."""
+    
+    def __init__(
+        self,
+        sync_interval: timedelta = timedelta(hours=1),
+        spread: bool = False,
+        jitter: timedelta = timedelta(0),
+        rng: random.Random | None = None
+    ):
+        """Initialize scheduler.
+        
+        Args:
+            sync_interval: Interval of the regular per-user syncs, aligned to
+                the start of the interval (e.g. the top of the hour)
+            spread: Give each user a fixed sync offset within the interval
+            jitter: Maximum random deviation of each sync time
+            rng: Random generator for the jitter
+        """
+        self.sync_interval = sync_interval
+        self.spread = spread
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self._heap: list[Trigger] = []
+        self._live: dict[tuple[str, str], Trigger] = {}  # (kind, key) -> current trigger
+        self._user_reminders: dict[str, set[str]] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+    
+    def __len__(self) -> int:
+        """Number of live triggers."""
+        with self._lock:
+            return len(self._live)
+    
+    def schedule(self, kind: str, key: str, when: datetime, user: str | None = None) -> Trigger:
+        """Schedule a trigger, replacing any earlier one with the same kind and key.
+        
+        Args:
+            kind: Trigger kind (SYNC, REMINDER, CACHE_REFRESH)
+            key: Identifier unique within the kind
+            when: Time to fire
+            user: User the trigger belongs to
+        
+        Returns:
+            The scheduled trigger
+        """
+        with self._lock:
+            trigger = self._push(kind, key, when, user)
+        # Let a waiting loop recompute its timeout
+        self._wakeup.set()
+        return trigger
+    
+    def _push(self, kind: str, key: str, when: datetime, user: str | None) -> Trigger:
+        """Push a trigger; the caller holds the lock."""
+        trigger = Trigger(when, next(self._seq), kind, key, user)
+        self._live[(kind, key)] = trigger
+        heapq.heappush(self._heap, trigger)
+        return trigger
+    
+    def cancel(self, kind: str, key: str) -> None:
+        """Cancel a trigger if scheduled.
+        
+        Args:
+            kind: Trigger kind
+            key: Trigger key
+        """
+        with self._lock:
+            self._live.pop((kind, key), None)
+    
+    def _is_live(self, trigger: Trigger) -> bool:
+        """Check whether a heap entry is still the current trigger of its key."""
+        return self._live.get((trigger.kind, trigger.key)) is trigger
+    
+    def next_trigger(self) -> Trigger | None:
+        """Get the earliest live trigger without removing it.
+        
+        Also resets the wake-up signal, so ``wait()`` returns early only for
+        changes made after this call.
+        """
+        with self._lock:
+            self._wakeup.clear()
+            while self._heap and not self._is_live(self._heap[0]):
+                heapq.heappop(self._heap)
+            return self._heap[0] if self._heap else None
+    
+    def pop_due(self, now: datetime) -> list[Trigger]:
+        """Remove and return all triggers due at or before now.
+        
+        Args:
+            now: Current time
+        
+        Returns:
+            Due triggers in time order
+        """
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0].when <= now:
+                trigger = heapq.heappop(self._heap)
+                if self._is_live(trigger):
+                    del self._live[(trigger.kind, trigger.key)]
+                    due.append(trigger)
+            # Drop stale entries from the top so the heap does not grow with cancelled triggers
+            while self._heap and not self._is_live(self._heap[0]):
+                heapq.heappop(self._heap)
+        return due
+    
+    def sync_offset(self, key: str) -> timedelta:
+        """Get the fixed offset of a key's syncs within the interval.
+        
+        Args:
+            key: User name
+        
+        Returns:
+            Offset from the start of the interval, zero unless spreading
+        """
+        if not self.spread:
+            return timedelta(0)
+        fraction = zlib.crc32(key.encode('utf-8')) / 2 ** 32
+        return timedelta(seconds=int(fraction * self.sync_interval.total_seconds()))
+    
+    def next_sync_time(self, now: datetime, key: str | None = None) -> datetime:
+        """Get the next sync time after now.
+        
+        Args:
+            now: Current time
+            key: User name; without one, the start of the next interval is returned
+        
+        Returns:
+            Next sync time, with the key's offset and jitter applied
+        """
+        interval = int(self.sync_interval.total_seconds())
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elapsed = int((now - midnight).total_seconds())
+        interval_start = midnight + timedelta(seconds=elapsed // interval * interval)
+        if key is None:
+            return interval_start + self.sync_interval
+        
+        when = interval_start + self.sync_offset(key)
+        # A slot within the jitter window is the one just synced (possibly early)
+        if when <= now + self.jitter:
+            when += self.sync_interval
+        if self.jitter:
+            jitter = self.jitter.total_seconds()
+            when += timedelta(seconds=self._rng.uniform(-jitter, jitter))
+        return when
+    
+    def schedule_sync(self, user: str, now: datetime) -> Trigger:
+        """Schedule the next regular sync of a user.
+        
+        Args:
+            user: User name
+            now: Current time
+        
+        Returns:
+            The scheduled trigger
+        """
+        return self.schedule(SYNC, user, self.next_sync_time(now, user), user=user)
+    
+    def update_reminders(self, user: str, events: Iterable[tuple[str, datetime]], now: datetime) -> int:
+        """Replace a user's reminders with those of the given events.
+        
+        Reminders whose time has already passed are not scheduled.
+        
+        Args:
+            user: User name
+            events: (uid, start time) of the user's upcoming events
+            now: Current time
+        
+        Returns:
+            Number of scheduled reminders
+        """
+        keys = set()
+        with self._lock:
+            for uid, start in events:
+                for offset in REMINDER_OFFSETS:
+                    when = start - offset
+                    if when <= now:
+                        continue
+                    key = f"{uid}@{int(offset.total_seconds() // 60)}"
+                    # Keep an unchanged trigger to avoid growing the heap on every sync
+                    current = self._live.get((REMINDER, key))
+                    if current is None or current.when != when:
+                        self._push(REMINDER, key, when, user)
+                    keys.add(key)
+            for key in self._user_reminders.get(user, set()) - keys:
+                self._live.pop((REMINDER, key), None)
+            self._user_reminders[user] = keys
+        self._wakeup.set()
+        return len(keys)
+    
+    def wait(self, timeout: float) -> bool:
+        """Sleep until the timeout passes or a trigger is (re)scheduled.
+        
+        Args:
+            timeout: Maximum seconds to sleep
+        
+        Returns:
+            True if woken early by a schedule change
+        """
+        return self._wakeup.wait(max(timeout, 0.0))
@@ -1,39 +1,342 @@
 """HTTP server for health checks and monitoring."""
 
+import gzip
+import hashlib
 import json
+import os
+import re
+import socket
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, unquote, urlparse
 
 from golfcal2.health import get_health_status
 from golfcal2.metrics import Metrics
 from golfcal2.metrics_prometheus import format_prometheus_metrics
+from golfcal2.profiling import MemoryProfiler, ProfilerBusyError, SamplingProfiler
 from golfcal2.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Calendar names are used as file names, so only allow a conservative character set
+_CALENDAR_PATH_RE = re.compile(r'^/calendars/(?P<name>[\w\-. ]+)\.ics$')
+
+# Upper bound for /debug/profile?seconds=N
+MAX_PROFILE_SECONDS = 60
+
+# Sent from the accepting thread when every worker is busy and the queue is full
+_BUSY_BODY = json.dumps({'error': 'Service Unavailable', 'message': 'Server busy'}).encode('utf-8')
+_BUSY_RESPONSE = (
+    b'HTTP/1.1 503 Service Unavailable\r\n'
+    b'Content-Type: application/json\r\n'
+    b'Content-Length: ' + str(len(_BUSY_BODY)).encode('ascii') + b'\r\n'
+    b'Retry-After: 1\r\n'
+    b'Connection: close\r\n'
+    b'\r\n' + _BUSY_BODY
+)
+
+@dataclass
+class CalendarFeedEntry:
+    """In-memory copy of a calendar file."""
+    mtime_ns: int
+    size: int
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    last_modified: str
+    mtime: int
+
+class CalendarFeedCache:
+    """Cache of generated ICS files, refreshed when the file changes on disk."""
+    
+    def __init__(self, ics_dir: str | Path):
+        """Initialize cache.
+        
+        Args:
+            ics_dir: Directory containing the generated ICS files
+        """
+        self.ics_dir = Path(ics_dir).resolve()
+        self._entries: dict[str, CalendarFeedEntry] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, name: str) -> CalendarFeedEntry | None:
+        """Get the current entry for a calendar.
+        
+        The file is stat'ed on every call; its contents are only re-read and
+        re-compressed when the modification time or size changes.
+        
+        Args:
+            name: Calendar name (file name without the .ics suffix)
+            
+        Returns:
+            Cached entry or None if the calendar does not exist
+        """
+        path = (self.ics_dir / f"{name}.ics").resolve()
+        if path.parent != self.ics_dir:
+            return None
+        
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                self._entries.pop(name, None)
+            return None
+        
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                return entry
+        
+        entry = self._load(path, stat)
+        with self._lock:
+            self._entries[name] = entry
+        return entry
+    
+    @staticmethod
+    def _load(path: Path, stat: os.stat_result) -> CalendarFeedEntry:
+        """Read and pre-compress a calendar file."""
+        body = path.read_bytes()
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        mtime = int(stat.st_mtime)
+        return CalendarFeedEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+            etag=f'"{digest}"',
+            last_modified=formatdate(mtime, usegmt=True),
+            mtime=mtime
+        )
+
 class HealthCheckHandler(BaseHTTPRequestHandler):
     """Handler for health check requests."""
     
-    def _send_response(self, status_code: int, data: dict[str, Any], content_type: str = 'application/json') -> None:
+    # Keep connections open between requests (Prometheus and calendar clients reuse them)
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls on reused connections
+    disable_nagle_algorithm = True
+    
+    # Set when the connection was handed to another thread, see _send_debug
+    detached = False
+    
+    def setup(self) -> None:
+        """Apply the server's request timeout to the connection socket."""
+        self.timeout = getattr(self.server, 'request_timeout', None)
+        super().setup()
+    
+    def handle(self) -> None:
+        """Handle requests until the client closes or idles past the keep-alive timeout.
+        
+        The request timeout applies while a request is read; between requests
+        the connection only holds its worker for the shorter keep-alive timeout.
+        """
+        self.close_connection = True
+        self.handle_one_request()
+        keepalive_timeout = getattr(self.server, 'keepalive_timeout', None)
+        while not self.close_connection:
+            self.connection.settimeout(keepalive_timeout)
+            try:
+                if not self.rfile.peek(1):
+                    return
+            except OSError:
+                return
+            self.connection.settimeout(self.timeout)
+            self.handle_one_request()
+    
+    def finish(self) -> None:
+        """Flush the response unless another thread now owns the connection."""
+        if not self.detached:
+            super().finish()
+    
+    def _send_response(
+        self,
+        status_code: int,
+        data: dict[str, Any] | str,
+        content_type: str = 'application/json',
+        head_only: bool = False
+    ) -> None:
         """Send response with appropriate content type.
         
         Args:
             status_code: HTTP status code
-            data: Response data
+            data: Response data, or the body text of a non-JSON response
             content_type: Content type header value
+            head_only: Whether to omit the response body, keeping its Content-Length
         """
-        self.send_response(status_code)
-        self.send_header('Content-Type', content_type)
-        self.end_headers()
-        
         if content_type == 'application/json':
             response = json.dumps(data, indent=2)
         else:
             response = str(data)
+        body = response.encode('utf-8')
+        
+        self.send_response(status_code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(body)
+    
+    def _accepts_gzip(self) -> bool:
+        """Check whether the client accepts gzip content encoding."""
+        for part in self.headers.get('Accept-Encoding', '').split(','):
+            coding, _, params = part.strip().partition(';')
+            if coding.strip().lower() in ('gzip', '*'):
+                return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+        return False
+    
+    def _is_not_modified(self, entry: CalendarFeedEntry) -> bool:
+        """Evaluate conditional request headers against a calendar entry."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since
+            tags = {tag.strip().removeprefix('W/').replace('-gzip"', '"') for tag in if_none_match.split(',')}
+            return '*' in tags or entry.etag in tags
+        
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return entry.mtime <= int(parsedate_to_datetime(if_modified_since).timestamp())
+            except (TypeError, ValueError):
+                return False
+        return False
+    
+    def _send_calendar(self, name: str, head_only: bool = False) -> None:
+        """Serve a calendar feed from the in-memory cache.
+        
+        Args:
+            name: Calendar name
+            head_only: Whether to omit the response body
+        """
+        feed: CalendarFeedCache | None = getattr(self.server, 'calendar_feed', None)
+        entry = feed.get(name) if feed else None
+        if entry is None:
+            self._send_response(404, {
+                'error': 'Not Found',
+                'message': f'Calendar not found: {name}'
+            }, head_only=head_only)
+            return
+        
+        metrics = Metrics()
+        metrics.increment('calendar_feed_requests')
+        
+        use_gzip = self._accepts_gzip()
+        etag = entry.etag[:-1] + '-gzip"' if use_gzip else entry.etag
+        
+        if self._is_not_modified(entry):
+            metrics.increment('calendar_feed_not_modified')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', entry.last_modified)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        
+        body = entry.gzip_body if use_gzip else entry.body
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/calendar; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', entry.last_modified)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(body)
+    
+    def _send_debug(self, path: str, query_params: dict[str, list[str]]) -> None:
+        """Serve the profiling endpoints if enabled.
+        
+        Args:
+            path: Request path
+            query_params: Parsed query parameters
+        """
+        if not getattr(self.server, 'debug_endpoints', False):
+            self._send_response(404, {
+                'error': 'Not Found',
+                'message': f'Path not found: {path}'
+            })
+            return
+        
+        try:
+            if path == '/debug/profile':
+                seconds = float(query_params.get('seconds', ['10'])[0])
+                interval_ms = float(query_params.get('interval_ms', ['10'])[0])
+                output_format = query_params.get('format', ['collapsed'])[0].lower()
+                if not 0 < seconds <= MAX_PROFILE_SECONDS or not 1 <= interval_ms <= 1000:
+                    raise ValueError(f"seconds must be in (0, {MAX_PROFILE_SECONDS}] and interval_ms in [1, 1000]")
+                if output_format not in ('collapsed', 'top'):
+                    raise ValueError("format must be 'collapsed' or 'top'")
+            elif path == '/debug/memory':
+                limit = int(query_params.get('limit', ['20'])[0])
+                stop = query_params.get('stop', ['0'])[0] in ('1', 'true')
+            else:
+                self._send_response(404, {
+                    'error': 'Not Found',
+                    'message': f'Path not found: {path}'
+                })
+                return
+        except ValueError as e:
+            self._send_response(400, {'error': 'Bad Request', 'message': str(e)})
+            return
+        
+        if path == '/debug/memory':
+            memory_profiler: MemoryProfiler = self.server.memory_profiler  # type: ignore[attr-defined]
+            if stop:
+                self._send_response(200, {'stopped': memory_profiler.stop()})
+            else:
+                self._send_response(200, memory_profiler.diff(limit))
+            return
+        
+        # Profile on a thread of its own, so the worker goes back to /health and /metrics
+        self.close_connection = True
+        self.detached = True
+        self.server.detach(self.connection)  # type: ignore[attr-defined]
+        threading.Thread(
+            target=self._send_profile,
+            args=(seconds, interval_ms, output_format),
+            name='health-http-profile',
+            daemon=True
+        ).start()
+    
+    def _send_profile(self, seconds: float, interval_ms: float, output_format: str) -> None:
+        """Run a sampling profile, send it and close the detached connection."""
+        try:
+            profiler = SamplingProfiler(interval=interval_ms / 1000)
+            try:
+                logger.info(f"Running sampling profile for {seconds:g} seconds")
+                profiler.run(seconds)
+            except ProfilerBusyError as e:
+                self._send_response(409, {'error': 'Conflict', 'message': str(e)})
+                return
             
-        self.wfile.write(response.encode('utf-8'))
+            output = profiler.collapsed() if output_format == 'collapsed' else profiler.top()
+            self._send_response(200, output, 'text/plain; charset=utf-8')
+        except OSError as e:
+            logger.warning(f"Failed to send profile to {self.address_string()}: {e}")
+        finally:
+            try:
+                super().finish()
+            except OSError:
+                pass
+            self.server.release(self.connection)  # type: ignore[attr-defined]
+    
+    def do_HEAD(self) -> None:
+        """Handle HEAD requests for calendar feeds."""
+        match = _CALENDAR_PATH_RE.match(unquote(urlparse(self.path).path))
+        if match:
+            self._send_calendar(match.group('name'), head_only=True)
+            return
+        self.send_response(404)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
     
     def do_GET(self) -> None:
         """Handle GET requests."""
@@ -41,6 +344,15 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
             parsed_url = urlparse(self.path)
             query_params = parse_qs(parsed_url.query)
             
+            match = _CALENDAR_PATH_RE.match(unquote(parsed_url.path))
+            if match:
+                self._send_calendar(match.group('name'))
+                return
+            
+            if parsed_url.path.startswith('/debug/'):
+                self._send_debug(parsed_url.path, query_params)
+                return
+            
             if parsed_url.path == '/health':
                 # Get health status
                 status = get_health_status()
@@ -81,19 +393,163 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         """Override to use our logger instead of printing to stderr."""
         logger.info(f"{self.address_string()} - {format%args}")
 
+class PooledHTTPServer(HTTPServer):
+    """HTTP server that handles connections on a bounded pool of worker threads.
+    
+    Unlike ``ThreadingHTTPServer`` the number of concurrent handlers is capped,
+    so a burst of slow requests cannot spawn an unbounded number of threads.
+    Connections beyond the workers and a bounded queue are answered with 503
+    right away instead of waiting behind busy workers.
+    """
+    
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type[BaseHTTPRequestHandler],
+        max_workers: int = 4,
+        request_timeout: float | None = 10.0,
+        calendar_feed: CalendarFeedCache | None = None,
+        debug_endpoints: bool = False,
+        max_pending: int = 16,
+        keepalive_timeout: float | None = 2.0
+    ):
+        """Initialize server.
+        
+        Args:
+            server_address: Address to bind to
+            handler_class: Request handler class
+            max_workers: Maximum number of concurrently handled connections
+            request_timeout: Socket timeout in seconds for reading a request
+            calendar_feed: Optional calendar feed cache
+            debug_endpoints: Whether to serve /debug/profile and /debug/memory
+            max_pending: Connections queued for a worker before new ones get a 503
+            keepalive_timeout: Seconds an idle keep-alive connection holds a worker
+        """
+        super().__init__(server_address, handler_class)
+        self.request_timeout = request_timeout
+        self.keepalive_timeout = keepalive_timeout
+        self.calendar_feed = calendar_feed
+        self.debug_endpoints = debug_endpoints
+        self.memory_profiler = MemoryProfiler()
+        self.max_connections = max_workers + max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='health-http')
+        self._queued = 0
+        self._connections: set[socket.socket] = set()
+        self._detached: set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+    
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Hand the connection to a worker thread, or reject it if the queue is full."""
+        with self._connections_lock:
+            busy = self._queued >= self.max_connections
+            if not busy:
+                self._queued += 1
+        if busy:
+            Metrics().increment('health_server_rejected')
+            self._reject(request)
+            return
+        self._executor.submit(self._process_request_worker, request, client_address)
+    
+    def _reject(self, request: Any) -> None:
+        """Answer a connection with 503 from the accepting thread and close it."""
+        try:
+            request.settimeout(0.1)
+            # Read the request first, closing with unread data would reset the connection
+            request.recv(65536)
+        except OSError:
+            pass
+        try:
+            request.sendall(_BUSY_RESPONSE)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+    
+    def _process_request_worker(self, request: Any, client_address: Any) -> None:
+        """Handle a connection in a worker thread."""
+        with self._connections_lock:
+            self._connections.add(request)
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+                self._queued -= 1
+                detached = request in self._detached
+            if not detached:
+                self.shutdown_request(request)
+    
+    def detach(self, request: Any) -> None:
+        """Hand a connection over to a thread outside the pool.
+        
+        The worker returns to the pool without closing the connection; the
+        new owner calls ``release`` when it is done.
+        
+        Args:
+            request: Connection socket
+        """
+        with self._connections_lock:
+            self._detached.add(request)
+    
+    def release(self, request: Any) -> None:
+        """Close a connection handed over by ``detach``.
+        
+        Args:
+            request: Connection socket
+        """
+        with self._connections_lock:
+            self._detached.discard(request)
+        self.shutdown_request(request)
+    
+    def server_close(self) -> None:
+        """Close the listening socket and wait for in-flight requests."""
+        super().server_close()
+        # Unblock workers waiting on idle keep-alive connections
+        with self._connections_lock:
+            for connection in self._connections:
+                try:
+                    connection.shutdown(socket.SHUT_RD)
+                except OSError:
+                    pass
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.memory_profiler.stop()
+
 class HealthCheckServer:
     """Server for health checks and metrics."""
     
-    def __init__(self, host: str = 'localhost', port: int = 8080):
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 8080,
+        ics_dir: str | Path | None = None,
+        max_workers: int = 4,
+        request_timeout: float = 10.0,
+        debug_endpoints: bool = False,
+        max_pending: int = 16,
+        keepalive_timeout: float = 2.0
+    ):
         """Initialize server.
         
         Args:
             host: Host to bind to
             port: Port to listen on
+            ics_dir: Optional directory of generated calendars to serve under /calendars/
+            max_workers: Number of worker threads handling connections
+            request_timeout: Per-connection socket timeout in seconds
+            debug_endpoints: Whether to serve the /debug/ profiling endpoints
+            max_pending: Connections queued for a worker before new ones get a 503
+            keepalive_timeout: Seconds an idle keep-alive connection is kept open
         """
         self.host = host
         self.port = port
-        self.server: HTTPServer | None = None
+        self.calendar_feed = CalendarFeedCache(ics_dir) if ics_dir else None
+        self.max_workers = max_workers
+        self.request_timeout = request_timeout
+        self.debug_endpoints = debug_endpoints
+        self.max_pending = max_pending
+        self.keepalive_timeout = keepalive_timeout
+        self.server: PooledHTTPServer | None = None
         self.thread: threading.Thread | None = None
         self.metrics = Metrics()  # Initialize metrics
         
@@ -104,8 +560,17 @@ class HealthCheckServer:
             return
             
         try:
-            self.server = HTTPServer((self.host, self.port), HealthCheckHandler)
-            self.thread = threading.Thread(target=self.server.serve_forever)
+            self.server = PooledHTTPServer(
+                (self.host, self.port),
+                HealthCheckHandler,
+                max_workers=self.max_workers,
+                request_timeout=self.request_timeout,
+                calendar_feed=self.calendar_feed,
+                debug_endpoints=self.debug_endpoints,
+                max_pending=self.max_pending,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self.thread = threading.Thread(target=self.server.serve_forever, name='health-http-accept')
             self.thread.daemon = True
             self.thread.start()
             
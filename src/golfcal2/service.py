@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
 
 import argparse
+import signal
 import sys
-import time
-from dataclasses import dataclass
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 from golfcal2.config.error_aggregator import (
     ErrorAggregationConfig,
@@ -13,80 +11,23 @@ from golfcal2.config.error_aggregator import (
 )
 from golfcal2.config.logging import load_logging_config, setup_logging
 from golfcal2.config.settings import ConfigurationManager
-from golfcal2.metrics import Metrics, Timer, track_time
+from golfcal2.context import init_context
+from golfcal2.metrics import Metrics, Timer
 from golfcal2.models.user import User
+from golfcal2.scheduler import CACHE_REFRESH, REMINDER, SYNC, Scheduler
 from golfcal2.server import HealthCheckServer
-from golfcal2.services import CalendarService, ExternalEventService, WeatherService
-from golfcal2.services.reservation_service import ReservationService
+from golfcal2.services import WeatherService
+from golfcal2.services.reservation_snapshots import reservation_snapshots
+from golfcal2.tracing import Tracer, span
+from golfcal2.utils.circuit_breaker import circuit_breakers
 from golfcal2.utils.cli_utils import CLIBuilder, CLIContext
+from golfcal2.utils.host_limiter import host_limiter
 from golfcal2.utils.logging_utils import get_logger
+from golfcal2.utils.retry_policy import retry_policy
 
+# Lower bound between weather cache refreshes, so expiring entries cannot make the loop spin
+CACHE_REFRESH_MIN_INTERVAL = timedelta(minutes=15)
 
-@dataclass
-class EventState:
-    """Track the state of an event's processing."""
-    start_time: datetime
-    thirty_min_processed: bool = False
-    fifteen_min_processed: bool = False
-
-class ServiceState:
-    """Track the state of the calendar service."""
-    def __init__(self):
-        self.processed_events: dict[str, EventState] = {}  # uid -> EventState
-        self.calendar_mtimes: dict[str, float] = {}  # path -> mtime
-        self.next_event: datetime | None = None
-        self.next_event_uid: str | None = None
-        self._timezone: ZoneInfo | None = None
-        
-    @property
-    def timezone(self) -> ZoneInfo:
-        """Get cached timezone instance."""
-        if not self._timezone:
-            config_manager = ConfigurationManager()
-            self._timezone = config_manager.get_timezone(
-                config_manager.config.global_config.get('timezone', 'UTC')
-            )
-        return self._timezone
-        
-    def needs_processing(self, event_uid: str, event_time: datetime, current_time: datetime) -> bool:
-        """Check if an event needs processing at current_time."""
-        if event_time < current_time:
-            return False
-            
-        state = self.processed_events.get(event_uid)
-        if not state:
-            return True
-            
-        # Check if we need to process 30 or 15 minute marks
-        time_to_event = event_time - current_time
-        if time_to_event <= timedelta(minutes=30) and not state.thirty_min_processed:
-            return True
-        if time_to_event <= timedelta(minutes=15) and not state.fifteen_min_processed:
-            return True
-            
-        return False
-        
-    def mark_processed(self, event_uid: str, event_time: datetime, current_time: datetime):
-        """Mark an event as processed based on current time."""
-        state = self.processed_events.get(event_uid)
-        if not state:
-            state = EventState(start_time=event_time)
-            self.processed_events[event_uid] = state
-            
-        time_to_event = event_time - current_time
-        if time_to_event <= timedelta(minutes=15):
-            state.fifteen_min_processed = True
-        if time_to_event <= timedelta(minutes=30):
-            state.thirty_min_processed = True
-            
-    def cleanup_old_events(self, current_time: datetime):
-        """Remove processed events that are in the past."""
-        to_remove = [
-            uid for uid, state in self.processed_events.items()
-            if state.start_time < current_time
-        ]
-        for uid in to_remove:
-            del self.processed_events[uid]
 
 def create_args() -> argparse.Namespace:
     """Create service arguments."""
@@ -97,96 +38,40 @@ def create_args() -> argparse.Namespace:
     parser.add_argument('-u', '--user', help='Username to use for operations (default: from config)')
     parser.add_argument('--host', default='localhost', help='Host to bind health check server to')
     parser.add_argument('--port', type=int, default=8080, help='Port for health check server')
+    parser.add_argument('--http-workers', type=int, default=4, help='Worker threads for the health check server')
     parser.add_argument('--dry-run', action='store_true', help='Dry run mode - no changes will be made')
     parser.add_argument('--list-only', action='store_true', help='Only list events, do not write calendar')
+    parser.add_argument('--trace-dir', help='Write a Chrome trace of each processing cycle to this directory')
     return parser.parse_args()
 
-@track_time("get_next_event_time")
-def get_next_event_time(calendar_service: CalendarService, service_state: ServiceState) -> tuple[datetime | None, str | None]:
-    """Get the next event time that needs processing."""
-    next_event_time = None
-    next_event_uid = None
+def refresh_weather_cache(weather_service: WeatherService, scheduler: Scheduler, now: datetime) -> None:
+    """Remove expired weather responses and schedule the next refresh.
     
-    try:
-        # Get all upcoming events
-        now = datetime.now(service_state.timezone)
-        now + timedelta(days=7)  # Look ahead 7 days
-        
-        # Process each user's reservations
-        for user_name, user_config in calendar_service.config.users.items():
-            try:
-                # Create user object and process reservations
-                user = User.from_config(user_name, dict(user_config))
-                
-                # Create reservation service for this user
-                reservation_service = ReservationService(
-                    config=calendar_service.config,
-                    user=user,
-                    logger=logger
-                )
-                
-                # Get reservations for next 7 days
-                reservations = reservation_service.list_reservations(days=7)
-                
-                # Convert reservations to events
-                for reservation in reservations:
-                    event_time = reservation.start_time
-                    event_uid = reservation.uid
-                    
-                    if not event_time or not event_uid:
-                        continue
-                        
-                    if service_state.needs_processing(event_uid, event_time, now):
-                        if not next_event_time or event_time < next_event_time:
-                            next_event_time = event_time
-                            next_event_uid = event_uid
-                            
-            except Exception as e:
-                logger.error(f"Error processing user {user_name}: {e}", exc_info=True)
-                continue
-    
-    except Exception as e:
-        logger.error(f"Error getting next event time: {e}", exc_info=True)
+    The next refresh is due when the next cached response expires, but no
+    sooner than CACHE_REFRESH_MIN_INTERVAL from now.
     
-    return next_event_time, next_event_uid
-
-def get_next_processing_time(now: datetime, next_event: datetime | None = None) -> datetime:
-    """Calculate the next processing time.
-    
-    The service should process:
-    1. At the start of every hour
-    2. 30 minutes before an event
-    3. 15 minutes before an event
-    
-    Returns the earliest applicable time.
+    Args:
+        weather_service: Weather service owning the response cache
+        scheduler: Service scheduler
+        now: Current time
     """
-    # Always calculate next hour processing time
-    next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
-    
-    if not next_event:
-        return next_hour
-    
-    # Calculate event-based processing times
-    time_to_event = next_event - now
-    
-    if time_to_event <= timedelta(minutes=15):
-        # Process immediately if within 15 minutes
-        return now
-    elif time_to_event <= timedelta(minutes=30):
-        # Process at 15 minute mark
-        process_at_15 = next_event - timedelta(minutes=15)
-        return min(next_hour, process_at_15)
-    else:
-        # Process at 30 minute mark
-        process_at_30 = next_event - timedelta(minutes=30)
-        return min(next_hour, process_at_30)
+    cache = weather_service.response_cache
+    cache.clear_expired()
+    next_expiry = cache.next_expiry()
+    when = scheduler.next_sync_time(now) if next_expiry is None else next_expiry.astimezone(now.tzinfo)
+    scheduler.schedule(CACHE_REFRESH, 'weather', max(when, now + CACHE_REFRESH_MIN_INTERVAL))
+
+def _handle_sigterm(signum: int, frame: object) -> None:
+    """Turn SIGTERM into SystemExit so the main loop unwinds and stops the health server."""
+    raise SystemExit(0)
 
 def main():
     """Main service entry point."""
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     try:
         # Initialize metrics first
         metrics = Metrics()
-
+        
         # Initialize configuration
         config_manager = ConfigurationManager()
         args = create_args()
@@ -197,13 +82,12 @@ def main():
         logging_config = load_logging_config()
         logging_config.default_level = "INFO"  # Set default level to INFO
         
-        # Set up logging with the full configuration
+        # Set up logging
         setup_logging(
             config,
             dev_mode=args.dev,
             verbose=args.verbose,
-            log_file=None,  # Don't use file logging
-            logging_config=logging_config  # Use the logging config we set up earlier
+            log_file=None  # Don't use file logging
         )
         
         logger = get_logger(__name__)
@@ -214,36 +98,58 @@ def main():
             report_interval=logging_config.error_aggregation.report_interval,
             error_threshold=logging_config.error_aggregation.error_threshold,
             time_threshold=logging_config.error_aggregation.time_threshold,
-            categorize_by=logging_config.error_aggregation.categorize_by
+            categorize_by=logging_config.error_aggregation.categorize_by,
+            max_stack_traces=logging_config.error_aggregation.max_stack_traces
         )
         init_error_aggregator(error_config)
         
         logger.info("Starting GolfCal2 service")
         
-        # Start health check server
-        health_server = HealthCheckServer(args.host, args.port)
+        # Services live for the whole run and are rebuilt only when the configuration changes
+        context = init_context(config, dev_mode=args.dev)
+        calendar_service = context.calendar_service
+        
+        # Start health check server, also serving the generated calendars
+        health_server = HealthCheckServer(
+            args.host,
+            args.port,
+            ics_dir=calendar_service.ics_dir,
+            max_workers=args.http_workers,
+            debug_endpoints=bool(config.global_config.get('debug', {}).get('endpoints', False))
+        )
         try:
             health_server.start()
         except Exception as e:
             logger.error(f"Failed to start health check server: {e}")
             # Continue even if health check server fails
         
-        # Initialize services and state
-        weather_service = WeatherService(
-            config=config
-        )
-        
-        calendar_service = CalendarService(
-            config=config,
-            weather_service=weather_service
-        )
+        timezone = config_manager.get_timezone(config.global_config.get('timezone', 'UTC'))
         
-        external_event_service = ExternalEventService(
-            weather_service=weather_service,
-            config=config
+        # Sync every user at startup, then at their own offset within each interval and on reminders
+        sync_config = config.global_config.get('sync', {})
+        scheduler = Scheduler(
+            sync_interval=timedelta(minutes=int(sync_config.get('interval_minutes', 60))),
+            spread=bool(sync_config.get('spread', True)),
+            jitter=timedelta(seconds=float(sync_config.get('jitter_seconds', 60)))
         )
+        host_limiter.configure(int(config.global_config.get('http', {}).get('max_requests_per_host', 2)))
+        retry_policy.configure(config.global_config.get('http', {}))
+        circuit_breakers.configure(config.global_config.get('http', {}), config.global_config.get('data_dir', 'data'))
+        reservation_snapshots.configure(config.global_config.get('data_dir', 'data'))
+        now = datetime.now(timezone)
+        known_users = set(config.users)
+        for user_name in known_users:
+            scheduler.schedule(SYNC, user_name, now, user=user_name)
+        scheduler.schedule(CACHE_REFRESH, 'weather', scheduler.next_sync_time(now))
+        next_events: dict[str, datetime] = {}  # user -> start of the user's next reservation
         
-        service_state = ServiceState()
+        # Per-cycle tracing, enabled by --trace-dir or the tracing config section
+        tracing_config = config.global_config.get('tracing', {})
+        trace_dir = args.trace_dir or (tracing_config.get('dir', 'traces') if tracing_config.get('enabled') else None)
+        tracer = Tracer()
+        if trace_dir:
+            tracer.enable()
+            logger.info(f"Writing processing cycle traces to {trace_dir}")
         
         # Create CLI parser for context
         cli_builder = CLIBuilder("GolfCal2 Service CLI")
@@ -251,95 +157,126 @@ def main():
         
         try:
             while True:
-                try:
-                    logger.debug("Starting calendar processing cycle")
-                    logger.info("Starting calendar processing")
-                    
-                    with Timer("calendar_processing"):
-                        # Process calendars for all configured users
-                        for user_name, user_config in config.users.items():
-                            try:
-                                logger.info(f"Processing calendar for user {user_name}")
-                                args.user = user_name  # Set current user
-                                CLIContext(args=args, logger=logger, config=config, parser=parser)
-                                logger.info("Processing external events")
-                                external_events = external_event_service.process_events(user_name, dev_mode=args.dev)
-                                logger.info(f"Found {len(external_events)} external events")
-                                
-                                # Create calendar service with external events
-                                calendar_service = CalendarService(
-                                    config=config,
-                                    weather_service=weather_service,
-                                    dev_mode=args.dev,
-                                    external_event_service=external_event_service  # Pass the service directly
-                                )
-                                
-                                user = User.from_config(user_name, dict(user_config))
-                                reservation_service = ReservationService(user_name, config)
-                                reservations = reservation_service.list_reservations()
-                                
-                                # Process calendar with both reservations and external events
-                                calendar_service.process_user_reservations(user, reservations)
-                                
-                                metrics.increment("calendar_processing_success")
-                                logger.info(f"Calendar processing completed successfully for user {user_name}")
-                            except Exception as e:
-                                logger.error(f"Error processing calendar for user {user_name}: {e}", exc_info=True)
-                                metrics.increment("calendar_processing_errors")
-                                continue
-                    
-                    # Mark current event as processed if applicable
-                    now = datetime.now(service_state.timezone)
-                    if service_state.next_event_uid:
-                        service_state.mark_processed(
-                            service_state.next_event_uid,
-                            service_state.next_event,
-                            now
-                        )
-                        metrics.increment("events_processed")
+                now = datetime.now(timezone)
+                if context.reload_if_changed():
+                    config = context.config
+                    # Sync added users now and forget removed ones
+                    for user_name in set(config.users) - known_users:
+                        scheduler.schedule(SYNC, user_name, now, user=user_name)
+                    for user_name in known_users - set(config.users):
+                        scheduler.cancel(SYNC, user_name)
+                        scheduler.update_reminders(user_name, [], now)
+                        next_events.pop(user_name, None)
+                    known_users = set(config.users)
+                
+                due = scheduler.pop_due(now)
+                # Users to sync, in trigger order and once each even if several of their triggers are due
+                users = list(dict.fromkeys(
+                    t.user for t in due if t.kind in (SYNC, REMINDER) and t.user in known_users
+                ))
+                reminders = sum(1 for t in due if t.kind == REMINDER)
+                
+                if users:
+                    try:
+                        logger.info(f"Starting calendar processing for {len(users)} users ({reminders} reminders due)")
+                        
+                        with span('cycle', users=len(users)), Timer("calendar_processing"), retry_policy.cycle():
+                            for user_name in users:
+                                with span('user', user=user_name):
+                                    try:
+                                        logger.info(f"Processing calendar for user {user_name}")
+                                        user_config = config.users[user_name]
+                                        args.user = user_name  # Set current user
+                                        CLIContext(args=args, logger=logger, config=config, parser=parser)
+                                        logger.info("Processing external events")
+                                        external_events = context.external_event_service.process_events(user_name, dev_mode=args.dev)
+                                        logger.info(f"Found {len(external_events)} external events")
+                                        
+                                        user = User.from_config(user_name, dict(user_config))
+                                        reservation_service = context.reservation_service(user_name)
+                                        with span('reservations', user=user_name):
+                                            reservations = reservation_service.list_reservations()
+                                        
+                                        # Process calendar with both reservations and external events
+                                        context.calendar_service.process_user_reservations(user, reservations)
+                                        
+                                        # Schedule reminders from the reservations just fetched
+                                        synced_at = datetime.now(timezone)
+                                        upcoming = [
+                                            (reservation.uid, reservation.start_time) for reservation in reservations
+                                            if reservation.start_time and reservation.start_time > synced_at
+                                        ]
+                                        scheduler.update_reminders(user_name, upcoming, synced_at)
+                                        if upcoming:
+                                            next_events[user_name] = min(start for _, start in upcoming)
+                                        else:
+                                            next_events.pop(user_name, None)
+                                        
+                                        metrics.increment("calendar_processing_success")
+                                        logger.info(f"Calendar processing completed successfully for user {user_name}")
+                                    except Exception as e:
+                                        logger.error(f"Error processing calendar for user {user_name}: {e}", exc_info=True)
+                                        metrics.increment("calendar_processing_errors")
+                                    finally:
+                                        scheduler.schedule_sync(user_name, datetime.now(timezone))
+                        
+                        if reminders:
+                            metrics.increment("events_processed", reminders)
                     
-                    # Cleanup old event states
-                    service_state.cleanup_old_events(now)
+                    except Exception as e:
+                        logger.error(f"Error in calendar processing: {e}", exc_info=True)
+                        metrics.increment("calendar_processing_errors")
                     
-                except Exception as e:
-                    logger.error(f"Error in calendar processing: {e}", exc_info=True)
-                    metrics.increment("calendar_processing_errors")
+                    if tracer.enabled:
+                        try:
+                            trace_path = tracer.export(trace_dir, keep=int(tracing_config.get('keep', 48)))
+                            if trace_path:
+                                logger.info(f"Wrote processing cycle trace to {trace_path}")
+                        except Exception as e:
+                            logger.error(f"Failed to write processing cycle trace: {e}")
                 
-                # Get current time and next event time
-                now = datetime.now(service_state.timezone)
-                next_event, next_event_uid = get_next_event_time(calendar_service, service_state)
+                if any(t.kind == CACHE_REFRESH for t in due):
+                    try:
+                        refresh_weather_cache(context.weather_service, scheduler, now)
+                    except Exception as e:
+                        logger.error(f"Failed to refresh weather cache: {e}")
+                        scheduler.schedule(CACHE_REFRESH, 'weather', now + CACHE_REFRESH_MIN_INTERVAL)
                 
-                # Update service state and metrics
-                service_state.next_event = next_event
-                service_state.next_event_uid = next_event_uid
-                if next_event:
-                    time_to_next = (next_event - now).total_seconds()
-                    metrics.set_gauge("seconds_to_next_event", time_to_next)
+                # Sleep until the earliest trigger; no I/O is needed to find it
+                now = datetime.now(timezone)
+                upcoming_events = [start for start in next_events.values() if start > now]
+                if upcoming_events:
+                    metrics.set_gauge("seconds_to_next_event", (min(upcoming_events) - now).total_seconds())
                 
-                # Calculate time until next processing
-                next_process = get_next_processing_time(now, next_event)
-                sleep_seconds = (next_process - now).total_seconds()
-                metrics.set_gauge("seconds_to_next_processing", sleep_seconds)
+                next_trigger = scheduler.next_trigger()
+                if next_trigger is None:
+                    # Nothing configured; check again at the next interval
+                    sleep_seconds = (scheduler.next_sync_time(now) - now).total_seconds()
+                else:
+                    sleep_seconds = (next_trigger.when - now).total_seconds()
+                    logger.info(f"Next wake-up: {next_trigger.kind} {next_trigger.key} at {next_trigger.when.isoformat()}")
+                metrics.set_gauge("seconds_to_next_processing", max(sleep_seconds, 0))
                 
                 if sleep_seconds > 0:
-                    logger.debug(f"Next processing scheduled in {sleep_seconds:.0f} seconds")
-                    logger.info(f"Sleeping for {sleep_seconds:.0f} seconds until next processing")
-                    time.sleep(sleep_seconds)
-                    
+                    logger.debug(f"Sleeping for {sleep_seconds:.0f} seconds")
+                    scheduler.wait(sleep_seconds)
+        
         finally:
+            context.close()
+            
             # Stop health check server
             if health_server:
                 try:
                     health_server.stop()
                 except Exception as e:
                     logger.error(f"Error stopping health check server: {e}")
-            
+    
     except Exception:
         logger = get_logger(__name__)
         logger.exception("Fatal error in service")
         metrics.increment("fatal_errors")
         return 1
-        
+    
     return 0
 
 if __name__ == '__main__':
@@ -8,7 +8,8 @@ from urllib.parse import urljoin
 
 from golfcal2.config.types import AppConfig, ClubConfig
 from golfcal2.models.user import Membership
-from golfcal2.utils.logging_utils import LoggerMixin
+from golfcal2.services.session_store import SessionStore
+from golfcal2.utils.logging_utils import LoggerMixin, payload
 
 # Use TYPE_CHECKING for imports only needed for type hints
 if TYPE_CHECKING:
@@ -184,6 +185,8 @@ class AuthService(LoggerMixin):
         self.config = config
         self.strategy: AuthStrategy | None = None
         self._current_auth_details: dict[str, Any] | None = None
+        # Authenticated sessions shared by the API clients, kept across runs
+        self.session_store = SessionStore.from_config(config)
     
     def _ensure_strategy(self, auth_details: dict[str, Any]) -> None:
         """Ensure strategy is initialized with current auth details."""
@@ -263,7 +266,7 @@ class AuthService(LoggerMixin):
             cookie_name = auth_details.get('cookie_name', '')
             cookie_value = auth_details['cookie_value']
             
-            self.logger.debug(f"Processing cookie auth with type: {auth_type}, name: {cookie_name}, value: {cookie_value}")
+            self.logger.debug("Processing cookie auth with type: %s, name: %s", auth_type, cookie_name)
             
             # For WiseGolf0, we need to prefix with wisenetwork_session=
             if auth_type == 'wisegolf0':
@@ -284,14 +287,14 @@ class AuthService(LoggerMixin):
                     headers['X-Auth-Token'] = auth_details['token']
                 elif 'x_auth_token' in auth_details:
                     headers['X-Auth-Token'] = auth_details['x_auth_token']
-                self.logger.debug(f"Generated headers for NexGolf: {headers}")
+                self.logger.debug("Generated headers for NexGolf: %s", payload(headers))
             # For other cookie-based auth, use the cookie value as is
             elif cookie_name:
                 headers['Cookie'] = f'{cookie_name}={cookie_value}'
             else:
                 headers['Cookie'] = cookie_value
                 
-            self.logger.debug(f"Generated cookie header: {headers}")
+            self.logger.debug("Generated cookie header: %s", payload(headers))
         return headers
     
     def _get_strategy(self, auth_details: dict[str, Any]) -> AuthStrategy:
@@ -2,10 +2,12 @@
 Calendar builder for golf calendar application.
 """
 
+import os
+from collections.abc import Iterable
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from icalendar import Calendar, vText
+from icalendar import Calendar, Event, vText
 
 from golfcal2.models.user import User
 from golfcal2.utils.logging_utils import LoggerMixin
@@ -54,4 +56,52 @@ class CalendarBuilder(LoggerMixin):
             
         except OSError as e:
             self.logger.error(f"Failed to write calendar file: {e}")
-            raise 
\ No newline at end of file
+            raise
+    
+    def write_calendar_stream(
+        self,
+        calendar: Calendar,
+        events: Iterable[Event],
+        file_path: Path,
+        dev_mode: bool = False
+    ) -> int:
+        """Write calendar to file, serializing events as they are produced.
+        
+        The events are not added to the calendar, so they never need to be in
+        memory at once. The file is written next to its final path and moved
+        in place when complete, so an interrupted import leaves the previous
+        calendar intact.
+        
+        Args:
+            calendar: Calendar with the metadata, written before the events
+            events: Events to write
+            file_path: Calendar file path
+            dev_mode: Whether to write the development calendar
+        
+        Returns:
+            Number of events written
+        """
+        if dev_mode:
+            file_path = file_path.with_name(f"{file_path.stem}-dev{file_path.suffix}")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        header, end, trailer = calendar.to_ical().rpartition(b'END:VCALENDAR')
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        event_count = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                for event in events:
+                    f.write(event.to_ical())
+                    event_count += 1
+                f.write(end + trailer)
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            self.logger.error(f"Failed to write calendar file: {e}")
+            raise
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        
+        self.logger.info(f"Created calendar file: {file_path} with {event_count} events")
+        return event_count
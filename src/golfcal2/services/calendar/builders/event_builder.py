@@ -142,8 +142,26 @@ class ReservationEventBuilder(EventBuilder):
 class ExternalEventBuilder(EventBuilder):
     """Event builder for external golf events."""
     
-    def build(self, event_data: dict[str, Any], person_name: str, start: datetime, end: datetime) -> Event | None:
-        """Build an event from external event data."""
+    def build(
+        self,
+        event_data: dict[str, Any],
+        person_name: str,
+        start: datetime,
+        end: datetime,
+        with_weather: bool = True
+    ) -> Event | None:
+        """Build an event from external event data.
+        
+        Args:
+            event_data: External event definition
+            person_name: User the event is built for
+            start: Event start time
+            end: Event end time
+            with_weather: Whether to look up a forecast for the event
+        
+        Returns:
+            Event, or None if it could not be built
+        """
         try:
             self.logger.debug(f"Building external event for {event_data.get('name', 'Unknown')}")
             
@@ -222,7 +240,7 @@ class ExternalEventBuilder(EventBuilder):
             
             # Get weather data if coordinates available
             weather_data = None
-            if 'coordinates' in event_data:
+            if with_weather and 'coordinates' in event_data:
                 try:
                     coords = event_data['coordinates']
                     location = Location(
@@ -3,7 +3,7 @@ Calendar service for golf calendar application.
 """
 
 import os
-import traceback
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any, NoReturn, Protocol, TypeVar, cast, runtime_checkable
 from zoneinfo import ZoneInfo
@@ -29,6 +29,7 @@ from golfcal2.services.calendar.builders import (
 from golfcal2.services.external_event_service import ExternalEventService
 from golfcal2.services.mixins import CalendarHandlerMixin
 from golfcal2.services.weather_service import WeatherService
+from golfcal2.tracing import span
 from golfcal2.utils.logging_utils import EnhancedLoggerMixin
 
 T = TypeVar('T')
@@ -153,11 +154,13 @@ class CalendarService(EnhancedLoggerMixin, CalendarHandlerMixin):
                 lambda: raise_error("Failed to process reservations")
             ):
                 # Add reservations
-                for reservation in reservations:
-                    self._process_reservation(reservation, calendar, user.name)
+                with span('build', user=user.name, reservations=len(reservations)):
+                    for reservation in reservations:
+                        self._process_reservation(reservation, calendar, user.name)
                 
                 # Add external events
-                self._process_external_events(calendar, user.name)
+                with span('external_events', user=user.name):
+                    self._process_external_events(calendar, user.name)
                 
                 # Write calendar to file if not in list-only mode
                 if not getattr(self, 'list_only', False):
@@ -187,11 +190,63 @@ class CalendarService(EnhancedLoggerMixin, CalendarHandlerMixin):
                     "operation": "process_user_reservations"
                 }
             )
-            # Convert traceback to string
-            tb_str = "".join(traceback.format_tb(e.__traceback__)) if e.__traceback__ else None
-            aggregate_error(str(error), "calendar", tb_str)
+            aggregate_error(str(error), "calendar", e)
             raise error
 
+    def write_user_reservations(self, user: User, reservations: Iterable[Reservation]) -> int:
+        """Write a user's calendar from reservations as they are produced.
+        
+        Unlike ``process_user_reservations`` no calendar holding every event
+        is built: each event is serialized as soon as its reservation
+        arrives, so large imports can be streamed from a generator.
+        
+        Args:
+            user: User whose calendar is written
+            reservations: Reservations to write, consumed once
+        
+        Returns:
+            Number of events written, external events included
+        """
+        calendar = self.build_base_calendar(user.name, self.local_tz)
+        self.seen_uids.clear()
+        
+        def events() -> Iterator[Event]:
+            for reservation in reservations:
+                if reservation.uid in self.seen_uids:
+                    self.debug(f"Skipping duplicate reservation with UID: {reservation.uid}")
+                    continue
+                with handle_errors(
+                    CalendarEventError,
+                    "calendar",
+                    f"process reservation {reservation.uid}",
+                    lambda: raise_error("Failed to process reservation")
+                ):
+                    event = self.reservation_builder.build(reservation, self._get_club_config(reservation))
+                if event and self._claim_uid(event):
+                    yield event
+            for event in self.external_event_service.process_events(user.name, dev_mode=self.dev_mode):
+                if self._claim_uid(event):
+                    yield event
+        
+        file_path = self._get_calendar_path(user.name)
+        with handle_errors(
+            CalendarWriteError,
+            "calendar",
+            f"write calendar for user {user.name}",
+            lambda: raise_error("Failed to write calendar")
+        ):
+            with span('write', user=user.name, path=str(file_path)):
+                return self.calendar_builder.write_calendar_stream(calendar, events(), file_path, self.dev_mode)
+    
+    def _get_club_config(self, reservation: Reservation) -> dict[str, Any]:
+        """Get the configuration of a reservation's club."""
+        club_config = cast(dict[str, Any], self.config.clubs).get(reservation.membership.club) or \
+                     cast(dict[str, Any], self.config.clubs).get(reservation.club.name)
+        if not club_config:
+            self.warning(f"No club config found for {reservation.membership.club} or {reservation.club.name}")
+            club_config = {}
+        return club_config
+    
     def _process_reservation(self, reservation: Reservation, calendar: Calendar, user_name: str) -> None:
         """Process a single reservation."""
         # Skip if we've already seen this event
@@ -243,7 +298,8 @@ class CalendarService(EnhancedLoggerMixin, CalendarHandlerMixin):
             f"write calendar for user {user_name}",
             lambda: raise_error("Failed to write calendar")
         ):
-            self.calendar_builder.write_calendar(calendar, file_path, self.dev_mode)
+            with span('write', user=user_name, path=str(file_path)):
+                self.calendar_builder.write_calendar(calendar, file_path, self.dev_mode)
 
     def _get_calendar_path(self, user_name: str) -> Path:
         """Get calendar file path for user."""
@@ -322,12 +378,18 @@ class CalendarService(EnhancedLoggerMixin, CalendarHandlerMixin):
 
     def _add_event_to_calendar(self, event: Event, calendar: Calendar) -> None:
         """Add an event to the calendar."""
-        # Check for duplicate UIDs
+        if self._claim_uid(event):
+            calendar.add_component(event)
+    
+    def _claim_uid(self, event: Event) -> bool:
+        """Record an event's UID, returning False if it was already seen."""
+        # Check for duplicate UIDs; overrides of a recurring event share its UID
         uid = event.get('uid')
+        if uid and 'recurrence-id' in event:
+            uid = f"{uid}@{event['recurrence-id'].to_ical().decode()}"
         if uid and uid in self.seen_uids:
             self.debug(f"Skipping duplicate event with UID: {uid}")
-            return
-        
-        calendar.add_component(event)
+            return False
         if uid:
-            self.seen_uids.add(uid)
\ No newline at end of file
+            self.seen_uids.add(uid)
+        return True
\ No newline at end of file
@@ -0,0 +1,337 @@
+"""Conflict detection across reservations, external events and imported events.
+
+Every booking is placed on the timeline of each person taking part in it:
+its user and, in cross-user mode, also the players on it. Overlaps are found
+per timeline with a sweep over the bookings sorted by start time, keeping a
+min-heap of the bookings still in progress, so the cost is O(n log n) plus
+the number of overlaps rather than a comparison of every pair. Recurring
+events are expanded only within the checked window.
+"""
+
+import heapq
+import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from dateutil.rrule import rrulestr
+
+from golfcal2.models.reservation import Reservation
+from golfcal2.utils.logging_utils import get_logger
+
+RESERVATION = 'reservation'
+EXTERNAL = 'external'
+IMPORTED = 'imported'
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ScheduledItem:
+    """A booking on the timeline."""
+    start: datetime
+    end: datetime
+    user: str
+    source: str
+    title: str
+    # Identity of the underlying booking, the same for every user on it
+    key: str
+    participants: frozenset[str] = frozenset()
+    ref: Any = field(default=None, compare=False, hash=False)
+
+
+@dataclass(frozen=True)
+class Conflict:
+    """Two overlapping bookings of the same people."""
+    first: ScheduledItem
+    second: ScheduledItem
+    people: tuple[str, ...]
+    
+    @property
+    def overlap(self) -> timedelta:
+        """Length of the overlap."""
+        return min(self.first.end, self.second.end) - max(self.first.start, self.second.start)
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert conflict to a JSON-serializable dictionary."""
+        def item(entry: ScheduledItem) -> dict[str, Any]:
+            return {
+                'user': entry.user,
+                'source': entry.source,
+                'title': entry.title,
+                'start': entry.start.isoformat(),
+                'end': entry.end.isoformat()
+            }
+        return {
+            'people': list(self.people),
+            'overlap_minutes': int(self.overlap.total_seconds() // 60),
+            'first': item(self.first),
+            'second': item(self.second)
+        }
+
+
+def find_overlaps(items: Iterable[ScheduledItem]) -> Iterator[tuple[ScheduledItem, ScheduledItem]]:
+    """Find all overlapping pairs of items with a sorted sweep.
+    
+    Args:
+        items: Items to check
+    
+    Yields:
+        Overlapping pairs, the earlier-starting item first
+    """
+    ordered = sorted(items, key=lambda item: (item.start, item.end))
+    # Items still in progress, ordered by end time
+    active: list[tuple[datetime, int, ScheduledItem]] = []
+    for index, item in enumerate(ordered):
+        while active and active[0][0] <= item.start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            yield other, item
+        heapq.heappush(active, (item.end, index, item))
+
+
+def detect_conflicts(items: Iterable[ScheduledItem], cross_user: bool = False) -> list[Conflict]:
+    """Find bookings that overlap for the same person.
+    
+    Args:
+        items: Bookings of one or more users
+        cross_user: Also check the players on the bookings, so a guest
+            booked into two users' overlapping flights is reported
+    
+    Returns:
+        Conflicts ordered by start time
+    """
+    timelines: defaultdict[str, list[ScheduledItem]] = defaultdict(list)
+    for item in items:
+        people = {item.user}
+        if cross_user:
+            people |= item.participants
+        for person in people:
+            timelines[_person_key(person)].append(item)
+    
+    found: dict[tuple[int, int], tuple[ScheduledItem, ScheduledItem, set[str]]] = {}
+    for person, timeline in timelines.items():
+        for first, second in find_overlaps(timeline):
+            # The same flight seen by two of its players is not a conflict
+            if first.key == second.key:
+                continue
+            pair = (id(first), id(second)) if id(first) < id(second) else (id(second), id(first))
+            if pair not in found:
+                found[pair] = (first, second, set())
+            found[pair][2].add(person)
+    
+    conflicts = [Conflict(first, second, tuple(sorted(people))) for first, second, people in found.values()]
+    return sorted(conflicts, key=lambda c: (c.first.start, c.second.start))
+
+
+def _person_key(name: str) -> str:
+    """Normalize a person's name for matching users and players."""
+    return ' '.join(name.split()).casefold()
+
+
+def reservation_items(
+    reservations: Iterable[Reservation],
+    source: str = RESERVATION,
+    window_start: datetime | None = None,
+    window_end: datetime | None = None
+) -> list[ScheduledItem]:
+    """Convert reservations to timeline items.
+    
+    Imported reservations carrying a recurrence rule in their raw data are
+    expanded within the window.
+    
+    Args:
+        reservations: Reservations, fetched from a CRM or imported from CSV
+        source: Source label of the items
+        window_start: Start of the checked period
+        window_end: End of the checked period
+    
+    Returns:
+        Timeline items
+    """
+    items = []
+    for reservation in reservations:
+        club_name = reservation.club.name if reservation.club else 'Unknown'
+        user = reservation.user.name if reservation.user else ''
+        participants = frozenset(p.name for p in reservation.players)
+        rule = (reservation.raw_data or {}).get('rrule')
+        title = (reservation.raw_data or {}).get('summary') or club_name
+        for start, end in expand(reservation.start_time, reservation.end_time, rule, window_start, window_end):
+            items.append(ScheduledItem(
+                start, end, user, source, title, _booking_key(reservation, club_name, start), participants, reservation
+            ))
+    return items
+
+
+def _booking_key(reservation: Reservation, club_name: str, start: datetime) -> str:
+    """Identify a booked slot, the same for every user on the flight.
+    
+    The resource, i.e. the course or tee sheet, keeps apart distinct bookings
+    at the same club and start. The user is left out, unlike in
+    ``Reservation.uid``, as the players' copies of a flight are one booking.
+    """
+    raw_data = reservation.raw_data if isinstance(reservation.raw_data, dict) else {}
+    resource_id = raw_data.get('resourceId')
+    if resource_id is None and raw_data.get('resources'):
+        resource_id = raw_data['resources'][0].get('resourceId')
+    if resource_id is None:
+        # Imported events have no resource; their summary tells them apart
+        resource_id = raw_data.get('id', raw_data.get('summary', ''))
+    return f"{club_name}|{resource_id}|{start.isoformat()}"
+
+
+def external_event_items(
+    events: Iterable[dict[str, Any]],
+    user: str,
+    window_start: datetime | None = None,
+    window_end: datetime | None = None
+) -> list[ScheduledItem]:
+    """Convert external event definitions to a user's timeline items.
+    
+    Args:
+        events: Event definitions as loaded from external_events.yaml
+        user: User name
+        window_start: Start of the checked period
+        window_end: End of the checked period
+    
+    Returns:
+        Timeline items of the events the user takes part in
+    """
+    items = []
+    for event in events:
+        if 'users' in event and user not in event['users']:
+            continue
+        try:
+            timezone = ZoneInfo(event.get('timezone', 'Europe/Helsinki'))
+            start = _aware(datetime.fromisoformat(event['start']), timezone)
+            end = _aware(datetime.fromisoformat(event['end']), timezone)
+            rule = event.get('rrule') or _repeat_rule(event.get('repeat'), timezone)
+            exdates = [occurrence_start(value, start) for value in (event.get('repeat') or {}).get('exclude', [])]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Skipping external event {event.get('name', 'Unknown')}: {e}")
+            continue
+        name = event.get('name', 'External event')
+        for item_start, item_end in expand(start, end, rule, window_start, window_end, exdates):
+            items.append(ScheduledItem(
+                item_start,
+                item_end,
+                user,
+                EXTERNAL,
+                name,
+                f"{name}|{item_start.isoformat()}",
+                frozenset(event.get('users', [])),
+                event
+            ))
+    return items
+
+
+def _aware(value: datetime, timezone: ZoneInfo) -> datetime:
+    """Attach a timezone to a naive datetime."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone)
+
+
+def _repeat_rule(repeat: dict[str, Any] | None, timezone: ZoneInfo) -> str | None:
+    """Convert an external event's ``repeat`` section to an RRULE."""
+    if not repeat:
+        return None
+    until = _aware(datetime.fromisoformat(str(repeat['until'])), timezone)
+    rule = f"FREQ={str(repeat.get('frequency', 'weekly')).upper()};UNTIL={until.astimezone(UTC):%Y%m%dT%H%M%SZ}"
+    if 'interval' in repeat:
+        rule += f";INTERVAL={int(repeat['interval'])}"
+    return rule
+
+
+def occurrence_start(value: Any, start: datetime) -> datetime:
+    """Get the start of a series occurrence given by date, or by date and time.
+    
+    Args:
+        value: Date or datetime, or its ISO format
+        start: Start of the first occurrence, giving the time of day and timezone
+    
+    Returns:
+        Start time of the occurrence
+    """
+    if isinstance(value, datetime):
+        result = value
+    elif isinstance(value, date):
+        result = datetime.combine(value, start.time())
+    elif len(str(value)) == len('YYYY-MM-DD'):
+        result = datetime.combine(date.fromisoformat(str(value)), start.time())
+    else:
+        result = datetime.fromisoformat(str(value))
+    return result if result.tzinfo else result.replace(tzinfo=start.tzinfo)
+
+
+def _rule_text(rule: Any) -> str:
+    """Get the RRULE text of a rule given as text, JSON or a dictionary."""
+    if isinstance(rule, str):
+        stripped = rule.strip()
+        if not stripped.startswith('{'):
+            return stripped.removeprefix('RRULE:')
+        rule = json.loads(stripped)
+    if hasattr(rule, 'to_ical'):
+        return rule.to_ical().decode('utf-8')
+    parts = []
+    for name, value in rule.items():
+        values = value if isinstance(value, list | tuple) else [value]
+        rendered = []
+        for v in values:
+            if name.upper() == 'UNTIL' and isinstance(v, str):
+                v = datetime.fromisoformat(v)
+            if isinstance(v, datetime):
+                v = v.astimezone(UTC).strftime('%Y%m%dT%H%M%SZ') if v.tzinfo else v.strftime('%Y%m%dT%H%M%S')
+            rendered.append(str(v))
+        parts.append(f"{name.upper()}={','.join(rendered)}")
+    return ';'.join(parts)
+
+
+def expand(
+    start: datetime,
+    end: datetime,
+    rule: Any = None,
+    window_start: datetime | None = None,
+    window_end: datetime | None = None,
+    exdates: Iterable[datetime] = ()
+) -> Iterator[tuple[datetime, datetime]]:
+    """Get the occurrences of a possibly recurring booking within a window.
+    
+    Args:
+        start: Start of the first occurrence
+        end: End of the first occurrence
+        rule: Recurrence rule as RRULE text, JSON, a dictionary or an
+            icalendar vRecur; None for a single booking
+        window_start: Start of the window, unbounded if None
+        window_end: End of the window, unbounded if None
+        exdates: Start times of excluded occurrences
+    
+    Yields:
+        (start, end) of each occurrence overlapping the window
+    """
+    duration = end - start
+    if not rule:
+        occurrences: Iterable[datetime] = [start]
+    else:
+        try:
+            recurrence = rrulestr(_rule_text(rule), dtstart=start)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring invalid recurrence rule {rule!r}: {e}")
+            occurrences = [start]
+        else:
+            if window_end is None:
+                occurrences = recurrence
+            else:
+                after = (window_start or start) - duration
+                occurrences = recurrence.between(after, window_end, inc=True)
+    
+    excluded = set(exdates)
+    for occurrence in occurrences:
+        if window_end is not None and occurrence >= window_end:
+            break
+        if occurrence in excluded:
+            continue
+        if window_start is not None and occurrence + duration <= window_start:
+            continue
+        yield occurrence, occurrence + duration
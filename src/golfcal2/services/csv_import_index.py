@@ -0,0 +1,170 @@
+"""Persistent index of imported CSV rows."""
+
+import hashlib
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from golfcal2.utils.logging_utils import LoggerMixin
+
+# SQLite limits the number of parameters of a statement
+_BATCH_SIZE = 500
+
+
+def row_fingerprint(location: str, start_date: str, start_time: str, course_code: str | None) -> str:
+    """Get the stable identity of an imported event.
+    
+    Args:
+        location: Event location
+        start_date: Start date as in the export
+        start_time: Start time as in the export
+        course_code: Course code, or None for an event outside a course
+    
+    Returns:
+        Hex digest identifying the event across exports
+    """
+    key = '\x1f'.join((location, start_date, start_time, course_code or ''))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def content_hash(values: Sequence[str], salt: str = '') -> str:
+    """Get a hash of an imported row's content.
+    
+    Args:
+        values: Stripped values of the row
+        salt: Import options affecting how the row is parsed
+    
+    Returns:
+        Hex digest of the row, changing with any field or option
+    """
+    return hashlib.sha1('\x1f'.join((salt, *values)).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class ImportDelta:
+    """Changes of a re-import relative to the previous import."""
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    # Keys of the recurring series with an added, changed or removed occurrence
+    series: set[str] = field(default_factory=set)
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+    
+    def __str__(self) -> str:
+        return (
+            f"{self.added} added, {self.changed} changed, {self.removed} removed, "
+            f"{self.unchanged} unchanged rows; {len(self.series)} recurring series affected"
+        )
+
+
+class CSVImportIndex(LoggerMixin):
+    """Rows imported for each user, keyed by row fingerprint.
+    
+    Each row holds a hash of its content, the recurring series it belongs
+    to and its parsed form, so a re-import parses only new and changed rows
+    and the calendar can be rebuilt from the index.
+    """
+    
+    def __init__(self, db_path: str | Path):
+        """Initialize index.
+        
+        Args:
+            db_path: Path to SQLite database file
+        """
+        super().__init__()
+        self.db_path = str(db_path)
+        self._init_db()
+    
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS csv_import_rows (
+                    user TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    series_key TEXT,
+                    parsed TEXT,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (user, fingerprint)
+                )
+            """)
+    
+    def entries(self, user: str) -> dict[str, tuple[str, str | None]]:
+        """Get the imported rows of a user.
+        
+        Args:
+            user: User name
+        
+        Returns:
+            Content hash and series key by row fingerprint
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT fingerprint, content_hash, series_key FROM csv_import_rows WHERE user = ?",
+                (user,)
+            )
+            return {fingerprint: (digest, series_key) for fingerprint, digest, series_key in cursor}
+    
+    def upsert(self, user: str, rows: Iterable[tuple[str, str, str | None, str | None]]) -> None:
+        """Store new and changed rows in one transaction.
+        
+        Args:
+            user: User name
+            rows: (fingerprint, content hash, series key, parsed row JSON) of
+                each row; rows that could not be parsed have no parsed form
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO csv_import_rows
+                    (user, fingerprint, content_hash, series_key, parsed, updated_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                ((user, *row) for row in rows)
+            )
+    
+    def remove(self, user: str, fingerprints: Sequence[str]) -> None:
+        """Remove rows no longer in the export.
+        
+        Args:
+            user: User name
+            fingerprints: Fingerprints of the removed rows
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            for i in range(0, len(fingerprints), _BATCH_SIZE):
+                batch = fingerprints[i:i + _BATCH_SIZE]
+                conn.execute(
+                    f"DELETE FROM csv_import_rows WHERE user = ? AND fingerprint IN ({','.join('?' * len(batch))})",
+                    (user, *batch)
+                )
+    
+    def clear(self, user: str) -> None:
+        """Forget every row imported for a user.
+        
+        Args:
+            user: User name
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM csv_import_rows WHERE user = ?", (user,))
+    
+    def parsed_rows(self, user: str) -> Iterator[str]:
+        """Stream the parsed rows of a user.
+        
+        Args:
+            user: User name
+        
+        Yields:
+            Parsed row JSON of each row that could be parsed
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT parsed FROM csv_import_rows WHERE user = ? AND parsed IS NOT NULL ORDER BY rowid",
+                (user,)
+            )
+            for (parsed,) in cursor:
+                yield parsed
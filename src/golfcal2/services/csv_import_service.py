@@ -1,149 +1,216 @@
 """
 CSV import service for golf calendar application.
+
+Rows are read with the csv module and parsed in chunks, in worker processes
+when a file has more than one chunk. At most two chunks per worker are in
+flight at a time, single events are yielded as soon as their chunk is
+parsed, and recurring courses are reduced to their first and last
+occurrence as rows arrive, so memory use does not grow with the size of
+the file.
 """
 
+import csv
 import json
+import os
 import re
-from collections import defaultdict
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, time
+from itertools import islice
 from typing import Any
 from zoneinfo import ZoneInfo
 
 from golfcal2.models.golf_club import ExternalGolfClub
 from golfcal2.models.reservation import Reservation
 from golfcal2.models.user import Membership, User
+from golfcal2.services.csv_import_index import CSVImportIndex, ImportDelta, content_hash, row_fingerprint
 from golfcal2.utils.logging_utils import get_logger
-from golfcal2.utils.timezone_utils import TimezoneManager
 
 logger = get_logger(__name__)
 
-class CSVImportService:
-    """Service for importing calendar events from CSV files."""
+# Expected columns in order; additional fields are appended to the description
+COLUMNS = ('START DATE', 'START TIME', 'END DATE', 'END TIME', 'LOCATION', 'DESCRIPTION', 'SUBJECT')
 
-    def __init__(self, timezone: str = "Europe/Helsinki"):
-        """Initialize service."""
-        self.timezone = timezone
-        self.tz_manager = TimezoneManager()
+# Rows parsed per chunk
+DEFAULT_CHUNK_SIZE = 5000
 
-    def _parse_datetime(self, date_str: str, time_str: str, timezone: str | None = None) -> datetime:
-        """
-        Parse date and time strings into datetime object.
-        
-        Args:
-            date_str: Date string in YYYY-MM-DD format
-            time_str: Time string in HH:MM:SS format
-            timezone: Optional timezone name (e.g. 'Europe/Helsinki')
-            
-        Returns:
-            Timezone-aware datetime object
-        """
-        try:
-            # Handle time format with or without seconds
-            if len(time_str.split(':')) == 2:
-                time_str = f"{time_str}:00"
-                
-            dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
-            
-            # Use provided timezone or default
-            tz = ZoneInfo(timezone or self.timezone)
-            return dt.replace(tzinfo=tz)
-            
-        except ValueError as e:
-            logger.error(f"Error parsing datetime: {e}")
-            raise
+COURSE_CODE_PATTERN = re.compile(r';\s*[^;]+;\s*([A-Z0-9]+)')
+COURSE_SUMMARY_PATTERN = re.compile(r'([^;]+);\s*([^;]+);\s*([A-Z0-9]+)\s+([^;\n]+)')
 
-    def _create_recurrence_rule(self, start_date: datetime, end_date: datetime, description: str, location: str, start_time: time) -> dict[str, Any] | None:
-        """Create a recurrence rule for weekly events if they match certain patterns."""
-        # Extract course name and level from description
-        course_match = re.search(r';\s*([^;]+);\s*([A-Z0-9]+)\s+([^;\n]+)', description)
-        if not course_match:
-            return None
-        
-        teacher, course_code, course_name = course_match.groups()
-        
-        # Check if this is a recurring course by looking at the course code and name
-        is_recurring = bool(re.search(r'A\d{5}|IL\d{4}', course_code))  # Match course codes like A14903 or IL0002
-        
-        if not is_recurring:
-            return None
-        
-        # Create weekly recurrence
-        rrule = {
-            'FREQ': 'WEEKLY',
-            'UNTIL': end_date,
-            'INTERVAL': 1,
-            'BYDAY': [start_date.strftime('%A')[:2].upper()],  # Convert day name to 2-letter code (e.g., 'Monday' -> 'MO')
-            'WKST': 'MO'  # Week starts on Monday
-        }
-        
-        return rrule
 
-    def _parse_csv_row(self, row: list[str]) -> dict[str, str]:
-        """
-        Parse a CSV row into a dictionary with proper column mapping.
+@dataclass
+class ParsedRow:
+    """A CSV row with its times parsed."""
+    data: dict[str, str]
+    start_time: datetime
+    end_time: datetime
+    # Course code of a course event, grouped into a weekly series
+    course_code: str | None
+    # Stripped values of the row
+    values: tuple[str, ...] = ()
+    
+    @property
+    def series_key(self) -> tuple[str, time, int, str] | None:
+        """Key of the weekly series of a course event."""
+        if self.course_code is None:
+            return None
+        return (self.data['LOCATION'], self.start_time.time(), self.start_time.weekday(), self.course_code)
+    
+    def to_json(self) -> str:
+        """Serialize the row for the import index; times are stored in local time."""
+        return json.dumps({
+            'data': self.data,
+            'start': self.start_time.replace(tzinfo=None).isoformat(),
+            'end': self.end_time.replace(tzinfo=None).isoformat(),
+            'course_code': self.course_code
+        })
+    
+    @classmethod
+    def from_json(cls, text: str, tz: ZoneInfo) -> 'ParsedRow':
+        """Restore a row from the import index.
         
         Args:
-            row: List of values from CSV row
-            
+            text: Serialized row
+            tz: Timezone the row was parsed in
+        
         Returns:
-            Dictionary with mapped column values
+            Parsed row
         """
-        # Expected columns in order
-        columns = ['START DATE', 'START TIME', 'END DATE', 'END TIME', 'LOCATION', 'DESCRIPTION', 'SUBJECT']
-        
-        # Create a dictionary with known columns
-        data = {}
-        for i, col in enumerate(columns):
-            if i < len(row):
-                data[col] = row[i]
-            else:
-                data[col] = ''
-                
-        # Combine additional fields into description
-        if len(row) > len(columns):
-            extra_info = '; '.join(row[len(columns):])
-            if data['DESCRIPTION']:
-                data['DESCRIPTION'] = f"{data['DESCRIPTION']}; {extra_info}"
-            else:
-                data['DESCRIPTION'] = extra_info
-                
-        return data
+        row = json.loads(text)
+        return cls(
+            row['data'],
+            datetime.fromisoformat(row['start']).replace(tzinfo=tz),
+            datetime.fromisoformat(row['end']).replace(tzinfo=tz),
+            row['course_code']
+        )
+
+
+@dataclass
+class _Series:
+    """Occurrences of a recurring course seen so far."""
+    first: ParsedRow
+    last_start: datetime
+
+
+def _parse_datetime(date_str: str, time_str: str, tz: ZoneInfo) -> datetime:
+    """
+    Parse date and time strings into datetime object.
+    
+    Args:
+        date_str: Date string in YYYY-MM-DD format
+        time_str: Time string in HH:MM:SS or HH:MM format
+        tz: Timezone of the time
+    
+    Returns:
+        Timezone-aware datetime object
+    """
+    # Handle time format with or without seconds
+    if time_str.count(':') == 1:
+        time_str = f"{time_str}:00"
+    return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S").replace(tzinfo=tz)
+
+
+def _map_columns(row: list[str]) -> dict[str, str]:
+    """
+    Map a CSV row to the expected columns.
+    
+    Args:
+        row: Stripped values of a CSV row
+    
+    Returns:
+        Dictionary with mapped column values
+    """
+    data = {col: row[i] if i < len(row) else '' for i, col in enumerate(COLUMNS)}
+    
+    # Combine additional fields into description
+    if len(row) > len(COLUMNS):
+        extra_info = '; '.join(row[len(COLUMNS):])
+        if data['DESCRIPTION']:
+            data['DESCRIPTION'] = f"{data['DESCRIPTION']}; {extra_info}"
+        else:
+            data['DESCRIPTION'] = extra_info
+    return data
+
 
-    def _get_event_key(self, start_time: datetime, location: str, description: str) -> tuple[int, str, str, str]:
+def parse_chunk(rows: list[list[str]], timezone: str) -> tuple[list[ParsedRow], list[str]]:
+    """
+    Parse a chunk of CSV rows.
+    
+    Runs in worker processes, so errors are returned rather than logged.
+    
+    Args:
+        rows: Raw CSV rows
+        timezone: Timezone name of the event times
+    
+    Returns:
+        Parsed rows and the errors of rows that could not be parsed
+    """
+    tz = ZoneInfo(timezone)
+    parsed = []
+    errors = []
+    for raw in rows:
+        row = [val.strip() for val in raw]
+        if not row or not row[0]:  # Skip empty lines
+            continue
+        try:
+            data = _map_columns(row)
+            start_time = _parse_datetime(data['START DATE'], data['START TIME'], tz)
+            end_time = _parse_datetime(data['END DATE'], data['END TIME'], tz)
+        except (KeyError, ValueError) as e:
+            errors.append(str(e))
+            continue
+        course_match = COURSE_CODE_PATTERN.search(data['DESCRIPTION'])
+        parsed.append(ParsedRow(data, start_time, end_time, course_match.group(1) if course_match else None, tuple(row)))
+    return parsed, errors
+
+
+class CSVImportService:
+    """Service for importing calendar events from CSV files."""
+    
+    def __init__(
+        self,
+        timezone: str = "Europe/Helsinki",
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
         """
-        Get a key for grouping recurring events.
+        Initialize service.
         
         Args:
-            start_time: Event start time
-            location: Event location
-            description: Event description
-            
-        Returns:
-            Tuple of (weekday, time, location, course_code) for grouping
+            timezone: Default timezone of the event times
+            workers: Processes parsing large files; defaults to the CPU count,
+                1 parses in this process
+            chunk_size: Rows per parsed chunk
         """
-        # Extract course code from description
-        course_match = re.search(r';\s*[^;]+;\s*([A-Z0-9]+)', description)
-        course_code = course_match.group(1) if course_match else ''
-        
-        return (
-            start_time.weekday(),
-            start_time.strftime('%H:%M'),
-            location,
-            course_code
-        )
-
+        self.timezone = timezone
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+    
+    @staticmethod
+    def _weekly_rule(start_time: datetime, until: datetime) -> dict[str, Any]:
+        """Create a weekly recurrence rule on the weekday of the first occurrence."""
+        return {
+            'FREQ': 'WEEKLY',
+            'UNTIL': until,
+            'INTERVAL': 1,
+            'BYDAY': [start_time.strftime('%A')[:2].upper()],  # Convert day name to 2-letter code (e.g., 'Monday' -> 'MO')
+            'WKST': 'MO'  # Week starts on Monday
+        }
+    
     def _get_event_summary(self, description: str) -> str:
         """
         Get a summary for the event based on the description.
         
         Args:
             description: Event description
-            
+        
         Returns:
             Event summary string
         """
         # Extract course name and details from description
-        course_match = re.search(r'([^;]+);\s*([^;]+);\s*([A-Z0-9]+)\s+([^;\n]+)', description)
+        course_match = COURSE_SUMMARY_PATTERN.search(description)
         if course_match:
             course_name, teacher, course_code, course_title = course_match.groups()
             if "Level" in course_title:
@@ -153,8 +220,114 @@ class CSVImportService:
                 # For other courses, use the course name
                 return f"{course_name} - {course_title}"
         return description
-
-    def import_from_csv(
+    
+    def _parsed_rows(self, rows: Iterator[list[str]], timezone: str) -> Iterator[ParsedRow]:
+        """
+        Parse CSV rows in chunks, in order.
+        
+        The first chunk is parsed in this process; a process pool is started
+        only if there are more rows, and at most two chunks per worker are in
+        flight at a time.
+        
+        Args:
+            rows: Raw CSV rows after the header
+            timezone: Timezone name of the event times
+        
+        Yields:
+            Parsed rows in file order
+        """
+        def chunks() -> Iterator[list[list[str]]]:
+            while chunk := list(islice(rows, self.chunk_size)):
+                yield chunk
+        
+        def unpack(result: tuple[list[ParsedRow], list[str]]) -> list[ParsedRow]:
+            parsed, errors = result
+            for error in errors:
+                logger.error(f"Error processing row: {error}")
+            return parsed
+        
+        pending_chunks = chunks()
+        first = next(pending_chunks, None)
+        if first is None:
+            return
+        yield from unpack(parse_chunk(first, timezone))
+        
+        second = next(pending_chunks, None)
+        if second is None:
+            return
+        if self.workers <= 1:
+            yield from unpack(parse_chunk(second, timezone))
+            for chunk in pending_chunks:
+                yield from unpack(parse_chunk(chunk, timezone))
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            in_flight: deque[Future[tuple[list[ParsedRow], list[str]]]] = deque(
+                [executor.submit(parse_chunk, second, timezone)]
+            )
+            for chunk in pending_chunks:
+                in_flight.append(executor.submit(parse_chunk, chunk, timezone))
+                if len(in_flight) >= 2 * self.workers:
+                    yield from unpack(in_flight.popleft().result())
+            while in_flight:
+                yield from unpack(in_flight.popleft().result())
+    
+    def _create_reservation(
+        self,
+        row: ParsedRow,
+        user: User,
+        timezone: str,
+        rrule: dict[str, Any] | None = None
+    ) -> Reservation:
+        """
+        Create a reservation for an imported event.
+        
+        Args:
+            row: Parsed row of the event, or of the first occurrence of a series
+            user: User the events are imported for
+            timezone: Timezone name of the event
+            rrule: Recurrence rule of a series
+        
+        Returns:
+            Reservation at an external club named after the event location
+        """
+        data = row.data
+        club = ExternalGolfClub(
+            name=data['LOCATION'],
+            url="",
+            coordinates=None,
+            timezone=timezone,
+            address=data['LOCATION']
+        )
+        
+        # Create a pseudo-membership for the external event
+        membership = Membership(
+            club=club.name,
+            club_abbreviation="EXT",  # External event marker
+            duration={"hours": 0, "minutes": 0},  # Duration will be calculated from event times
+            auth_details={}  # External events don't need auth details
+        )
+        
+        raw_data: dict[str, Any] = {
+            'description': data['DESCRIPTION'],
+            'subject': data['SUBJECT'],
+            'location': data['LOCATION'],
+            'summary': self._get_event_summary(data['DESCRIPTION'])
+        }
+        if rrule is not None:
+            raw_data['rrule'] = rrule
+        
+        return Reservation(
+            club=club,
+            user=user,
+            membership=membership,
+            start_time=row.start_time,
+            end_time=row.end_time,
+            players=[],
+            raw_data=raw_data
+        )
+    
+    def iter_reservations(
         self,
         file_path: str,
         user: User,
@@ -162,166 +335,248 @@ class CSVImportService:
         recurrence_end: datetime | None = None,
         timezone: str | None = None,
         delimiter: str = ";"
-    ) -> list[Reservation]:
+    ) -> Iterator[Reservation]:
         """
-        Import reservations from a CSV file.
+        Stream reservations from a CSV file.
+        
+        Events without a course code are yielded as their rows are parsed.
+        Course events are grouped by location, start time, weekday and course
+        code into weekly series, yielded once the file has been read.
+        
+        Args:
+            file_path: CSV file with a header line
+            user: User the events are imported for
+            recurring_until: Latest end of the recurring series
+            recurrence_end: Latest end of the recurring series
+            timezone: Timezone name of the event times; defaults to the service's
+            delimiter: Field delimiter
+        
+        Yields:
+            Reservations, recurring series carrying an ``rrule`` in their raw data
         """
         logger.info(f"Importing reservations from {file_path}")
-        reservations = []
-        event_groups = defaultdict(list)  # For grouping potential recurring events
-
+        
         # Use provided timezone or default
         event_timezone = timezone or self.timezone
         logger.info(f"Using timezone: {event_timezone}")
-
-        try:
-            with open(file_path, encoding='utf-8') as f:
-                # Skip header line
-                next(f)
+        
+        def parsed_rows() -> Iterator[ParsedRow]:
+            try:
+                with open(file_path, encoding='utf-8', newline='') as f:
+                    rows = csv.reader(f, delimiter=delimiter)
+                    # Skip header line
+                    next(rows, None)
+                    yield from self._parsed_rows(rows, event_timezone)
+            except Exception as e:
+                logger.error(f"Error importing from CSV: {e}")
+                raise
+        
+        yield from self._reservations(parsed_rows(), user, event_timezone, recurring_until, recurrence_end)
+    
+    def _reservations(
+        self,
+        rows: Iterable[ParsedRow],
+        user: User,
+        timezone: str,
+        recurring_until: datetime | None = None,
+        recurrence_end: datetime | None = None
+    ) -> Iterator[Reservation]:
+        """
+        Turn parsed rows into single events and weekly series.
+        
+        Args:
+            rows: Parsed rows
+            user: User the events are imported for
+            timezone: Timezone name of the events
+            recurring_until: Latest end of the recurring series
+            recurrence_end: Latest end of the recurring series
+        
+        Yields:
+            Single events as their rows arrive, then the series
+        """
+        series: dict[tuple[str, time, int, str], _Series] = {}
+        count = 0
+        for row in rows:
+            # Group events by weekday, time, location, and course code
+            pattern_key = row.series_key
+            if pattern_key is None:
+                # Handle non-course events individually
+                count += 1
+                yield self._create_reservation(row, user, timezone)
+                continue
+            
+            group = series.get(pattern_key)
+            if group is None:
+                series[pattern_key] = _Series(row, row.start_time)
+                continue
+            if row.start_time < group.first.start_time:
+                group.first = row
+            group.last_start = max(group.last_start, row.start_time)
+        
+        # Create recurring events
+        for group in series.values():
+            try:
+                # Calculate recurrence end date
+                series_end = group.last_start  # Last event in the series
+                if recurring_until:
+                    series_end = min(series_end, recurring_until)
+                if recurrence_end:
+                    series_end = min(series_end, recurrence_end)
                 
-                # First pass: Read all events and group them
-                for line in f:
-                    try:
-                        # Split line and clean values
-                        row = [val.strip() for val in line.split(delimiter)]
-                        if not row or not row[0]:  # Skip empty lines
-                            continue
-                            
-                        # Parse row into proper column mapping
-                        data = self._parse_csv_row(row)
-                        
-                        # Parse start and end times with specified timezone
-                        start_time = self._parse_datetime(
-                            data['START DATE'], 
-                            data['START TIME'],
-                            event_timezone
-                        )
-                        end_time = self._parse_datetime(
-                            data['END DATE'], 
-                            data['END TIME'],
-                            event_timezone
-                        )
-
-                        # Extract course code from description
-                        course_match = re.search(r';\s*[^;]+;\s*([A-Z0-9]+)', data['DESCRIPTION'])
-                        if course_match:
-                            course_code = course_match.group(1)
-                            # Create a pattern key for recurring events
-                            pattern_key = (
-                                data['LOCATION'],
-                                start_time.time(),
-                                start_time.weekday(),
-                                course_code
-                            )
-                            
-                            # Group events by weekday, time, location, and course code
-                            event_groups[pattern_key].append((data, start_time, end_time))
-                        else:
-                            # Handle non-course events individually
-                            club = ExternalGolfClub(
-                                name=data['LOCATION'],
-                                url="",
-                                coordinates=None,
-                                timezone=event_timezone,
-                                address=data['LOCATION']
-                            )
-
-                            membership = Membership(
-                                club=club.name,
-                                club_abbreviation="EXT",  # External event marker
-                                duration={"hours": 0, "minutes": 0},  # Duration will be calculated from event times
-                                auth_details={}  # External events don't need auth details
-                            )
-
-                            raw_data = {
-                                'description': data['DESCRIPTION'],
-                                'subject': data['SUBJECT'],
-                                'location': data['LOCATION'],
-                                'summary': self._get_event_summary(data['DESCRIPTION'])
-                            }
-
-                            reservation = Reservation(
-                                club=club,
-                                user=user,
-                                membership=membership,
-                                start_time=start_time,
-                                end_time=end_time,
-                                players=[],
-                                raw_data=raw_data
-                            )
-                            reservations.append(reservation)
-                    except (KeyError, ValueError) as e:
-                        logger.error(f"Error processing row: {e}")
-                        continue
-
-                # Second pass: Create recurring events
-                for _pattern_key, events in event_groups.items():
-                    try:
-                        # Sort events by date
-                        events.sort(key=lambda x: x[1])
-                        
-                        # Get the first event as the base
-                        data, start_time, end_time = events[0]
-                        
-                        # Create external golf club for the event
-                        club = ExternalGolfClub(
-                            name=data['LOCATION'],
-                            url="",
-                            coordinates=None,
-                            timezone=event_timezone,
-                            address=data['LOCATION']
-                        )
-
-                        # Create a pseudo-membership for the external event
-                        membership = Membership(
-                            club=club.name,
-                            club_abbreviation="EXT",  # External event marker
-                            duration={"hours": 0, "minutes": 0},  # Duration will be calculated from event times
-                            auth_details={}  # External events don't need auth details
-                        )
-
-                        # Calculate recurrence end date
-                        series_end = events[-1][1]  # Last event in the series
-                        if recurring_until:
-                            series_end = min(series_end, recurring_until)
-                        if recurrence_end:
-                            series_end = min(series_end, recurrence_end)
-
-                        # Create RRULE for weekly recurrence
-                        rrule = {
-                            'FREQ': 'WEEKLY',
-                            'UNTIL': series_end,
-                            'INTERVAL': 1,
-                            'BYDAY': [start_time.strftime('%A')[:2].upper()],  # Convert day name to 2-letter code
-                            'WKST': 'MO'  # Week starts on Monday
-                        }
-
-                        # Create the base reservation with recurrence rule
-                        raw_data = {
-                            'description': data['DESCRIPTION'],
-                            'subject': data['SUBJECT'],
-                            'location': data['LOCATION'],
-                            'rrule': json.dumps(rrule),
-                            'summary': self._get_event_summary(data['DESCRIPTION'])
-                        }
-
-                        reservation = Reservation(
-                            club=club,
-                            user=user,
-                            membership=membership,
-                            start_time=start_time,
-                            end_time=end_time,
-                            players=[],
-                            raw_data=raw_data
-                        )
-                        reservations.append(reservation)
-                    except Exception as e:
-                        logger.error(f"Error creating recurring event: {e}")
-                        continue
-
-                logger.info(f"Imported {len(reservations)} reservations")
-                return reservations
-
-        except Exception as e:
-            logger.error(f"Error importing from CSV: {e}")
-            raise 
\ No newline at end of file
+                rrule = self._weekly_rule(group.first.start_time, series_end)
+                count += 1
+                yield self._create_reservation(group.first, user, timezone, rrule)
+            except Exception as e:
+                logger.error(f"Error creating recurring event: {e}")
+                continue
+        
+        logger.info(f"Imported {count} reservations")
+    
+    def sync_index(
+        self,
+        index: CSVImportIndex,
+        file_path: str,
+        user: User,
+        recurring_until: datetime | None = None,
+        recurrence_end: datetime | None = None,
+        timezone: str | None = None,
+        delimiter: str = ";"
+    ) -> ImportDelta:
+        """
+        Bring a user's import index up to date with a CSV export.
+        
+        Rows are matched to the previous import by fingerprint (location,
+        start and course code) and compared by a hash of their content and
+        the import options. Only new and changed rows are parsed; rows no
+        longer in the export are removed from the index.
+        
+        Args:
+            index: Import index
+            file_path: CSV file with a header line
+            user: User the events are imported for
+            recurring_until: Latest end of the recurring series
+            recurrence_end: Latest end of the recurring series
+            timezone: Timezone name of the event times; defaults to the service's
+            delimiter: Field delimiter
+        
+        Returns:
+            Rows added, changed, removed and unchanged since the last import
+        """
+        event_timezone = timezone or self.timezone
+        salt = f"{event_timezone}|{recurring_until}|{recurrence_end}"
+        known = index.entries(user.name)
+        delta = ImportDelta()
+        occurrences: Counter[str] = Counter()
+        # Values, fingerprints and hashes of the rows being parsed, in file order
+        pending: deque[tuple[tuple[str, ...], str, str]] = deque()
+        
+        def changed_rows(rows: Iterator[list[str]]) -> Iterator[list[str]]:
+            for raw in rows:
+                values = tuple(val.strip() for val in raw)
+                if not values or not values[0]:  # Skip empty lines
+                    continue
+                data = _map_columns(list(values))
+                course_match = COURSE_CODE_PATTERN.search(data['DESCRIPTION'])
+                fingerprint = row_fingerprint(
+                    data['LOCATION'],
+                    data['START DATE'],
+                    data['START TIME'],
+                    course_match.group(1) if course_match else None
+                )
+                # Identical events in one export are told apart by their order
+                occurrences[fingerprint] += 1
+                if occurrences[fingerprint] > 1:
+                    fingerprint = f"{fingerprint}#{occurrences[fingerprint]}"
+                
+                digest = content_hash(values, salt)
+                previous = known.pop(fingerprint, None)
+                if previous is not None and previous[0] == digest:
+                    delta.unchanged += 1
+                    continue
+                if previous is None:
+                    delta.added += 1
+                else:
+                    delta.changed += 1
+                    if previous[1]:
+                        delta.series.add(previous[1])
+                pending.append((values, fingerprint, digest))
+                yield raw
+        
+        def parsed_entries(rows: Iterator[list[str]]) -> Iterator[tuple[str, str, str | None, str | None]]:
+            for row in self._parsed_rows(changed_rows(rows), event_timezone):
+                # Rows skipped before this one failed to parse; they are
+                # recorded so they are not retried until they change
+                values, fingerprint, digest = pending.popleft()
+                while values != row.values:
+                    yield fingerprint, digest, None, None
+                    values, fingerprint, digest = pending.popleft()
+                series_key = row.series_key
+                key = '|'.join(map(str, series_key)) if series_key else None
+                if key:
+                    delta.series.add(key)
+                yield fingerprint, digest, key, row.to_json()
+            while pending:
+                _, fingerprint, digest = pending.popleft()
+                yield fingerprint, digest, None, None
+        
+        logger.info(f"Updating import index of {user.name} from {file_path}")
+        with open(file_path, encoding='utf-8', newline='') as f:
+            rows = csv.reader(f, delimiter=delimiter)
+            # Skip header line
+            next(rows, None)
+            index.upsert(user.name, parsed_entries(rows))
+        
+        delta.removed = len(known)
+        delta.series.update(series_key for _, series_key in known.values() if series_key)
+        index.remove(user.name, list(known))
+        logger.info(f"Import delta for {user.name}: {delta}")
+        return delta
+    
+    def indexed_reservations(
+        self,
+        index: CSVImportIndex,
+        user: User,
+        recurring_until: datetime | None = None,
+        recurrence_end: datetime | None = None,
+        timezone: str | None = None
+    ) -> Iterator[Reservation]:
+        """
+        Stream the reservations of a user's import index.
+        
+        Args:
+            index: Import index updated with ``sync_index``
+            user: User the events were imported for
+            recurring_until: Latest end of the recurring series
+            recurrence_end: Latest end of the recurring series
+            timezone: Timezone name the rows were parsed in
+        
+        Yields:
+            Reservations, recurring series carrying an ``rrule`` in their raw data
+        """
+        event_timezone = timezone or self.timezone
+        tz = ZoneInfo(event_timezone)
+        rows = (ParsedRow.from_json(parsed, tz) for parsed in index.parsed_rows(user.name))
+        yield from self._reservations(rows, user, event_timezone, recurring_until, recurrence_end)
+    
+    def import_from_csv(
+        self,
+        file_path: str,
+        user: User,
+        recurring_until: datetime | None = None,
+        recurrence_end: datetime | None = None,
+        timezone: str | None = None,
+        delimiter: str = ";"
+    ) -> list[Reservation]:
+        """
+        Import reservations from a CSV file.
+        
+        See ``iter_reservations``, which streams the same reservations.
+        """
+        return list(self.iter_reservations(
+            file_path,
+            user,
+            recurring_until=recurring_until,
+            recurrence_end=recurrence_end,
+            timezone=timezone,
+            delimiter=delimiter
+        ))
@@ -3,20 +3,73 @@ Service for handling external golf events.
 """
 
 import os
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
 import yaml
-from icalendar import Event
+from icalendar import Event, vDatetime, vRecur
 
 from golfcal2.config.types import AppConfig
 from golfcal2.services.calendar.builders import ExternalEventBuilder
+from golfcal2.services.conflict_service import expand, occurrence_start
 from golfcal2.services.weather_service import WeatherService
 from golfcal2.utils.logging_utils import EnhancedLoggerMixin
 
 
+@dataclass(frozen=True)
+class ExternalEventDefinition:
+    """An external event definition with its times parsed."""
+    data: dict[str, Any] = field(compare=False, hash=False)
+    timezone_name: str
+    start: datetime
+    end: datetime
+    until: datetime | None = None
+    
+    @classmethod
+    def from_dict(cls, event_data: dict[str, Any]) -> 'ExternalEventDefinition':
+        """Parse an event definition from external_events.yaml.
+        
+        Naive times are in the event's timezone.
+        
+        Args:
+            event_data: Event definition
+        
+        Returns:
+            Parsed definition
+        
+        Raises:
+            KeyError: If start, end or the repeat end date is missing
+            ValueError: If a time or the timezone is invalid
+        """
+        timezone_name = event_data.get('timezone', 'Europe/Helsinki')
+        timezone = ZoneInfo(timezone_name)
+        
+        def parse(value: Any) -> datetime:
+            parsed = datetime.fromisoformat(str(value))
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone)
+        
+        repeat = event_data.get('repeat')
+        return cls(
+            event_data,
+            timezone_name,
+            parse(event_data['start']),
+            parse(event_data['end']),
+            parse(repeat['until']) if repeat else None
+        )
+
+
+@dataclass
+class _EventIndex:
+    """Parsed event definitions indexed by user."""
+    signature: tuple[int | None, ...]
+    by_user: dict[str, list[ExternalEventDefinition]]
+    # Events without a user list, which apply to everyone
+    shared: list[ExternalEventDefinition]
+
+
 class ExternalEventService(EnhancedLoggerMixin):
     """Service for handling external golf events."""
     
@@ -39,6 +92,14 @@ class ExternalEventService(EnhancedLoggerMixin):
         # Get config directory path relative to this file
         self.config_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / 'config'
         
+        # Recurring events get forecasts only this far ahead
+        external_config = config.global_config.get('external_events', {}) if isinstance(config.global_config, dict) else {}
+        self.forecast_horizon = timedelta(days=float(external_config.get('forecast_horizon_days', 10)))
+        
+        # Parsed event files by path, with the modification time they were read at
+        self._file_cache: dict[Path, tuple[int, list[dict[str, Any]]]] = {}
+        self._index: dict[bool, _EventIndex] = {}
+        
         # Cache for processed events
         self._processed_events: list[Event] = []
         self._last_process_time: datetime | None = None
@@ -51,54 +112,119 @@ class ExternalEventService(EnhancedLoggerMixin):
         """
         return self._processed_events
     
-    def load_events(self, dev_mode: bool = False) -> list[dict[str, Any]]:
-        """Load external events from YAML file."""
+    def _event_files(self, dev_mode: bool) -> list[tuple[Path, bool]]:
+        """Get the event files to read, and whether each nests its events under ``events``."""
+        files = [(self.config_dir / 'external_events.yaml', True)]
+        if dev_mode:
+            files.append((self.config_dir / 'test_events.yaml', False))
+        return files
+    
+    @staticmethod
+    def _mtime(path: Path) -> int | None:
+        """Get the modification time of a file, or None if it does not exist."""
         try:
-            # Load regular events
-            events = []
-            events_file = self.config_dir / 'external_events.yaml'
-            
-            if events_file.exists():
-                with open(events_file, encoding='utf-8') as file:
-                    self.logger.info(f"Loading external events from {events_file}")
-                    data = yaml.safe_load(file)
-                    events.extend(data.get('events', []))
-            
-            # Load test events in dev mode
-            if dev_mode:
-                test_file = self.config_dir / 'test_events.yaml'
-                if test_file.exists():
-                    with open(test_file, encoding='utf-8') as file:
-                        self.logger.info(f"Loading test events from {test_file}")
-                        data = yaml.safe_load(file)
-                        events.extend(data or [])
-            
-            self.logger.info(f"Found {len(events)} external events")
-            return events
-            
+            return path.stat().st_mtime_ns
         except FileNotFoundError:
-            self.logger.warning(f"No external events file found at {events_file}")
+            return None
+    
+    def _read_events_file(self, path: Path, nested: bool) -> list[dict[str, Any]]:
+        """Get the events of a YAML file, parsing it only when it has changed.
+        
+        Args:
+            path: Events file
+            nested: Whether the events are under an ``events`` key
+        
+        Returns:
+            Event definitions, empty if the file does not exist or is invalid
+        """
+        mtime = self._mtime(path)
+        if mtime is None:
+            self._file_cache.pop(path, None)
             return []
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        self.logger.info(f"Loading external events from {path}")
+        try:
+            with open(path, encoding='utf-8') as file:
+                data = yaml.safe_load(file)
         except yaml.YAMLError as e:
-            self.logger.error(f"Error parsing external events file: {e}")
-            return []
+            self.logger.error(f"Error parsing external events file {path}: {e}")
+            data = None
+        events = ((data or {}).get('events') if nested else data) or []
+        self._file_cache[path] = (mtime, events)
+        return events
+    
+    def load_events(self, dev_mode: bool = False) -> list[dict[str, Any]]:
+        """Load external events from YAML files.
+        
+        Files are parsed again only after they have been modified.
+        
+        Args:
+            dev_mode: Also load the test events
+        
+        Returns:
+            Event definitions
+        """
+        events = []
+        for path, nested in self._event_files(dev_mode):
+            events.extend(self._read_events_file(path, nested))
+        return events
+    
+    def _event_index(self, dev_mode: bool) -> _EventIndex:
+        """Get the parsed events by user, rebuilding the index when a file has changed."""
+        files = self._event_files(dev_mode)
+        signature = tuple(self._mtime(path) for path, _ in files)
+        index = self._index.get(dev_mode)
+        if index is not None and index.signature == signature:
+            return index
+        
+        definitions = []
+        for event_data in self.load_events(dev_mode):
+            try:
+                definitions.append(ExternalEventDefinition.from_dict(event_data))
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.error(f"Skipping invalid external event {event_data.get('name', 'Unknown')}: {e!s}")
+        
+        users = {user for definition in definitions for user in definition.data.get('users', [])}
+        by_user: dict[str, list[ExternalEventDefinition]] = {user: [] for user in users}
+        shared = []
+        for definition in definitions:
+            if 'users' not in definition.data:
+                shared.append(definition)
+            for user in definition.data.get('users', users):
+                by_user[user].append(definition)
+        
+        self.logger.info(f"Found {len(definitions)} external events")
+        index = self._index[dev_mode] = _EventIndex(signature, by_user, shared)
+        return index
+    
+    def events_for_user(self, user_name: str, dev_mode: bool = False) -> list[ExternalEventDefinition]:
+        """Get the external events a user takes part in.
+        
+        Args:
+            user_name: User name
+            dev_mode: Also include the test events
+        
+        Returns:
+            Parsed event definitions
+        """
+        index = self._event_index(dev_mode)
+        return index.by_user.get(user_name, index.shared)
 
     def process_events(self, user_name: str, dev_mode: bool = False) -> list[Event]:
         """Process external events for a user."""
         try:
             events = []
-            for event_data in self.load_events(dev_mode):
-                # Skip events that don't include this user
-                if 'users' in event_data and user_name not in event_data['users']:
-                    continue
-
+            for definition in self.events_for_user(user_name, dev_mode):
                 # Process recurring events
-                if 'repeat' in event_data:
-                    recurring_events = self._process_recurring_event(event_data, user_name)
+                if definition.until is not None:
+                    recurring_events = self._process_recurring_event(definition, user_name)
                     events.extend(recurring_events)
                 else:
                     # Process single event
-                    event = self._create_event(event_data, user_name)
+                    event = self._create_event(definition, user_name)
                     if event:
                         events.append(event)
             
@@ -110,58 +236,67 @@ class ExternalEventService(EnhancedLoggerMixin):
 
     def _process_recurring_event(
         self,
-        event_data: dict[str, Any],
+        definition: ExternalEventDefinition,
         person_name: str
     ) -> list[Event]:
-        """Process a recurring event and return all instances."""
-        events = []
-        # Get event timezone
-        event_timezone = ZoneInfo(event_data.get('timezone', 'Europe/Helsinki'))
-        
-        # Parse dates with timezone
-        start_date = datetime.fromisoformat(event_data['start']).replace(tzinfo=event_timezone)
-        end_date = datetime.fromisoformat(event_data['repeat']['until']).replace(tzinfo=event_timezone)
-        current_date = start_date
-        
-        while current_date <= end_date:
-            # Create event data for this instance
-            instance_data = event_data.copy()
-            # Keep timezone info by using isoformat
-            instance_data['start'] = current_date.isoformat()
-            
-            # Calculate end time for this instance
-            original_duration = (datetime.fromisoformat(event_data['end']).replace(tzinfo=event_timezone) - 
-                             datetime.fromisoformat(event_data['start']).replace(tzinfo=event_timezone))
-            end_time = current_date + original_duration
-            instance_data['end'] = end_time.isoformat()
-            
-            # Create and add the event
-            event = self._create_event(instance_data, person_name)
-            if event:
-                events.append(event)
-            
-            # Move to next occurrence
-            if event_data['repeat']['frequency'] == 'weekly':
-                current_date += timedelta(days=7)
-            elif event_data['repeat']['frequency'] == 'monthly':
-                # Move to same day next month
-                if current_date.month == 12:
-                    current_date = current_date.replace(year=current_date.year + 1, month=1)
-                else:
-                    current_date = current_date.replace(month=current_date.month + 1)
+        """Process a recurring event into a series and its forecast overrides.
+        
+        The series is a single event with an RRULE, and an EXDATE for dates
+        listed in ``repeat.exclude``. Only occurrences within the weather
+        forecast horizon are emitted as overrides (same UID and a
+        RECURRENCE-ID) carrying their forecast; later occurrences follow the
+        rule without building events or looking up weather.
+        """
+        event_data = definition.data
+        timezone_name = definition.timezone_name
+        start, end, until = definition.start, definition.end, definition.until
+        assert until is not None
+        repeat = event_data['repeat']
+        duration = end - start
+        
+        # Skip series whose last occurrence has ended
+        now = datetime.now(start.tzinfo)
+        if until + duration < now:
+            self.logger.debug(f"Skipping past recurring event: {event_data.get('name', 'Unknown')}")
+            return []
+        
+        rule: dict[str, Any] = {'FREQ': str(repeat['frequency']).upper(), 'UNTIL': until.astimezone(UTC)}
+        if 'interval' in repeat:
+            rule['INTERVAL'] = int(repeat['interval'])
+        excluded = [occurrence_start(value, start) for value in repeat.get('exclude', [])]
+        
+        series = self.event_builder.build(event_data, person_name, start, end, with_weather=False)
+        if series is None:
+            return []
+        series.add('rrule', vRecur(rule))
+        if excluded:
+            series.add('exdate', excluded)
+        events = [series]
+        
+        # Materialise the occurrences a forecast is available for
+        if 'coordinates' in event_data:
+            for instance_start, instance_end in expand(
+                start, end, rule, now, now + self.forecast_horizon, excluded
+            ):
+                override = self.event_builder.build(event_data, person_name, instance_start, instance_end)
+                if override is None:
+                    continue
+                del override['uid']
+                override.add('uid', series['uid'])
+                override.add('recurrence-id', vDatetime(instance_start), parameters={'TZID': [timezone_name]})
+                events.append(override)
         
         return events
-
+    
     def _create_event(
         self,
-        event_data: dict[str, Any],
+        definition: ExternalEventDefinition,
         person_name: str
     ) -> Event | None:
-        """Create an event from external event data."""
+        """Create an event from a parsed external event definition."""
         try:
-            # Parse start and end times
-            start = self._parse_datetime(event_data['start'])
-            end = self._parse_datetime(event_data['end'])
+            event_data = definition.data
+            start, end = definition.start, definition.end
 
             # Skip past events
             now = datetime.now(start.tzinfo)
@@ -179,13 +314,6 @@ class ExternalEventService(EnhancedLoggerMixin):
             self.logger.error(f"Failed to create external event: {e!s}")
             return None
 
-    def _parse_datetime(self, datetime_str: str) -> datetime:
-        """Parse datetime string to datetime object."""
-        dt = datetime.fromisoformat(datetime_str)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=self.default_timezone)
-        return dt
-
     def _parse_dynamic_time(self, time_str: str, timezone: ZoneInfo) -> datetime:
         """Parse a dynamic time string like 'tomorrow 10:00' or '3 days 09:30'."""
         try:
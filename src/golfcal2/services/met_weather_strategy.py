@@ -16,6 +16,7 @@ class MetWeatherStrategy(WeatherStrategy):
     """Weather strategy for Norwegian Meteorological Institute (MET)."""
     
     service_type: str = "met"
+    api_url: str = "https://api.met.no/weatherapi/locationforecast/2.0/complete"
     HOURLY_RANGE: int = 48  # 2 days
     SIX_HOURLY_RANGE: int = 240  # 10 days
     MAX_FORECAST_RANGE: int = 216  # 9 days
@@ -68,7 +69,7 @@ class MetWeatherStrategy(WeatherStrategy):
         """Fetch forecast data from MET API."""
         try:
             # Build API URL
-            base_url = "https://api.met.no/weatherapi/locationforecast/2.0/complete"
+            base_url = self.get_api_url()
             params = {
                 'lat': f"{self.context.lat:.4f}",
                 'lon': f"{self.context.lon:.4f}"
@@ -81,7 +82,7 @@ class MetWeatherStrategy(WeatherStrategy):
             }
             
             # Make request
-            response = requests.get(base_url, params=params, headers=headers)
+            response = self._http_get(base_url, params=params, headers=headers)
             
             # Handle response
             if response.status_code == 200:
@@ -0,0 +1,267 @@
+"""Durable outbound notification queue with a background sender."""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from golfcal2.metrics import Metrics
+from golfcal2.utils.logging_utils import LoggerMixin
+
+# Pushover rejects longer messages
+MAX_MESSAGE_LENGTH = 1024
+
+
+@dataclass
+class QueuedNotification:
+    """A notification waiting to be sent."""
+    id: int
+    user: str
+    title: str
+    message: str
+    flight: str
+    created_at: float
+    attempts: int
+    next_attempt: float
+
+
+class NotificationQueue(LoggerMixin):
+    """Queue of notifications delivered by a background thread.
+    
+    Notifications are stored in SQLite before ``enqueue`` returns, so they
+    survive restarts. The notifications of a user are held for the coalesce
+    window after the first one and then sent as a single message; failed
+    sends are retried with exponential backoff.
+    """
+    
+    def __init__(
+        self,
+        db_path: str | Path,
+        send: Callable[[str, str], bool],
+        coalesce_window: float = 120.0,
+        retry_backoff: float = 30.0,
+        max_backoff: float = 3600.0,
+        max_attempts: int = 5
+    ):
+        """Initialize queue and start delivering pending notifications.
+        
+        Args:
+            db_path: Path to SQLite database file
+            send: Function sending a title and message, returning True on success
+            coalesce_window: Seconds to collect a user's notifications before sending
+            retry_backoff: Seconds before the first retry, doubled on each failure
+            max_backoff: Maximum seconds between retries
+            max_attempts: Attempts before a notification is dropped
+        """
+        super().__init__()
+        self.db_path = str(db_path)
+        self.send = send
+        self.coalesce_window = coalesce_window
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._successor: NotificationQueue | None = None
+        self._lock = threading.Lock()
+        self._init_db()
+        if self.depth():
+            self._ensure_sender()
+    
+    @classmethod
+    def from_config(cls, config: Any, db_path: str | Path, send: Callable[[str, str], bool]) -> 'NotificationQueue':
+        """Create a queue with the settings of the ``notifications`` section.
+        
+        Args:
+            config: Application configuration
+            db_path: Path to SQLite database file
+            send: Function sending a title and message
+        
+        Returns:
+            Notification queue
+        """
+        global_config = getattr(config, 'global_config', None) or {}
+        settings = global_config.get('notifications', {}) if isinstance(global_config, dict) else {}
+        return cls(
+            db_path,
+            send,
+            coalesce_window=float(settings.get('coalesce_window', 120)),
+            retry_backoff=float(settings.get('retry_backoff', 30)),
+            max_backoff=float(settings.get('max_backoff', 3600)),
+            max_attempts=int(settings.get('max_attempts', 5))
+        )
+    
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS notification_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    flight TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt REAL NOT NULL
+                )
+            """)
+    
+    def depth(self) -> int:
+        """Get the number of queued notifications and publish it as a gauge."""
+        with sqlite3.connect(self.db_path) as conn:
+            depth = conn.execute("SELECT COUNT(*) FROM notification_queue").fetchone()[0]
+        Metrics().set_gauge('notification_queue_depth', depth)
+        return depth
+    
+    def enqueue(self, user: str, title: str, message: str, flight: str = '') -> None:
+        """Queue a notification.
+        
+        Args:
+            user: User the notification is about; notifications are coalesced per user
+            title: Notification title
+            message: Notification message
+            flight: Reservation the notification is about
+        """
+        successor = self._successor
+        if successor is not None:
+            successor.enqueue(user, title, message, flight)
+            return
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO notification_queue (user, title, message, flight, created_at, next_attempt)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (user, title, message, flight, now, now)
+            )
+        self.depth()
+        self._ensure_sender()
+        self._wakeup.set()
+    
+    def _ensure_sender(self) -> None:
+        """Start the sender thread unless running."""
+        with self._lock:
+            if self._thread is None and not self._stop.is_set():
+                self._thread = threading.Thread(target=self._run, name='notification-sender', daemon=True)
+                self._thread.start()
+    
+    def _run(self) -> None:
+        """Deliver notifications as they become due until closed."""
+        while not self._stop.is_set():
+            try:
+                delay = self.deliver_due()
+            except Exception as e:
+                self.logger.error(f"Failed to deliver notifications: {e}")
+                delay = self.retry_backoff
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+    
+    def _pending(self) -> dict[str, list[QueuedNotification]]:
+        """Get queued notifications by user, oldest first."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT id, user, title, message, flight, created_at, attempts, next_attempt
+                FROM notification_queue ORDER BY id
+                """
+            ).fetchall()
+        pending: dict[str, list[QueuedNotification]] = {}
+        for row in rows:
+            notification = QueuedNotification(*row)
+            pending.setdefault(notification.user, []).append(notification)
+        return pending
+    
+    def deliver_due(self, now: float | None = None) -> float | None:
+        """Send the coalesced notifications of users whose batch is due.
+        
+        Args:
+            now: Current time as a Unix timestamp
+        
+        Returns:
+            Seconds until the next batch is due, or None if the queue is empty
+        """
+        now = time.time() if now is None else now
+        next_due: float | None = None
+        for batch in self._pending().values():
+            due_at = max(batch[0].created_at + self.coalesce_window, max(n.next_attempt for n in batch))
+            if due_at > now:
+                next_due = due_at if next_due is None else min(next_due, due_at)
+                continue
+            
+            title, message = coalesce(batch)
+            ids = [(n.id,) for n in batch]
+            if self.send(title, message):
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.executemany("DELETE FROM notification_queue WHERE id = ?", ids)
+                Metrics().increment('notifications_sent')
+                Metrics().increment('notifications_coalesced', len(batch) - 1)
+                continue
+            
+            attempts = max(n.attempts for n in batch) + 1
+            if attempts >= self.max_attempts:
+                self.logger.error(f"Dropping {len(batch)} notifications for {batch[0].user} after {attempts} attempts")
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.executemany("DELETE FROM notification_queue WHERE id = ?", ids)
+                Metrics().increment('notifications_dropped', len(batch))
+                continue
+            
+            retry_at = now + min(self.retry_backoff * 2 ** (attempts - 1), self.max_backoff)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "UPDATE notification_queue SET attempts = ?, next_attempt = ? WHERE id = ?",
+                    [(attempts, retry_at, n.id) for n in batch]
+                )
+            Metrics().increment('notification_retries')
+            next_due = retry_at if next_due is None else min(next_due, retry_at)
+        self.depth()
+        return None if next_due is None else max(next_due - now, 0.0)
+    
+    def hand_over(self, successor: 'NotificationQueue') -> None:
+        """Stop the sender and forward later notifications to another queue.
+        
+        Threads still holding this queue, e.g. through a service dropped on a
+        configuration reload, keep delivering through the successor, which
+        also sends what is left undelivered in a shared database.
+        
+        Args:
+            successor: Queue taking over delivery
+        """
+        self._successor = successor
+        self.close()
+        successor._ensure_sender()
+        successor._wakeup.set()
+    
+    def close(self) -> None:
+        """Stop the sender; undelivered notifications are sent after the next start."""
+        self._stop.set()
+        self._wakeup.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+
+def coalesce(batch: list[QueuedNotification]) -> tuple[str, str]:
+    """Combine a user's notifications into one.
+    
+    Args:
+        batch: Queued notifications of one user, oldest first
+    
+    Returns:
+        Title and message of the combined notification
+    """
+    if len(batch) == 1:
+        title, message = batch[0].title, batch[0].message
+    else:
+        flights = len({n.flight for n in batch})
+        title = f"{len(batch)} changes in {flights} flight{'s' if flights != 1 else ''}"
+        message = "\n\n".join(f"{n.title}\n{n.message}" for n in batch)
+    if len(message) > MAX_MESSAGE_LENGTH:
+        message = message[:MAX_MESSAGE_LENGTH - 3] + "..."
+    return title, message
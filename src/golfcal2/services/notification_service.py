@@ -1,6 +1,5 @@
 """Notification service for golf calendar application."""
 
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -8,6 +7,8 @@ from typing import Any
 
 from golfcal2.config.settings import AppConfig
 from golfcal2.models.reservation import Player, Reservation
+from golfcal2.services.notification_queue import NotificationQueue
+from golfcal2.services.notification_state import NotificationStateStore, roster_hash
 from golfcal2.services.pushover_service import PushoverService
 from golfcal2.utils.logging_utils import LoggerMixin
 
@@ -28,33 +29,22 @@ class NotificationService(LoggerMixin):
         super().__init__()
         self.config = config
         self.data_dir = Path(config.get('data_dir', 'data'))
-        self.state_file = self.data_dir / 'reservation_state.json'
         self.pushover = PushoverService(config)
         self._ensure_data_dir()
+        self.state = NotificationStateStore(
+            self.data_dir / 'notification_state.db',
+            legacy_state_file=self.data_dir / 'reservation_state.json'
+        )
+        self.queue = NotificationQueue.from_config(
+            config,
+            self.data_dir / 'notification_state.db',
+            send=lambda title, message: self.pushover.send_notification(title=title, message=message)
+        )
     
     def _ensure_data_dir(self) -> None:
         """Ensure data directory exists."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
     
-    def _load_state(self) -> dict[str, list[dict[str, Any]]]:
-        """Load previous state from file."""
-        if not self.state_file.exists():
-            return {}
-        try:
-            with open(self.state_file) as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Failed to load state: {e}")
-            return {}
-    
-    def _save_state(self, state: dict[str, list[dict[str, Any]]]) -> None:
-        """Save current state to file."""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
-        except Exception as e:
-            self.logger.error(f"Failed to save state: {e}")
-    
     def _player_to_dict(self, player: Player) -> dict[str, Any]:
         """Convert player to dictionary for storage."""
         return {
@@ -76,24 +66,45 @@ class NotificationService(LoggerMixin):
         return {f"{p.name}|{p.club}" for p in players}
     
     def check_for_changes(self, reservations: list[Reservation]) -> list[PlayerChange]:
-        """Check for changes in players for the given reservations."""
+        """Check for changes in players for the given reservations.
+        
+        Only reservations whose roster hash differs from the stored one are
+        compared player by player and written back. Reservations of other
+        users are left untouched, and past reservations are pruned.
+        
+        Args:
+            reservations: Reservations of one or more users
+        
+        Returns:
+            Player changes of the reservations
+        """
         changes: list[PlayerChange] = []
-        state = self._load_state()
-        new_state: dict[str, list[dict[str, Any]]] = {}
         
-        # Process each reservation
-        for reservation in reservations:
-            # Skip past reservations
-            if reservation.start_time < datetime.now(reservation.start_time.tzinfo):
-                continue
-                
-            # Convert current players to storable format
-            current_players = [self._player_to_dict(p) for p in reservation.players]
-            new_state[reservation.uid] = current_players
+        # Skip past reservations
+        upcoming = [
+            reservation for reservation in reservations
+            if reservation.start_time >= datetime.now(reservation.start_time.tzinfo)
+        ]
+        hashes = {reservation.uid: roster_hash(reservation.players) for reservation in upcoming}
+        try:
+            stored_hashes = self.state.get_hashes(list(hashes))
+            changed = [r for r in upcoming if stored_hashes.get(r.uid) != hashes[r.uid]]
+            stored_players = self.state.get_players([r.uid for r in changed])
+        except Exception as e:
+            self.logger.error(f"Failed to load state: {e}")
+            return changes
+        
+        rows = []
+        for reservation in changed:
+            rows.append((
+                reservation.uid,
+                hashes[reservation.uid],
+                [self._player_to_dict(p) for p in reservation.players],
+                reservation.start_time
+            ))
             
             # Get previous players
-            prev_players_data = state.get(reservation.uid, [])
-            prev_players = [self._dict_to_player(p) for p in prev_players_data]
+            prev_players = [self._dict_to_player(p) for p in stored_players.get(reservation.uid, [])]
             
             # Compare players
             current_set = self._get_player_set(reservation.players)
@@ -116,17 +127,33 @@ class NotificationService(LoggerMixin):
                 )
                 changes.append(change)
                 
-                # Send Pushover notification for the change
+                # Queue a Pushover notification; the sender coalesces a user's changes
                 if self.pushover.is_enabled():
                     title = f"Player Changes - {reservation.club.name}"
                     message = self.format_change_message(change)
-                    self.pushover.send_notification(title=title, message=message)
+                    user = reservation.user.name if reservation.user else ''
+                    self.queue.enqueue(user, title, message, flight=reservation.uid)
         
-        # Save new state
-        self._save_state(new_state)
+        # Save changed rosters
+        try:
+            self.state.save(rows)
+        except Exception as e:
+            self.logger.error(f"Failed to save state: {e}")
         
         return changes
     
+    def close(self) -> None:
+        """Stop the notification sender; queued notifications are kept."""
+        self.queue.close()
+    
+    def hand_over(self, successor: 'NotificationService') -> None:
+        """Stop the notification sender and queue later notifications with another service.
+        
+        Args:
+            successor: Service taking over delivery
+        """
+        self.queue.hand_over(successor.queue)
+    
     def format_change_message(self, change: PlayerChange) -> str:
         """Format a change notification message."""
         lines = [
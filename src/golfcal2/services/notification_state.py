@@ -0,0 +1,170 @@
+"""Persistent roster state of notified reservations."""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from golfcal2.utils.logging_utils import LoggerMixin
+
+# SQLite limits the number of parameters of a statement
+_BATCH_SIZE = 500
+
+# Imported rows without a start time are kept this long for their reservation to be checked
+LEGACY_ROW_RETENTION = timedelta(days=7)
+
+
+def roster_hash(players: Iterable[Any]) -> str:
+    """Get a hash of a reservation's roster.
+    
+    Only the identity of the players counts, so a changed handicap is not
+    a roster change.
+    
+    Args:
+        players: Players with ``name`` and ``club``, or their stored dictionaries
+    
+    Returns:
+        Hex digest of the sorted player identities
+    """
+    identities = sorted(
+        f"{p['name']}|{p['club']}" if isinstance(p, dict) else f"{p.name}|{p.club}"
+        for p in players
+    )
+    return hashlib.sha1('\n'.join(identities).encode('utf-8')).hexdigest()
+
+
+class NotificationStateStore(LoggerMixin):
+    """Rosters of upcoming reservations keyed by reservation UID.
+    
+    Each row holds a hash of the roster next to the roster itself, so a
+    check cycle reads only hashes and loads the rosters that changed.
+    """
+    
+    def __init__(self, db_path: str | Path, legacy_state_file: str | Path | None = None):
+        """Initialize store.
+        
+        Args:
+            db_path: Path to SQLite database file
+            legacy_state_file: JSON state file of earlier versions, imported once
+        """
+        super().__init__()
+        self.db_path = str(db_path)
+        self._init_db()
+        if legacy_state_file is not None:
+            self._import_legacy_state(Path(legacy_state_file))
+    
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS reservation_state (
+                    uid TEXT PRIMARY KEY,
+                    roster_hash TEXT NOT NULL,
+                    players TEXT NOT NULL,
+                    start_time TEXT,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_reservation_state_start ON reservation_state (start_time)"
+            )
+    
+    def _import_legacy_state(self, state_file: Path) -> None:
+        """Import rosters from the JSON state file and set the file aside.
+        
+        Imported rows have no start time; they are rewritten with one the
+        next time their reservation is checked, and pruned after
+        ``LEGACY_ROW_RETENTION`` if it never is.
+        """
+        if not state_file.exists():
+            return
+        try:
+            with open(state_file) as f:
+                state: dict[str, list[dict[str, Any]]] = json.load(f)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO reservation_state (uid, roster_hash, players) VALUES (?, ?, ?)",
+                    [(uid, roster_hash(players), json.dumps(players)) for uid, players in state.items()]
+                )
+            state_file.rename(state_file.with_suffix('.json.migrated'))
+            self.logger.info(f"Imported {len(state)} reservations from {state_file}")
+        except Exception as e:
+            self.logger.error(f"Failed to import state from {state_file}: {e}")
+    
+    def get_hashes(self, uids: Sequence[str]) -> dict[str, str]:
+        """Get the stored roster hashes of reservations.
+        
+        Args:
+            uids: Reservation UIDs
+        
+        Returns:
+            Roster hash by UID, for reservations stored with a start time
+        """
+        hashes: dict[str, str] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            for i in range(0, len(uids), _BATCH_SIZE):
+                batch = uids[i:i + _BATCH_SIZE]
+                cursor = conn.execute(
+                    f"""
+                    SELECT uid, roster_hash FROM reservation_state
+                    WHERE start_time IS NOT NULL AND uid IN ({','.join('?' * len(batch))})
+                    """,
+                    batch
+                )
+                hashes.update(cursor.fetchall())
+        return hashes
+    
+    def get_players(self, uids: Sequence[str]) -> dict[str, list[dict[str, Any]]]:
+        """Get the stored rosters of reservations.
+        
+        Args:
+            uids: Reservation UIDs
+        
+        Returns:
+            Stored players by UID, for reservations in the store
+        """
+        players: dict[str, list[dict[str, Any]]] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            for i in range(0, len(uids), _BATCH_SIZE):
+                batch = uids[i:i + _BATCH_SIZE]
+                cursor = conn.execute(
+                    f"SELECT uid, players FROM reservation_state WHERE uid IN ({','.join('?' * len(batch))})",
+                    batch
+                )
+                players.update((uid, json.loads(data)) for uid, data in cursor.fetchall())
+        return players
+    
+    def save(self, rows: Iterable[tuple[str, str, list[dict[str, Any]], datetime]], now: datetime | None = None) -> None:
+        """Store changed rosters and prune past reservations in one transaction.
+        
+        Imported rows without a start time are pruned once they are older
+        than ``LEGACY_ROW_RETENTION``.
+        
+        Args:
+            rows: (UID, roster hash, players, start time) of changed reservations
+            now: Reservations starting before this are removed; defaults to now
+        """
+        now = now or datetime.now(UTC)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO reservation_state (uid, roster_hash, players, start_time, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                [
+                    (uid, hash_, json.dumps(players), start_time.astimezone(UTC).isoformat())
+                    for uid, hash_, players, start_time in rows
+                ]
+            )
+            conn.execute(
+                "DELETE FROM reservation_state WHERE start_time < ?",
+                (now.astimezone(UTC).isoformat(),)
+            )
+            # updated_at has the format of SQLite's CURRENT_TIMESTAMP
+            conn.execute(
+                "DELETE FROM reservation_state WHERE start_time IS NULL AND updated_at < ?",
+                ((now - LEGACY_ROW_RETENTION).astimezone(UTC).strftime('%Y-%m-%d %H:%M:%S'),)
+            )
@@ -16,6 +16,7 @@ class OpenMeteoStrategy(WeatherStrategy):
     """Weather strategy for OpenMeteo service."""
     
     service_type: str = "openmeteo"
+    api_url: str = "https://api.open-meteo.com/v1/forecast"
     HOURLY_RANGE: int = 168  # 7 days
     MAX_FORECAST_RANGE: int = 168  # 7 days
     BLOCK_SIZE: int = 1  # Always use 1-hour blocks
@@ -92,7 +93,7 @@ class OpenMeteoStrategy(WeatherStrategy):
         """Fetch forecast data from OpenMeteo API."""
         try:
             # Build API URL
-            base_url = "https://api.open-meteo.com/v1/forecast"
+            base_url = self.get_api_url()
             params = {
                 'latitude': f"{self.context.lat:.4f}",
                 'longitude': f"{self.context.lon:.4f}",
@@ -117,7 +118,7 @@ class OpenMeteoStrategy(WeatherStrategy):
             )
             
             # Make request
-            response = requests.get(base_url, params=params)
+            response = self._http_get(base_url, params=params)
             
             # Log response details
             self.debug(
@@ -91,7 +91,7 @@ class PushoverService(LoggerMixin):
             data = {k: v for k, v in data.items() if v is not None}
             
             # Send notification
-            conn = http.client.HTTPSConnection("api.pushover.net:443")
+            conn = http.client.HTTPSConnection("api.pushover.net:443", timeout=10)
             conn.request(
                 "POST",
                 "/1/messages.json",
@@ -10,6 +10,7 @@ from zoneinfo import ZoneInfo
 from golfcal2.models.golf_club import GolfClub
 from golfcal2.models.reservation import Player, Reservation
 from golfcal2.models.user import Membership, User
+from golfcal2.tracing import span
 from golfcal2.utils.logging_utils import LoggerMixin
 from golfcal2.utils.timezone_utils import TimezoneManager
 
@@ -140,7 +141,8 @@ class WiseGolfStrategy(ReservationStrategy):
         
         if is_future_event and hasattr(context.club, 'fetch_players'):
             try:
-                player_data_list = context.club.fetch_players(data, context.membership)
+                with span('players', club=context.club.name):
+                    player_data_list = context.club.fetch_players(data, context.membership)
                 
                 if isinstance(player_data_list, dict):
                     if 'reservationsGolfPlayers' in player_data_list and 'rows' in player_data_list:
@@ -255,7 +257,8 @@ class WiseGolf0Strategy(WiseGolfStrategy):
         
         if is_future_event and hasattr(context.club, 'fetch_players'):
             try:
-                player_data_list = context.club.fetch_players(data, context.membership)
+                with span('players', club=context.club.name):
+                    player_data_list = context.club.fetch_players(data, context.membership)
                 
                 if isinstance(player_data_list, dict):
                     if 'reservationsGolfPlayers' in player_data_list and 'rows' in player_data_list:
@@ -3,7 +3,6 @@ Reservation service for golf calendar application.
 """
 
 import os
-import traceback
 from datetime import datetime, timedelta
 from typing import Any, NoReturn, Protocol, runtime_checkable
 from zoneinfo import ZoneInfo
@@ -16,6 +15,7 @@ from icalendar import (
     vDatetime,  # type: ignore
 )
 
+from golfcal2 import http_cassette
 from golfcal2.config.error_aggregator import aggregate_error
 from golfcal2.config.settings import AppConfig
 from golfcal2.exceptions import (
@@ -31,15 +31,21 @@ from golfcal2.models.mixins import ReservationHandlerMixin
 from golfcal2.models.reservation import Reservation
 from golfcal2.models.user import Membership, User
 from golfcal2.services.auth_service import AuthService
+from golfcal2.services.conflict_service import find_overlaps, reservation_items
 from golfcal2.services.met_weather_strategy import MetWeatherStrategy
 from golfcal2.services.mixins import CalendarHandlerMixin
 from golfcal2.services.notification_service import NotificationService
 from golfcal2.services.open_meteo_strategy import OpenMeteoStrategy
 from golfcal2.services.reservation_factory import ReservationContext, ReservationFactory
+from golfcal2.services.reservation_snapshots import reservation_snapshots
+from golfcal2.services.session_store import SessionStore
 from golfcal2.services.weather_formatter import WeatherFormatter
 from golfcal2.services.weather_service import WeatherService
 from golfcal2.services.wise_golf_discovery_service import WiseGolfDiscoveryService
+from golfcal2.tracing import span
+from golfcal2.utils.circuit_breaker import circuit_breakers
 from golfcal2.utils.logging_utils import EnhancedLoggerMixin
+from golfcal2.utils.retry_policy import retry_policy
 from golfcal2.utils.timezone_utils import TimezoneManager
 
 # Lazy load weather service
@@ -60,15 +66,32 @@ def raise_error(msg: str = "") -> NoReturn:
 class ReservationService(EnhancedLoggerMixin, ReservationHandlerMixin, CalendarHandlerMixin):
     """Service for managing golf reservations."""
     
-    def __init__(self, username: str, config: AppConfig):
-        """Initialize service."""
+    def __init__(
+        self,
+        username: str,
+        config: AppConfig,
+        auth_service: AuthService | None = None,
+        notification_service: NotificationService | None = None,
+        wise_golf_discovery: WiseGolfDiscoveryService | None = None,
+        weather_service: WeatherService | None = None
+    ):
+        """Initialize service.
+        
+        Args:
+            username: User name
+            config: Application configuration
+            auth_service: Shared authentication service, created if not given
+            notification_service: Shared notification service, created if not given
+            wise_golf_discovery: Shared WiseGolf discovery service, created if not given
+            weather_service: Shared weather service, created if not given
+        """
         super().__init__()
         self.username = username
         self.config = config
         self.club_factory = GolfClubFactory()
-        self.auth_service = AuthService(config)
-        self.notification_service = NotificationService(config)
-        self.wise_golf_discovery = WiseGolfDiscoveryService(config)
+        self.auth_service = auth_service or AuthService(config)
+        self.notification_service = notification_service or NotificationService(config)
+        self.wise_golf_discovery = wise_golf_discovery or WiseGolfDiscoveryService(config)
         
         # Get user configuration
         if username not in config.users:
@@ -95,10 +118,14 @@ class ReservationService(EnhancedLoggerMixin, ReservationHandlerMixin, CalendarH
         )
         
         # Initialize services
-        self.weather_service = WeatherService(
+        self.weather_service = weather_service or WeatherService(
             config=config
         )
         
+        # Last reservations fetched from each membership's club, kept while
+        # the club fails or its circuit is open
+        self._previous_reservations: dict[str, list[Reservation]] = {}
+        
         # Set logging context
         self.set_log_context(user=username)
     
@@ -194,19 +221,19 @@ class ReservationService(EnhancedLoggerMixin, ReservationHandlerMixin, CalendarH
                             
                         except Exception as e:
                             self.error(f"Failed to process reservation: {e}", exc_info=True)
-                            aggregate_error(str(e), "reservation_service", ''.join(traceback.format_tb(e.__traceback__)) if e.__traceback__ else None)
+                            aggregate_error(str(e), "reservation_service", e)
                             continue
                     
                 except Exception as e:
                     self.error(f"Failed to process club {membership.club}: {e}", exc_info=True)
-                    aggregate_error(str(e), "reservation_service", ''.join(traceback.format_tb(e.__traceback__)) if e.__traceback__ else None)
+                    aggregate_error(str(e), "reservation_service", e)
                     continue
             
             return sorted(reservations, key=lambda r: r.start_time)
             
         except Exception as e:
             self.error(f"Failed to process user {user_name}: {e}", exc_info=True)
-            aggregate_error(str(e), "reservation_service", ''.join(traceback.format_tb(e.__traceback__)) if e.__traceback__ else None)
+            aggregate_error(str(e), "reservation_service", e)
             return []
     
     def clear_weather_cache(self) -> None:
@@ -269,7 +296,7 @@ class ReservationService(EnhancedLoggerMixin, ReservationHandlerMixin, CalendarH
             lambda: raise_error(f"Failed to {method} {url}")
         ):
             try:
-                response = requests.request(method, url, headers=headers, json=data, timeout=30)
+                response = retry_policy.request(http_cassette, method, url, headers=headers, json=data, timeout=30)
                 response.raise_for_status()
                 return response.json()
             except requests.exceptions.Timeout:
@@ -362,46 +389,52 @@ class ReservationService(EnhancedLoggerMixin, ReservationHandlerMixin, CalendarH
         
         # Process each membership
         for membership in self.user.memberships:
-            try:
-                # Get club instance
-                if membership.club not in self.config.clubs:
-                    self.error(f"Club {membership.club} not found in configuration")
-                    continue
-                
-                club_config = self.config.clubs[membership.club]
-                club = self.club_factory.create_club(
-                    club_config,
-                    membership,
-                    self.auth_service,
-                    self.config
-                )
-                if not club:
-                    self.error(f"Failed to create club for {membership.club}")
-                    continue
-                
-                # If this is a WiseGolf club and we want all WiseGolf reservations,
-                # fetch from all clubs using that membership
-                if (
-                    not exclude_other_wisegolf and
-                    club_config.get('type') == 'wisegolf' and
-                    not club_config.get('disableGuestSignOn', False)
-                ):
-                    self.info(f"Fetching reservations from all WiseGolf clubs using {membership.club} membership")
-                    wisegolf_reservations = self.fetch_all_wisegolf_reservations(membership)
-                    all_reservations.extend(wisegolf_reservations)
-                    continue
-                
-                # Otherwise just fetch from this club
+            with span('membership', club=membership.club):
                 try:
-                    club_reservations = self._get_club_reservations(club, membership, days)
+                    # Get club instance
+                    if membership.club not in self.config.clubs:
+                        self.error(f"Club {membership.club} not found in configuration")
+                        continue
+                    
+                    club_config = self.config.clubs[membership.club]
+                    club = self.club_factory.create_club(
+                        club_config,
+                        membership,
+                        self.auth_service,
+                        self.config
+                    )
+                    if not club:
+                        self.error(f"Failed to create club for {membership.club}")
+                        continue
+                    
+                    # If this is a WiseGolf club and we want all WiseGolf reservations,
+                    # fetch from all clubs using that membership
+                    if (
+                        not exclude_other_wisegolf and
+                        club_config.get('type') == 'wisegolf' and
+                        not club_config.get('disableGuestSignOn', False)
+                    ):
+                        self.info(f"Fetching reservations from all WiseGolf clubs using {membership.club} membership")
+                        with span('club_request', club=membership.club, scope='all_wisegolf'):
+                            wisegolf_reservations = self.fetch_all_wisegolf_reservations(membership)
+                        all_reservations.extend(wisegolf_reservations)
+                        continue
+                    
+                    # Otherwise just fetch from this club, unless its host is known to be down
+                    club_reservations: list[Reservation] | None = None
+                    if circuit_breakers.is_open(club.url):
+                        self.info(f"Circuit open for {membership.club}, keeping its previous reservations")
+                    else:
+                        club_reservations = self._get_club_reservations(club, membership, days)
+                    if club_reservations is None:
+                        club_reservations = self._get_previous_reservations(club, membership, days)
+                    else:
+                        self._previous_reservations[membership.club] = club_reservations
                     all_reservations.extend(club_reservations)
+                    
                 except Exception as e:
-                    self.error(f"Failed to get reservations for club {membership.club}: {e}")
+                    self.error(f"Failed to process membership {membership.club}: {e}")
                     continue
-                
-            except Exception as e:
-                self.error(f"Failed to process membership {membership.club}: {e}")
-                continue
         
         # Sort all reservations by start time
         return sorted(
@@ -414,76 +447,129 @@ class ReservationService(EnhancedLoggerMixin, ReservationHandlerMixin, CalendarH
         club: GolfClub,
         membership: Membership,
         days: int
-    ) -> list[Reservation]:
-        """Get reservations for a club."""
-        try:
-            # Get current time in club's timezone
-            tz_manager = TimezoneManager(club.timezone)
-            now = tz_manager.now()
-            
-            # Calculate cutoff date for past reservations
-            past_cutoff = now - timedelta(days=days)
+    ) -> list[Reservation] | None:
+        """Get reservations for a club.
+        
+        The raw reservations of a successful fetch are saved as the club's
+        snapshot.
+        
+        Args:
+            club: Club to fetch from
+            membership: User's membership at the club
+            days: Number of past days to include
             
-            self.logger.debug(f"Getting reservations for club {club.name} from {past_cutoff}")
+        Returns:
+            Reservations, or None if the fetch failed
+        """
+        try:
+            self.logger.debug(f"Getting reservations for club {club.name}")
             
             # Fetch raw reservations from club
-            raw_reservations = club.fetch_reservations(membership)
+            with span('club_request', club=club.name) as request_span:
+                raw_reservations = club.fetch_reservations(membership)
+                request_span.set_attribute('reservations', len(raw_reservations))
             self.logger.debug(f"Got {len(raw_reservations)} raw reservations")
-            
-            # Convert raw reservations to Reservation objects
-            reservations = []
-            for raw_reservation in raw_reservations:
-                try:
-                    # Parse start time using club's method
-                    start_time = club.parse_start_time(raw_reservation)
-                    
-                    # Skip past reservations
-                    if start_time < past_cutoff:
-                        self.logger.debug(f"Skipping past reservation: {start_time}")
-                        continue
-                    
-                    # Create reservation object based on club type
-                    club_type = club.club_details.get('type', '')
-                    if club_type == 'wisegolf0':
-                        reservation = Reservation.from_wisegolf0(
-                            raw_reservation,
-                            club,
-                            self.user,
-                            membership,
-                            tz_manager
-                        )
-                    elif club_type == 'wisegolf':
-                        reservation = Reservation.from_wisegolf(
-                            raw_reservation,
-                            club,
-                            self.user,
-                            membership,
-                            tz_manager
-                        )
-                    elif club_type == 'nexgolf':
-                        reservation = Reservation.from_nexgolf(
-                            raw_reservation,
-                            club,
-                            self.user,
-                            membership,
-                            tz_manager
-                        )
-                    else:
-                        self.logger.warning(f"Unsupported club type: {club_type}")
-                        continue
-                    
-                    reservations.append(reservation)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to process reservation: {e}", exc_info=True)
-                    continue
-            
-            self.logger.debug(f"Processed {len(reservations)} reservations for club {club.name}")
-            return reservations
-            
         except Exception as e:
             self.logger.error(f"Failed to get reservations for club {club.name}: {e}", exc_info=True)
+            return None
+        
+        if not raw_reservations and circuit_breakers.is_open(club.url):
+            # The client swallowed the failure that opened the circuit
+            return None
+        
+        reservation_snapshots.save(SessionStore.account_key(club.url, membership.auth_details), raw_reservations)
+        return self._convert_club_reservations(club, membership, days, raw_reservations)
+    
+    def _get_previous_reservations(
+        self,
+        club: GolfClub,
+        membership: Membership,
+        days: int
+    ) -> list[Reservation]:
+        """Get the reservations last fetched from a club that cannot be reached.
+        
+        Args:
+            club: Club that failed or whose circuit is open
+            membership: User's membership at the club
+            days: Number of past days to include
+            
+        Returns:
+            Reservations of this process's last fetch, else those of the
+            saved snapshot, else an empty list
+        """
+        previous = self._previous_reservations.get(membership.club)
+        if previous is not None:
+            return previous
+        snapshot = reservation_snapshots.get(SessionStore.account_key(club.url, membership.auth_details))
+        if snapshot is None:
             return []
+        self.info(f"Using the saved reservations of {membership.club}")
+        return self._convert_club_reservations(club, membership, days, snapshot)
+    
+    def _convert_club_reservations(
+        self,
+        club: GolfClub,
+        membership: Membership,
+        days: int,
+        raw_reservations: list[dict[str, Any]]
+    ) -> list[Reservation]:
+        """Convert raw reservations of a club to Reservation objects."""
+        # Get current time in club's timezone
+        tz_manager = TimezoneManager(club.timezone)
+        now = tz_manager.now()
+        
+        # Calculate cutoff date for past reservations
+        past_cutoff = now - timedelta(days=days)
+        
+        reservations = []
+        for raw_reservation in raw_reservations:
+            try:
+                # Parse start time using club's method
+                start_time = club.parse_start_time(raw_reservation)
+                
+                # Skip past reservations
+                if start_time < past_cutoff:
+                    self.logger.debug(f"Skipping past reservation: {start_time}")
+                    continue
+                
+                # Create reservation object based on club type
+                club_type = club.club_details.get('type', '')
+                if club_type == 'wisegolf0':
+                    reservation = Reservation.from_wisegolf0(
+                        raw_reservation,
+                        club,
+                        self.user,
+                        membership,
+                        tz_manager
+                    )
+                elif club_type == 'wisegolf':
+                    reservation = Reservation.from_wisegolf(
+                        raw_reservation,
+                        club,
+                        self.user,
+                        membership,
+                        tz_manager
+                    )
+                elif club_type == 'nexgolf':
+                    reservation = Reservation.from_nexgolf(
+                        raw_reservation,
+                        club,
+                        self.user,
+                        membership,
+                        tz_manager
+                    )
+                else:
+                    self.logger.warning(f"Unsupported club type: {club_type}")
+                    continue
+                
+                reservations.append(reservation)
+                
+            except Exception as e:
+                self.logger.error(f"Failed to process reservation: {e}", exc_info=True)
+                continue
+        
+        self.logger.debug(f"Processed {len(reservations)} reservations for club {club.name}")
+        return reservations
 
     def check_overlaps(self) -> list[tuple[Reservation, Reservation]]:
         """
@@ -498,32 +584,8 @@ class ReservationService(EnhancedLoggerMixin, ReservationHandlerMixin, CalendarH
             "check overlaps",
             lambda: raise_error("Failed to check overlaps")
         ):
-            overlaps: list[tuple[Reservation, Reservation]] = []
-            all_reservations = self.list_reservations()
-            
-            # Group reservations by user
-            user_reservations: dict[str, list[Reservation]] = {}
-            for reservation in all_reservations:
-                user_name = reservation.user.name
-                if user_name not in user_reservations:
-                    user_reservations[user_name] = []
-                user_reservations[user_name].append(reservation)
-            
-            # Check for overlaps within each user's reservations
-            for _user_name, reservations in user_reservations.items():
-                for i, res1 in enumerate(reservations):
-                    for res2 in reservations[i+1:]:
-                        if self._reservations_overlap(res1, res2):
-                            overlaps.append((res1, res2))
-            
-            return overlaps
-
-    def _reservations_overlap(self, res1: Reservation, res2: Reservation) -> bool:
-        """Check if two reservations overlap."""
-        return (
-            res1.start_time < res2.end_time and
-            res2.start_time < res1.end_time
-        )
+            items = reservation_items(self.list_reservations())
+            return [(first.ref, second.ref) for first, second in find_overlaps(items)]
 
     def _get_club_address(self, club_id: str) -> str:
         """
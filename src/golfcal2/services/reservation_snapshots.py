@@ -0,0 +1,101 @@
+"""Last reservations fetched from each club account, kept across restarts."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from golfcal2.utils.logging_utils import LoggerMixin
+
+STATE_FILE = 'reservation_snapshots.json'
+
+
+class ReservationSnapshots(LoggerMixin):
+    """Raw reservations of the last successful fetch from each club account.
+    
+    A club that fails or whose circuit is open is served from its snapshot,
+    so its bookings stay in the calendar. The snapshots are saved next to the
+    circuit breaker state and, like open circuits, outlive a restart.
+    """
+    
+    def __init__(self, path: str | Path | None = None):
+        """Initialize snapshots.
+        
+        Args:
+            path: Snapshot file, or None to keep the snapshots in memory only
+        """
+        super().__init__()
+        self.path = Path(path) if path else None
+        self._snapshots: dict[str, list[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    def configure(self, data_dir: str | Path | None = None) -> None:
+        """Load the saved snapshots.
+        
+        Args:
+            data_dir: Directory of the snapshot file, or None to keep the
+                snapshots in memory only
+        """
+        with self._lock:
+            self.path = Path(data_dir) / STATE_FILE if data_dir else None
+            self._snapshots = self._read()
+    
+    def _read(self) -> dict[str, list[dict[str, Any]]]:
+        """Read the snapshot file; the caller holds the lock."""
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                snapshots = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable reservation snapshots {self.path}: {e}")
+            return {}
+        return {key: rows for key, rows in snapshots.items() if isinstance(rows, list)}
+    
+    def _flush(self) -> None:
+        """Write the snapshot file; the caller holds the lock."""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._snapshots, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write reservation snapshots {self.path}: {e}")
+    
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Get the last reservations fetched for an account.
+        
+        Args:
+            key: Account key, see ``SessionStore.account_key``
+        
+        Returns:
+            Copy of the raw reservations, or None if none were ever fetched
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            return None if snapshot is None else json.loads(json.dumps(snapshot))
+    
+    def save(self, key: str, reservations: list[dict[str, Any]]) -> None:
+        """Store the reservations of a successful fetch.
+        
+        The file is only written when the reservations changed.
+        
+        Args:
+            key: Account key, see ``SessionStore.account_key``
+            reservations: Raw reservations returned by the club
+        """
+        snapshot = json.loads(json.dumps(reservations, default=str))
+        with self._lock:
+            if self._snapshots.get(key) == snapshot:
+                return
+            self._snapshots[key] = snapshot
+            self._flush()
+
+
+# Shared by the reservation services; the service loads the saved snapshots at startup
+reservation_snapshots = ReservationSnapshots()
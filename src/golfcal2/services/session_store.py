@@ -0,0 +1,251 @@
+"""
+Persistent store of authenticated CRM sessions.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+
+from golfcal2.metrics import Metrics
+from golfcal2.utils.logging_utils import LoggerMixin
+
+# Headers carrying credentials; other session headers are rebuilt by the clients
+AUTH_HEADERS = ('Authorization', 'X-Auth-Token', 'Cookie')
+
+# Responses after which a restored session is discarded and authentication redone
+AUTH_FAILURE_STATUSES = (401, 403)
+
+DEFAULT_SESSION_TTL = 12 * 3600
+
+
+class SessionStore(LoggerMixin):
+    """Cookies and auth headers per club and account, kept across runs.
+    
+    Sessions are stored in a JSON file readable only by the owner. An entry
+    is used until it expires or the CRM rejects it; a changed password or
+    token in the configuration gives a new account key, so stale sessions are
+    never used with new credentials.
+    """
+    
+    def __init__(self, path: str | Path | None = None, ttl: float = DEFAULT_SESSION_TTL):
+        """Initialize store.
+        
+        Args:
+            path: Sessions file, or None to keep sessions in memory only
+            ttl: Maximum age of a session in seconds
+        """
+        super().__init__()
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self._sessions: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config: Any) -> 'SessionStore':
+        """Create the store configured in the ``auth`` section.
+        
+        Args:
+            config: Application configuration
+        
+        Returns:
+            Session store, in memory only if persistence is disabled
+        """
+        global_config = getattr(config, 'global_config', None) or {}
+        auth_config = global_config.get('auth', {}) if isinstance(global_config, dict) else {}
+        ttl = float(auth_config.get('session_ttl_hours', DEFAULT_SESSION_TTL / 3600)) * 3600
+        if not auth_config.get('persist_sessions', True):
+            return cls(None, ttl)
+        data_dir = global_config.get('data_dir', 'data') if isinstance(global_config, dict) else 'data'
+        return cls(Path(data_dir) / 'sessions.json', ttl)
+    
+    @staticmethod
+    def account_key(url: str, auth_details: dict[str, Any]) -> str:
+        """Get the key of an account at a CRM host.
+        
+        Args:
+            url: CRM base URL
+            auth_details: Membership credentials
+        
+        Returns:
+            Host and a hash of the credentials
+        """
+        credentials = json.dumps(auth_details, sort_keys=True, default=str)
+        digest = hashlib.sha256(credentials.encode('utf-8')).hexdigest()[:16]
+        return f"{urlparse(url).netloc or url}:{digest}"
+    
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Get the sessions, reading the file on first use; the caller holds the lock."""
+        if self._sessions is None:
+            self._sessions = {}
+            if self.path and self.path.exists():
+                try:
+                    with open(self.path, encoding='utf-8') as f:
+                        self._sessions = json.load(f)
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"Ignoring unreadable session store {self.path}: {e}")
+        return self._sessions
+    
+    def _flush(self) -> None:
+        """Write the sessions to disk; the caller holds the lock."""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._sessions, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write session store {self.path}: {e}")
+    
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get an unexpired session.
+        
+        Args:
+            key: Account key
+        
+        Returns:
+            Session with 'headers' and 'cookies', or None
+        """
+        with self._lock:
+            sessions = self._load()
+            entry = sessions.get(key)
+            if entry is None:
+                return None
+            if entry.get('expires_at', 0) <= time.time():
+                del sessions[key]
+                self._flush()
+                return None
+            return entry
+    
+    def restore(self, key: str, session: requests.Session) -> bool:
+        """Apply a stored session's auth headers and cookies to a requests session.
+        
+        Args:
+            key: Account key
+            session: Session to update
+        
+        Returns:
+            True if a stored session was applied
+        """
+        entry = self.get(key)
+        if entry is None:
+            Metrics().increment('crm_session_restores', labels={'result': 'miss'})
+            return False
+        session.headers.update(entry.get('headers', {}))
+        for cookie in entry.get('cookies', []):
+            session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/'),
+                expires=cookie.get('expires'),
+                secure=cookie.get('secure', False)
+            )
+        Metrics().increment('crm_session_restores', labels={'result': 'hit'})
+        return True
+    
+    def save(self, key: str, session: requests.Session) -> None:
+        """Store a session's auth headers and cookies.
+        
+        The file is only written when the session changed, so calling this
+        after every successful request is cheap.
+        
+        Args:
+            key: Account key
+            session: Authenticated session
+        """
+        headers = {name: str(session.headers[name]) for name in AUTH_HEADERS if name in session.headers}
+        cookies = [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'expires': cookie.expires,
+                'secure': cookie.secure
+            }
+            for cookie in session.cookies
+        ]
+        if not headers and not cookies:
+            return
+        
+        with self._lock:
+            sessions = self._load()
+            current = sessions.get(key)
+            if current and current.get('headers') == headers and current.get('cookies') == cookies:
+                return
+            expires_at = time.time() + self.ttl
+            # A session cookie expiring earlier ends the session
+            cookie_expiry = [cookie['expires'] for cookie in cookies if cookie['expires']]
+            if cookie_expiry:
+                expires_at = min(expires_at, *cookie_expiry)
+            sessions[key] = {'headers': headers, 'cookies': cookies, 'expires_at': expires_at}
+            self._flush()
+    
+    def invalidate(self, key: str) -> None:
+        """Forget a session after the CRM rejected it.
+        
+        Args:
+            key: Account key
+        """
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._flush()
+
+
+class PersistentSessionMixin(ABC):
+    """Reuse a CRM client's authenticated session across runs.
+    
+    Clients call ``_restore_session()`` after building their session, set up
+    authentication themselves only if nothing was restored, and implement
+    ``_setup_auth()`` to redo it when a restored session is rejected.
+    """
+    
+    session_store: SessionStore | None = None
+    session_key: str = ''
+    _session_restored: bool = False
+    
+    def _restore_session(self) -> bool:
+        """Apply the stored session of this client's account, if any."""
+        store = getattr(getattr(self, 'auth_service', None), 'session_store', None)
+        if not isinstance(store, SessionStore):
+            return False
+        self.session_store = store
+        self.session_key = SessionStore.account_key(self.base_url, self.auth_details)
+        self._session_restored = store.restore(self.session_key, self.session)
+        return self._session_restored
+    
+    def _save_session(self) -> None:
+        """Store the session after a successful request."""
+        if self.session_store is not None:
+            self.session_store.save(self.session_key, self.session)
+    
+    def _should_reauthenticate(self, response: requests.Response) -> bool:
+        """Check whether a response rejected a restored session."""
+        return self._session_restored and response.status_code in AUTH_FAILURE_STATUSES
+    
+    def _reauthenticate(self) -> None:
+        """Drop the stored session and authenticate from the configured credentials."""
+        if self.session_store is not None:
+            self.session_store.invalidate(self.session_key)
+        self._session_restored = False
+        self.session.cookies.clear()
+        for name in AUTH_HEADERS:
+            self.session.headers.pop(name, None)
+        self._setup_auth()
+        Metrics().increment('crm_reauthentications', labels={'host': urlparse(self.base_url).hostname or ''})
+    
+    @abstractmethod
+    def _setup_auth(self) -> None:
+        """Set up authentication from the configured credentials."""
@@ -7,6 +7,8 @@ import sqlite3
 from datetime import UTC, datetime
 from typing import Any
 
+from golfcal2.metrics import Metrics
+
 
 class WeatherResponseCache:
     """Cache for weather service responses."""
@@ -63,6 +65,7 @@ class WeatherResponseCache:
         Returns:
             Cached response data or None if not found/expired
         """
+        result = 'error'
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.execute(
@@ -84,6 +87,7 @@ class WeatherResponseCache:
                 )
                 row = cursor.fetchone()
                 if not row:
+                    result = 'miss'
                     return None
                     
                 response_str, expires_str = row
@@ -95,6 +99,7 @@ class WeatherResponseCache:
                 # Check if expired
                 if expires < now:
                     self.logger.debug("Cached response expired")
+                    result = 'expired'
                     return None
                     
                 # Parse the response string directly into a dictionary
@@ -102,12 +107,15 @@ class WeatherResponseCache:
                 if not isinstance(response_data, dict):
                     self.logger.error("Invalid response data format")
                     return None
-                    
+                
+                result = 'hit'
                 return response_data
                 
         except Exception as e:
             self.logger.error("Failed to get cached response: %s", str(e))
             return None
+        finally:
+            Metrics().increment('weather_cache', labels={'provider': service_type, 'result': result})
     
     def store_response(
         self,
@@ -157,11 +165,33 @@ class WeatherResponseCache:
             with sqlite3.connect(self.db_path) as conn:
                 conn.execute(
                     "DELETE FROM weather_responses WHERE expires < ?",
-                    (datetime.now().isoformat(),)
+                    (datetime.now(UTC).isoformat(),)
                 )
         except Exception as e:
             self.logger.error("Failed to clear expired entries: %s", str(e))
     
+    def next_expiry(self) -> datetime | None:
+        """Get the earliest expiry time of the cached responses.
+        
+        Returns:
+            Earliest expiry time (naive timestamps are taken as UTC), or None if the cache is empty
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute("SELECT expires FROM weather_responses").fetchall()
+        except sqlite3.Error as e:
+            self.logger.error("Failed to read expiry times: %s", str(e))
+            return None
+        
+        expiries = []
+        for (expires_str,) in rows:
+            try:
+                expires = datetime.fromisoformat(expires_str)
+            except (TypeError, ValueError):
+                continue
+            expiries.append(expires if expires.tzinfo else expires.replace(tzinfo=UTC))
+        return min(expiries, default=None)
+    
     def clear_all(self) -> None:
         """Clear all entries from cache."""
         try:
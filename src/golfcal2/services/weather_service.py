@@ -3,16 +3,23 @@ Unified weather service with improved caching and error handling.
 """
 
 import os
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Protocol, cast, runtime_checkable
 from zoneinfo import ZoneInfo
 
+import requests
+
+from golfcal2 import http_cassette
 from golfcal2.config.error_aggregator import aggregate_error
+from golfcal2.metrics import Metrics
 from golfcal2.services.weather_cache import WeatherLocationCache
 from golfcal2.services.weather_database import WeatherResponseCache
 from golfcal2.services.weather_types import WeatherResponse
+from golfcal2.tracing import span
 from golfcal2.utils.logging_utils import LoggerMixin
+from golfcal2.utils.retry_policy import TimeoutValue, retry_policy
 
 
 class WeatherContext:
@@ -50,6 +57,7 @@ class WeatherStrategy(ABC, LoggerMixin):
     """Base strategy for weather services."""
     
     service_type: str = "base"  # Should be overridden by subclasses
+    api_url: str = ""  # Forecast endpoint, overridden by subclasses
     
     def __init__(self, context: WeatherContext):
         """Initialize strategy."""
@@ -57,6 +65,47 @@ class WeatherStrategy(ABC, LoggerMixin):
         self.context = context
         self.set_log_context(service=self.__class__.__name__.lower())
     
+    def get_api_url(self) -> str:
+        """Get the forecast endpoint URL.
+        
+        ``GOLFCAL_<SERVICE>_URL`` (e.g. ``GOLFCAL_MET_URL``) overrides the
+        provider URL, e.g. to point at the load test server.
+        
+        Returns:
+            Forecast endpoint URL
+        """
+        return os.getenv(f"GOLFCAL_{self.service_type.upper()}_URL", self.api_url)
+    
+    def _http_get(self, url: str, timeout: TimeoutValue = None, **kwargs: Any) -> requests.Response:
+        """Make a GET request to the provider API and record its latency.
+        
+        The request runs under the shared retry policy, so it is retried with
+        jitter, charged to the host's retry budget and cut to the cycle deadline.
+        
+        Args:
+            url: Request URL
+            timeout: Requested timeout of each attempt, the policy's default if None
+            **kwargs: Arguments passed to requests
+            
+        Returns:
+            Response object
+        """
+        status = 'error'
+        start = time.perf_counter()
+        try:
+            response = retry_policy.request(http_cassette, 'GET', url, timeout=timeout, **kwargs)
+            status = str(response.status_code)
+            return response
+        except requests.exceptions.Timeout:
+            status = 'timeout'
+            raise
+        finally:
+            Metrics().record_time(
+                'weather_request',
+                time.perf_counter() - start,
+                {'provider': self.service_type, 'status': status}
+            )
+    
     @abstractmethod
     def get_weather(self) -> WeatherResponse | None:
         """Get weather data for the given context."""
@@ -124,65 +173,68 @@ class WeatherService:
         service_type: str | None = None
     ) -> WeatherResponse | None:
         """Get weather data using appropriate strategy."""
-        try:
-            # Create context
-            context = WeatherContext(
-                lat=lat,
-                lon=lon,
-                start_time=start_time,
-                end_time=end_time,
-                local_tz=self.local_tz,
-                utc_tz=self.utc_tz,
-                config=self.config
-            )
-            
-            # Try cache first
-            cached_response = self.response_cache.get_response(
-                service_type or self._select_service_for_location(lat, lon),
-                lat,
-                lon,
-                start_time,
-                end_time
-            )
-            if cached_response:
-                return WeatherResponse.from_dict(cached_response)
-            
-            # Select strategy
-            if not service_type:
-                service_type = self._select_service_for_location(lat, lon)
-            
-            strategy_class = self._strategies.get(service_type)
-            if not strategy_class:
-                raise ValueError(f"No strategy registered for service type: {service_type}")
-            
-            # Get weather data
-            strategy = strategy_class(context)
-            response = strategy.get_weather()
-            
-            # If OpenMeteo fails, try Met as fallback
-            if not response and service_type == 'openmeteo':
-                met_strategy = self._strategies['met'](context)
-                response = met_strategy.get_weather()
-                if response:
-                    service_type = 'met'  # Update service type for caching
-            
-            # Cache response if successful
-            if response:
-                self.response_cache.store_response(
-                    service_type=service_type,
-                    latitude=lat,
-                    longitude=lon,
-                    forecast_start=start_time,
-                    forecast_end=end_time,
-                    response_data=response.to_dict(),
-                    expires=strategy.get_expiry_time()
+        with span('weather', lat=lat, lon=lon) as weather_span:
+            try:
+                # Create context
+                context = WeatherContext(
+                    lat=lat,
+                    lon=lon,
+                    start_time=start_time,
+                    end_time=end_time,
+                    local_tz=self.local_tz,
+                    utc_tz=self.utc_tz,
+                    config=self.config
                 )
-            
-            return response
-            
-        except Exception as e:
-            aggregate_error(str(e), "weather_service", str(e.__traceback__))
-            return None
+                
+                # Try cache first
+                cached_response = self.response_cache.get_response(
+                    service_type or self._select_service_for_location(lat, lon),
+                    lat,
+                    lon,
+                    start_time,
+                    end_time
+                )
+                if cached_response:
+                    weather_span.set_attribute('cached', True)
+                    return WeatherResponse.from_dict(cached_response)
+                
+                # Select strategy
+                if not service_type:
+                    service_type = self._select_service_for_location(lat, lon)
+                
+                weather_span.set_attribute('provider', service_type)
+                strategy_class = self._strategies.get(service_type)
+                if not strategy_class:
+                    raise ValueError(f"No strategy registered for service type: {service_type}")
+                
+                # Get weather data
+                strategy = strategy_class(context)
+                response = strategy.get_weather()
+                
+                # If OpenMeteo fails, try Met as fallback
+                if not response and service_type == 'openmeteo':
+                    met_strategy = self._strategies['met'](context)
+                    response = met_strategy.get_weather()
+                    if response:
+                        service_type = 'met'  # Update service type for caching
+                
+                # Cache response if successful
+                if response:
+                    self.response_cache.store_response(
+                        service_type=service_type,
+                        latitude=lat,
+                        longitude=lon,
+                        forecast_start=start_time,
+                        forecast_end=end_time,
+                        response_data=response.to_dict(),
+                        expires=strategy.get_expiry_time()
+                    )
+                
+                return response
+                
+            except Exception as e:
+                aggregate_error(str(e), "weather_service", e)
+                return None
     
     def _select_service_for_location(self, lat: float, lon: float) -> str:
         """Select appropriate weather service based on coordinates."""
@@ -2,7 +2,7 @@
 
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +10,10 @@ from golfcal2.config.settings import AppConfig
 from golfcal2.models.golf_club import WiseGolfClub
 from golfcal2.models.user import Membership
 from golfcal2.services.auth_service import AuthService
+from golfcal2.services.reservation_snapshots import reservation_snapshots
+from golfcal2.services.session_store import SessionStore
+from golfcal2.tracing import propagate
+from golfcal2.utils.circuit_breaker import circuit_breakers
 from golfcal2.utils.logging_utils import EnhancedLoggerMixin
 
 
@@ -25,7 +29,6 @@ class WiseGolfDiscoveryService(EnhancedLoggerMixin):
         super().__init__()
         self.config = config
         self.endpoints_file = Path(os.path.dirname(os.path.dirname(__file__))) / 'config' / 'wisegolf_endpoints.json'
-        self.seen_reservation_ids: set[str] = set()
         
         # Initialize club data caches
         self.club_details_cache: dict[str, dict[str, Any]] = {}
@@ -156,6 +159,10 @@ class WiseGolfDiscoveryService(EnhancedLoggerMixin):
     ) -> list[dict[str, Any]]:
         """Fetch reservations from all WiseGolf clubs.
         
+        Clubs whose host has an open circuit are skipped, and these and
+        clubs failing to respond contribute the reservations they returned
+        last time.
+        
         Args:
             membership: User's membership details
             auth_service: Authentication service
@@ -164,6 +171,8 @@ class WiseGolfDiscoveryService(EnhancedLoggerMixin):
             List of reservations from all clubs
         """
         all_reservations = []
+        # Per call, as the service is shared by all users
+        seen_reservation_ids: set[str] = set()
         unique_clubs = self.get_unique_clubs()
         
         # Get max workers from config, default to 5 if not set
@@ -217,36 +226,44 @@ class WiseGolfDiscoveryService(EnhancedLoggerMixin):
             except Exception as e:
                 self.error(f"Failed to create club instance: {e}")
                 
-        # Fetch from all clubs in parallel with timeout handling
+        # Skip hosts known to be down rather than wait for them
+        club_results: list[tuple[WiseGolfClub, list[dict[str, Any]] | None]] = []
+        reachable = []
+        for club in club_instances:
+            if circuit_breakers.is_open(club.url):
+                self.info(f"Circuit open for {club.name}, keeping its previous reservations")
+                club_results.append((club, None))
+            else:
+                reachable.append(club)
+        
+        # Fetch from the other clubs in parallel
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
             future_to_club = {
-                executor.submit(self._fetch_club_reservations, club, membership): club
-                for club in club_instances
+                executor.submit(propagate(self._fetch_club_reservations), club, membership): club
+                for club in reachable
             }
-            
-            # Process completed tasks with timeout
             for future in as_completed(future_to_club):
-                club = future_to_club[future]
-                try:
-                    # Add timeout to prevent hanging on slow responses
-                    club_reservations = future.result(timeout=30)
-                    if club_reservations:
-                        # Add unique reservations
-                        for reservation in club_reservations:
-                            reservation_id = reservation.get('reservationTimeId') or reservation.get('orderId')
-                            if reservation_id not in self.seen_reservation_ids:
-                                # Enrich reservation with club details
-                                reservation['clubDetails'] = self.club_details_cache.get(
-                                    str(reservation.get('golfClubId', '')),
-                                    {}
-                                )
-                                all_reservations.append(reservation)
-                                self.seen_reservation_ids.add(reservation_id)
-                except TimeoutError:
-                    self.error(f"Timeout while fetching from club {club.name}")
-                except Exception as e:
-                    self.error(f"Failed to fetch from club {club.name}: {e}")
+                club_results.append((future_to_club[future], future.result()))
+        
+        for club, club_reservations in club_results:
+            account = SessionStore.account_key(club.url, membership.auth_details)
+            if club_reservations is None:
+                # Keep the reservations last fetched for clubs that cannot be reached
+                club_reservations = reservation_snapshots.get(account) or []
+            else:
+                reservation_snapshots.save(account, club_reservations)
+            
+            # Add unique reservations
+            for reservation in club_reservations:
+                reservation_id = reservation.get('reservationTimeId') or reservation.get('orderId')
+                if reservation_id not in seen_reservation_ids:
+                    # Enrich reservation with club details
+                    reservation['clubDetails'] = self.club_details_cache.get(
+                        str(reservation.get('golfClubId', '')),
+                        {}
+                    )
+                    all_reservations.append(reservation)
+                    seen_reservation_ids.add(reservation_id)
                     
         return all_reservations
         
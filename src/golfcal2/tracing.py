@@ -0,0 +1,269 @@
+"""Lightweight span tracing for golfcal2.
+
+Spans nest through a context variable, so the current span follows the code
+through function calls, asyncio tasks and (via ``propagate``) worker threads.
+Finished spans are buffered in memory and exported as Chrome trace-event JSON,
+which can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+Tracing is off by default; ``span()`` then returns a shared no-op context
+manager, so instrumented code pays only a function call and a flag check.
+"""
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+
+_current_span: contextvars.ContextVar['Span | None'] = contextvars.ContextVar('golfcal2_span', default=None)
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """A timed, named unit of work."""
+    
+    __slots__ = ('name', 'attributes', 'span_id', 'parent_id', 'start_ns', 'end_ns',
+                 'thread_id', 'thread_name', '_tracer', '_token')
+    
+    def __init__(self, tracer: 'Tracer', name: str, attributes: dict[str, Any]):
+        """Initialize span.
+        
+        Args:
+            tracer: Tracer that collects the span when it ends
+            name: Span name
+            attributes: Span attributes
+        """
+        self.name = name
+        self.attributes = attributes
+        self.span_id = next(_span_ids)
+        self.parent_id: int | None = None
+        self.start_ns = 0
+        self.end_ns = 0
+        self.thread_id = 0
+        self.thread_name = ''
+        self._tracer = tracer
+        self._token: contextvars.Token | None = None
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the span.
+        
+        Args:
+            key: Attribute name
+            value: Attribute value
+        """
+        self.attributes[key] = value
+    
+    def __enter__(self) -> 'Span':
+        """Start the span and make it current."""
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent else None
+        thread = threading.current_thread()
+        self.thread_id = thread.ident or 0
+        self.thread_name = thread.name
+        self._token = _current_span.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """End the span and hand it to the tracer."""
+        self.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self._tracer._finish(self)
+
+
+class _NoopSpan:
+    """Span returned while tracing is disabled."""
+    
+    __slots__ = ()
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+    
+    def __enter__(self) -> '_NoopSpan':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Central span collection."""
+    
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(Tracer, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+    
+    def __init__(self):
+        if not getattr(self, '_initialized', False):
+            self.enabled = False
+            self._spans: list[Span] = []
+            self._lock = threading.Lock()
+            self._initialized = True
+    
+    def enable(self) -> None:
+        """Start recording spans."""
+        self.enabled = True
+    
+    def disable(self) -> None:
+        """Stop recording spans and drop buffered ones."""
+        self.enabled = False
+        self.clear()
+    
+    def clear(self) -> None:
+        """Drop buffered spans, e.g. at the start of a processing cycle."""
+        with self._lock:
+            self._spans = []
+    
+    def span(self, name: str, **attributes: Any) -> Span | _NoopSpan:
+        """Create a span.
+        
+        Args:
+            name: Span name
+            **attributes: Span attributes
+        
+        Returns:
+            Context manager timing the enclosed block
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, attributes)
+    
+    def _finish(self, span: Span) -> None:
+        """Buffer a finished span."""
+        with self._lock:
+            self._spans.append(span)
+    
+    def get_spans(self) -> list[Span]:
+        """Get buffered spans in finishing order."""
+        with self._lock:
+            return list(self._spans)
+    
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Convert buffered spans to Chrome trace-event format.
+        
+        Returns:
+            Trace document with complete ("X") events and thread name metadata
+        """
+        pid = os.getpid()
+        spans = sorted(self.get_spans(), key=lambda s: s.start_ns)
+        events: list[dict[str, Any]] = []
+        thread_names: dict[int, str] = {}
+        
+        for span in spans:
+            thread_names.setdefault(span.thread_id, span.thread_name)
+            args = {key: value if isinstance(value, (str, int, float, bool)) else str(value)
+                    for key, value in span.attributes.items()}
+            args['span_id'] = span.span_id
+            if span.parent_id is not None:
+                args['parent_id'] = span.parent_id
+            events.append({
+                'name': span.name,
+                'cat': 'golfcal2',
+                'ph': 'X',
+                'ts': span.start_ns / 1000,
+                'dur': (span.end_ns - span.start_ns) / 1000,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args
+            })
+        
+        for thread_id, thread_name in thread_names.items():
+            events.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': thread_id,
+                'args': {'name': thread_name}
+            })
+        
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    
+    def export(self, trace_dir: str | Path, prefix: str = 'cycle', keep: int = 0) -> Path | None:
+        """Write buffered spans to a Chrome trace file and clear the buffer.
+        
+        Args:
+            trace_dir: Directory for trace files
+            prefix: File name prefix
+            keep: Number of most recent trace files with this prefix to keep (0 keeps all)
+        
+        Returns:
+            Path of the written file, or None if there were no spans
+        """
+        trace = self.to_chrome_trace()
+        self.clear()
+        if not trace['traceEvents']:
+            return None
+        
+        directory = Path(trace_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        timestamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}.{int(now * 1000) % 1000:03d}"
+        path = directory / f"{prefix}-{timestamp}-{os.getpid()}.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+        
+        if keep > 0:
+            old_files = sorted(directory.glob(f"{prefix}-*.json"), key=lambda p: p.stat().st_mtime)
+            for old_file in old_files[:-keep]:
+                try:
+                    old_file.unlink()
+                except OSError:
+                    pass
+        
+        return path
+
+
+_tracer = Tracer()
+
+
+def span(name: str, **attributes: Any) -> Span | _NoopSpan:
+    """Create a span on the global tracer.
+    
+    Args:
+        name: Span name
+        **attributes: Span attributes
+    
+    Returns:
+        Context manager timing the enclosed block
+    """
+    return _tracer.span(name, **attributes)
+
+
+def propagate(func: Callable[..., T]) -> Callable[..., T]:
+    """Bind a callable to the current context so spans nest across threads.
+    
+    Use when submitting work to a thread pool:
+    ``executor.submit(propagate(fetch), club)``.
+    
+    Args:
+        func: Callable to run in another thread
+    
+    Returns:
+        Callable that runs ``func`` in a copy of the current context
+    """
+    context = contextvars.copy_context()
+    
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        # A context can only be entered by one thread at a time, so run each call in its own copy
+        return context.copy().run(func, *args, **kwargs)
+    
+    return wrapper
@@ -0,0 +1,232 @@
+"""Per-host circuit breakers for CRM APIs, kept across restarts."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+
+from golfcal2.metrics import Metrics
+from golfcal2.utils.logging_utils import LoggerMixin
+
+CLOSED = 'closed'
+HALF_OPEN = 'half_open'
+OPEN = 'open'
+
+STATE_FILE = 'circuit_breakers.json'
+
+# Gauge values of the states
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+def _host(url: str) -> str:
+    """Get the host of a URL, or the URL itself if it has none."""
+    return urlparse(url).hostname or url
+
+
+class CircuitBreakers(LoggerMixin):
+    """A circuit breaker for each CRM host.
+    
+    A host's circuit opens after ``failure_threshold`` consecutive failed
+    requests. Requests to an open host fail at once until ``reset_timeout``
+    has passed; then one probe request is let through (half-open), and its
+    outcome closes the circuit or opens it again. Open circuits are saved in
+    a JSON file, so a restart does not hammer a host that is known to be down.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 900.0,
+        path: str | Path | None = None
+    ):
+        """Initialize breakers.
+        
+        Args:
+            failure_threshold: Consecutive failures opening a circuit, 0 to disable
+            reset_timeout: Seconds before an open circuit lets a probe through
+            path: State file, or None to keep the state in memory only
+        """
+        super().__init__()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.path = Path(path) if path else None
+        self._hosts: dict[str, dict[str, Any]] = {}
+        self._probing: set[str] = set()
+        self._lock = threading.Lock()
+    
+    def configure(self, http_config: dict[str, Any], data_dir: str | Path | None = None) -> None:
+        """Apply the breaker settings of the ``http`` section and load the saved state.
+        
+        Args:
+            http_config: The ``http`` section of the global configuration
+            data_dir: Directory of the state file, or None to keep the state
+                in memory only
+        """
+        with self._lock:
+            self.failure_threshold = max(int(http_config.get('breaker_failure_threshold', 3)), 0)
+            self.reset_timeout = float(http_config.get('breaker_reset_seconds', 900))
+            self.path = Path(data_dir) / STATE_FILE if data_dir else None
+            self._hosts = self._read()
+            self._probing = set()
+            for host, entry in self._hosts.items():
+                self._publish(host, entry['state'])
+    
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Read the state file; the caller holds the lock."""
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                hosts = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable circuit breaker state {self.path}: {e}")
+            return {}
+        # A probe in flight when the process stopped never reported back
+        return {
+            host: {**entry, 'state': OPEN if entry.get('state') == HALF_OPEN else entry.get('state', CLOSED)}
+            for host, entry in hosts.items() if isinstance(entry, dict)
+        }
+    
+    def _flush(self) -> None:
+        """Write the state file; the caller holds the lock."""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._hosts, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write circuit breaker state {self.path}: {e}")
+    
+    @staticmethod
+    def _publish(host: str, state: str) -> None:
+        """Publish the state of a host as a gauge."""
+        Metrics().set_gauge('circuit_breaker_state', STATE_VALUES[state], labels={'host': host})
+    
+    def _transition(self, host: str, entry: dict[str, Any], state: str) -> None:
+        """Change the state of a host; the caller holds the lock."""
+        if entry.get('state', CLOSED) != state:
+            self.logger.warning(f"Circuit for {host} is now {state.replace('_', '-')}")
+            Metrics().increment('circuit_breaker_transitions', labels={'host': host, 'state': state})
+        entry['state'] = state
+        self._hosts[host] = entry
+        self._publish(host, state)
+        self._flush()
+    
+    def is_open(self, url: str) -> bool:
+        """Check whether requests to a host would be rejected.
+        
+        Args:
+            url: Request URL or bare host name
+        
+        Returns:
+            True if the host's circuit is open and not yet due for a probe,
+            or its probe is in flight
+        """
+        host = _host(url)
+        with self._lock:
+            entry = self._hosts.get(host)
+            if entry is None or entry['state'] == CLOSED:
+                return False
+            if host in self._probing:
+                return True
+            return entry['state'] == OPEN and time.time() < entry.get('opened_at', 0) + self.reset_timeout
+    
+    def check(self, url: str) -> None:
+        """Let a request through or fail fast.
+        
+        An open circuit past its reset timeout becomes half-open and admits
+        this request as its probe.
+        
+        Args:
+            url: Request URL
+        
+        Raises:
+            CircuitOpenError: If the host's circuit is open or its probe is in flight
+        """
+        host = _host(url)
+        with self._lock:
+            entry = self._hosts.get(host)
+            if entry is None or entry['state'] == CLOSED:
+                return
+            if host not in self._probing and time.time() >= entry.get('opened_at', 0) + self.reset_timeout:
+                self._probing.add(host)
+                self._transition(host, entry, HALF_OPEN)
+                return
+        Metrics().increment('circuit_breaker_rejections', labels={'host': host})
+        raise CircuitOpenError(f"Circuit open for {host}")
+    
+    def release(self, url: str) -> None:
+        """Give up a request let through by ``check`` without an outcome.
+        
+        Args:
+            url: Request URL
+        """
+        with self._lock:
+            self._probing.discard(_host(url))
+    
+    def record_success(self, url: str) -> None:
+        """Record a request the host answered, closing its circuit.
+        
+        Args:
+            url: Request URL
+        """
+        host = _host(url)
+        with self._lock:
+            self._probing.discard(host)
+            entry = self._hosts.get(host)
+            if entry is None:
+                return
+            if entry['state'] != CLOSED:
+                self._transition(host, {'state': entry['state'], 'failures': 0}, CLOSED)
+            elif entry.get('failures'):
+                entry['failures'] = 0
+    
+    def record_failure(self, url: str, error: str) -> None:
+        """Record a request the host failed, opening its circuit at the threshold.
+        
+        Args:
+            url: Request URL
+            error: Description of the failure
+        """
+        host = _host(url)
+        with self._lock:
+            probe = host in self._probing
+            self._probing.discard(host)
+            entry = self._hosts.setdefault(host, {'state': CLOSED, 'failures': 0})
+            entry['failures'] = entry.get('failures', 0) + 1
+            entry['last_error'] = error
+            if not self.failure_threshold:
+                return
+            if probe or (entry['state'] == CLOSED and entry['failures'] >= self.failure_threshold):
+                entry['opened_at'] = time.time()
+                self._transition(host, entry, OPEN)
+    
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get the state of every host that has failed since its circuit last closed.
+        
+        Returns:
+            State, consecutive failures, last error and, for circuits that
+            opened, the time they opened, by host
+        """
+        with self._lock:
+            return {
+                host: dict(entry)
+                for host, entry in sorted(self._hosts.items())
+                if entry['state'] != CLOSED or entry.get('failures')
+            }
+
+
+# Shared by the CRM clients; the service loads the saved state at startup
+circuit_breakers = CircuitBreakers()
@@ -4,15 +4,20 @@ Utility functions and decorators for CLI argument handling.
 
 import argparse
 import logging
+import sys
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
 from functools import wraps
+from pathlib import Path
 from typing import Any, TypeVar, cast
 
 from typing_extensions import ParamSpec
 
 from golfcal2.config.types import AppConfig
+from golfcal2.profiling import PROFILE_MODES, profile_call
+from golfcal2.tracing import Tracer
 
 T = TypeVar('T')
 P = ParamSpec('P')
@@ -34,6 +39,7 @@ class CommandCategory(Enum):
     CHECK = auto()
     MANAGE = auto()
     IMPORT = auto()
+    DEVELOP = auto()
 
 @dataclass
 class CommandMetadata:
@@ -223,6 +229,101 @@ def add_common_options(parser: argparse.ArgumentParser) -> None:
         '--log-file',
         help='Path to write log output (default: logs to stdout)'
     )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Profile the command and write the profile next to the logs'
+    )
+    parser.add_argument(
+        '--profile-mode',
+        choices=PROFILE_MODES,
+        help='What to profile: cpu (default), wall or alloc; implies --profile'
+    )
+    http_mode = parser.add_mutually_exclusive_group()
+    http_mode.add_argument(
+        '--record-http',
+        metavar='CASSETTE',
+        help='Record all CRM and weather API traffic to a cassette file (e.g. cycle.jsonl.gz)'
+    )
+    http_mode.add_argument(
+        '--replay-http',
+        metavar='CASSETTE',
+        help='Answer all CRM and weather API requests from a recorded cassette instead of the network'
+    )
+    parser.add_argument(
+        '--replay-latency',
+        default=0.0,
+        type=float,
+        metavar='FACTOR',
+        help='With --replay-http, delay responses by their recorded time multiplied by FACTOR (1 reproduces it)'
+    )
+
+def _format_phase_summary(tracer: Tracer, total_seconds: float) -> str:
+    """Summarize traced spans by name for the profile report.
+    
+    Args:
+        tracer: Tracer holding the spans of the profiled command
+        total_seconds: Wall-clock duration of the command
+        
+    Returns:
+        Table of calls, total and max time per phase
+    """
+    phases: dict[str, list[float]] = {}
+    for span in tracer.get_spans():
+        phases.setdefault(span.name, []).append((span.end_ns - span.start_ns) / 1e9)
+    
+    lines = [f"Profile summary: {total_seconds:.3f}s total"]
+    if phases:
+        lines.append(f"  {'phase':<20} {'calls':>6} {'total s':>9} {'max s':>8}")
+        for name, durations in sorted(phases.items(), key=lambda item: sum(item[1]), reverse=True):
+            lines.append(f"  {name:<20} {len(durations):>6} {sum(durations):>9.3f} {max(durations):>8.3f}")
+    return '\n'.join(lines)
+
+def run_command_handler(ctx: CLIContext, handler: Callable[[CLIContext], int], command_name: str) -> int:
+    """Run a command handler, profiling it if --profile or --profile-mode was given.
+    
+    With profiling the artifacts are written next to the log file (or to the
+    configured logs directory) and a per-phase timing summary, built from the
+    tracing spans, is printed to stderr.
+    
+    Args:
+        ctx: CLI context
+        handler: Command handler
+        command_name: Command name used in artifact file names
+        
+    Returns:
+        Handler exit code
+    """
+    mode = getattr(ctx.args, 'profile_mode', None) or ('cpu' if getattr(ctx.args, 'profile', False) else None)
+    if not mode:
+        return handler(ctx)
+    
+    log_file = getattr(ctx.args, 'log_file', None)
+    if log_file:
+        output_dir = Path(log_file).parent
+    else:
+        output_dir = Path(ctx.config.global_config.get('directories', {}).get('logs', 'logs'))
+    
+    tracer = Tracer()
+    was_enabled = tracer.enabled
+    tracer.clear()
+    tracer.enable()
+    start = time.perf_counter()
+    try:
+        result, artifacts = profile_call(
+            mode,
+            handler,
+            ctx,
+            output_dir=output_dir,
+            name=f"profile-{command_name}"
+        )
+        print(_format_phase_summary(tracer, time.perf_counter() - start), file=sys.stderr)
+        for artifact in artifacts:
+            print(f"Profile written to {artifact}", file=sys.stderr)
+        return result
+    finally:
+        if not was_enabled:
+            tracer.disable()
 
 def with_common_options(func: F) -> F:
     """Decorator to add common options to a command function."""
@@ -0,0 +1,83 @@
+"""Per-host concurrency limits for outgoing API requests."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+
+from golfcal2.metrics import Metrics
+
+
+class HostSlotTimeout(requests.exceptions.Timeout):
+    """Raised when no request slot of a host frees up in time."""
+
+
+class HostLimiter:
+    """Cap the number of requests in flight to each host.
+    
+    Requests beyond the cap wait for a slot, so parallel fetches (e.g. the
+    WiseGolf club discovery) cannot pile onto a single API host.
+    """
+    
+    def __init__(self, max_per_host: int = 0):
+        """Initialize limiter.
+        
+        Args:
+            max_per_host: Maximum concurrent requests per host, 0 for no limit
+        """
+        self.max_per_host = max_per_host
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+    
+    def configure(self, max_per_host: int) -> None:
+        """Change the limit; hosts pick it up on their next request.
+        
+        Args:
+            max_per_host: Maximum concurrent requests per host, 0 for no limit
+        """
+        with self._lock:
+            self.max_per_host = max(int(max_per_host), 0)
+            self._semaphores = {}
+    
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore | None:
+        """Get the semaphore of a host, or None if unlimited."""
+        with self._lock:
+            if self.max_per_host <= 0:
+                return None
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+    
+    @contextmanager
+    def slot(self, url: str, timeout: float | None = None) -> Iterator[None]:
+        """Hold a request slot for the host of a URL.
+        
+        Args:
+            url: Request URL or bare host name
+            timeout: Seconds to wait for a slot, None to wait as long as it takes
+        
+        Raises:
+            HostSlotTimeout: If no slot freed up within the timeout
+        """
+        host = urlparse(url).hostname or url
+        semaphore = self._semaphore(host)
+        if semaphore is None:
+            yield
+            return
+        
+        if not semaphore.acquire(blocking=False):
+            Metrics().increment('http_host_limit_waits', labels={'host': host})
+            if not semaphore.acquire(timeout=None if timeout is None else max(timeout, 0.0)):
+                raise HostSlotTimeout(f"No request slot for {host} within {timeout:.1f}s")
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+# Shared by all API clients and weather strategies
+host_limiter = HostLimiter()
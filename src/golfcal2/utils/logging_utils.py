@@ -2,6 +2,7 @@
 Logging utilities for golf calendar application.
 """
 
+import json
 import logging
 import traceback
 from collections.abc import Callable
@@ -15,6 +16,70 @@ from typing_extensions import ParamSpec
 T = TypeVar('T')
 P = ParamSpec('P')
 
+# Maximum characters of a payload rendered into a log message
+PAYLOAD_LIMIT = 2000
+
+# Keys whose values never reach the logs
+SENSITIVE_KEYS = {'authorization', 'cookie', 'x-auth-token', 'token', 'password', 'appauth', 'cookie_value'}
+
+class LazyPayload:
+    """A log argument rendered only when a handler formats the record.
+    
+    Pass it as a %-style argument so that disabled levels cost nothing:
+    ``logger.debug("Response: %s", payload(data))``. Dicts are rendered as
+    JSON with credentials masked, and the result is capped in size.
+    """
+    
+    __slots__ = ('limit', 'value')
+    
+    def __init__(self, value: Any, limit: int | None = None):
+        """Initialize payload.
+        
+        Args:
+            value: Object to render
+            limit: Maximum rendered length, PAYLOAD_LIMIT by default
+        """
+        self.value = value
+        self.limit = limit
+    
+    @staticmethod
+    def _mask(value: Any) -> Any:
+        """Mask credentials in nested dicts and lists."""
+        if isinstance(value, dict) or hasattr(value, 'items'):
+            return {
+                k: '***' if str(k).lower() in SENSITIVE_KEYS else LazyPayload._mask(v)
+                for k, v in value.items()
+            }
+        if isinstance(value, list | tuple):
+            return [LazyPayload._mask(item) for item in value]
+        return value
+    
+    def __str__(self) -> str:
+        """Render the payload."""
+        if isinstance(self.value, str | bytes):
+            text = self.value.decode('utf-8', 'replace') if isinstance(self.value, bytes) else self.value
+        else:
+            try:
+                text = json.dumps(self._mask(self.value), default=str, ensure_ascii=False)
+            except (TypeError, ValueError):
+                text = repr(self.value)
+        limit = PAYLOAD_LIMIT if self.limit is None else self.limit
+        if len(text) > limit:
+            return f"{text[:limit]}... ({len(text)} chars)"
+        return text
+
+def payload(value: Any, limit: int | None = None) -> LazyPayload:
+    """Wrap a response, header dict or other object for lazy, size-capped logging.
+    
+    Args:
+        value: Object to log
+        limit: Maximum rendered length, PAYLOAD_LIMIT by default
+    
+    Returns:
+        Lazily rendered log argument
+    """
+    return LazyPayload(value, limit)
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name."""
     return logging.getLogger(name)
@@ -81,25 +146,31 @@ class EnhancedLoggerMixin:
         """Clear all context values."""
         self._log_context.clear()
     
-    def _format_message(self, msg: str, **kwargs: Any) -> str:
+    def _format_message(self, msg: str, *args: Any, **kwargs: Any) -> str:
         """Format log message with context and additional kwargs."""
         context = {**self._log_context, **kwargs}
         if context:
             context_str = " | ".join(f"{k}={v}" for k, v in context.items())
+            if args:
+                # The message is %-formatted with args later
+                context_str = context_str.replace('%', '%%')
             return f"{msg} | Context: {context_str}"
         return msg
     
-    def debug(self, msg: str, **kwargs: Any) -> None:
-        """Log a debug message with context."""
-        self.logger.debug(self._format_message(msg, **kwargs))
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a debug message with context; args are rendered only if DEBUG is enabled."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_message(msg, *args, **kwargs), *args)
     
-    def info(self, msg: str, **kwargs: Any) -> None:
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log an info message with context."""
-        self.logger.info(self._format_message(msg, **kwargs))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_message(msg, *args, **kwargs), *args)
     
-    def warning(self, msg: str, **kwargs: Any) -> None:
+    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a warning message with context."""
-        self.logger.warning(self._format_message(msg, **kwargs))
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_message(msg, *args, **kwargs), *args)
     
     def error(self, msg: str, exc_info: Any = None, **kwargs: Any) -> None:
         """Log an error message with context and optional exception info."""
@@ -0,0 +1,345 @@
+"""Shared retry and timeout policy for outgoing API requests."""
+
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any, TypeVar
+from urllib.parse import urlparse
+
+import requests
+
+from golfcal2.metrics import Metrics
+from golfcal2.utils.circuit_breaker import circuit_breakers
+from golfcal2.utils.host_limiter import HostSlotTimeout, host_limiter
+
+T = TypeVar('T')
+
+# Statuses worth another attempt; anything else is final
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Methods retried after a failed attempt
+RETRY_METHODS = frozenset({'GET', 'POST'})
+
+# Statuses counting as a failure of the host for its circuit breaker
+FAILURE_STATUSES = RETRY_STATUSES - {429}
+
+TimeoutValue = float | tuple[float, float] | None
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Raised when the cycle deadline leaves no time for a request."""
+
+
+def _host(url: str) -> str:
+    """Get the host of a URL, or the URL itself if it has none."""
+    return urlparse(url).hostname or url
+
+
+def retryable_response(response: Any) -> bool:
+    """Check whether a response has a status worth retrying.
+    
+    Args:
+        response: Response of an attempt
+    
+    Returns:
+        True if the request should be retried
+    """
+    return getattr(response, 'status_code', None) in RETRY_STATUSES
+
+
+def _retry_after(response: Any) -> float | None:
+    """Get the delay requested by a numeric Retry-After header."""
+    headers = getattr(response, 'headers', None)
+    if not isinstance(headers, Mapping):
+        return None
+    try:
+        return max(float(headers.get('Retry-After', '')), 0.0)
+    except ValueError:
+        return None
+
+
+class RetryPolicy:
+    """Retry, timeout and deadline rules shared by all API clients.
+    
+    Retries wait a decorrelated-jitter delay, so clients failing together
+    spread out instead of retrying in lockstep. Each host has a budget of
+    retries per cycle, and every request timeout is cut to the time left
+    before the cycle deadline, so one misbehaving club cannot use up the
+    whole cycle.
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        timeout: tuple[float, float] = (7, 20),
+        cycle_deadline: float | None = None,
+        retry_budget: int = 10,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize policy.
+        
+        Args:
+            max_attempts: Attempts per request, including the first one
+            base_delay: Minimum seconds between attempts
+            max_delay: Maximum seconds between attempts
+            timeout: Default (connect timeout, read timeout) of a request
+            cycle_deadline: Seconds a cycle may take, None for no deadline
+            retry_budget: Retries per host and cycle, 0 for no limit
+            sleep: Function waiting between attempts
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.default_timeout = timeout
+        self.cycle_deadline = cycle_deadline
+        self.retry_budget = retry_budget
+        self.sleep = sleep
+        self._deadline: float | None = None
+        self._retries: dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def configure(self, http_config: dict[str, Any]) -> None:
+        """Apply the retry settings of the ``http`` configuration section.
+        
+        Args:
+            http_config: The ``http`` section of the global configuration
+        """
+        self.max_attempts = max(int(http_config.get('retry_attempts', 3)), 1)
+        self.base_delay = float(http_config.get('retry_base_delay', 0.5))
+        self.max_delay = float(http_config.get('retry_max_delay', 20))
+        self.default_timeout = (
+            float(http_config.get('connect_timeout', 7)),
+            float(http_config.get('read_timeout', 20))
+        )
+        deadline = http_config.get('cycle_deadline_seconds', 1800)
+        self.cycle_deadline = float(deadline) if deadline else None
+        self.retry_budget = max(int(http_config.get('retry_budget_per_host', 10)), 0)
+    
+    def start_cycle(self, deadline: float | None = None) -> None:
+        """Reset the retry budgets and start the cycle deadline.
+        
+        Args:
+            deadline: Seconds the cycle may take, the configured deadline if None
+        """
+        seconds = self.cycle_deadline if deadline is None else deadline
+        with self._lock:
+            self._retries = {}
+            self._deadline = time.monotonic() + seconds if seconds else None
+    
+    @contextmanager
+    def cycle(self, deadline: float | None = None) -> Iterator[None]:
+        """Run a cycle under its own deadline and retry budgets.
+        
+        Args:
+            deadline: Seconds the cycle may take, the configured deadline if None
+        """
+        self.start_cycle(deadline)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._deadline = None
+    
+    def remaining(self) -> float | None:
+        """Get the seconds left before the cycle deadline, None without one."""
+        deadline = self._deadline
+        return None if deadline is None else deadline - time.monotonic()
+    
+    def timeout(self, requested: TimeoutValue = None) -> TimeoutValue:
+        """Get the timeout of a request, cut to the time left in the cycle.
+        
+        Args:
+            requested: Seconds, or (connect, read) seconds; the default if None
+        
+        Returns:
+            Timeout of the same shape as requested
+        
+        Raises:
+            DeadlineExceeded: If the cycle deadline has passed
+        """
+        requested = self.default_timeout if requested is None else requested
+        remaining = self.remaining()
+        if remaining is None:
+            return requested
+        if remaining <= 0:
+            Metrics().increment('http_deadline_exceeded')
+            raise DeadlineExceeded("Cycle deadline exceeded")
+        if isinstance(requested, tuple):
+            return (min(requested[0], remaining), min(requested[1], remaining))
+        return min(requested, remaining)
+    
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Hold a request slot of the host, waiting at most until the cycle deadline.
+        
+        Args:
+            url: Request URL
+        
+        Raises:
+            DeadlineExceeded: If the deadline passes before a slot frees up
+        """
+        try:
+            with host_limiter.slot(url, timeout=self.remaining()):
+                yield
+        except HostSlotTimeout:
+            Metrics().increment('http_deadline_exceeded')
+            raise DeadlineExceeded("Cycle deadline exceeded waiting for a request slot") from None
+    
+    def next_delay(self, previous: float, base_delay: float | None = None) -> float:
+        """Get the delay before the next attempt with decorrelated jitter.
+        
+        Args:
+            previous: Delay before the previous attempt, the base delay at first
+            base_delay: Minimum delay, the policy's if None
+        
+        Returns:
+            Seconds to wait
+        """
+        base = self.base_delay if base_delay is None else base_delay
+        return min(self.max_delay, random.uniform(base, max(previous, base) * 3))
+    
+    def allow_retry(self, url: str, attempt: int, delay: float, max_attempts: int | None = None) -> bool:
+        """Check whether a failed attempt may be retried and charge the host's budget.
+        
+        Args:
+            url: Request URL
+            attempt: Number of the failed attempt, starting from 1
+            delay: Seconds to wait before the retry
+            max_attempts: Attempts allowed for this request, the default if None
+        
+        Returns:
+            True if the request should be retried after the delay
+        """
+        if attempt >= (max_attempts or self.max_attempts):
+            return False
+        host = _host(url)
+        reason = None
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            reason = 'deadline'
+        else:
+            with self._lock:
+                used = self._retries.get(host, 0)
+                if self.retry_budget and used >= self.retry_budget:
+                    reason = 'budget'
+                else:
+                    self._retries[host] = used + 1
+        if reason is not None:
+            Metrics().increment('http_retries_denied', labels={'host': host, 'reason': reason})
+            return False
+        Metrics().increment('http_retries', labels={'host': host})
+        return True
+    
+    def call(
+        self,
+        url: str,
+        send: Callable[[TimeoutValue], T],
+        retry_on: tuple[type[BaseException], ...] = (requests.exceptions.Timeout, requests.exceptions.ConnectionError),
+        retry_if: Callable[[T], bool] | None = None,
+        timeout: TimeoutValue = None,
+        max_attempts: int | None = None,
+        base_delay: float | None = None
+    ) -> T:
+        """Make a request, retrying failed attempts under the policy.
+        
+        Args:
+            url: Request URL, identifying the host
+            send: Function making one attempt with the given timeout
+            retry_on: Exceptions of an attempt worth retrying
+            retry_if: Check of a result worth retrying, e.g. a 503 response
+            timeout: Requested timeout of each attempt, the default if None
+            max_attempts: Attempts allowed for this request, the default if None
+            base_delay: Minimum delay between attempts, the default if None
+        
+        Returns:
+            Result of the last attempt; a retryable result is returned when
+            no retry is allowed
+        
+        Raises:
+            DeadlineExceeded: If the cycle deadline passes before an attempt
+        """
+        delay = self.base_delay if base_delay is None else base_delay
+        attempt = 1
+        while True:
+            request_timeout = self.timeout(timeout)
+            try:
+                result = send(request_timeout)
+            except DeadlineExceeded:
+                raise
+            except retry_on:
+                delay = self.next_delay(delay, base_delay)
+                if not self.allow_retry(url, attempt, delay, max_attempts):
+                    raise
+            else:
+                if retry_if is None or not retry_if(result):
+                    return result
+                delay = max(self.next_delay(delay, base_delay), min(_retry_after(result) or 0.0, self.max_delay))
+                if not self.allow_retry(url, attempt, delay, max_attempts):
+                    return result
+            self.sleep(delay)
+            attempt += 1
+    
+    def request(
+        self,
+        session: Any,
+        method: str,
+        url: str,
+        timeout: TimeoutValue = None,
+        **kwargs: Any
+    ) -> requests.Response:
+        """Send a request under the policy, the host limit and the host's circuit breaker.
+        
+        Timeouts, connection errors and responses with a retryable status
+        are retried for GET and POST requests. A request that still fails
+        counts against the host's circuit breaker.
+        
+        Args:
+            session: Session sending the request, or a module with a
+                compatible ``request`` function such as ``http_cassette``
+            method: HTTP method
+            url: Request URL
+            timeout: Requested timeout of each attempt, the default if None
+            **kwargs: Arguments passed to the session
+        
+        Returns:
+            Response of the last attempt
+        
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+        """
+        def send(request_timeout: TimeoutValue) -> requests.Response:
+            with self.slot(url):
+                return session.request(method=method, url=url, timeout=request_timeout, **kwargs)
+        
+        circuit_breakers.check(url)
+        try:
+            response = self.call(
+                url,
+                send,
+                retry_if=retryable_response,
+                timeout=timeout,
+                max_attempts=None if method.upper() in RETRY_METHODS else 1
+            )
+        except DeadlineExceeded:
+            # Running out of time is not the host's fault
+            circuit_breakers.release(url)
+            raise
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            circuit_breakers.record_failure(url, type(e).__name__)
+            raise
+        except BaseException:
+            circuit_breakers.release(url)
+            raise
+        if getattr(response, 'status_code', None) in FAILURE_STATUSES:
+            circuit_breakers.record_failure(url, f"HTTP {response.status_code}")
+        else:
+            circuit_breakers.record_success(url)
+        return response
+
+
+# Shared by all API clients; the service starts a cycle for each run
+retry_policy = RetryPolicy()
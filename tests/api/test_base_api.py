@@ -13,6 +13,7 @@ from golfcal2.exceptions import (
     APITimeoutError,
     APIValidationError,
 )
+from golfcal2.metrics import Metrics
 
 
 @pytest.fixture
@@ -99,10 +100,10 @@ def test_base_api_initialization(auth_service, club_details, membership):
     assert dict(api.session.headers) == {"Authorization": "Bearer test-token"}
 
 def test_create_session_retry_config(base_api):
-    """Test session creation with retry configuration."""
+    """Test that sessions leave retries to the shared retry policy."""
     session = base_api._create_session()
-    assert session.adapters["https://"].max_retries.total == 3
-    assert session.adapters["http://"].max_retries.total == 3
+    assert session.adapters["https://"].max_retries.total == 0
+    assert session.adapters["http://"].max_retries.total == 0
 
 @pytest.mark.parametrize("status_code,response_text,expected_error", [
     (400, '{"error": "Bad Request"}', "Request failed: HTTP 400 (Code: invalid_response)"),
@@ -240,4 +241,22 @@ def test_auth_type_handling(auth_service, club_details, membership):
     api = BaseAPI("https://api.test.com", auth_service, club_details, membership)
     api.session.headers.clear()
     api.session.headers.update({"X-API-Key": "test_key"})
-    assert dict(api.session.headers) == {"X-API-Key": "test_key"} 
\ No newline at end of file
+    assert dict(api.session.headers) == {"X-API-Key": "test_key"} 
+
+
+def test_make_request_records_labelled_timing(base_api):
+    """Test that requests are timed per host, endpoint and status."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"success": True}
+    base_api.session.request.return_value = mock_response
+    base_api._make_request("GET", "/reservations/12345/details")
+
+    samples = Metrics().get_metrics()["labelled"]["timers"]["http_request"]
+    labels = {
+        "host": "api.test.com",
+        "endpoint": "/reservations/:id/details",
+        "method": "GET",
+        "status": "200"
+    }
+    assert any(sample["labels"] == labels and sample["stats"]["count"] >= 1 for sample in samples)
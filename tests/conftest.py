@@ -5,6 +5,10 @@ from pathlib import Path
 
 import pytest
 
+from golfcal2.services.reservation_snapshots import reservation_snapshots
+from golfcal2.utils.circuit_breaker import circuit_breakers
+from golfcal2.utils.retry_policy import retry_policy
+
 
 @pytest.fixture(scope="session")
 def test_data_dir():
@@ -51,4 +55,12 @@ def setup_test_env(monkeypatch, test_data_dir):
     if cache_dir.exists():
         for file in cache_dir.glob("*"):
             file.unlink()
-        cache_dir.rmdir() 
\ No newline at end of file
+        cache_dir.rmdir() 
+
+@pytest.fixture(autouse=True)
+def reset_http_policies(monkeypatch):
+    """Retry without waiting, without a cycle deadline, with all circuits closed and no saved reservations."""
+    monkeypatch.setattr(retry_policy, "sleep", lambda seconds: None)
+    retry_policy.start_cycle(deadline=0)
+    circuit_breakers.configure({})
+    reservation_snapshots.configure()
@@ -0,0 +1,120 @@
+"""Tests for conflict detection."""
+
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+from golfcal2.services.conflict_service import (
+    EXTERNAL,
+    IMPORTED,
+    ScheduledItem,
+    detect_conflicts,
+    expand,
+    external_event_items,
+    find_overlaps,
+    reservation_items,
+)
+
+TZ = ZoneInfo('Europe/Helsinki')
+START = datetime(2025, 6, 2, 8, 0, tzinfo=TZ)
+
+
+def reservation(user, club, start, hours=4, players=(), raw_data=None):
+    """Create a stand-in for a reservation with the fields used by conflict detection."""
+    return SimpleNamespace(
+        user=SimpleNamespace(name=user),
+        club=SimpleNamespace(name=club),
+        start_time=start,
+        end_time=start + timedelta(hours=hours),
+        players=[SimpleNamespace(name=name) for name in players],
+        raw_data=raw_data
+    )
+
+
+def test_sweep_finds_the_same_pairs_as_comparing_every_pair():
+    """Test the sweep against the quadratic check on random intervals."""
+    rng = random.Random(7)
+    items = []
+    for i in range(400):
+        start = START + timedelta(minutes=rng.randrange(0, 60 * 24 * 30, 15))
+        end = start + timedelta(minutes=rng.randrange(15, 300, 15))
+        items.append(ScheduledItem(start, end, 'alice', EXTERNAL, f"e{i}", f"e{i}"))
+    
+    expected = {
+        frozenset((a.key, b.key))
+        for i, a in enumerate(items) for b in items[i + 1:]
+        if a.start < b.end and b.start < a.end
+    }
+    found = [frozenset((a.key, b.key)) for a, b in find_overlaps(items)]
+    assert len(found) == len(expected)
+    assert set(found) == expected
+
+
+def test_conflicts_across_sources_and_shared_guests():
+    """Test reservations against recurring external and imported events, and cross-user guests."""
+    window_end = START + timedelta(days=60)
+    reservations = [
+        reservation('alice', 'HGK', START + timedelta(days=14), players=['Alice', 'Bob']),
+        # Bob booked the same flight from his own account
+        reservation('bob', 'HGK', START + timedelta(days=14), players=['Alice', 'Bob']),
+        reservation('carol', 'Tali', START + timedelta(days=14, hours=1), players=['Carol', 'Bob'])
+    ]
+    events = [{
+        'name': 'Weekly training',
+        'users': ['alice'],
+        'start': '2025-06-02T10:00:00',
+        'end': '2025-06-02T11:30:00',
+        'repeat': {'frequency': 'weekly', 'until': '2026-12-31T00:00:00'}
+    }]
+    imported = [reservation('alice', 'Language school', START + timedelta(days=28, hours=3), hours=1, raw_data={
+        'summary': 'Finnish course',
+        'rrule': {'FREQ': 'WEEKLY', 'UNTIL': START + timedelta(days=50), 'INTERVAL': 1, 'BYDAY': ['MO']}
+    })]
+    
+    items = (
+        reservation_items(reservations, window_start=START, window_end=window_end)
+        + external_event_items(events, 'alice', START, window_end)
+        + reservation_items(imported, IMPORTED, START, window_end)
+    )
+    # Only the weekly instances inside the window are expanded
+    assert sum(item.title == 'Weekly training' for item in items) == 9
+    
+    conflicts = detect_conflicts(items)
+    assert [(c.first.title, c.second.title, c.people) for c in conflicts] == (
+        [('HGK', 'Weekly training', ('alice',))] + [('Weekly training', 'Finnish course', ('alice',))] * 4
+    )
+    
+    shared = [c for c in detect_conflicts(items, cross_user=True) if c.first.source == c.second.source == 'reservation']
+    assert {(c.first.user, c.second.user) for c in shared} == {('alice', 'carol'), ('bob', 'carol')}
+    assert all(c.people == ('bob',) for c in shared)
+
+
+def test_distinct_bookings_at_the_same_club_and_start_conflict():
+    """Test that two courses booked at the same start are a conflict, unlike the players' copies of one flight."""
+    bookings = [
+        reservation('alice', 'HGK', START, raw_data={'resources': [{'resourceId': 1}]}),
+        reservation('alice', 'HGK', START, raw_data={'resources': [{'resourceId': 2}]}),
+        reservation('bob', 'HGK', START, players=['Alice'], raw_data={'resources': [{'resourceId': 1}]})
+    ]
+    conflicts = detect_conflicts(reservation_items(bookings), cross_user=True)
+    # Alice's two courses clash, and so do Bob's copy of the first and her second
+    # but not the two copies of the first
+    def course(item):
+        return item.ref.raw_data['resources'][0]['resourceId']
+    assert sorted((c.first.user, c.second.user, course(c.first) + course(c.second)) for c in conflicts) == [
+        ('alice', 'alice', 3), ('alice', 'bob', 3)
+    ]
+
+
+def test_expand_skips_excluded_and_out_of_window_occurrences():
+    """Test that a long daily series yields only window occurrences minus exclusions."""
+    occurrences = list(expand(
+        START,
+        START + timedelta(hours=1),
+        'FREQ=DAILY;COUNT=3650',
+        window_start=START + timedelta(days=100, minutes=30),
+        window_end=START + timedelta(days=103),
+        exdates=[START + timedelta(days=101)]
+    ))
+    assert [start for start, _ in occurrences] == [START + timedelta(days=100), START + timedelta(days=102)]
@@ -0,0 +1,148 @@
+"""Tests for streaming CSV import."""
+
+import tracemalloc
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from icalendar import Calendar, Event
+
+from golfcal2.models.user import User
+from golfcal2.services.calendar.builders.calendar_builder import CalendarBuilder
+from golfcal2.services.csv_import_index import CSVImportIndex
+from golfcal2.services.csv_import_service import CSVImportService
+
+TZ = ZoneInfo('Europe/Helsinki')
+HEADER = 'START DATE;START TIME;END DATE;END TIME;LOCATION;;;DESCRIPTION;SUBJECT\n'
+
+
+def write_export(path, weeks):
+    """Write an export with two weekly courses and one single event per week."""
+    monday = date(2025, 2, 17)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\ufeff' + HEADER)
+        # Newest first, so series have to be ordered as rows arrive
+        for week in reversed(range(weeks)):
+            day = monday + timedelta(weeks=week)
+            f.write(f'{day};9:30:00;{day};12:30:00;C116;Innovation;Lezione;Aurelio Ravarini;A14903 Organizing Digital Change\n')
+            f.write(f'{day + timedelta(days=1)};14:00:00;{day + timedelta(days=1)};16:00:00;C108;Innovation;Lezione;;IL0002 Italian Level 1\n')
+            f.write(f'{day + timedelta(days=2)};10:00;{day + timedelta(days=2)};11:00;"Hall; B";"Open day";\n')
+            f.write('\n')
+        f.write('not-a-date;10:00;2025-01-01;11:00;C1;Broken\n')
+
+
+def summary(reservations):
+    """Get comparable fields of imported reservations."""
+    return [
+        (r.start_time, r.end_time, r.club.name, r.raw_data['summary'], (r.raw_data.get('rrule') or {}).get('UNTIL'))
+        for r in reservations
+    ]
+
+
+def test_parallel_import_matches_sequential_import(tmp_path):
+    """Test that chunked parallel parsing groups series like a single pass."""
+    export = tmp_path / 'export.csv'
+    write_export(export, weeks=30)
+    user = User(name='Jarkko', memberships=[])
+
+    sequential = CSVImportService(workers=1).import_from_csv(str(export), user)
+    parallel = CSVImportService(workers=2, chunk_size=7).import_from_csv(str(export), user)
+
+    assert summary(parallel) == summary(sequential)
+    singles = [r for r in sequential if 'rrule' not in r.raw_data]
+    series = [r for r in sequential if 'rrule' in r.raw_data]
+    assert len(singles) == 30
+    # The quoted location keeps its delimiter
+    assert singles[0].club.name == 'Hall; B'
+    assert singles[0].start_time == datetime(2025, 2, 19, 10, tzinfo=TZ) + timedelta(weeks=29)
+    assert [(r.start_time, r.raw_data['rrule']['BYDAY'], r.raw_data['rrule']['UNTIL']) for r in series] == [
+        (datetime(2025, 2, 17, 9, 30, tzinfo=TZ), ['MO'], datetime(2025, 2, 17, 9, 30, tzinfo=TZ) + timedelta(weeks=29)),
+        (datetime(2025, 2, 18, 14, 0, tzinfo=TZ), ['TU'], datetime(2025, 2, 18, 14, 0, tzinfo=TZ) + timedelta(weeks=29)),
+    ]
+
+
+def test_calendar_is_written_from_a_stream(tmp_path):
+    """Test that streamed events form a valid calendar and replace the file only when complete."""
+    builder = CalendarBuilder(TZ)
+    calendar = Calendar()
+    calendar.add('prodid', '-//Golf Calendar//EN')
+    calendar.add('version', '2.0')
+    path = tmp_path / 'Jarkko.ics'
+
+    def events(count):
+        for i in range(count):
+            event = Event()
+            event.add('uid', f'event-{i}')
+            event.add('summary', f'Event {i}')
+            event.add('dtstart', datetime(2025, 3, 1, tzinfo=TZ) + timedelta(hours=i))
+            yield event
+
+    assert builder.write_calendar_stream(calendar, events(100), path) == 100
+    written = Calendar.from_ical(path.read_bytes())
+    assert str(written['prodid']) == '-//Golf Calendar//EN'
+    assert [str(e['uid']) for e in written.walk('vevent')] == [f'event-{i}' for i in range(100)]
+
+    def failing():
+        yield from events(3)
+        raise OSError('disk full')
+
+    with pytest.raises(OSError):
+        builder.write_calendar_stream(calendar, failing(), path)
+    assert len(Calendar.from_ical(path.read_bytes()).walk('vevent')) == 100
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_reimport_reports_delta_and_rebuilds_from_index(tmp_path):
+    """Test that a re-import parses only changed rows and the index matches a full import."""
+    export = tmp_path / 'export.csv'
+    write_export(export, weeks=10)
+    user = User(name='Jarkko', memberships=[])
+    service = CSVImportService(workers=1)
+    index = CSVImportIndex(tmp_path / 'index.db')
+
+    first = service.sync_index(index, str(export), user)
+    assert (first.added, first.changed, first.removed, first.unchanged) == (31, 0, 0, 0)
+    assert len(first.series) == 2
+    again = service.sync_index(index, str(export), user)
+    assert not again
+    assert again.unchanged == 31
+
+    lines = export.read_text(encoding='utf-8').splitlines(keepends=True)
+    # Rename the latest course occurrence, drop the latest single event and add a new one
+    lines[1] = lines[1].replace('Organizing Digital Change', 'Organizing Digital Change II')
+    del lines[3]
+    lines.append('2025-06-02;10:00;2025-06-02;11:00;Clubhouse;Season opening;\n')
+    export.write_text(''.join(lines), encoding='utf-8')
+
+    parsed = []
+    original = service._parsed_rows
+    service._parsed_rows = lambda rows, timezone: (parsed.append(row) or row for row in original(rows, timezone))
+    delta = service.sync_index(index, str(export), user)
+    assert (delta.added, delta.changed, delta.removed, delta.unchanged) == (1, 1, 1, 29)
+    assert len(delta.series) == 1
+    assert len(parsed) == 2
+
+    indexed = list(service.indexed_reservations(index, user))
+    assert sorted(summary(indexed)) == sorted(summary(CSVImportService(workers=1).import_from_csv(str(export), user)))
+
+
+def test_reimport_memory_does_not_grow_with_export(tmp_path):
+    """Test that syncing the index holds only the rows in flight, not every changed row."""
+    user = User(name='Jarkko', memberships=[])
+
+    def peak(weeks):
+        export = tmp_path / f'export-{weeks}.csv'
+        write_export(export, weeks=weeks)
+        service = CSVImportService(workers=1, chunk_size=50)
+        index = CSVImportIndex(tmp_path / f'index-{weeks}.db')
+        tracemalloc.start()
+        try:
+            delta = service.sync_index(index, str(export), user)
+            return tracemalloc.get_traced_memory()[1], delta
+        finally:
+            tracemalloc.stop()
+
+    small, _ = peak(100)
+    large, delta = peak(400)
+    assert delta.added == 3 * 400 + 1
+    assert large < 2 * small
@@ -0,0 +1,97 @@
+"""Tests for external event processing."""
+
+import os
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import yaml
+from icalendar import Calendar
+
+from golfcal2.config.types import AppConfig
+from golfcal2.services.external_event_service import ExternalEventDefinition, ExternalEventService
+
+TZ = ZoneInfo('Europe/Helsinki')
+
+
+class CountingWeatherService:
+    """Weather service stand-in counting forecast lookups."""
+    
+    def __init__(self):
+        self.lookups = []
+    
+    def get_weather(self, lat, lon, start_time, end_time):
+        self.lookups.append(start_time)
+        return None
+
+
+def make_service(weather=None):
+    """Create a service with a minimal configuration."""
+    config = AppConfig(users={}, clubs={}, global_config={'timezone': 'Europe/Helsinki'}, api_keys={})
+    return ExternalEventService(weather or CountingWeatherService(), config)
+
+
+def test_recurring_event_is_one_series_with_forecast_overrides():
+    """Test that a long series yields one RRULE event plus overrides within the forecast horizon."""
+    weather = CountingWeatherService()
+    service = make_service(weather)
+    
+    next_one = (datetime.now(TZ) + timedelta(days=2)).replace(minute=0, second=0, microsecond=0)
+    first = next_one - timedelta(weeks=20)
+    skipped = next_one + timedelta(weeks=1)
+    event_data = {
+        'name': 'Winter Practice',
+        'location': 'Golfluola',
+        'coordinates': {'lat': 60.2859, 'lon': 24.8427},
+        'start': first.replace(tzinfo=None).isoformat(),
+        'end': (first + timedelta(hours=3)).replace(tzinfo=None).isoformat(),
+        'timezone': 'Europe/Helsinki',
+        'repeat': {
+            'frequency': 'weekly',
+            'until': (next_one + timedelta(weeks=150)).date().isoformat(),
+            'exclude': [skipped.date().isoformat()]
+        }
+    }
+    
+    events = service._process_recurring_event(ExternalEventDefinition.from_dict(event_data), 'Jarkko')
+    
+    # Round-trip through ICS to check what calendar clients get
+    calendar = Calendar()
+    for event in events:
+        calendar.add_component(event)
+    series, *overrides = Calendar.from_ical(calendar.to_ical()).walk('vevent')
+    
+    assert series['rrule']['FREQ'] == ['WEEKLY']
+    assert [dt.dt for dt in series['exdate'].dts] == [skipped]
+    # Of the 150 weeks ahead only the next occurrence gets built and a forecast;
+    # the one after is excluded and the rest are past the 10 day horizon
+    assert [override['recurrence-id'].dt for override in overrides] == [next_one]
+    assert weather.lookups == [next_one]
+    assert str(overrides[0]['uid']) == str(series['uid'])
+
+
+def test_events_are_parsed_once_per_file_change_and_indexed_by_user(tmp_path, monkeypatch):
+    """Test that the events file is parsed again only after it changes."""
+    service = make_service()
+    service.config_dir = tmp_path
+    events_file = tmp_path / 'external_events.yaml'
+    events_file.write_text(
+        "events:\n"
+        "  - {name: Cup, start: '2030-06-01T10:00:00', end: '2030-06-01T14:00:00', timezone: Europe/Istanbul, users: [Jarkko]}\n"
+        "  - {name: Open, start: '2030-06-02T10:00:00', end: '2030-06-02T14:00:00'}\n"
+    )
+    parses = []
+    safe_load = yaml.safe_load
+    monkeypatch.setattr(yaml, 'safe_load', lambda stream: parses.append(stream) or safe_load(stream))
+    
+    jarkko = service.events_for_user('Jarkko')
+    assert [d.data['name'] for d in jarkko] == ['Cup', 'Open']
+    assert [d.data['name'] for d in service.events_for_user('Seven')] == ['Open']
+    assert service.events_for_user('Jarkko') is jarkko
+    assert len(parses) == 1
+    # Naive times are in the event's own timezone
+    assert jarkko[0].start == datetime(2030, 6, 1, 10, tzinfo=ZoneInfo('Europe/Istanbul'))
+    
+    events_file.write_text("events: []\n")
+    os.utime(events_file, ns=(0, events_file.stat().st_mtime_ns + 1_000_000))
+    assert service.events_for_user('Jarkko') == []
+    assert len(parses) == 2
@@ -0,0 +1,65 @@
+"""Tests for the outbound notification queue."""
+
+import threading
+
+from golfcal2.services.notification_queue import NotificationQueue
+
+
+class Sender:
+    """Records sent notifications and fails while told to."""
+    
+    def __init__(self):
+        self.sent = []
+        self.failing = False
+        self.called = threading.Event()
+    
+    def __call__(self, title, message):
+        if not self.failing:
+            self.sent.append((title, message))
+        self.called.set()
+        return not self.failing
+
+
+def test_coalesces_per_user_and_retries_with_backoff(tmp_path):
+    """Test that a user's changes within the window go out as one push, retried after failures."""
+    sender = Sender()
+    queue = NotificationQueue(tmp_path / 'state.db', sender, coalesce_window=60, retry_backoff=10)
+    try:
+        queue.enqueue('alice', 'Player Changes - HGK', 'Bob joined', flight='r1')
+        queue.enqueue('alice', 'Player Changes - HGK', 'Carol joined', flight='r1')
+        queue.enqueue('alice', 'Player Changes - Tali', 'Dave left', flight='r2')
+        queue.enqueue('bob', 'Player Changes - HGK', 'Erin joined', flight='r3')
+        first = queue._pending()['alice'][0].created_at
+        
+        # Nothing is sent before the window closes
+        assert queue.deliver_due(first + 30) == 30
+        assert sender.sent == []
+        
+        sender.failing = True
+        assert queue.deliver_due(first + 61) == 10
+        assert queue.depth() == 4
+        
+        sender.failing = False
+        assert queue.deliver_due(first + 65) == 6
+        assert queue.deliver_due(first + 71) is None
+        assert sorted(title for title, _ in sender.sent) == ['3 changes in 2 flights', 'Player Changes - HGK']
+        assert "Carol joined" in dict(sender.sent)['3 changes in 2 flights']
+        assert queue.depth() == 0
+    finally:
+        queue.close()
+
+
+def test_pending_notifications_survive_restart(tmp_path):
+    """Test that a new queue delivers what an earlier one left behind."""
+    sender = Sender()
+    queue = NotificationQueue(tmp_path / 'state.db', sender, coalesce_window=3600)
+    queue.enqueue('alice', 'Player Changes - HGK', 'Bob joined')
+    queue.close()
+    assert sender.sent == []
+    
+    restarted = NotificationQueue(tmp_path / 'state.db', sender, coalesce_window=0)
+    try:
+        assert sender.called.wait(5)
+        assert sender.sent == [('Player Changes - HGK', 'Bob joined')]
+    finally:
+        restarted.close()
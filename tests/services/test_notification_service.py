@@ -0,0 +1,83 @@
+"""Tests for roster change detection."""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from golfcal2.config.types import AppConfig
+from golfcal2.models.reservation import Player
+from golfcal2.services.notification_service import NotificationService
+
+TZ = ZoneInfo('Europe/Helsinki')
+
+
+def reservation(uid, players, start):
+    """Create a stand-in for a reservation with the fields used by change detection."""
+    return SimpleNamespace(
+        uid=uid,
+        players=[Player(name=name, club='HGK', handicap=10.0) for name in players],
+        start_time=start,
+        club=SimpleNamespace(name='Helsingin Golfklubi')
+    )
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """Notification service keeping its state under a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    config = AppConfig(users={}, clubs={}, global_config={}, api_keys={})
+    return NotificationService(config)
+
+
+def test_only_changed_rosters_are_compared_and_written(service, monkeypatch):
+    """Test that unchanged reservations are neither compared nor rewritten."""
+    start = datetime.now(TZ) + timedelta(days=1)
+    first = service.check_for_changes([reservation('a', ['Alice'], start), reservation('b', ['Bob'], start)])
+    assert sorted(change.reservation.uid for change in first) == ['a', 'b']
+    
+    loaded = []
+    get_players = service.state.get_players
+    monkeypatch.setattr(service.state, 'get_players', lambda uids: loaded.append(list(uids)) or get_players(uids))
+    
+    changes = service.check_for_changes([reservation('a', ['Alice', 'Carol'], start), reservation('b', ['Bob'], start)])
+    assert loaded == [['a']]
+    assert [(c.reservation.uid, [p.name for p in c.added], c.removed) for c in changes] == [('a', ['Carol'], [])]
+    
+    # Another user's reservations leave these rows alone
+    service.check_for_changes([reservation('c', ['Dave'], start)])
+    assert service.check_for_changes([reservation('a', ['Carol'], start)])[0].removed[0].name == 'Alice'
+
+
+def test_past_reservations_are_pruned_and_legacy_state_imported(tmp_path, monkeypatch):
+    """Test that the JSON state is imported without notifying and past rows are removed."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    legacy = {'a': [{'name': 'Alice', 'club': 'HGK', 'handicap': 10.0}]}
+    (tmp_path / 'data' / 'reservation_state.json').write_text(json.dumps(legacy))
+    service = NotificationService(AppConfig(users={}, clubs={}, global_config={}, api_keys={}))
+    assert (tmp_path / 'data' / 'reservation_state.json.migrated').exists()
+    
+    now = datetime.now(TZ)
+    assert service.check_for_changes([reservation('a', ['Alice'], now + timedelta(hours=1))]) == []
+    service.state.save([], now=now + timedelta(hours=2))
+    with sqlite3.connect(service.state.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM reservation_state").fetchone() == (0,)
+
+
+def test_unchecked_legacy_rows_are_pruned(tmp_path, monkeypatch):
+    """Test that imported rows whose reservation is never checked do not stay forever."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    legacy = {'gone': [{'name': 'Alice', 'club': 'HGK', 'handicap': 10.0}]}
+    (tmp_path / 'data' / 'reservation_state.json').write_text(json.dumps(legacy))
+    service = NotificationService(AppConfig(users={}, clubs={}, global_config={}, api_keys={}))
+    
+    now = datetime.now(TZ)
+    service.state.save([], now=now + timedelta(days=1))
+    assert service.state.get_players(['gone'])
+    service.state.save([], now=now + timedelta(days=8))
+    assert service.state.get_players(['gone']) == {}
@@ -0,0 +1,60 @@
+"""Tests for listing a user's reservations."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+from golfcal2.services.reservation_service import ReservationService
+from golfcal2.services.reservation_snapshots import reservation_snapshots
+from golfcal2.utils.circuit_breaker import circuit_breakers
+
+TOMORROW = datetime.now(ZoneInfo('Europe/Helsinki')) + timedelta(days=1)
+
+
+def _service(monkeypatch, club):
+    """Create a reservation service for a user with one NexGolf membership."""
+    config = SimpleNamespace(
+        users={'alice': {'memberships': [{'club': 'Nex', 'auth_details': {'token': 'x'}}]}},
+        clubs={'Nex': {'type': 'nexgolf'}},
+        timezone='Europe/Helsinki'
+    )
+    service = ReservationService(
+        'alice',
+        config,
+        auth_service=MagicMock(),
+        notification_service=MagicMock(),
+        wise_golf_discovery=MagicMock(),
+        weather_service=MagicMock()
+    )
+    monkeypatch.setattr(service.club_factory, 'create_club', lambda *args: club)
+    monkeypatch.setattr(
+        service,
+        '_convert_club_reservations',
+        lambda club, membership, days, raw: [SimpleNamespace(uid=row['id'], start_time=TOMORROW) for row in raw]
+    )
+    return service
+
+
+def test_failed_clubs_keep_their_saved_reservations(tmp_path, monkeypatch):
+    """Test that a failed fetch or an open circuit keeps the club's last reservations, also after a restart."""
+    circuit_breakers.configure({'breaker_failure_threshold': 3})
+    reservation_snapshots.configure(tmp_path)
+    club = MagicMock(url='https://nex.example.com/', timezone='Europe/Helsinki', club_details={'type': 'nexgolf'})
+    club.name = 'Nex'
+    club.fetch_reservations.return_value = [{'id': 'booking-1'}]
+    service = _service(monkeypatch, club)
+    assert [r.uid for r in service.list_reservations()] == ['booking-1']
+    
+    # A failure below the breaker threshold does not drop the booking
+    club.fetch_reservations.side_effect = ConnectionError('down')
+    assert [r.uid for r in service.list_reservations()] == ['booking-1']
+    
+    # Nor does an open circuit after a restart
+    for _ in range(3):
+        circuit_breakers.record_failure(club.url, 'ConnectTimeout')
+    reservation_snapshots.configure(tmp_path)
+    club.fetch_reservations.reset_mock()
+    restarted = _service(monkeypatch, club)
+    assert [r.uid for r in restarted.list_reservations()] == ['booking-1']
+    club.fetch_reservations.assert_not_called()
@@ -0,0 +1,117 @@
+"""Tests for the persistent CRM session store."""
+
+import json
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from golfcal2.api.base_api import BaseAPI
+from golfcal2.config.types import AppConfig
+from golfcal2.services.auth_service import AuthService
+from golfcal2.services.session_store import PersistentSessionMixin, SessionStore
+
+
+def _session(**cookies):
+    """Create a requests session with a bearer token and cookies."""
+    session = requests.Session()
+    session.headers['Authorization'] = 'Bearer token'
+    for name, value in cookies.items():
+        session.cookies.set(name, value)
+    return session
+
+
+def test_sessions_survive_restart_with_private_file(tmp_path):
+    """Test that sessions are written once, owner-only, and read back by a new store."""
+    path = tmp_path / 'data' / 'sessions.json'
+    key = SessionStore.account_key('https://crm.example.com/api', {'token': 'secret'})
+    store = SessionStore(path)
+    store.save(key, _session(sid='abc'))
+    written = path.stat().st_mtime_ns
+    
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    store.save(key, _session(sid='abc'))
+    assert path.stat().st_mtime_ns == written
+    
+    restored = requests.Session()
+    assert SessionStore(path).restore(key, restored) is True
+    assert restored.cookies['sid'] == 'abc'
+    assert restored.headers['Authorization'] == 'Bearer token'
+    
+    # Changed credentials never see the old session
+    assert SessionStore(path).get(SessionStore.account_key('https://crm.example.com', {'token': 'new'})) is None
+
+
+def test_expired_sessions_are_dropped(tmp_path):
+    """Test that a session past its TTL is not restored."""
+    store = SessionStore(tmp_path / 'sessions.json', ttl=0.05)
+    store.save('crm:account', _session(sid='abc'))
+    time.sleep(0.1)
+    
+    assert store.restore('crm:account', requests.Session()) is False
+    assert json.loads((tmp_path / 'sessions.json').read_text()) == {}
+
+
+def test_clients_must_implement_setup_auth():
+    """Test that a client without _setup_auth cannot be created."""
+    class Client(PersistentSessionMixin):
+        pass
+    
+    with pytest.raises(TypeError, match='_setup_auth'):
+        Client()
+
+
+class SessionHandler(BaseHTTPRequestHandler):
+    """Rejects the stale session cookie and hands out a fresh one."""
+    
+    requests_seen = 0
+    
+    def do_GET(self):
+        type(self).requests_seen += 1
+        if 'sid=stale' in self.headers.get('Cookie', ''):
+            self.send_response(401)
+            self.end_headers()
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', 'sid=fresh; Path=/')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def crm_url():
+    """Run a CRM stand-in on a free port."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SessionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_rejected_session_is_replaced(tmp_path, crm_url):
+    """Test that a client drops a rejected stored session, retries once and stores the new one."""
+    auth_service = AuthService(AppConfig(users={}, clubs={}, global_config={}, api_keys={}))
+    auth_service.session_store = SessionStore(tmp_path / 'sessions.json')
+    key = SessionStore.account_key(crm_url, {})
+    auth_service.session_store.save(key, _session(sid='stale'))
+    SessionHandler.requests_seen = 0
+    
+    api = BaseAPI(crm_url, auth_service)
+    assert api._make_request('GET', '/reservations') == {'ok': True}
+    assert SessionHandler.requests_seen == 2
+    
+    # The next run starts with the fresh session and needs a single request
+    api = BaseAPI(crm_url, auth_service)
+    assert api.session.cookies['sid'] == 'fresh'
+    api._make_request('GET', '/reservations')
+    assert SessionHandler.requests_seen == 3
@@ -0,0 +1,44 @@
+"""Tests for fetching reservations from all WiseGolf clubs."""
+
+from unittest.mock import MagicMock
+
+from golfcal2.models.user import Membership
+from golfcal2.services.wise_golf_discovery_service import WiseGolfDiscoveryService
+from golfcal2.utils.circuit_breaker import circuit_breakers
+
+
+def club(name, host):
+    """Get an endpoints entry of a WiseGolf club."""
+    return {
+        'name': name,
+        'golfClubId': name,
+        'sessionType': 'wisegolf',
+        'ajaxUrl': f'https://{host}/pd/',
+        'baseUrl': f'https://{host}/',
+        'restUrl': f'https://{host}/api/1.0/',
+    }
+
+
+def test_open_circuit_keeps_previous_reservations(monkeypatch):
+    """Test that a club on a failed host is skipped and its last reservations are kept."""
+    circuit_breakers.configure({'breaker_failure_threshold': 1})
+    service = WiseGolfDiscoveryService({'max_workers': 2})
+    monkeypatch.setattr(service, 'get_unique_clubs', lambda: [club('A', 'a.example.com'), club('B', 'b.example.com')])
+    fetched = []
+    cycle = [1]
+    
+    def fetch(golf_club, membership):
+        fetched.append(golf_club.name)
+        return [{'orderId': f'{golf_club.name}-{cycle[0]}'}]
+    
+    monkeypatch.setattr(service, '_fetch_club_reservations', fetch)
+    membership = Membership(club='A', club_abbreviation='A', duration={'hours': 4}, auth_details={'token': 'x'})
+    first = service.fetch_from_all_clubs(membership, MagicMock())
+    assert sorted(r['orderId'] for r in first) == ['A-1', 'B-1']
+    
+    circuit_breakers.record_failure('https://b.example.com/pd/', 'ConnectTimeout')
+    fetched.clear()
+    cycle[0] = 2
+    second = service.fetch_from_all_clubs(membership, MagicMock())
+    assert fetched == ['A']
+    assert sorted(r['orderId'] for r in second) == ['A-2', 'B-1']
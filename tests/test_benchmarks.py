@@ -0,0 +1,62 @@
+"""Tests for the benchmark suite and its recorded fixtures."""
+
+import importlib.util
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+SUITE_PATH = Path(__file__).parent.parent / 'benchmarks' / 'suite.py'
+
+
+@pytest.fixture(scope='module')
+def suite():
+    """Import benchmarks/suite.py, which is not part of the package."""
+    spec = importlib.util.spec_from_file_location('benchmark_suite', SUITE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_fixture_dates_shift_to_today(suite):
+    """Test that recorded dates move by the same offset in every format."""
+    met = suite.load_fixture('met_locationforecast.json', today=date(2030, 1, 1))
+    assert met['properties']['timeseries'][0]['time'] == '2030-01-01T00:00:00Z'
+    
+    nexgolf = suite.load_fixture('nexgolf_reservations.json', today=date(2030, 1, 1))
+    assert nexgolf['data'][0]['startTime'] == '08:30 2030-01-03'
+
+
+def test_workload_replays_all_providers(suite):
+    """Test that every stage runs on the fixtures and produces real output."""
+    workload = suite.Workload(2)
+    
+    assert len(workload.reservations) == 2
+    players = {type(r.club).__name__: len(r.players) for r in workload.reservations[0]}
+    # Players come from the recorded tee sheets, not the single-user fallback
+    assert players['ReplayWiseGolf0Club'] == 4
+    assert players['NexGolfClub'] > 1
+    
+    assert workload.match_players() > 2 * len(workload.raw['wisegolf'] + workload.raw['wisegolf0'])
+    assert workload.weather() > 0
+    assert all(event is not None for events in workload.events for event in events)
+    assert b'Weather:' in workload.events[0][0].to_ical()
+    assert workload.serialise() > 0
+
+
+def test_compare_flags_regressions(suite):
+    """Test that only slowdowns beyond the threshold are reported."""
+    baseline = {'results': {
+        'parse': {'1': {'per_user_ms': 1.0}, '50': {'per_user_ms': 1.0}},
+        'ics': {'1': {'per_user_ms': 2.0}}
+    }}
+    results = {
+        'parse': {'1': {'per_user_ms': 1.2}, '50': {'per_user_ms': 1.3}},
+        'ics': {'1': {'per_user_ms': 1.0}},
+        'players': {'1': {'per_user_ms': 5.0}}  # Not in the baseline
+    }
+    
+    regressions = suite.compare(results, baseline, threshold=0.25)
+    
+    assert len(regressions) == 1
+    assert regressions[0].startswith('parse @ 50 users')
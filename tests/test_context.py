@@ -0,0 +1,96 @@
+"""Tests for the long-lived application context."""
+
+import os
+import time
+
+import pytest
+
+from golfcal2.config.types import AppConfig
+from golfcal2.context import AppContext
+from golfcal2.services.pushover_service import PushoverService
+
+
+def _config(config_dir, users):
+    """Create a configuration loaded from a directory."""
+    return AppConfig(
+        users={name: {'memberships': []} for name in users},
+        clubs={},
+        global_config={'timezone': 'Europe/Helsinki', 'data_dir': str(config_dir / 'data')},
+        api_keys={'weather': {}},
+        config_dir=str(config_dir)
+    )
+
+
+class ReloadingManager:
+    """Configuration manager returning a prepared configuration on reload."""
+    
+    def __init__(self, config):
+        self.config = config
+    
+    def reload_config(self):
+        return self.config
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Configuration directory, also the working directory for service caches."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'users.json').write_text('{}')
+    return tmp_path
+
+
+def test_services_are_shared_until_config_changes(config_dir):
+    """Test that services are built once and rebuilt after the config files change."""
+    manager = ReloadingManager(_config(config_dir, ['alice', 'bob']))
+    context = AppContext(_config(config_dir, ['alice']), config_manager=manager, check_interval=0)
+    
+    reservations = context.reservation_service('alice')
+    assert context.reservation_service('alice') is reservations
+    assert reservations.weather_service is context.weather_service
+    assert reservations.auth_service is context.auth_service
+    assert context.calendar_service.external_event_service is context.external_event_service
+    assert context.reload_if_changed() is False
+    
+    users_file = config_dir / 'users.json'
+    os.utime(users_file, (users_file.stat().st_atime, users_file.stat().st_mtime + 10))
+    assert context.reload_if_changed() is True
+    assert set(context.config.users) == {'alice', 'bob'}
+    assert context.reservation_service('alice') is not reservations
+    assert context.reload_if_changed() is False
+
+
+def test_failed_reload_keeps_old_services(config_dir):
+    """Test that a broken configuration on disk does not drop working services."""
+    class BrokenManager:
+        def reload_config(self):
+            raise ValueError("invalid users.json")
+    
+    context = AppContext(_config(config_dir, ['alice']), config_manager=BrokenManager(), check_interval=0)
+    weather_service = context.weather_service
+    users_file = config_dir / 'users.json'
+    os.utime(users_file, (users_file.stat().st_atime, users_file.stat().st_mtime + 10))
+    
+    assert context.reload_if_changed() is False
+    assert context.weather_service is weather_service
+    assert context.reload_if_changed() is False
+
+
+def test_notifications_queued_across_reload_are_sent(config_dir, monkeypatch):
+    """Test that a notification service dropped by a reload still delivers through its successor."""
+    sent = []
+    monkeypatch.setattr(PushoverService, 'send_notification', lambda self, title, message, **kwargs: sent.append(title) or True)
+    config = _config(config_dir, ['alice'])
+    config.global_config['notifications'] = {'coalesce_window': 0}
+    context = AppContext(config, config_manager=ReloadingManager(config), check_interval=0)
+    old = context.notification_service
+    
+    context.reload()
+    assert context.notification_service is not old
+    old.queue.enqueue('alice', 'Player added', 'Bob joined your flight')
+    
+    deadline = time.monotonic() + 5
+    while not sent and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sent == ['Player added']
+    assert context.notification_service.queue.depth() == 0
+    context.close()
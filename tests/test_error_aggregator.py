@@ -0,0 +1,71 @@
+"""Tests for error aggregation."""
+
+import logging
+import time
+
+from golfcal2.config.error_aggregator import ErrorAggregator, error_fingerprint
+from golfcal2.config.logging_config import ErrorAggregationConfig
+
+
+def make_config(**overrides):
+    """Create an aggregation config with thresholds that are not reached."""
+    values = {
+        'enabled': True,
+        'report_interval': 3600,
+        'error_threshold': 100,
+        'time_threshold': 3600,
+        'categorize_by': ['service', 'message'],
+        'max_stack_traces': 2
+    }
+    values.update(overrides)
+    return ErrorAggregationConfig(**values)
+
+
+def fail(value):
+    """Raise an error whose message depends on the value."""
+    raise ValueError(f"bad value {value}")
+
+
+def test_groups_by_location_and_formats_traces_on_report(caplog):
+    """Test that one failure groups across messages and keeps only the first tracebacks."""
+    aggregator = ErrorAggregator(make_config())
+    for i in range(5):
+        try:
+            fail(i)
+        except ValueError as e:
+            aggregator.add_error(str(e), 'reservation_service', e)
+    aggregator.add_error("plain message", 'calendar')
+    
+    assert len(aggregator._errors) == 2
+    group = next(g for g in aggregator._errors.values() if g.message == "bad value 0")
+    assert group.count == 5
+    # Exceptions are kept unformatted, and only the first ones
+    assert [str(e) for e in group.stack_traces] == ["bad value 0", "bad value 1"]
+    assert error_fingerprint("bad value 0", group.stack_traces[0]) == error_fingerprint("other", group.stack_traces[1])
+    
+    with caplog.at_level(logging.ERROR, logger='error_aggregator'):
+        aggregator.shutdown()
+    traces = [r.stack_trace for r in caplog.records if r.getMessage() == "Stack trace:"]
+    assert len(traces) == 2
+    assert all("in fail" in trace and "ValueError" in trace for trace in traces)
+    assert {r.getMessage() for r in caplog.records} >= {"bad value 0", "plain message"}
+    assert aggregator._errors == {}
+
+
+def test_reports_on_threshold_and_by_timer(caplog):
+    """Test that groups are reported at the count threshold and otherwise by the report timer."""
+    aggregator = ErrorAggregator(make_config(report_interval=0.05, error_threshold=3))
+    assert aggregator._timer is None
+    
+    with caplog.at_level(logging.ERROR, logger='error_aggregator'):
+        for _ in range(3):
+            aggregator.add_error("quota exceeded", 'weather_service')
+        assert [r.error_count for r in caplog.records] == [3]
+        
+        aggregator.add_error("timeout", 'weather_service')
+        deadline = time.monotonic() + 5
+        while len(caplog.records) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    
+    assert [r.getMessage() for r in caplog.records] == ["quota exceeded", "timeout"]
+    assert aggregator._timer is None
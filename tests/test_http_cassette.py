@@ -0,0 +1,83 @@
+"""Tests for HTTP record and replay."""
+
+import gzip
+import json
+import time
+
+import pytest
+import requests
+
+from golfcal2 import http_cassette
+from golfcal2.api.base_api import BaseAPI
+from golfcal2.loadtest_server import LoadTestConfig, LoadTestServer
+
+RESERVATIONS = {'controller': 'ajax', 'reservations': 'getusergolfreservations', 'appauth': 'secret-token'}
+
+
+@pytest.fixture(autouse=True)
+def live_mode():
+    """Restore live HTTP traffic after each test."""
+    yield
+    http_cassette.configure(None)
+
+
+def _client(base_url):
+    """Create an API client authenticated with a secret header."""
+    api = BaseAPI(base_url)
+    api.session.headers['Authorization'] = 'Bearer secret-token'
+    return api
+
+
+def test_record_then_replay_offline(tmp_path):
+    """Test that a recorded cycle replays without the server and without secrets on disk."""
+    cassette_path = tmp_path / 'cycle.jsonl.gz'
+    server = LoadTestServer('127.0.0.1', 0, LoadTestConfig(users=5, latency_ms=50), max_workers=2)
+    server.start()
+    base_url = server.base_url
+    try:
+        http_cassette.configure('record', cassette_path)
+        recorded = _client(base_url)._make_request('GET', '/', params=RESERVATIONS)
+        forecast = http_cassette.request('GET', f"{base_url}/v1/forecast", params={'latitude': 60, 'longitude': 25})
+        assert forecast.status_code == 200
+    finally:
+        server.stop()
+    
+    with gzip.open(cassette_path, 'rt', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 2
+    assert 'secret-token' not in json.dumps(lines)
+    assert lines[0]['elapsed_ms'] >= 50
+    
+    http_cassette.configure('replay', cassette_path)
+    assert _client(base_url)._make_request('GET', '/', params=RESERVATIONS) == recorded
+    assert http_cassette.request('GET', f"{base_url}/v1/forecast",
+                                 params={'latitude': 60, 'longitude': 25}).json() == forecast.json()
+    
+    # Different parameters fall back to a recording of the same path
+    assert http_cassette.request('GET', f"{base_url}/v1/forecast", params={'latitude': 61}).status_code == 200
+    
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_cassette.request('GET', f"{base_url}/unknown")
+
+
+def test_replay_reproduces_latency(tmp_path):
+    """Test that replay latency scales the recorded response times."""
+    cassette_path = tmp_path / 'cycle.jsonl.gz'
+    server = LoadTestServer('127.0.0.1', 0, LoadTestConfig(latency_ms=100), max_workers=2)
+    server.start()
+    base_url = server.base_url
+    try:
+        http_cassette.configure('record', cassette_path)
+        http_cassette.request('GET', f"{base_url}/v1/forecast")
+    finally:
+        server.stop()
+    
+    http_cassette.configure('replay', cassette_path)
+    start = time.perf_counter()
+    http_cassette.request('GET', f"{base_url}/v1/forecast")
+    assert time.perf_counter() - start < 0.1
+    
+    http_cassette.configure('replay', cassette_path, replay_latency=1.0)
+    start = time.perf_counter()
+    http_cassette.request('GET', f"{base_url}/v1/forecast")
+    assert time.perf_counter() - start >= 0.1
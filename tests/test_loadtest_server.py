@@ -0,0 +1,100 @@
+"""Tests for the load test stand-in server."""
+
+import json
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from golfcal2.loadtest_server import LoadTestConfig, LoadTestServer
+from golfcal2.services.met_weather_strategy import MetWeatherStrategy
+from golfcal2.services.open_meteo_strategy import OpenMeteoStrategy
+from golfcal2.services.weather_service import WeatherContext
+
+
+@pytest.fixture
+def loadtest_server():
+    """Run a load test server on an ephemeral port."""
+    server = LoadTestServer('127.0.0.1', 0, LoadTestConfig(users=10, reservations_per_user=2), max_workers=4)
+    server.start()
+    yield server
+    server.stop()
+
+
+def _get(server, path, headers=None):
+    """Make a GET request and return (status, headers, parsed JSON body)."""
+    request = urllib.request.Request(f"{server.base_url}{path}", headers=headers or {})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, json.loads(e.read())
+
+
+def _weather_context():
+    """Create a weather context for tomorrow morning."""
+    utc = ZoneInfo('UTC')
+    start = (datetime.now(utc) + timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
+    return WeatherContext(60.2, 24.9, start, start + timedelta(hours=4), ZoneInfo('Europe/Helsinki'), utc, {})
+
+
+def test_crm_endpoints_are_deterministic_per_user(loadtest_server):
+    """Test that each CRM endpoint serves stable data per credential."""
+    status, _, first = _get(loadtest_server, '/?controller=ajax&reservations=getusergolfreservations',
+                            {'Authorization': 'token-a'})
+    _, _, again = _get(loadtest_server, '/?controller=ajax&reservations=getusergolfreservations',
+                       {'Authorization': 'token-a'})
+    assert status == 200
+    assert first['success'] is True
+    assert len(first['rows']) == 2
+    assert first == again
+    
+    time_id = first['rows'][0]['reservationTimeId']
+    day = first['rows'][0]['dateTimeStart'][:10]
+    _, _, sheet = _get(loadtest_server, f'/api/1.0/reservations/?productid=55&date={day}')
+    assert time_id in {row['reservationTimeId'] for row in sheet['rows']}
+    assert any(player['reservationTimeId'] == time_id for player in sheet['reservationsGolfPlayers'])
+    
+    _, _, nexgolf = _get(loadtest_server, '/pgc/member/api/flight/own', {'Cookie': 'JSESSIONID=abc'})
+    assert datetime.strptime(nexgolf[0]['startTime'], '%H:%M %Y-%m-%d')
+    assert nexgolf[0]['reservations'][0]['player']['club']['abbreviation']
+    
+    _, _, teetime = _get(loadtest_server, '/backend/player/flight?token=abc&from=2024-01-01&to=2024-12-31')
+    assert len(teetime['data']) == 2
+
+
+def test_weather_strategies_parse_forecasts(loadtest_server, monkeypatch):
+    """Test that the weather strategies can be pointed at the server and parse its forecasts."""
+    for name, value in loadtest_server.weather_environment().items():
+        monkeypatch.setenv(name, value)
+    
+    for strategy_class in (MetWeatherStrategy, OpenMeteoStrategy):
+        response = strategy_class(_weather_context()).get_weather()
+        assert response is not None and response.data, strategy_class.__name__
+    
+    endpoints = loadtest_server.stats()['endpoints']
+    assert endpoints['met_forecast'] == {'200': 1}
+    assert endpoints['openmeteo_forecast'] == {'200': 1}
+
+
+def test_fault_injection_and_counters():
+    """Test that injected errors are returned and counted per endpoint and status."""
+    server = LoadTestServer('127.0.0.1', 0, LoadTestConfig(rate_429=1.0), max_workers=2)
+    server.start()
+    try:
+        status, headers, _ = _get(server, '/v1/forecast?latitude=60&longitude=25')
+        assert status == 429
+        assert headers['Retry-After'] == '1'
+        
+        status, _, _ = _get(server, '/unknown')
+        assert status == 404
+        
+        # The control endpoints are never failed
+        status, _, stats = _get(server, '/_loadtest/stats')
+        assert status == 200
+        assert stats['total'] == 2
+        assert stats['endpoints'] == {'openmeteo_forecast': {'429': 1}, 'unknown': {'404': 1}}
+    finally:
+        server.stop()
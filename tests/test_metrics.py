@@ -0,0 +1,134 @@
+"""Tests for metrics collection and Prometheus formatting."""
+
+import pytest
+
+from golfcal2.metrics import HISTOGRAM_BUCKETS, MAX_LABEL_SETS, OVERFLOW_LABEL_VALUE, Metrics, TimerStats
+from golfcal2.metrics_prometheus import format_prometheus_metrics
+
+
+def test_timer_stats_percentiles():
+    """Test that percentile estimates stay within a bucket of the exact value."""
+    stats = TimerStats()
+    durations = [i / 1000 for i in range(1, 1001)]  # 1ms .. 1s
+    for duration in durations:
+        stats.add(duration)
+
+    result = stats.get_stats()
+    assert result["count"] == 1000
+    assert result["min"] == 0.001
+    assert result["max"] == 1.0
+    assert result["total"] == pytest.approx(sum(durations))
+    # Buckets are sqrt(2) wide, so estimates are within that factor
+    for key, exact in (("p50", 0.5), ("p90", 0.9), ("p95", 0.95), ("p99", 0.99)):
+        assert exact / 1.42 <= result[key] <= exact * 1.42
+    assert result["median"] == result["p50"]
+
+
+def test_timer_stats_buckets_are_cumulative():
+    """Test cumulative bucket counts and constant memory."""
+    stats = TimerStats()
+    for _ in range(10000):
+        stats.add(0.002)
+    stats.add(1000.0)  # Beyond the largest bucket
+
+    buckets = stats.get_buckets()
+    assert len(buckets) == len(HISTOGRAM_BUCKETS) + 1
+    assert len(stats.bucket_counts) == len(HISTOGRAM_BUCKETS) + 1
+    assert buckets["0.001"] == 0
+    assert buckets["0.002"] == 10000  # le is inclusive
+    assert buckets["+Inf"] == 10001
+    counts = list(buckets.values())
+    assert counts == sorted(counts)
+    assert stats.percentile(1.0) == 1000.0
+
+
+def test_empty_timer_stats():
+    """Test summary of a timer without measurements."""
+    result = TimerStats().get_stats()
+    assert result["count"] == 0
+    assert result["p99"] == 0.0
+    assert result["buckets"]["+Inf"] == 0
+
+
+def test_prometheus_histogram_output():
+    """Test that timers are exported as Prometheus histograms."""
+    stats = TimerStats()
+    stats.add(0.003)
+    stats.add(0.5)
+    metrics = {
+        "uptime_seconds": 1.0,
+        "counters": {},
+        "gauges": {},
+        "timers": {"api_call": stats.get_stats()}
+    }
+
+    output = format_prometheus_metrics(metrics)
+    assert "# TYPE golfcal_api_call_seconds histogram" in output
+    assert 'golfcal_api_call_seconds_bucket{le="0.001"} 0.0' in output
+    assert 'golfcal_api_call_seconds_bucket{le="0.004"} 1.0' in output
+    assert 'golfcal_api_call_seconds_bucket{le="+Inf"} 2.0' in output
+    assert "golfcal_api_call_seconds_count 2.0" in output
+    assert "golfcal_api_call_seconds_sum 0.503" in output
+
+
+def test_labelled_metrics():
+    """Test that labelled series are tracked separately from flat metrics."""
+    metrics = Metrics()
+    metrics.increment("test_labelled_cache", labels={"provider": "met", "result": "hit"})
+    metrics.increment("test_labelled_cache", 2, labels={"provider": "met", "result": "hit"})
+    metrics.increment("test_labelled_cache", labels={"provider": "met", "result": "miss"})
+    metrics.set_gauge("test_labelled_gauge", 3.5, labels={"club": "a"})
+    metrics.record_time("test_labelled_timer", 0.01, labels={"host": "example.com"})
+
+    result = metrics.get_metrics()
+    assert "test_labelled_cache" not in result["counters"]
+    counters = {
+        sample["labels"]["result"]: sample["value"]
+        for sample in result["labelled"]["counters"]["test_labelled_cache"]
+    }
+    assert counters == {"hit": 3, "miss": 1}
+    assert result["labelled"]["gauges"]["test_labelled_gauge"] == [{"labels": {"club": "a"}, "value": 3.5}]
+    timer = result["labelled"]["timers"]["test_labelled_timer"][0]
+    assert timer["labels"] == {"host": "example.com"}
+    assert timer["stats"]["count"] == 1
+
+
+def test_labelled_metrics_cardinality_is_bounded():
+    """Test that label sets past the limit are folded into an overflow series."""
+    metrics = Metrics()
+    for i in range(MAX_LABEL_SETS + 50):
+        metrics.increment("test_cardinality", labels={"endpoint": f"/item/{i}"})
+
+    samples = metrics.get_metrics()["labelled"]["counters"]["test_cardinality"]
+    assert len(samples) == MAX_LABEL_SETS + 1
+    overflow = [s for s in samples if s["labels"] == {"endpoint": OVERFLOW_LABEL_VALUE}]
+    assert overflow[0]["value"] == 50
+
+
+def test_prometheus_labelled_output():
+    """Test that labelled families share one TYPE line and carry label sets."""
+    stats = TimerStats()
+    stats.add(0.003)
+    metrics = {
+        "uptime_seconds": 1.0,
+        "counters": {},
+        "gauges": {},
+        "timers": {},
+        "labelled": {
+            "counters": {"weather_cache": [
+                {"labels": {"provider": "met", "result": "hit"}, "value": 2},
+                {"labels": {"provider": "met", "result": "miss"}, "value": 1}
+            ]},
+            "gauges": {},
+            "timers": {"http_request": [
+                {"labels": {"host": "a.example", "status": "200"}, "stats": stats.get_stats()}
+            ]}
+        }
+    }
+
+    output = format_prometheus_metrics(metrics)
+    assert output.count("# TYPE golfcal_weather_cache_total counter") == 1
+    assert 'golfcal_weather_cache_total{provider="met",result="hit"} 2.0' in output
+    assert 'golfcal_weather_cache_total{provider="met",result="miss"} 1.0' in output
+    assert 'golfcal_http_request_seconds_bucket{host="a.example",le="+Inf",status="200"} 1.0' in output
+    assert 'golfcal_http_request_seconds_count{host="a.example",status="200"} 1.0' in output
@@ -0,0 +1,72 @@
+"""Tests for the service scheduler."""
+
+import random
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from golfcal2.scheduler import CACHE_REFRESH, REMINDER, SYNC, Scheduler
+
+TZ = ZoneInfo('Europe/Helsinki')
+NOW = datetime(2024, 7, 16, 9, 40, tzinfo=TZ)
+
+
+def test_syncs_align_to_interval_and_replace_by_key():
+    """Test that rescheduling a sync replaces the earlier trigger."""
+    scheduler = Scheduler()
+    scheduler.schedule(SYNC, 'alice', NOW, user='alice')
+    scheduler.schedule_sync('alice', NOW)
+    
+    assert len(scheduler) == 1
+    assert scheduler.next_trigger().when == datetime(2024, 7, 16, 10, 0, tzinfo=TZ)
+    assert scheduler.pop_due(NOW) == []
+
+
+def test_reminders_follow_sync_results():
+    """Test that reminders are replaced from each sync's reservations."""
+    scheduler = Scheduler()
+    tee_time = NOW + timedelta(hours=2)
+    
+    assert scheduler.update_reminders('alice', [('r1', tee_time), ('r2', NOW + timedelta(minutes=20))], NOW) == 3
+    # r2 is 20 minutes away: only its 15 minute reminder is still ahead
+    assert scheduler.next_trigger().key == 'r2@15'
+    
+    # The next sync no longer returns r2 and moves r1
+    moved = tee_time + timedelta(hours=1)
+    scheduler.update_reminders('alice', [('r1', moved)], NOW)
+    assert len(scheduler) == 2
+    assert scheduler.next_trigger().when == moved - timedelta(minutes=30)
+    
+    due = scheduler.pop_due(moved)
+    assert [(t.kind, t.key, t.user) for t in due] == [(REMINDER, 'r1@30', 'alice'), (REMINDER, 'r1@15', 'alice')]
+    assert scheduler.next_trigger() is None
+
+
+def test_earliest_kind_wins_and_wait_wakes_on_change():
+    """Test that the earliest trigger of any kind is next and scheduling interrupts a wait."""
+    scheduler = Scheduler()
+    scheduler.schedule_sync('alice', NOW)
+    scheduler.schedule(CACHE_REFRESH, 'weather', NOW + timedelta(minutes=5))
+    
+    assert scheduler.next_trigger().kind == CACHE_REFRESH
+    assert scheduler.wait(0) is False
+    
+    scheduler.cancel(CACHE_REFRESH, 'weather')
+    scheduler.schedule(REMINDER, 'r1@15', NOW + timedelta(minutes=1), user='alice')
+    assert scheduler.wait(5) is True
+    assert scheduler.next_trigger().kind == REMINDER
+
+
+def test_spread_syncs_are_deterministic_and_jitter_never_resyncs_early():
+    """Test that users get stable, distinct offsets and jitter stays within bounds."""
+    scheduler = Scheduler(spread=True)
+    offsets = {scheduler.sync_offset(f"user{i}") for i in range(50)}
+    assert len(offsets) > 40
+    assert all(timedelta(0) <= offset < timedelta(hours=1) for offset in offsets)
+    assert Scheduler(spread=True).sync_offset('alice') == scheduler.sync_offset('alice')
+    
+    jittered = Scheduler(spread=True, jitter=timedelta(minutes=1), rng=random.Random(1))
+    slot = NOW.replace(minute=0) + jittered.sync_offset('alice')
+    for _ in range(20):
+        # A sync run up to a minute early must not schedule the same slot again
+        when = jittered.next_sync_time(slot - timedelta(seconds=59), 'alice')
+        assert slot + timedelta(minutes=59) <= when <= slot + timedelta(minutes=61)
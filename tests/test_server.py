@@ -0,0 +1,274 @@
+"""Tests for the health check and calendar feed HTTP server."""
+
+import gzip
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+import tracemalloc
+import urllib.error
+import urllib.request
+
+import pytest
+
+from golfcal2.profiling import MemoryProfiler
+from golfcal2.server import CalendarFeedCache, HealthCheckServer
+
+ICS_BODY = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nEND:VCALENDAR\r\n"
+
+
+@pytest.fixture
+def ics_dir(tmp_path):
+    """Create a directory with a single calendar."""
+    (tmp_path / "Alice.ics").write_bytes(ICS_BODY)
+    return tmp_path
+
+
+@pytest.fixture
+def server(ics_dir):
+    """Run a server on an ephemeral port."""
+    health_server = HealthCheckServer('127.0.0.1', 0, ics_dir=ics_dir)
+    health_server.start()
+    yield health_server
+    health_server.stop()
+
+
+def _get(server, path, headers=None):
+    """Make a GET request and return (status, headers, body)."""
+    host, port = server.server.server_address[:2]
+    request = urllib.request.Request(f"http://{host}:{port}{path}", headers=headers or {})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_feed_cache_reloads_on_change(ics_dir):
+    """Test that the cache only reloads when the file changes."""
+    cache = CalendarFeedCache(ics_dir)
+    first = cache.get("Alice")
+    assert first is not None
+    assert first.body == ICS_BODY
+    assert gzip.decompress(first.gzip_body) == ICS_BODY
+    assert cache.get("Alice") is first
+
+    path = ics_dir / "Alice.ics"
+    path.write_bytes(ICS_BODY + b"X")
+    os.utime(path, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+    second = cache.get("Alice")
+    assert second is not first
+    assert second.etag != first.etag
+
+
+def test_feed_cache_rejects_missing_and_traversal(ics_dir):
+    """Test that unknown names and paths outside the directory are rejected."""
+    cache = CalendarFeedCache(ics_dir)
+    assert cache.get("Bob") is None
+    assert cache.get("../Alice") is None
+
+
+def test_calendar_feed_conditional_get(server):
+    """Test full and conditional calendar responses."""
+    status, headers, body = _get(server, "/calendars/Alice.ics")
+    assert status == 200
+    assert body == ICS_BODY
+    assert headers['Content-Type'].startswith('text/calendar')
+
+    status, _, body = _get(server, "/calendars/Alice.ics", {'If-None-Match': headers['ETag']})
+    assert status == 304
+    assert body == b''
+
+    status, _, _ = _get(server, "/calendars/Alice.ics", {'If-Modified-Since': headers['Last-Modified']})
+    assert status == 304
+
+
+def test_calendar_feed_gzip(server):
+    """Test that gzip is served when accepted."""
+    status, headers, body = _get(server, "/calendars/Alice.ics", {'Accept-Encoding': 'gzip'})
+    assert status == 200
+    assert headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(body) == ICS_BODY
+
+    status, _, _ = _get(server, "/calendars/Alice.ics", {
+        'Accept-Encoding': 'gzip',
+        'If-None-Match': headers['ETag']
+    })
+    assert status == 304
+
+
+def test_calendar_feed_unknown(server):
+    """Test that unknown calendars return 404."""
+    status, _, _ = _get(server, "/calendars/Bob.ics")
+    assert status == 404
+
+
+def test_head_unknown_calendar_keeps_connection_usable(server):
+    """Test that a 404 to HEAD has no body to corrupt the next response on the connection."""
+    host, port = server.server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        connection.request('HEAD', '/calendars/Bob.ics')
+        response = connection.getresponse()
+        assert response.status == 404
+        assert int(response.headers['Content-Length']) > 0
+        assert response.read() == b''
+
+        connection.request('GET', '/calendars/Alice.ics')
+        response = connection.getresponse()
+        assert response.status == 200
+        assert response.read() == ICS_BODY
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def debug_server():
+    """Run a server with the debug endpoints enabled."""
+    health_server = HealthCheckServer('127.0.0.1', 0, debug_endpoints=True)
+    health_server.start()
+    yield health_server
+    health_server.stop()
+
+
+def test_debug_endpoints_disabled_by_default(server):
+    """Test that profiling endpoints are not served unless enabled."""
+    status, _, _ = _get(server, "/debug/profile?seconds=0.1")
+    assert status == 404
+    status, _, _ = _get(server, "/debug/memory")
+    assert status == 404
+
+
+def test_debug_profile(debug_server):
+    """Test that a sampling profile captures other threads."""
+    stop = threading.Event()
+
+    def busy_loop():
+        while not stop.is_set():
+            sum(range(1000))
+
+    worker = threading.Thread(target=busy_loop, name='busy-worker')
+    worker.start()
+    try:
+        status, headers, body = _get(debug_server, "/debug/profile?seconds=0.3&interval_ms=5")
+    finally:
+        stop.set()
+        worker.join()
+
+    assert status == 200
+    assert headers['Content-Type'].startswith('text/plain')
+    lines = body.decode().splitlines()
+    assert any(line.startswith('busy-worker;') and 'busy_loop' in line for line in lines)
+
+    status, _, body = _get(debug_server, "/debug/profile?seconds=0.1&format=top")
+    assert status == 200
+    assert b'samples' in body
+
+
+def test_debug_profile_rejects_bad_parameters(debug_server):
+    """Test validation of profile parameters."""
+    assert _get(debug_server, "/debug/profile?seconds=3600")[0] == 400
+    assert _get(debug_server, "/debug/profile?seconds=abc")[0] == 400
+    assert _get(debug_server, "/debug/profile?seconds=1&format=svg")[0] == 400
+
+
+def test_debug_memory(debug_server):
+    """Test tracemalloc baseline and diff responses."""
+    try:
+        status, _, body = _get(debug_server, "/debug/memory")
+        assert status == 200
+        first = json.loads(body)
+        assert first['baseline'] is True
+
+        retained = [bytearray(1024) for _ in range(1000)]
+        status, _, body = _get(debug_server, "/debug/memory?limit=5")
+        second = json.loads(body)
+        assert second['baseline'] is False
+        assert 0 < len(second['top']) <= 5
+        assert second['top'][0]['size_diff_kb'] > 0
+        del retained
+
+        status, _, body = _get(debug_server, "/debug/memory?stop=1")
+        assert json.loads(body) == {'stopped': True}
+        assert not tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_tracing_stops_when_idle():
+    """Test that tracing started for a diff stops after the idle timeout."""
+    profiler = MemoryProfiler(idle_timeout=0.1)
+    try:
+        assert profiler.diff()['stops_in_seconds'] == 0.1
+        assert tracemalloc.is_tracing()
+        time.sleep(0.3)
+        assert not tracemalloc.is_tracing()
+        assert profiler.diff()['baseline'] is True
+    finally:
+        profiler.stop()
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def single_worker_server():
+    """Run a server with one worker, no queue and the debug endpoints enabled."""
+    health_server = HealthCheckServer(
+        '127.0.0.1',
+        0,
+        max_workers=1,
+        max_pending=0,
+        keepalive_timeout=0.2,
+        debug_endpoints=True
+    )
+    health_server.start()
+    yield health_server
+    health_server.stop()
+
+
+def test_full_queue_is_rejected_with_503(single_worker_server):
+    """Test that connections beyond the workers and the queue get a 503 instead of waiting."""
+    idle = socket.create_connection(single_worker_server.server.server_address[:2])
+    try:
+        time.sleep(0.1)
+        status, headers, _ = _get(single_worker_server, "/metrics")
+        assert status == 503
+        assert headers['Retry-After'] == '1'
+    finally:
+        idle.close()
+    time.sleep(0.1)
+    assert _get(single_worker_server, "/metrics")[0] == 200
+
+
+def test_idle_keepalive_connection_frees_its_worker(single_worker_server):
+    """Test that an idle keep-alive connection only holds its worker for the keep-alive timeout."""
+    host, port = single_worker_server.server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        connection.request('GET', '/metrics')
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 200
+        assert not response.will_close
+        
+        time.sleep(0.4)
+        assert _get(single_worker_server, "/metrics")[0] == 200
+    finally:
+        connection.close()
+
+
+def test_profile_runs_outside_the_worker_pool(single_worker_server):
+    """Test that /metrics is served while a profile is running."""
+    result = {}
+    profile = threading.Thread(
+        target=lambda: result.update(profile=_get(single_worker_server, "/debug/profile?seconds=0.5"))
+    )
+    profile.start()
+    try:
+        time.sleep(0.2)
+        assert _get(single_worker_server, "/metrics")[0] == 200
+        assert profile.is_alive()
+    finally:
+        profile.join()
+    assert result['profile'][0] == 200
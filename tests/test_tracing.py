@@ -0,0 +1,85 @@
+"""Tests for span tracing and Chrome trace export."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from golfcal2.tracing import Tracer, propagate, span
+
+
+@pytest.fixture
+def tracer():
+    """Enable the global tracer for a test."""
+    tracer = Tracer()
+    tracer.clear()
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+
+
+def test_disabled_tracer_records_nothing():
+    """Test that spans are no-ops while tracing is disabled."""
+    tracer = Tracer()
+    tracer.disable()
+    with span('cycle') as cycle_span:
+        cycle_span.set_attribute('ignored', True)
+    assert tracer.get_spans() == []
+
+
+def test_spans_nest(tracer):
+    """Test parent links and attributes of nested spans."""
+    with span('user', user='Alice'):
+        with span('weather') as weather_span:
+            weather_span.set_attribute('provider', 'met')
+
+    spans = {s.name: s for s in tracer.get_spans()}
+    assert spans['weather'].parent_id == spans['user'].span_id
+    assert spans['user'].parent_id is None
+    assert spans['weather'].attributes == {'provider': 'met'}
+    assert spans['user'].attributes == {'user': 'Alice'}
+
+
+def test_span_records_error(tracer):
+    """Test that exceptions are recorded on the span."""
+    with pytest.raises(ValueError):
+        with span('write'):
+            raise ValueError("disk full")
+    assert tracer.get_spans()[0].attributes['error'] == 'ValueError'
+
+
+def test_propagate_to_threads(tracer):
+    """Test that spans in worker threads nest under the submitting span."""
+    def fetch(club):
+        with span('club_request', club=club):
+            pass
+
+    with span('membership'):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            wrapped = propagate(fetch)
+            list(executor.map(wrapped, ['a', 'b', 'c']))
+
+    spans = tracer.get_spans()
+    membership = next(s for s in spans if s.name == 'membership')
+    requests = [s for s in spans if s.name == 'club_request']
+    assert len(requests) == 3
+    assert all(s.parent_id == membership.span_id for s in requests)
+
+
+def test_export_chrome_trace(tracer, tmp_path):
+    """Test writing a Chrome trace file and pruning old ones."""
+    for _ in range(3):
+        with span('cycle'):
+            with span('build', reservations=2):
+                pass
+        path = tracer.export(tmp_path, keep=2)
+
+    assert len(list(tmp_path.glob('cycle-*.json'))) <= 2
+    trace = json.loads(path.read_text())
+    events = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    assert [e['name'] for e in events] == ['cycle', 'build']
+    assert events[1]['args']['parent_id'] == events[0]['args']['span_id']
+    assert events[1]['args']['reservations'] == 2
+    assert any(e['ph'] == 'M' and e['name'] == 'thread_name' for e in trace['traceEvents'])
+    assert tracer.get_spans() == []
+    assert tracer.export(tmp_path) is None
@@ -0,0 +1,75 @@
+"""Tests for the per-host circuit breakers."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from golfcal2.utils import circuit_breaker
+from golfcal2.utils.circuit_breaker import CLOSED, OPEN, CircuitBreakers, CircuitOpenError, circuit_breakers
+from golfcal2.utils.retry_policy import retry_policy
+
+SETTINGS = {'breaker_failure_threshold': 2, 'breaker_reset_seconds': 60}
+URL = 'https://down.example.com/pd/ajax'
+
+
+def test_circuit_opens_survives_restart_and_probes(tmp_path, monkeypatch):
+    """Test that a failing host is skipped across restarts until a probe succeeds."""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, 'time', lambda: now[0])
+    breakers = CircuitBreakers()
+    breakers.configure(SETTINGS, tmp_path)
+    
+    breakers.record_failure(URL, 'ConnectTimeout')
+    assert not breakers.is_open(URL)
+    breakers.record_failure(URL, 'ConnectTimeout')
+    assert breakers.is_open(URL)
+    with pytest.raises(CircuitOpenError):
+        breakers.check(URL)
+    
+    restarted = CircuitBreakers()
+    restarted.configure(SETTINGS, tmp_path)
+    assert restarted.is_open('down.example.com')
+    assert restarted.snapshot()['down.example.com']['last_error'] == 'ConnectTimeout'
+    
+    # After the reset timeout a single probe is let through
+    now[0] += 61
+    assert not restarted.is_open(URL)
+    restarted.check(URL)
+    assert restarted.is_open(URL)
+    with pytest.raises(CircuitOpenError):
+        restarted.check(URL)
+    
+    # A failed probe opens the circuit again, a successful one closes it
+    restarted.record_failure(URL, 'HTTP 503')
+    assert restarted.is_open(URL)
+    now[0] += 61
+    restarted.check(URL)
+    restarted.record_success(URL)
+    assert not restarted.is_open(URL)
+    assert restarted.snapshot() == {}
+    state = json.loads((tmp_path / 'circuit_breakers.json').read_text())
+    assert state['down.example.com']['state'] == CLOSED
+
+
+def test_requests_fail_fast_on_open_circuit():
+    """Test that shared requests count failures and stop reaching a dead host."""
+    circuit_breakers.configure(SETTINGS)
+    session = Mock()
+    session.request.side_effect = requests.exceptions.ConnectTimeout('no route')
+    
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            retry_policy.request(session, 'GET', URL)
+    calls = session.request.call_count
+    
+    with pytest.raises(CircuitOpenError):
+        retry_policy.request(session, 'GET', URL)
+    assert session.request.call_count == calls
+    assert circuit_breakers.snapshot()['down.example.com']['state'] == OPEN
+    
+    # Other hosts are unaffected
+    session.request.side_effect = None
+    session.request.return_value = Mock(status_code=200)
+    assert retry_policy.request(session, 'GET', 'https://up.example.com/').status_code == 200
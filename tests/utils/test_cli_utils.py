@@ -0,0 +1,81 @@
+"""Tests for CLI utilities."""
+
+import argparse
+import logging
+import pstats
+from types import SimpleNamespace
+
+import pytest
+
+from golfcal2.tracing import Tracer, span
+from golfcal2.utils.cli_utils import CLIContext, add_common_options, run_command_handler
+
+
+def _parse(*argv):
+    """Parse arguments with the common options."""
+    parser = argparse.ArgumentParser()
+    add_common_options(parser)
+    return parser.parse_args(list(argv))
+
+
+def _handler(ctx):
+    """Command handler doing a bit of traced work."""
+    with span('reservations'):
+        sum(i * i for i in range(10000))
+    with span('write'):
+        data = [bytearray(64) for _ in range(100)]
+    return len(data) and 0
+
+
+def _context(tmp_path, *argv):
+    """Create a CLI context logging to tmp_path."""
+    args = _parse('--log-file', str(tmp_path / 'golfcal.log'), *argv)
+    return CLIContext(
+        args=args,
+        logger=logging.getLogger(__name__),
+        config=SimpleNamespace(global_config={}),
+        parser=argparse.ArgumentParser()
+    )
+
+
+def test_profile_option():
+    """Test that --profile takes no value, so it can precede the command."""
+    args = _parse('--profile', '--profile-mode', 'alloc')
+    assert args.profile and args.profile_mode == 'alloc'
+    assert not _parse().profile
+    
+    parser = argparse.ArgumentParser()
+    add_common_options(parser)
+    parser.add_argument('command')
+    assert parser.parse_args(['--profile', 'process']).command == 'process'
+    with pytest.raises(SystemExit):
+        _parse('--profile-mode', 'bogus')
+
+
+def test_run_command_handler_without_profile(tmp_path):
+    """Test that handlers run directly without --profile."""
+    ctx = _context(tmp_path)
+    assert run_command_handler(ctx, lambda c: 3, 'process') == 3
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("mode,report_suffix", [
+    ('cpu', '.pstats'),
+    ('wall', '.pstats'),
+    ('alloc', '.alloc.txt')
+])
+def test_run_command_handler_with_profile(tmp_path, capsys, mode, report_suffix):
+    """Test that profiling writes artifacts and a phase summary."""
+    ctx = _context(tmp_path, '--profile-mode', mode)
+    assert run_command_handler(ctx, _handler, 'process') == 0
+
+    reports = list(tmp_path.glob(f'profile-process-{mode}-*{report_suffix}'))
+    assert len(reports) == 1
+    assert list(tmp_path.glob(f'profile-process-{mode}-*.collapsed'))
+    if report_suffix == '.pstats':
+        assert pstats.Stats(str(reports[0])).total_calls > 0
+
+    err = capsys.readouterr().err
+    assert 'Profile summary' in err
+    assert 'reservations' in err and 'write' in err
+    assert not Tracer().enabled
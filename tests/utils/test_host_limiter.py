@@ -0,0 +1,55 @@
+"""Tests for the per-host request limiter."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from golfcal2.utils.host_limiter import HostLimiter, HostSlotTimeout
+
+
+def test_limits_concurrent_requests_per_host():
+    """Test that each host gets at most max_per_host requests in flight."""
+    limiter = HostLimiter(max_per_host=2)
+    in_flight = {'a.example.com': 0, 'b.example.com': 0}
+    peak = dict(in_flight)
+    lock = threading.Lock()
+    
+    def request(url):
+        host = url.split('/')[2]
+        with limiter.slot(url):
+            with lock:
+                in_flight[host] += 1
+                peak[host] = max(peak[host], in_flight[host])
+            time.sleep(0.02)
+            with lock:
+                in_flight[host] -= 1
+    
+    urls = [f"https://{host}/api?n={i}" for i in range(6) for host in in_flight]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(request, urls))
+    
+    assert peak == {'a.example.com': 2, 'b.example.com': 2}
+
+
+def test_zero_disables_limit():
+    """Test that a zero limit never blocks."""
+    limiter = HostLimiter()
+    with limiter.slot('https://a.example.com/'), limiter.slot('https://a.example.com/'):
+        pass
+    
+    limiter.configure(1)
+    with limiter.slot('https://a.example.com/'):
+        assert not limiter._semaphore('a.example.com').acquire(blocking=False)
+
+
+def test_waiting_for_a_slot_times_out():
+    """Test that a slot wait with a timeout gives up when the host stays busy."""
+    limiter = HostLimiter(max_per_host=1)
+    with limiter.slot('https://a.example.com/'):
+        with pytest.raises(HostSlotTimeout):
+            with limiter.slot('https://a.example.com/', timeout=0.05):
+                pass
+    with limiter.slot('https://a.example.com/', timeout=0.05):
+        pass
@@ -0,0 +1,93 @@
+"""Tests for lazy log payloads and the asynchronous logging pipeline."""
+
+import logging
+import logging.handlers
+import queue
+
+from golfcal2.config.logging import DroppingQueueHandler
+from golfcal2.utils.logging_utils import LoggerMixin, payload
+
+
+class Rendered:
+    """Counts how often it is rendered."""
+    
+    renders = 0
+    
+    def __str__(self):
+        type(self).renders += 1
+        return 'rendered'
+
+
+class Client(LoggerMixin):
+    """Logs through the mixin."""
+
+
+def test_payload_not_rendered_when_debug_is_off(caplog):
+    """Test that disabled levels never render payloads or context."""
+    Rendered.renders = 0
+    client = Client()
+    with caplog.at_level(logging.INFO, logger=__name__):
+        client.logger.debug("Response: %s", payload({'data': Rendered()}))
+        client.debug("Response: %s", payload(Rendered()), user=Rendered())
+    assert Rendered.renders == 0
+    
+    with caplog.at_level(logging.DEBUG, logger=__name__):
+        client.debug("Response: %s", payload({'data': Rendered()}), rate='100%')
+    assert Rendered.renders > 0
+    assert caplog.records[-1].getMessage() == 'Response: {"data": "rendered"} | Context: rate=100%'
+
+
+def test_payload_masks_credentials_and_caps_size():
+    """Test that credentials are masked and long payloads truncated."""
+    headers = {'Authorization': 'Bearer secret', 'Accept': 'application/json'}
+    assert str(payload(headers)) == '{"Authorization": "***", "Accept": "application/json"}'
+    assert str(payload({'rows': [{'token': 'secret'}]})) == '{"rows": [{"token": "***"}]}'
+    assert str(payload('x' * 50, limit=10)) == 'xxxxxxxxxx... (50 chars)'
+
+
+def test_queue_handler_drops_instead_of_blocking():
+    """Test that a full queue drops records and the listener renders the rest."""
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+    logger = logging.getLogger('golfcal2.tests.queue')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    try:
+        for i in range(5):
+            logger.debug("Record %s: %s", i, payload({'n': i}))
+        assert handler.dropped == 3
+        
+        received = []
+        target = logging.Handler()
+        target.emit = lambda record: received.append(record.getMessage())
+        listener = logging.handlers.QueueListener(log_queue, target)
+        listener.start()
+        listener.stop()
+        assert received == ['Record 0: {"n": 0}', 'Record 1: {"n": 1}']
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_queue_handler_logs_payload_state_at_call():
+    """Test that a payload changed after logging is logged as it was."""
+    log_queue = queue.Queue()
+    handler = DroppingQueueHandler(log_queue)
+    logger = logging.getLogger('golfcal2.tests.queue_state')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    try:
+        headers = {'status': 'before'}
+        logger.debug("State: %s", payload(headers))
+        headers['status'] = 'after'
+        
+        received = []
+        target = logging.Handler()
+        target.emit = lambda record: received.append(record.getMessage())
+        listener = logging.handlers.QueueListener(log_queue, target)
+        listener.start()
+        listener.stop()
+        assert received == ['State: {"status": "before"}']
+    finally:
+        logger.removeHandler(handler)
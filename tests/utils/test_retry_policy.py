@@ -0,0 +1,95 @@
+"""Tests for the shared retry policy."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from golfcal2.utils import retry_policy as retry_policy_module
+from golfcal2.utils.host_limiter import HostLimiter
+from golfcal2.utils.retry_policy import DeadlineExceeded, RetryPolicy
+
+
+def failing(log):
+    """Get a send function that always times out, recording its timeouts."""
+    def send(timeout):
+        log.append(timeout)
+        raise requests.exceptions.Timeout("slow club")
+    return send
+
+
+def test_delays_use_decorrelated_jitter():
+    """Test that delays stay between the base delay and three times the previous one."""
+    policy = RetryPolicy(base_delay=0.5, max_delay=20)
+    previous = policy.base_delay
+    for _ in range(100):
+        delay = policy.next_delay(previous)
+        assert 0.5 <= delay <= min(20, previous * 3)
+        previous = delay
+    assert policy.next_delay(1000) <= 20
+
+
+def test_retry_budget_is_per_host_and_cycle():
+    """Test that a failing host uses up only its own retries."""
+    sleeps = []
+    policy = RetryPolicy(max_attempts=3, retry_budget=4, sleep=sleeps.append)
+    policy.start_cycle()
+    attempts = []
+    
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.Timeout):
+            policy.call('https://slow.example.com/api', failing(attempts))
+    # Two retries for each of the first two requests, none for the third
+    assert len(attempts) == 3 + 3 + 1
+    assert len(sleeps) == 4
+    
+    healthy = Mock(side_effect=[Mock(status_code=503, headers={'Retry-After': '2'}), Mock(status_code=200)])
+    response = policy.call('https://ok.example.com/api', healthy, retry_if=lambda r: r.status_code == 503)
+    assert response.status_code == 200
+    assert sleeps[-1] >= 2
+    
+    policy.start_cycle()
+    attempts.clear()
+    with pytest.raises(requests.exceptions.Timeout):
+        policy.call('https://slow.example.com/api', failing(attempts))
+    assert len(attempts) == 3
+
+
+def test_deadline_cuts_timeouts_and_stops_retries():
+    """Test that requests get at most the time left in the cycle."""
+    policy = RetryPolicy(max_attempts=5, base_delay=0.5, timeout=(7, 20), sleep=lambda seconds: None)
+    policy.start_cycle(deadline=0.3)
+    
+    connect, read = policy.timeout()
+    assert 0 < connect <= 0.3 and 0 < read <= 0.3
+    assert policy.timeout(30) <= 0.3
+    
+    # The shortest delay does not fit in the time left, so no retry is made
+    attempts = []
+    with pytest.raises(requests.exceptions.Timeout):
+        policy.call('https://slow.example.com/api', failing(attempts))
+    assert len(attempts) == 1
+    
+    time.sleep(0.3)
+    with pytest.raises(DeadlineExceeded):
+        policy.call('https://slow.example.com/api', failing(attempts))
+    assert len(attempts) == 1
+    
+    with policy.cycle(deadline=0):
+        assert policy.timeout() == (7, 20)
+
+
+def test_waiting_for_a_host_slot_stops_at_the_deadline(monkeypatch):
+    """Test that a request queued behind a full host gives up at the cycle deadline."""
+    monkeypatch.setattr(retry_policy_module, 'host_limiter', HostLimiter(max_per_host=1))
+    policy = RetryPolicy(sleep=lambda seconds: None)
+    policy.start_cycle(deadline=0.2)
+    session = Mock()
+    
+    start = time.monotonic()
+    with retry_policy_module.host_limiter.slot('https://busy.example.com/'):
+        with pytest.raises(DeadlineExceeded):
+            policy.request(session, 'GET', 'https://busy.example.com/api')
+    assert time.monotonic() - start < 1
+    session.request.assert_not_called()